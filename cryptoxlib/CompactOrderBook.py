@@ -0,0 +1,287 @@
+import bisect
+import itertools
+from array import array
+from decimal import Decimal
+from typing import List, Optional, Iterable, Any, Union, Dict, Tuple, Callable
+
+from cryptoxlib.OrderBook import PriceLevelType, OrderBookView
+from cryptoxlib.exceptions import CryptoXLibException
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NumberType = Union[str, float, int]
+
+# range of the 64-bit integers levels are stored as
+MAX_FIXED_POINT = 2**63 - 1
+
+
+def to_fixed_point(value: NumberType, decimals: int) -> int:
+    # strings are converted exactly, floats are rounded to the nearest fixed point value
+    if isinstance(value, str):
+        integer, _, fraction = value.partition('.')
+        if len(fraction) <= decimals and 'e' not in value and 'E' not in value:
+            result = int(integer + fraction.ljust(decimals, '0'))
+        else:
+            result = int((Decimal(value) * 10**decimals).to_integral_value())
+    else:
+        result = int(round(value * 10**decimals))
+
+    if not -MAX_FIXED_POINT <= result <= MAX_FIXED_POINT:
+        raise CryptoXLibException(f"Value [{value}] with {decimals} decimals does not fit into a 64-bit fixed point "
+                                  f"integer, the order book has to be created with fewer decimals.")
+
+    return result
+
+
+class CompactOrderBookSide(object):
+    # Price levels of one side of an order book stored as two sorted columns of 64-bit fixed point integers. Levels are
+    # sorted so that the best level is the last one, hence updates close to the top of the book move only a few items.
+    # Bids are stored under their price, asks under their negated price.
+    #
+    # Queries over many levels (depth at price, cumulative quantity, VWAP) are vectorized when numpy is installed.
+
+    def __init__(self, descending: bool, price_decimals: int, quantity_decimals: int) -> None:
+        # bids are ordered from the highest price, asks from the lowest one
+        self.descending = descending
+        self.price_decimals = price_decimals
+        self.quantity_decimals = quantity_decimals
+
+        self.price_factor = 10**price_decimals
+        self.quantity_factor = 10**quantity_decimals
+
+        self.keys = array('q')
+        self.quantities = array('q')
+
+    def update(self, price: NumberType, quantity: NumberType) -> None:
+        # zero quantity removes the level
+        self.update_fixed_point(to_fixed_point(price, self.price_decimals),
+                                to_fixed_point(quantity, self.quantity_decimals))
+
+    def update_fixed_point(self, price: int, quantity: int) -> None:
+        # values must be within +-MAX_FIXED_POINT
+        key = price if self.descending else -price
+        keys = self.keys
+
+        i = bisect.bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            if quantity == 0:
+                del keys[i]
+                del self.quantities[i]
+            else:
+                self.quantities[i] = quantity
+        elif quantity != 0:
+            keys.insert(i, key)
+            self.quantities.insert(i, quantity)
+
+    def replace(self, levels: Iterable) -> None:
+        # replaces all levels at once, levels are (price, quantity) pairs in any order
+        fixed_point_levels = {}
+        for price, quantity in levels:
+            quantity = to_fixed_point(quantity, self.quantity_decimals)
+            if quantity != 0:
+                price = to_fixed_point(price, self.price_decimals)
+                fixed_point_levels[price if self.descending else -price] = quantity
+
+        keys = sorted(fixed_point_levels.keys())
+        self.keys = array('q', keys)
+        self.quantities = array('q', [fixed_point_levels[key] for key in keys])
+
+    def clear(self) -> None:
+        self.keys = array('q')
+        self.quantities = array('q')
+
+    def get_best(self) -> Optional[PriceLevelType]:
+        if len(self.keys) == 0:
+            return None
+
+        return self._to_price(self.keys[-1]), self.quantities[-1] / self.quantity_factor
+
+    def get_quantity(self, price: NumberType) -> float:
+        key = self._to_key(price)
+        i = bisect.bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            return self.quantities[i] / self.quantity_factor
+
+        return 0.0
+
+    def get_levels(self, depth: int = None) -> List[PriceLevelType]:
+        # levels ordered from the best price
+        start = 0 if depth is None else max(len(self.keys) - depth, 0)
+        return [(self._to_price(key), quantity / self.quantity_factor)
+                for key, quantity in zip(reversed(self.keys[start:]), reversed(self.quantities[start:]))]
+
+    def get_quantities(self, prices: Iterable[NumberType]) -> List[float]:
+        # quantities at the given prices, 0 for prices without a level
+        keys = [self._to_key(price) for price in prices]
+        if len(self.keys) == 0:
+            return [0.0] * len(keys)
+
+        if numpy is not None:
+            # views of the columns must not outlive the call, columns can not be resized while exported
+            book_keys = numpy.frombuffer(self.keys, dtype = numpy.int64)
+            book_quantities = numpy.frombuffer(self.quantities, dtype = numpy.int64)
+            keys = numpy.array(keys, dtype = numpy.int64)
+
+            indices = numpy.minimum(numpy.searchsorted(book_keys, keys), len(book_keys) - 1)
+            quantities = numpy.where(book_keys[indices] == keys, book_quantities[indices], 0)
+
+            return (quantities / self.quantity_factor).tolist()
+
+        return [self._get_fixed_point_quantity(key) / self.quantity_factor for key in keys]
+
+    def get_depth_at_price(self, price: NumberType) -> float:
+        # total quantity of all levels at the price or better
+        i = bisect.bisect_left(self.keys, self._to_key(price))
+        if numpy is not None:
+            quantity = int(numpy.frombuffer(self.quantities, dtype = numpy.int64)[i:].sum())
+        else:
+            quantity = sum(self.quantities[i:])
+
+        return quantity / self.quantity_factor
+
+    def get_cumulative_quantities(self, depth: int = None) -> List[float]:
+        # cumulative quantity of the levels ordered from the best price
+        start = 0 if depth is None else max(len(self.keys) - depth, 0)
+        if numpy is not None:
+            quantities = numpy.frombuffer(self.quantities, dtype = numpy.int64)[start:][::-1]
+            return (numpy.cumsum(quantities) / self.quantity_factor).tolist()
+
+        return [quantity / self.quantity_factor for quantity in itertools.accumulate(reversed(self.quantities[start:]))]
+
+    def get_vwap(self, quantity: NumberType) -> Optional[float]:
+        # volume weighted average price of a market order of the quantity, None if the side is not deep enough
+        remaining = to_fixed_point(quantity, self.quantity_decimals)
+        if remaining <= 0:
+            return None
+
+        if numpy is not None:
+            quantities = numpy.frombuffer(self.quantities, dtype = numpy.int64)[::-1]
+            cumulative_quantities = numpy.cumsum(quantities)
+            # index of the level which fills the quantity
+            i = int(numpy.searchsorted(cumulative_quantities, remaining))
+            if i >= len(quantities):
+                return None
+
+            # fixed point products could overflow 64 bits, hence floats
+            prices = numpy.abs(numpy.frombuffer(self.keys, dtype = numpy.int64)[::-1][:i + 1]).astype(numpy.float64)
+            filled = quantities[:i + 1].astype(numpy.float64)
+            filled[i] = remaining - (int(cumulative_quantities[i - 1]) if i > 0 else 0)
+            notional = float(numpy.dot(prices, filled))
+        else:
+            notional = 0
+            for key, level_quantity in zip(reversed(self.keys), reversed(self.quantities)):
+                filled = min(level_quantity, remaining)
+                notional += abs(key) * filled
+                remaining -= filled
+                if remaining == 0:
+                    break
+            else:
+                return None
+
+        return notional / to_fixed_point(quantity, self.quantity_decimals) / self.price_factor
+
+    def get_memory_size(self) -> int:
+        # bytes occupied by the level columns
+        return (self.keys.buffer_info()[1] + self.quantities.buffer_info()[1]) * self.keys.itemsize
+
+    def _to_key(self, price: NumberType) -> int:
+        price = to_fixed_point(price, self.price_decimals)
+        return price if self.descending else -price
+
+    def _to_price(self, key: int) -> float:
+        return (key if self.descending else -key) / self.price_factor
+
+    def _get_fixed_point_quantity(self, key: int) -> int:
+        i = bisect.bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            return self.quantities[i]
+
+        return 0
+
+    def __len__(self):
+        return len(self.keys)
+
+
+class CompactOrderBook(object):
+    # Order book with the same interface as OrderBook storing price levels as fixed point integers in compact arrays
+    # instead of Python objects, i.e. 16 bytes per level. Prices and quantities must fit into 64-bit integers once
+    # scaled by 10^decimals, hence the decimals have to be chosen per symbol (e.g. from its tick and step size), e.g.
+    # 8 decimals limit values to 9.2e10. Values out of range raise CryptoXLibException.
+
+    def __init__(self, symbol: Any = None, *, price_decimals: int, quantity_decimals: int) -> None:
+        self.symbol = symbol
+
+        self.bids = CompactOrderBookSide(descending = True, price_decimals = price_decimals,
+                                         quantity_decimals = quantity_decimals)
+        self.asks = CompactOrderBookSide(descending = False, price_decimals = price_decimals,
+                                         quantity_decimals = quantity_decimals)
+
+        # exchange specific sequence number of the last applied update
+        self.sequence = None
+
+    @staticmethod
+    def create_factory(decimals: Dict[Any, Tuple[int, int]]) -> Callable[[Any], 'CompactOrderBook']:
+        # order_book_factory for managed order book subscriptions, decimals are (price decimals, quantity decimals)
+        # of every symbol. Symbols are looked up as they are or by their string representation, e.g. 'BTC/USDT' for
+        # a Pair.
+        def create_order_book(symbol: Any) -> CompactOrderBook:
+            symbol_decimals = decimals.get(symbol, decimals.get(str(symbol)))
+            if symbol_decimals is None:
+                raise CryptoXLibException(f"Decimals of symbol [{symbol}] are not known.")
+
+            price_decimals, quantity_decimals = symbol_decimals
+            return CompactOrderBook(symbol, price_decimals = price_decimals, quantity_decimals = quantity_decimals)
+
+        return create_order_book
+
+    def apply_snapshot(self, bids: Iterable, asks: Iterable, sequence: Any = None) -> None:
+        # bids and asks are iterables of (price, quantity) pairs, values may be strings
+        try:
+            self.bids.replace(bids)
+            self.asks.replace(asks)
+        except CryptoXLibException:
+            # do not leave the book with the new bids and the old asks
+            self.clear()
+            raise
+
+        self.sequence = sequence
+
+    def update_bids(self, bids: Iterable) -> None:
+        for price, quantity in bids:
+            self.bids.update(price, quantity)
+
+    def update_asks(self, asks: Iterable) -> None:
+        for price, quantity in asks:
+            self.asks.update(price, quantity)
+
+    def clear(self) -> None:
+        self.bids.clear()
+        self.asks.clear()
+        self.sequence = None
+
+    def get_best_bid(self) -> Optional[PriceLevelType]:
+        return self.bids.get_best()
+
+    def get_best_ask(self) -> Optional[PriceLevelType]:
+        return self.asks.get_best()
+
+    def get_mid_price(self) -> Optional[float]:
+        best_bid = self.bids.get_best()
+        best_ask = self.asks.get_best()
+        if best_bid is None or best_ask is None:
+            return None
+
+        return (best_bid[0] + best_ask[0]) / 2
+
+    def get_view(self, depth: int = None) -> OrderBookView:
+        return OrderBookView(self.symbol, self.bids.get_levels(depth), self.asks.get_levels(depth), self.sequence)
+
+    def get_memory_size(self) -> int:
+        return self.bids.get_memory_size() + self.asks.get_memory_size()
+
+    def __str__(self):
+        return f"CompactOrderBook [{self.symbol}]: best bid {self.get_best_bid()}, best ask {self.get_best_ask()}, " \
+               f"[{len(self.bids)}/{len(self.asks)}] levels, sequence [{self.sequence}]"
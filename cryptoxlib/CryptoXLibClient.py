@@ -1,19 +1,31 @@
 import asyncio
 import aiohttp
+import copy
+import functools
 import ssl
 import logging
 import datetime
-import json
 import enum
 import time
 from abc import ABC, abstractmethod
 from multidict import CIMultiDictProxy
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Any
 
 from cryptoxlib.version_conversions import async_create_task
 from cryptoxlib.Timer import Timer
 from cryptoxlib.exceptions import CryptoXLibException
-from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr
+from cryptoxlib.JsonCodec import JsonCodec, get_default_json_codec
+from cryptoxlib.IncrementalJsonDecoder import IncrementalJsonDecoder
+from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr, QueueOverflowPolicy
+from cryptoxlib.ShardingPolicy import ShardingPolicy
+from cryptoxlib.MessageDeduplicator import MessageDeduplicator, ReplicaStats
+from cryptoxlib.ReconnectPolicy import ReconnectPolicy, ExponentialBackoffReconnectPolicy
+from cryptoxlib.DnsCache import DnsCache
+from cryptoxlib.Scheduler import Scheduler
+from cryptoxlib.RestConnectionPool import RestConnectionPool
+from cryptoxlib.RateLimiter import RateLimiter, RestCallPriority
+from cryptoxlib.RestMiddleware import RestMiddleware, RestRequest
+from cryptoxlib.ResponseCache import ResponseCacheMiddleware
 
 LOG = logging.getLogger(__name__)
 
@@ -25,15 +37,74 @@ class RestCallType(enum.Enum):
     PUT = "PUT"
 
 
+class WebsocketShard(object):
+    def __init__(self, message_deduplicator: MessageDeduplicator = None):
+        # redundant websocket managers serving the same subscriptions
+        self.websocket_mgrs: List[WebsocketMgr] = []
+        self.message_deduplicator = message_deduplicator
+
+    def add_websocket_mgr(self, websocket_mgr: WebsocketMgr) -> None:
+        self.websocket_mgrs.append(websocket_mgr)
+        if self.message_deduplicator is not None:
+            self.message_deduplicator.add_replica(websocket_mgr)
+
+    def get_subscriptions(self) -> List[Subscription]:
+        return self.websocket_mgrs[0].subscriptions
+
+
 class SubscriptionSet(object):
     SUBSCRIPTION_SET_ID_SEQ = 0
 
-    def __init__(self, subscriptions: List[Subscription]):
+    def __init__(self, subscriptions: List[Subscription], message_queue_size: int = None,
+                 queue_overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+                 sharding_policy: ShardingPolicy = None, redundancy: int = 1,
+                 deduplication_window: int = MessageDeduplicator.DEFAULT_WINDOW_SIZE):
+        if redundancy < 1:
+            raise CryptoXLibException(f"Redundancy [{redundancy}] must be a positive number.")
+
         self.subscription_set_id = SubscriptionSet.SUBSCRIPTION_SET_ID_SEQ
         SubscriptionSet.SUBSCRIPTION_SET_ID_SEQ += 1
 
-        self.subscriptions: List[Subscription] = subscriptions
-        self.websocket_mgr: Optional[WebsocketMgr] = None
+        self.subscriptions: List[Subscription] = list(subscriptions)
+        self.message_queue_size = message_queue_size
+        self.queue_overflow_policy = queue_overflow_policy
+        # without sharding policy all subscriptions are served by a single shard
+        self.sharding_policy = sharding_policy
+        # number of redundant connections per shard, messages are delivered from the connection they arrive first.
+        # Subscriptions are shared by the redundant connections and hence initialized by each of them.
+        self.redundancy = redundancy
+        self.deduplication_window = deduplication_window
+        self.shards: List[WebsocketShard] = []
+
+    @property
+    def websocket_mgrs(self) -> List[WebsocketMgr]:
+        return [websocket_mgr for shard in self.shards for websocket_mgr in shard.websocket_mgrs]
+
+    @property
+    def websocket_mgr(self) -> Optional[WebsocketMgr]:
+        if len(self.shards) > 0:
+            return self.shards[0].websocket_mgrs[0]
+
+        return None
+
+    def create_shard(self) -> WebsocketShard:
+        if self.redundancy > 1:
+            shard = WebsocketShard(MessageDeduplicator(self.deduplication_window))
+        else:
+            shard = WebsocketShard()
+        self.shards.append(shard)
+
+        return shard
+
+    def get_deduplication_stats(self) -> List[List[ReplicaStats]]:
+        # per shard statistics of the redundant connections
+        return [shard.message_deduplicator.get_stats() for shard in self.shards if shard.message_deduplicator is not None]
+
+    def split_subscriptions(self) -> List[List[Subscription]]:
+        if self.sharding_policy is None:
+            return [self.subscriptions]
+
+        return self.sharding_policy.split(self.subscriptions)
 
     def find_subscription(self, subscription: Subscription) -> Optional[Subscription]:
         for s in self.subscriptions:
@@ -44,11 +115,47 @@ class SubscriptionSet(object):
 
 
 class CryptoXLibClient(ABC):
+    DEFAULT_MAX_CONCURRENT_BULK_REST_CALLS = 20
+
+    # endpoint path relative to the REST API URI -> time to live of cached responses in seconds, see enable_response_cache
+    RESPONSE_CACHE_TTLS_SEC: Dict[str, float] = {}
+
     def __init__(self, api_trace_log: bool = False, ssl_context: ssl.SSLContext = None) -> None:
         self.api_trace_log = api_trace_log
 
         self.rest_session = None
+        # pool of REST connections, can be shared with other clients. If not set before the first REST call,
+        # a private pool is created
+        self.rest_connection_pool: Optional[RestConnectionPool] = None
+        # critical calls (order placement and cancellation) have their own session and connection pool so that they
+        # never wait for a connection occupied by other calls
+        self.critical_rest_session = None
+        self.critical_rest_connection_pool: Optional[RestConnectionPool] = None
+        # max number of bulk calls in progress, the remaining connections of the pool are left for normal calls
+        self.max_concurrent_bulk_rest_calls = CryptoXLibClient.DEFAULT_MAX_CONCURRENT_BULK_REST_CALLS
+        self.bulk_rest_call_semaphore: Optional[asyncio.Semaphore] = None
+        # client side rate limiter declared by the exchange, can be shared with other clients using the same limits
+        self.rate_limiter: Optional[RateLimiter] = None
+        # middlewares wrapping every REST call, e.g. retries or hedging
+        self.rest_middlewares: List[RestMiddleware] = []
         self.subscription_sets: Dict[int, SubscriptionSet] = {}
+        # tasks of all running websocket managers, including those started after start_websockets was invoked
+        self.websocket_tasks: List[asyncio.Task] = []
+        self.websocket_tasks_updated: Optional[asyncio.Event] = None
+
+        # codec used to decode REST responses and all websocket traffic, can be replaced before the first call
+        self.json_codec: JsonCodec = get_default_json_codec()
+        # REST responses larger than the threshold (in bytes) are decoded incrementally without blocking the event loop,
+        # disabled if not set
+        self.incremental_json_threshold: Optional[int] = None
+        self.incremental_json_decoder = IncrementalJsonDecoder()
+
+        # template of the reconnection policy, every websocket manager obtains its own copy
+        self.reconnect_policy: ReconnectPolicy = ExponentialBackoffReconnectPolicy()
+        # resolved websocket hosts shared by all websocket managers so that reconnections skip the DNS lookup
+        self.dns_cache = DnsCache()
+        # scheduler of pings, listen key refreshes and other periodic processing of all websocket managers
+        self.scheduler = Scheduler()
 
         if ssl_context is not None:
             self.ssl_context = ssl_context
@@ -60,7 +167,9 @@ class CryptoXLibClient(ABC):
         pass
 
     @abstractmethod
-    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> None:
+    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> Optional[bytes]:
+        # Signs the request by modifying data, params or headers. If the signature covers the serialized data, the
+        # serialized data can be returned and are sent as the request body instead of serializing the data again.
         pass
 
     @abstractmethod
@@ -73,28 +182,72 @@ class CryptoXLibClient(ABC):
         pass
 
     async def close(self) -> None:
-        session = self._get_rest_session()
-        if session is not None:
-            await session.close()
+        if self.rest_session is not None:
+            await self.rest_session.close()
+            self.rest_session = None
+            await self.rest_connection_pool.release()
+
+        if self.critical_rest_session is not None:
+            await self.critical_rest_session.close()
+            self.critical_rest_session = None
+            await self.critical_rest_connection_pool.release()
+
+    def add_rest_middleware(self, middleware: RestMiddleware) -> None:
+        # middlewares are applied in the order they are added, i.e. the first one added is the outermost one
+        self.rest_middlewares.append(middleware)
+
+    def enable_response_cache(self, ttls_sec: Dict[str, float] = None,
+                              max_entries: int = ResponseCacheMiddleware.DEFAULT_MAX_ENTRIES) -> ResponseCacheMiddleware:
+        # caches responses of slow-changing public endpoints, by default those declared by the exchange. The returned
+        # cache can be used for invalidation, persistence and statistics
+        response_cache = ResponseCacheMiddleware(ttls_sec if ttls_sec is not None else self.RESPONSE_CACHE_TTLS_SEC,
+                                                 max_entries, self.json_codec)
+        self.add_rest_middleware(response_cache)
+
+        return response_cache
+
+    def get_rate_limit_budget(self, priority: RestCallPriority = None) -> Dict[str, int]:
+        # remaining capacity of every rate limit (available to calls of the priority if provided), empty if the client
+        # does not limit its requests
+        if self.rate_limiter is None:
+            return {}
+
+        return self.rate_limiter.get_budget(priority)
+
+    async def prewarm_rest_connections(self, connection_count: int, priority: RestCallPriority = RestCallPriority.NORMAL) -> None:
+        # Opens connections to the REST API in advance so that the first calls do not pay for TCP and TLS handshakes.
+        # The connections are kept in the pool for the pool's keepalive timeout.
+        session = self._get_rest_session(priority)
+        resource_uri = self._get_rest_api_uri()
+
+        async def prewarm_connection():
+            async with session.head(resource_uri, ssl = self.ssl_context) as response:
+                await response.read()
+
+        results = await asyncio.gather(*[prewarm_connection() for _ in range(connection_count)], return_exceptions = True)
+        failed_count = sum(1 for result in results if isinstance(result, Exception))
+        if failed_count > 0:
+            LOG.warning(f"{failed_count} out of {connection_count} REST connections could not be prewarmed.")
 
     async def _create_get(self, resource: str, params: dict = None, headers: dict = None, signed: bool = False,
-                          api_variable_path: str = None) -> dict:
-        return await self._create_rest_call(RestCallType.GET, resource, None, params, headers, signed, api_variable_path)
+                          api_variable_path: str = None, priority: RestCallPriority = None, raw: bool = False) -> dict:
+        return await self._create_rest_call(RestCallType.GET, resource, None, params, headers, signed, api_variable_path, priority, raw)
 
     async def _create_post(self, resource: str, data: dict = None, params: dict = None, headers: dict = None, signed: bool = False,
-                           api_variable_path: str = None) -> dict:
-        return await self._create_rest_call(RestCallType.POST, resource, data, params, headers, signed, api_variable_path)
+                           api_variable_path: str = None, priority: RestCallPriority = None, raw: bool = False) -> dict:
+        return await self._create_rest_call(RestCallType.POST, resource, data, params, headers, signed, api_variable_path, priority, raw)
 
     async def _create_delete(self, resource: str, data:dict = None,  params: dict = None, headers: dict = None, signed: bool = False,
-                             api_variable_path: str = None) -> dict:
-        return await self._create_rest_call(RestCallType.DELETE, resource, data, params, headers, signed, api_variable_path)
+                             api_variable_path: str = None, priority: RestCallPriority = None) -> dict:
+        return await self._create_rest_call(RestCallType.DELETE, resource, data, params, headers, signed, api_variable_path, priority)
 
     async def _create_put(self, resource: str, data: dict = None, params: dict = None, headers: dict = None, signed: bool = False,
-                          api_variable_path: str = None) -> dict:
-        return await self._create_rest_call(RestCallType.PUT, resource, data, params, headers, signed, api_variable_path)
+                          api_variable_path: str = None, priority: RestCallPriority = None) -> dict:
+        return await self._create_rest_call(RestCallType.PUT, resource, data, params, headers, signed, api_variable_path, priority)
 
     async def _create_rest_call(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None, signed: bool = False,
-                                api_variable_path: str = None) -> dict:
+                                api_variable_path: str = None, priority: RestCallPriority = None, raw: bool = False) -> dict:
+        # in raw mode the response body is returned as undecoded bytes
         with Timer('RestCall'):
             # ensure headers & params are always valid objects
             if headers is None:
@@ -102,54 +255,152 @@ class CryptoXLibClient(ABC):
             if params is None:
                 params = {}
 
-            # add signature into the parameters
-            if signed:
-                self._sign_payload(rest_call_type, resource, data, params, headers)
-
-            resource_uri = self._get_rest_api_uri()
-            if api_variable_path is not None:
-                resource_uri += api_variable_path
-            resource_uri += resource
-
-            if rest_call_type == RestCallType.GET:
-                rest_call = self._get_rest_session().get(resource_uri, json = data, params = params, headers = headers, ssl = self.ssl_context)
-            elif rest_call_type == RestCallType.POST:
-                rest_call = self._get_rest_session().post(resource_uri, json = data, params = params, headers = headers, ssl = self.ssl_context)
-            elif rest_call_type == RestCallType.DELETE:
-                rest_call = self._get_rest_session().delete(resource_uri, json = data, params = params, headers = headers, ssl = self.ssl_context)
-            elif rest_call_type == RestCallType.PUT:
-                rest_call = self._get_rest_session().put(resource_uri, json = data, params = params, headers = headers, ssl = self.ssl_context)
+            if priority is None:
+                if self.rate_limiter is not None:
+                    path = resource if api_variable_path is None else api_variable_path + resource
+                    priority = self.rate_limiter.get_request_priority(rest_call_type, path)
+                else:
+                    priority = RestCallPriority.NORMAL
+
+            request = RestRequest(rest_call_type, resource, data, params, headers, signed, api_variable_path, priority, raw)
+
+            # the first middleware is the outermost one
+            handler = self._execute_rest_request
+            for middleware in reversed(self.rest_middlewares):
+                handler = functools.partial(middleware.process, next_handler = handler)
+
+            response = await handler(request)
+
+            if raw:
+                self._preprocess_raw_rest_response(response['status_code'], response['headers'], response['response'])
             else:
-                raise Exception(f"Unsupported REST call type {rest_call_type}.")
+                self._preprocess_rest_response(response['status_code'], response['headers'], response['response'])
+
+            return response
+
+    async def _execute_rest_request(self, request: RestRequest) -> dict:
+        # signing modifies the payload, hence every attempt (e.g. a retry) signs its own copy
+        data = copy.copy(request.data)
+        params = dict(request.params)
+        headers = dict(request.headers)
+
+        # wait until the request fits into the rate limits, the request is signed only afterwards so that
+        # its timestamp is not delayed
+        consumed_totals = None
+        if self.rate_limiter is not None:
+            consumed_totals = await self.rate_limiter.acquire(
+                self.rate_limiter.get_request_cost(request.rest_call_type, request.path, params), request.priority)
+
+        # add signature into the parameters
+        serialized_data = None
+        if request.signed:
+            serialized_data = self._sign_payload(request.rest_call_type, request.resource, data, params, headers)
+
+        resource_uri = self._get_rest_api_uri()
+        if request.api_variable_path is not None:
+            resource_uri += request.api_variable_path
+        resource_uri += request.resource
+
+        session = self._get_rest_session(request.priority)
+        if request.priority == RestCallPriority.BULK:
+            # bulk calls must not occupy all connections of the pool shared with normal calls
+            async with self._get_bulk_rest_call_semaphore():
+                response = await self._send_rest_call(session, request.rest_call_type, resource_uri, data, params, headers, request.raw, serialized_data)
+        else:
+            response = await self._send_rest_call(session, request.rest_call_type, resource_uri, data, params, headers, request.raw, serialized_data)
 
-            LOG.debug(f"> rest type [{rest_call_type.name}], uri [{resource_uri}], params [{params}], headers [{headers}], data [{data}]")
-            async with rest_call as response:
-                status_code = response.status
-                headers = response.headers
-                body = await response.text()
+        # usage reported by the exchange, synchronized here as only this attempt knows which requests preceded it
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_headers(response['headers'], consumed_totals)
 
-                LOG.debug(f"<: status [{status_code}], response [{body}]")
+        return response
 
-                if len(body) > 0:
-                    try:
-                        body = json.loads(body)
-                    except json.JSONDecodeError:
-                        body = {
-                            "raw": body
-                        }
+    async def _send_rest_call(self, session: aiohttp.ClientSession, rest_call_type: RestCallType, resource_uri: str,
+                              data: Optional[dict], params: dict, headers: dict, raw: bool = False, serialized_data: bytes = None) -> dict:
+        # data already serialized during signing are sent as they are
+        if serialized_data is not None:
+            headers.setdefault('Content-Type', 'application/json')
+            payload = {'data': serialized_data}
+        else:
+            payload = {'json': data}
+
+        if rest_call_type == RestCallType.GET:
+            rest_call = session.get(resource_uri, params = params, headers = headers, ssl = self.ssl_context, **payload)
+        elif rest_call_type == RestCallType.POST:
+            rest_call = session.post(resource_uri, params = params, headers = headers, ssl = self.ssl_context, **payload)
+        elif rest_call_type == RestCallType.DELETE:
+            rest_call = session.delete(resource_uri, params = params, headers = headers, ssl = self.ssl_context, **payload)
+        elif rest_call_type == RestCallType.PUT:
+            rest_call = session.put(resource_uri, params = params, headers = headers, ssl = self.ssl_context, **payload)
+        else:
+            raise Exception(f"Unsupported REST call type {rest_call_type}.")
+
+        LOG.debug("> rest type [%s], uri [%s], params [%s], headers [%s], data [%s]", rest_call_type.name, resource_uri, params, headers, data)
+        async with rest_call as response:
+            status_code = response.status
+            headers = response.headers
+            body = await response.read()
+
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug("<: status [%s], response [%s]", status_code, body.decode('utf-8', 'replace'))
+
+            if not raw:
+                if self.incremental_json_threshold is not None and len(body) > self.incremental_json_threshold:
+                    body = await self._decode_rest_response_body_incrementally(body)
+                else:
+                    body = self._decode_rest_response_body(body)
+
+            return {
+                "status_code": status_code,
+                "headers": headers,
+                "response": body
+            }
+
+    def _decode_rest_response_body(self, body: bytes) -> Any:
+        if len(body) == 0:
+            return ""
+
+        try:
+            return self.json_codec.loads(body)
+        except ValueError:
+            return {
+                "raw": body.decode('utf-8', errors = 'replace')
+            }
+
+    async def _decode_rest_response_body_incrementally(self, body: bytes) -> Any:
+        try:
+            return await self.incremental_json_decoder.decode(body)
+        except ValueError:
+            return {
+                "raw": body.decode('utf-8', errors = 'replace')
+            }
+
+    def _preprocess_raw_rest_response(self, status_code: int, headers: 'CIMultiDictProxy[str]', body: bytes) -> None:
+        # Error responses are decoded so that the usual exchange exceptions are raised. Successful responses are passed
+        # undecoded as None, exchanges reporting errors within successful responses have to override this method.
+        if str(status_code)[0] != '2':
+            self._preprocess_rest_response(status_code, headers, self._decode_rest_response_body(body))
+        else:
+            self._preprocess_rest_response(status_code, headers, None)
 
-                self._preprocess_rest_response(status_code, headers, body)
+    def _get_rest_session(self, priority: RestCallPriority = RestCallPriority.NORMAL) -> aiohttp.ClientSession:
+        # critical calls use their own session with dedicated connections, normal and bulk calls share the other one
+        if priority == RestCallPriority.CRITICAL:
+            if self.critical_rest_session is None:
+                if self.critical_rest_connection_pool is None:
+                    self.critical_rest_connection_pool = RestConnectionPool(ssl_context = self.ssl_context)
+                self.critical_rest_session = self._create_rest_session(self.critical_rest_connection_pool)
 
-                return {
-                    "status_code": status_code,
-                    "headers": headers,
-                    "response": body
-                }
+            return self.critical_rest_session
 
-    def _get_rest_session(self) -> aiohttp.ClientSession:
-        if self.rest_session is not None:
-            return self.rest_session
+        if self.rest_session is None:
+            if self.rest_connection_pool is None:
+                self.rest_connection_pool = RestConnectionPool(ssl_context = self.ssl_context)
+            self.rest_session = self._create_rest_session(self.rest_connection_pool)
+
+        return self.rest_session
 
+    def _create_rest_session(self, connection_pool: RestConnectionPool) -> aiohttp.ClientSession:
         if self.api_trace_log:
             trace_config = aiohttp.TraceConfig()
             trace_config.on_request_start.append(CryptoXLibClient._on_request_start)
@@ -158,9 +409,16 @@ class CryptoXLibClient(ABC):
         else:
             trace_configs = None
 
-        self.rest_session = aiohttp.ClientSession(trace_configs=trace_configs)
+        return aiohttp.ClientSession(connector = connection_pool.acquire(),
+                                     connector_owner = False,
+                                     trace_configs = trace_configs)
 
-        return self.rest_session
+    def _get_bulk_rest_call_semaphore(self) -> asyncio.Semaphore:
+        # semaphore is created lazily in order to be bound to the running event loop
+        if self.bulk_rest_call_semaphore is None:
+            self.bulk_rest_call_semaphore = asyncio.Semaphore(self.max_concurrent_bulk_rest_calls)
+
+        return self.bulk_rest_call_semaphore
 
     @staticmethod
     def _clean_request_params(params: dict) -> dict:
@@ -173,13 +431,13 @@ class CryptoXLibClient(ABC):
 
     @staticmethod
     async def _on_request_start(session, trace_config_ctx, params) -> None:
-        LOG.debug(f"> Context: {trace_config_ctx}")
-        LOG.debug(f"> Params: {params}")
+        LOG.debug("> Context: %s", trace_config_ctx)
+        LOG.debug("> Params: %s", params)
 
     @staticmethod
     async def _on_request_end(session, trace_config_ctx, params) -> None:
-        LOG.debug(f"< Context: {trace_config_ctx}")
-        LOG.debug(f"< Params: {params}")
+        LOG.debug("< Context: %s", trace_config_ctx)
+        LOG.debug("< Params: %s", params)
 
     @staticmethod
     def _get_current_timestamp_ms() -> int:
@@ -189,14 +447,55 @@ class CryptoXLibClient(ABC):
     def _get_unix_timestamp_ns() -> int:
         return int(time.time_ns() * 10**9)
 
-    def compose_subscriptions(self, subscriptions: List[Subscription]) -> int:
-        subscription_set = SubscriptionSet(subscriptions = subscriptions)
+    def compose_subscriptions(self, subscriptions: List[Subscription], message_queue_size: int = None,
+                              queue_overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK,
+                              sharding_policy: ShardingPolicy = None, redundancy: int = 1,
+                              deduplication_window: int = MessageDeduplicator.DEFAULT_WINDOW_SIZE) -> int:
+        subscription_set = SubscriptionSet(subscriptions = subscriptions,
+                                           message_queue_size = message_queue_size,
+                                           queue_overflow_policy = queue_overflow_policy,
+                                           sharding_policy = sharding_policy,
+                                           redundancy = redundancy,
+                                           deduplication_window = deduplication_window)
         self.subscription_sets[subscription_set.subscription_set_id] = subscription_set
 
         return subscription_set.subscription_set_id
 
     async def add_subscriptions(self, subscription_set_id: int, subscriptions: List[Subscription]) -> None:
-        await self.subscription_sets[subscription_set_id].websocket_mgr.subscribe(subscriptions)
+        subscription_set = self.subscription_sets[subscription_set_id]
+        subscription_set.subscriptions += subscriptions
+
+        # websockets not started yet, subscriptions will be distributed when started
+        if len(subscription_set.shards) == 0:
+            return
+
+        if subscription_set.sharding_policy is None:
+            await self._subscribe_shard(subscription_set.shards[0], subscriptions)
+            return
+
+        # subscriptions are added to the running shards with enough capacity, the rest is distributed into new shards
+        shards = [list(shard.get_subscriptions()) for shard in subscription_set.shards]
+        new_subscriptions = {}
+        overflow_subscriptions = []
+        for subscription in subscriptions:
+            shard_id = subscription_set.sharding_policy.find_shard(shards, subscription)
+            if shard_id is not None:
+                shards[shard_id].append(subscription)
+                new_subscriptions.setdefault(shard_id, []).append(subscription)
+            else:
+                overflow_subscriptions.append(subscription)
+
+        for shard_id, shard_subscriptions in new_subscriptions.items():
+            await self._subscribe_shard(subscription_set.shards[shard_id], shard_subscriptions)
+
+        for shard_subscriptions in subscription_set.sharding_policy.split(overflow_subscriptions):
+            LOG.info(f"New websocket shard with {len(shard_subscriptions)} subscriptions created.")
+            self._start_shard(subscription_set, shard_subscriptions, 0, 0)
+
+    @staticmethod
+    async def _subscribe_shard(shard: WebsocketShard, subscriptions: List[Subscription]) -> None:
+        for websocket_mgr in shard.websocket_mgrs:
+            await websocket_mgr.subscribe(subscriptions)
 
     async def unsubscribe_subscriptions(self, subscriptions: List[Subscription]) -> None:
         for subscription in subscriptions:
@@ -204,11 +503,20 @@ class CryptoXLibClient(ABC):
             for id, subscription_set in self.subscription_sets.items():
                 if subscription_set.find_subscription(subscription) is not None:
                     subscription_found = True
-                    await subscription_set.websocket_mgr.unsubscribe(subscriptions)
 
             if not subscription_found:
                 raise CryptoXLibException(f"No active subscription {subscription.subscription_id} found.")
 
+        for id, subscription_set in self.subscription_sets.items():
+            subscription_set.subscriptions = [subscription for subscription in subscription_set.subscriptions
+                                              if subscription not in subscriptions]
+
+            for websocket_mgr in subscription_set.websocket_mgrs:
+                mgr_subscriptions = [subscription for subscription in subscriptions
+                                     if subscription in websocket_mgr.subscriptions]
+                if len(mgr_subscriptions) > 0:
+                    await websocket_mgr.unsubscribe(mgr_subscriptions)
+
     async def unsubscribe_subscription_set(self, subscription_set_id: int) -> None:
         return await self.unsubscribe_subscriptions(self.subscription_sets[subscription_set_id].subscriptions)
 
@@ -220,31 +528,76 @@ class CryptoXLibClient(ABC):
         if len(self.subscription_sets) < 1:
             raise CryptoXLibException("ERROR: There are no subscriptions to be started.")
 
-        tasks = []
+        self.websocket_tasks = []
+        self.websocket_tasks_updated = asyncio.Event()
+
         startup_delay_ms = 0
         for id, subscription_set in self.subscription_sets.items():
-            subscription_set.websocket_mgr = self._get_websocket_mgr(subscription_set.subscriptions, startup_delay_ms, self.ssl_context)
-            tasks.append(async_create_task(
-                subscription_set.websocket_mgr.run())
-            )
-            startup_delay_ms += websocket_start_time_interval_ms
-
-        done, pending = await asyncio.wait(tasks, return_when = asyncio.FIRST_EXCEPTION)
-        for task in done:
-            try:
-                task.result()
-            except Exception as e:
-                LOG.error(f"Unrecoverable exception occurred while processing messages: {e}")
-                LOG.info(f"Remaining websocket managers scheduled for shutdown.")
-
-                await self.shutdown_websockets()
-
-                if len(pending) > 0:
-                    await asyncio.wait(pending, return_when = asyncio.ALL_COMPLETED)
-
-                LOG.info("All websocket managers shut down.")
-                raise
+            for shard_subscriptions in subscription_set.split_subscriptions():
+                self._start_shard(subscription_set, shard_subscriptions, startup_delay_ms, websocket_start_time_interval_ms)
+                startup_delay_ms += websocket_start_time_interval_ms * subscription_set.redundancy
+
+        # wait until all websocket managers finish or any of them fails. Managers started in the meantime (e.g. new
+        # shards) are waited for as well
+        tasks_updated = None
+        try:
+            while len(self.websocket_tasks) > 0:
+                self.websocket_tasks_updated.clear()
+                tasks_updated = async_create_task(self.websocket_tasks_updated.wait())
+
+                done, pending = await asyncio.wait(self.websocket_tasks + [tasks_updated],
+                                                   return_when = asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task is tasks_updated:
+                        continue
+
+                    self.websocket_tasks.remove(task)
+                    try:
+                        task.result()
+                    except Exception as e:
+                        LOG.error(f"Unrecoverable exception occurred while processing messages: {e}")
+                        LOG.info(f"Remaining websocket managers scheduled for shutdown.")
+
+                        await self.shutdown_websockets()
+
+                        if len(self.websocket_tasks) > 0:
+                            await asyncio.wait(self.websocket_tasks, return_when = asyncio.ALL_COMPLETED)
+
+                        LOG.info("All websocket managers shut down.")
+                        raise
+        finally:
+            if tasks_updated is not None and not tasks_updated.done():
+                tasks_updated.cancel()
+
+    def _start_shard(self, subscription_set: SubscriptionSet, subscriptions: List[Subscription],
+                     startup_delay_ms: int, websocket_start_time_interval_ms: int) -> WebsocketShard:
+        shard = subscription_set.create_shard()
+        for i in range(subscription_set.redundancy):
+            # every replica works with its own copy of the subscription list
+            websocket_mgr = self._create_websocket_mgr(subscription_set, list(subscriptions),
+                                                       startup_delay_ms + i * websocket_start_time_interval_ms)
+            shard.add_websocket_mgr(websocket_mgr)
+
+            self.websocket_tasks.append(async_create_task(websocket_mgr.run()))
+
+        if self.websocket_tasks_updated is not None:
+            self.websocket_tasks_updated.set()
+
+        return shard
+
+    def _create_websocket_mgr(self, subscription_set: SubscriptionSet, subscriptions: List[Subscription],
+                              startup_delay_ms: int) -> WebsocketMgr:
+        websocket_mgr = self._get_websocket_mgr(subscriptions, startup_delay_ms, self.ssl_context)
+        websocket_mgr.startup_delay_ms = startup_delay_ms
+        websocket_mgr.json_codec = self.json_codec
+        websocket_mgr.reconnect_policy = self.reconnect_policy.clone()
+        websocket_mgr.dns_cache = self.dns_cache
+        websocket_mgr.scheduler = self.scheduler
+        websocket_mgr.configure_message_queue(subscription_set.message_queue_size, subscription_set.queue_overflow_policy)
+
+        return websocket_mgr
 
     async def shutdown_websockets(self):
         for id, subscription_set in self.subscription_sets.items():
-            await subscription_set.websocket_mgr.shutdown()
+            for websocket_mgr in subscription_set.websocket_mgrs:
+                await websocket_mgr.shutdown()
@@ -0,0 +1,33 @@
+import asyncio
+import logging
+import socket
+import time
+from typing import Dict, Tuple
+
+LOG = logging.getLogger(__name__)
+
+
+class DnsCache(object):
+    DEFAULT_TTL_SEC = 300
+
+    def __init__(self, ttl_sec: float = DEFAULT_TTL_SEC) -> None:
+        self.ttl_sec = ttl_sec
+
+        # (host, port) -> (address, expiration time)
+        self.entries: Dict[Tuple[str, int], Tuple[str, float]] = {}
+
+    async def resolve(self, host: str, port: int) -> str:
+        entry = self.entries.get((host, port))
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+
+        addresses = await asyncio.get_event_loop().getaddrinfo(host, port, type = socket.SOCK_STREAM)
+        address = addresses[0][4][0]
+        LOG.debug("Host %s resolved to %s.", host, address)
+
+        self.entries[(host, port)] = (address, time.monotonic() + self.ttl_sec)
+
+        return address
+
+    def invalidate(self, host: str, port: int) -> None:
+        self.entries.pop((host, port), None)
@@ -0,0 +1,32 @@
+import hmac
+from typing import Union, Callable, Optional
+
+
+class HmacSigner(object):
+    # HMAC signer keyed once per secret key. Every signature starts from a copy of the keyed state instead of encoding
+    # the key and hashing the padded key anew.
+
+    def __init__(self, sec_key: Optional[str], digestmod: Callable) -> None:
+        self.sec_key = sec_key
+        self.digestmod = digestmod
+
+        # created lazily so that clients without a secret key can be constructed
+        self.keyed_hmac: Optional[hmac.HMAC] = None
+
+    def sign(self, message: Union[str, bytes]) -> hmac.HMAC:
+        if self.keyed_hmac is None:
+            self.keyed_hmac = hmac.new(self.sec_key.encode('utf-8'), digestmod = self.digestmod)
+
+        if isinstance(message, str):
+            message = message.encode('utf-8')
+
+        signature = self.keyed_hmac.copy()
+        signature.update(message)
+
+        return signature
+
+    def hexdigest(self, message: Union[str, bytes]) -> str:
+        return self.sign(message).hexdigest()
+
+    def digest(self, message: Union[str, bytes]) -> bytes:
+        return self.sign(message).digest()
@@ -0,0 +1,132 @@
+import asyncio
+import codecs
+import json
+import time
+from typing import Any, Tuple
+
+from cryptoxlib.JsonCodec import JsonInputType
+
+# JSON whitespace matcher of the stdlib decoder
+WHITESPACE = json.decoder.WHITESPACE
+
+
+class IncrementalJsonDecoder(object):
+    # Decodes large JSON documents without blocking the event loop. Containers up to max_depth levels deep (e.g.
+    # the top-level object and the list of symbols in binance exchange info) are walked element by element, deeper
+    # values are decoded in one go by the stdlib decoder. Whenever decoding takes longer than the time slice,
+    # the decoder yields to the event loop so that other tasks (e.g. websocket receivers) are not stalled.
+    #
+    # Decoding in a thread would not help since the GIL is held for the whole json.loads call, decoding in a process
+    # pool would stall the loop while unpickling the result.
+
+    DEFAULT_MAX_DEPTH = 2
+    DEFAULT_TIME_SLICE_MS = 0.5
+    # bytes are converted to text in chunks, each of them takes well below the time slice
+    TEXT_CHUNK_SIZE = 128 * 1024
+
+    def __init__(self, max_depth: int = DEFAULT_MAX_DEPTH, time_slice_ms: float = DEFAULT_TIME_SLICE_MS) -> None:
+        self.max_depth = max_depth
+        self.time_slice_ns = int(time_slice_ms * 10**6)
+
+        self.decoder = json.JSONDecoder()
+
+    async def decode(self, data: JsonInputType) -> Any:
+        if not isinstance(data, str):
+            data = await self._decode_text(data)
+
+        decoding = _Decoding(self, data)
+        idx = WHITESPACE.match(data, 0).end()
+        value, idx = await decoding.decode_value(idx, 0)
+
+        idx = WHITESPACE.match(data, idx).end()
+        if idx != len(data):
+            raise json.JSONDecodeError("Extra data", data, idx)
+
+        return value
+
+    async def _decode_text(self, data: JsonInputType) -> str:
+        if len(data) <= IncrementalJsonDecoder.TEXT_CHUNK_SIZE:
+            return bytes(data).decode('utf-8')
+
+        data = memoryview(data)
+        text_decoder = codecs.getincrementaldecoder('utf-8')()
+        chunks = []
+        for i in range(0, len(data), IncrementalJsonDecoder.TEXT_CHUNK_SIZE):
+            chunks.append(text_decoder.decode(data[i:i + IncrementalJsonDecoder.TEXT_CHUNK_SIZE]))
+            await asyncio.sleep(0)
+        chunks.append(text_decoder.decode(b'', final = True))
+
+        return ''.join(chunks)
+
+
+class _Decoding(object):
+    # state of a single decode call so that concurrent calls can share the decoder
+
+    def __init__(self, incremental_decoder: IncrementalJsonDecoder, text: str) -> None:
+        self.incremental_decoder = incremental_decoder
+        self.text = text
+        self.slice_start_ns = time.perf_counter_ns()
+
+    async def decode_value(self, idx: int, depth: int) -> Tuple[Any, int]:
+        if depth < self.incremental_decoder.max_depth:
+            char = self.text[idx:idx + 1]
+            if char == '[':
+                return await self.decode_array(idx + 1, depth)
+            elif char == '{':
+                return await self.decode_object(idx + 1, depth)
+
+        if time.perf_counter_ns() - self.slice_start_ns > self.incremental_decoder.time_slice_ns:
+            await asyncio.sleep(0)
+            self.slice_start_ns = time.perf_counter_ns()
+
+        return self.incremental_decoder.decoder.raw_decode(self.text, idx)
+
+    async def decode_array(self, idx: int, depth: int) -> Tuple[list, int]:
+        text = self.text
+        result = []
+
+        idx = WHITESPACE.match(text, idx).end()
+        if text[idx:idx + 1] == ']':
+            return result, idx + 1
+
+        while True:
+            value, idx = await self.decode_value(idx, depth + 1)
+            result.append(value)
+
+            idx = WHITESPACE.match(text, idx).end()
+            char = text[idx:idx + 1]
+            if char == ']':
+                return result, idx + 1
+            elif char != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, idx)
+
+            idx = WHITESPACE.match(text, idx + 1).end()
+
+    async def decode_object(self, idx: int, depth: int) -> Tuple[dict, int]:
+        text = self.text
+        result = {}
+
+        idx = WHITESPACE.match(text, idx).end()
+        if text[idx:idx + 1] == '}':
+            return result, idx + 1
+
+        while True:
+            if text[idx:idx + 1] != '"':
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, idx)
+            key, idx = json.decoder.scanstring(text, idx + 1)
+
+            idx = WHITESPACE.match(text, idx).end()
+            if text[idx:idx + 1] != ':':
+                raise json.JSONDecodeError("Expecting ':' delimiter", text, idx)
+            idx = WHITESPACE.match(text, idx + 1).end()
+
+            result[key], idx = await self.decode_value(idx, depth + 1)
+
+            idx = WHITESPACE.match(text, idx).end()
+            char = text[idx:idx + 1]
+            if char == '}':
+                return result, idx + 1
+            elif char != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, idx)
+
+            idx = WHITESPACE.match(text, idx + 1).end()
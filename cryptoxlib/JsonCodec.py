@@ -0,0 +1,136 @@
+import json
+import logging
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+from cryptoxlib.exceptions import CryptoXLibException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import rapidjson
+except ImportError:
+    rapidjson = None
+
+LOG = logging.getLogger(__name__)
+
+JsonInputType = Union[str, bytes, bytearray, memoryview]
+
+
+class JsonCodec(ABC):
+    # Decoding errors of all codecs are subclasses of ValueError.
+
+    @abstractmethod
+    def loads(self, data: JsonInputType) -> Any:
+        pass
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        pass
+
+
+class StdlibJsonCodec(JsonCodec):
+    def loads(self, data: JsonInputType) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JsonCodec):
+    # orjson rejects NaN, Infinity and numbers out of the double range which stdlib json accepts, such documents are
+    # decoded by stdlib json instead so that a single frame does not stop a websocket. Invalid documents still raise
+    # ValueError.
+    #
+    # orjson decodes integers out of the 64-bit range as floats, i.e. with lost precision. With exact_big_integers set,
+    # documents containing a run of 20 or more digits are decoded by stdlib json keeping the exact integers, at the cost
+    # of scanning every document.
+
+    # 20 digits may exceed the unsigned 64-bit range
+    BIG_INTEGER_PATTERN = re.compile(r'\d{20}')
+    BIG_INTEGER_BYTES_PATTERN = re.compile(rb'\d{20}')
+
+    def __init__(self, exact_big_integers: bool = False):
+        if orjson is None:
+            raise CryptoXLibException("orjson codec requested but orjson is not installed.")
+
+        self.exact_big_integers = exact_big_integers
+        self.fallback_codec = StdlibJsonCodec()
+
+    def loads(self, data: JsonInputType) -> Any:
+        if self.exact_big_integers and self._contains_big_integer(data):
+            return self.fallback_codec.loads(data)
+
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return self.fallback_codec.loads(data)
+
+    def _contains_big_integer(self, data: JsonInputType) -> bool:
+        if isinstance(data, str):
+            return OrjsonCodec.BIG_INTEGER_PATTERN.search(data) is not None
+
+        return OrjsonCodec.BIG_INTEGER_BYTES_PATTERN.search(data) is not None
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj, option = orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+
+class UjsonCodec(JsonCodec):
+    def __init__(self):
+        if ujson is None:
+            raise CryptoXLibException("ujson codec requested but ujson is not installed.")
+
+    def loads(self, data: JsonInputType) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+
+        return ujson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return ujson.dumps(obj, escape_forward_slashes = False)
+
+
+class RapidjsonCodec(JsonCodec):
+    def __init__(self):
+        if rapidjson is None:
+            raise CryptoXLibException("rapidjson codec requested but python-rapidjson is not installed.")
+
+    def loads(self, data: JsonInputType) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+
+        return rapidjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return rapidjson.dumps(obj)
+
+
+DEFAULT_JSON_CODEC = None
+
+
+def get_default_json_codec() -> JsonCodec:
+    # orjson is the fastest available codec, stdlib json serves as a fallback
+    global DEFAULT_JSON_CODEC
+
+    if DEFAULT_JSON_CODEC is None:
+        if orjson is not None:
+            DEFAULT_JSON_CODEC = OrjsonCodec()
+        else:
+            DEFAULT_JSON_CODEC = StdlibJsonCodec()
+
+        LOG.debug("Default JSON codec: %s", type(DEFAULT_JSON_CODEC).__name__)
+
+    return DEFAULT_JSON_CODEC
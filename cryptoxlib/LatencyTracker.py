@@ -0,0 +1,73 @@
+import collections
+from typing import Dict, Tuple, Optional, List
+
+# identification of an endpoint, e.g. ('GET', 'api/v3/depth')
+EndpointType = Tuple[str, str]
+
+
+class EndpointLatency(object):
+    # number of new samples after which the percentiles are recalculated
+    RECALCULATION_INTERVAL = 50
+
+    def __init__(self, window_size: int) -> None:
+        self.samples_ms = collections.deque(maxlen = window_size)
+        self.sample_count = 0
+
+        self.sorted_samples_ms: List[float] = []
+        self.sorted_at_count = 0
+
+    def add(self, latency_ms: float) -> None:
+        self.samples_ms.append(latency_ms)
+        self.sample_count += 1
+
+    def get_percentile(self, percentile: float) -> Optional[float]:
+        if len(self.samples_ms) == 0:
+            return None
+
+        if self.sample_count - self.sorted_at_count >= EndpointLatency.RECALCULATION_INTERVAL or \
+                len(self.sorted_samples_ms) == 0:
+            self.sorted_samples_ms = sorted(self.samples_ms)
+            self.sorted_at_count = self.sample_count
+
+        index = min(len(self.sorted_samples_ms) - 1, int(len(self.sorted_samples_ms) * percentile / 100))
+        return self.sorted_samples_ms[index]
+
+
+class LatencyTracker(object):
+    # Tracks latency of the last window_size calls of every endpoint.
+
+    DEFAULT_WINDOW_SIZE = 1000
+
+    def __init__(self, window_size: int = DEFAULT_WINDOW_SIZE) -> None:
+        self.window_size = window_size
+
+        self.endpoints: Dict[EndpointType, EndpointLatency] = {}
+
+    def add(self, endpoint: EndpointType, latency_ms: float) -> None:
+        endpoint_latency = self.endpoints.get(endpoint)
+        if endpoint_latency is None:
+            endpoint_latency = EndpointLatency(self.window_size)
+            self.endpoints[endpoint] = endpoint_latency
+
+        endpoint_latency.add(latency_ms)
+
+    def get_sample_count(self, endpoint: EndpointType) -> int:
+        endpoint_latency = self.endpoints.get(endpoint)
+        if endpoint_latency is None:
+            return 0
+
+        return len(endpoint_latency.samples_ms)
+
+    def get_percentile(self, endpoint: EndpointType, percentile: float) -> Optional[float]:
+        endpoint_latency = self.endpoints.get(endpoint)
+        if endpoint_latency is None:
+            return None
+
+        return endpoint_latency.get_percentile(percentile)
+
+    def get_stats(self) -> Dict[EndpointType, Dict[str, float]]:
+        return {endpoint: {'count': endpoint_latency.sample_count,
+                           'p50': endpoint_latency.get_percentile(50),
+                           'p95': endpoint_latency.get_percentile(95),
+                           'p99': endpoint_latency.get_percentile(99)}
+                for endpoint, endpoint_latency in self.endpoints.items()}
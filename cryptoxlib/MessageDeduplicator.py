@@ -0,0 +1,88 @@
+import logging
+import time
+import collections
+from typing import List, Dict, Hashable, Optional, Any
+
+LOG = logging.getLogger(__name__)
+
+
+class ReplicaStats(object):
+    def __init__(self, replica_id: int):
+        self.replica_id = replica_id
+
+        # number of keyed messages delivered first by this replica
+        self.win_count = 0
+        # number of keyed messages which had already been delivered by another replica
+        self.duplicate_count = 0
+        # total delay of the duplicates behind the first arrival
+        self.total_lag_ns = 0
+        # number of messages without sequence key delivered by this replica as a leader
+        self.unkeyed_count = 0
+
+    def get_average_lag_ms(self) -> Optional[float]:
+        if self.duplicate_count == 0:
+            return None
+
+        return self.total_lag_ns / self.duplicate_count / 10**6
+
+    def __str__(self):
+        return f"replica [{self.replica_id}]: wins [{self.win_count}], duplicates [{self.duplicate_count}], " \
+               f"avg lag [{self.get_average_lag_ms()} ms], unkeyed [{self.unkeyed_count}]"
+
+
+class MessageDeduplicator(object):
+    DEFAULT_WINDOW_SIZE = 10000
+
+    def __init__(self, window_size: int = DEFAULT_WINDOW_SIZE):
+        self.window_size = window_size
+
+        # replicas (websocket managers) receiving the same messages
+        self.replicas: List[Any] = []
+        self.stats: Dict[int, ReplicaStats] = {}
+
+        # sequence key -> (winning replica id, arrival time), bounded by the window size
+        self.window: Dict[Hashable, tuple] = {}
+        self.window_keys = collections.deque()
+
+    def add_replica(self, replica: Any) -> None:
+        replica.replica_id = len(self.replicas)
+        replica.message_deduplicator = self
+
+        self.replicas.append(replica)
+        self.stats[replica.replica_id] = ReplicaStats(replica.replica_id)
+
+    def is_leader(self, replica: Any) -> bool:
+        # leader is the connected replica with the lowest id
+        for r in self.replicas:
+            if r.connected:
+                return r is replica
+
+        return True
+
+    def is_first_arrival(self, replica: Any, sequence_key: Optional[Hashable]) -> bool:
+        stats = self.stats[replica.replica_id]
+
+        # messages which cannot be identified across replicas are delivered by the leader only
+        if sequence_key is None:
+            if self.is_leader(replica):
+                stats.unkeyed_count += 1
+                return True
+
+            return False
+
+        first_arrival = self.window.get(sequence_key)
+        if first_arrival is not None:
+            stats.duplicate_count += 1
+            stats.total_lag_ns += time.monotonic_ns() - first_arrival[1]
+            return False
+
+        self.window[sequence_key] = (replica.replica_id, time.monotonic_ns())
+        self.window_keys.append(sequence_key)
+        if len(self.window_keys) > self.window_size:
+            del self.window[self.window_keys.popleft()]
+
+        stats.win_count += 1
+        return True
+
+    def get_stats(self) -> List[ReplicaStats]:
+        return list(self.stats.values())
@@ -0,0 +1,245 @@
+import heapq
+from typing import Dict, List, Optional, Tuple, Iterable, Any, Callable, Set
+
+# (price, quantity)
+PriceLevelType = Tuple[float, float]
+
+
+class OrderBookSide(object):
+    # Price levels of one side of an order book. Levels are kept in a dict and their prices in a heap ordered from the
+    # best price. Removed levels are deleted from the heap lazily, the heap top is always a valid level so that the best
+    # level is available in O(1) while updates take O(log n).
+
+    def __init__(self, descending: bool) -> None:
+        # bids are ordered from the highest price, asks from the lowest one
+        self.descending = descending
+
+        self.levels: Dict[float, float] = {}
+        # prices (negated for bids) including prices of removed levels
+        self.heap: List[float] = []
+
+    def update(self, price: float, quantity: float) -> None:
+        # zero quantity removes the level
+        if quantity == 0:
+            if self.levels.pop(price, None) is not None:
+                self._clean_top()
+            return
+
+        if price not in self.levels:
+            heapq.heappush(self.heap, -price if self.descending else price)
+
+            # removed levels are rebuilt once they outnumber the valid ones
+            if len(self.heap) > 2 * len(self.levels) + 64:
+                self._rebuild()
+        self.levels[price] = quantity
+
+    def clear(self) -> None:
+        self.levels = {}
+        self.heap = []
+
+    def get_best(self) -> Optional[PriceLevelType]:
+        if len(self.heap) == 0:
+            return None
+
+        price = -self.heap[0] if self.descending else self.heap[0]
+        return price, self.levels[price]
+
+    def get_quantity(self, price: float) -> float:
+        return self.levels.get(price, 0.0)
+
+    def get_levels(self, depth: int = None) -> List[PriceLevelType]:
+        # levels ordered from the best price
+        if depth is None or depth >= len(self.levels):
+            prices = sorted(self.levels.keys(), reverse = self.descending)
+        elif self.descending:
+            prices = heapq.nlargest(depth, self.levels.keys())
+        else:
+            prices = heapq.nsmallest(depth, self.levels.keys())
+
+        return [(price, self.levels[price]) for price in prices]
+
+    def _clean_top(self) -> None:
+        heap = self.heap
+        while len(heap) > 0 and (-heap[0] if self.descending else heap[0]) not in self.levels:
+            heapq.heappop(heap)
+
+    def _rebuild(self) -> None:
+        self.heap = [-price if self.descending else price for price in self.levels.keys()]
+        heapq.heapify(self.heap)
+
+    def __len__(self):
+        return len(self.levels)
+
+
+class OrderBook(object):
+    # Local order book maintained from exchange snapshots and updates. Prices and quantities are floats.
+
+    def __init__(self, symbol: Any = None) -> None:
+        self.symbol = symbol
+
+        self.bids = OrderBookSide(descending = True)
+        self.asks = OrderBookSide(descending = False)
+
+        # exchange specific sequence number of the last applied update
+        self.sequence = None
+
+    def apply_snapshot(self, bids: Iterable, asks: Iterable, sequence: Any = None) -> None:
+        # bids and asks are iterables of (price, quantity) pairs, values may be strings
+        self.bids.clear()
+        self.asks.clear()
+        self.update_bids(bids)
+        self.update_asks(asks)
+
+        self.sequence = sequence
+
+    def update_bids(self, bids: Iterable) -> None:
+        for price, quantity in bids:
+            self.bids.update(float(price), float(quantity))
+
+    def update_asks(self, asks: Iterable) -> None:
+        for price, quantity in asks:
+            self.asks.update(float(price), float(quantity))
+
+    def clear(self) -> None:
+        self.bids.clear()
+        self.asks.clear()
+        self.sequence = None
+
+    def get_best_bid(self) -> Optional[PriceLevelType]:
+        return self.bids.get_best()
+
+    def get_best_ask(self) -> Optional[PriceLevelType]:
+        return self.asks.get_best()
+
+    def get_mid_price(self) -> Optional[float]:
+        best_bid = self.bids.get_best()
+        best_ask = self.asks.get_best()
+        if best_bid is None or best_ask is None:
+            return None
+
+        return (best_bid[0] + best_ask[0]) / 2
+
+    def get_view(self, depth: int = None) -> 'OrderBookView':
+        return OrderBookView(self.symbol, self.bids.get_levels(depth), self.asks.get_levels(depth), self.sequence)
+
+    def __str__(self):
+        return f"OrderBook [{self.symbol}]: best bid {self.get_best_bid()}, best ask {self.get_best_ask()}, " \
+               f"[{len(self.bids)}/{len(self.asks)}] levels, sequence [{self.sequence}]"
+
+
+class OrderBookView(object):
+    # Copy of the top levels of an order book which does not change with further updates of the book.
+
+    def __init__(self, symbol: Any, bids: List[PriceLevelType], asks: List[PriceLevelType], sequence: Any) -> None:
+        self.symbol = symbol
+        self.bids = bids
+        self.asks = asks
+        self.sequence = sequence
+
+    def __str__(self):
+        return f"OrderBookView [{self.symbol}]: bids {self.bids}, asks {self.asks}, sequence [{self.sequence}]"
+
+
+class OrderBookReader(object):
+    # Read-only access to a live order book (OrderBook or CompactOrderBook) without copying its levels. The book keeps
+    # changing with further updates, use get_view() to keep its state.
+
+    __slots__ = ('_order_book',)
+
+    def __init__(self, order_book) -> None:
+        self._order_book = order_book
+
+    @property
+    def symbol(self) -> Any:
+        return self._order_book.symbol
+
+    @property
+    def sequence(self) -> Any:
+        return self._order_book.sequence
+
+    def get_best_bid(self) -> Optional[PriceLevelType]:
+        return self._order_book.get_best_bid()
+
+    def get_best_ask(self) -> Optional[PriceLevelType]:
+        return self._order_book.get_best_ask()
+
+    def get_mid_price(self) -> Optional[float]:
+        return self._order_book.get_mid_price()
+
+    def get_bids(self, depth: int = None) -> List[PriceLevelType]:
+        return self._order_book.bids.get_levels(depth)
+
+    def get_asks(self, depth: int = None) -> List[PriceLevelType]:
+        return self._order_book.asks.get_levels(depth)
+
+    def get_bid_quantity(self, price: float) -> float:
+        return self._order_book.bids.get_quantity(price)
+
+    def get_ask_quantity(self, price: float) -> float:
+        return self._order_book.asks.get_quantity(price)
+
+    def get_view(self, depth: int = None) -> OrderBookView:
+        return self._order_book.get_view(depth)
+
+    def __str__(self):
+        return str(self._order_book)
+
+
+class OrderBookUpdate(OrderBookReader):
+    # Read-only access to a live order book together with the price levels changed by the last update. Changes are
+    # (price, quantity) pairs as received from the exchange, removed levels have zero quantity.
+
+    __slots__ = ('bid_changes', 'ask_changes')
+
+    def __init__(self, order_book, bid_changes: List[tuple] = None, ask_changes: List[tuple] = None) -> None:
+        super().__init__(order_book)
+
+        self.bid_changes = bid_changes if bid_changes is not None else []
+        self.ask_changes = ask_changes if ask_changes is not None else []
+
+
+class OrderBookCollection(object):
+    # Order books of several symbols maintained by one managed order book subscription. The book of a symbol is created
+    # by the factory with its first snapshot and updates are applied only to books synchronized by a snapshot, i.e.
+    # updates preceding the snapshot are dropped. reset() clears all books until their next snapshot (e.g. after
+    # a reconnection), readers obtained before remain valid.
+
+    def __init__(self, order_book_factory: Callable[[Any], Any] = OrderBook) -> None:
+        # creates a book with the OrderBook interface for a symbol, e.g. CompactOrderBook
+        self.order_book_factory = order_book_factory
+
+        self.order_books: Dict[Any, Any] = {}
+        # read-only access to the books passed to the callbacks
+        self.order_book_readers: Dict[Any, OrderBookReader] = {}
+        self.synchronized: Set[Any] = set()
+
+    def get_reader(self, symbol: Any) -> Optional[OrderBookReader]:
+        return self.order_book_readers.get(symbol)
+
+    def apply_snapshot(self, symbol: Any, bids: Iterable, asks: Iterable, sequence: Any = None) -> OrderBookReader:
+        order_book = self.order_books.get(symbol)
+        if order_book is None:
+            order_book = self.order_book_factory(symbol)
+            self.order_books[symbol] = order_book
+            self.order_book_readers[symbol] = OrderBookReader(order_book)
+
+        order_book.apply_snapshot(bids, asks, sequence)
+        self.synchronized.add(symbol)
+
+        return self.order_book_readers[symbol]
+
+    def apply_update(self, symbol: Any, bids: Iterable, asks: Iterable) -> Optional[OrderBookReader]:
+        # returns None if the book has not been synchronized by a snapshot yet
+        if symbol not in self.synchronized:
+            return None
+
+        order_book = self.order_books[symbol]
+        order_book.update_bids(bids)
+        order_book.update_asks(asks)
+
+        return self.order_book_readers[symbol]
+
+    def reset(self) -> None:
+        for order_book in self.order_books.values():
+            order_book.clear()
+        self.synchronized.clear()
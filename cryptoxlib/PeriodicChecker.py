@@ -1,5 +1,5 @@
 import logging
-import datetime
+import time
 
 LOG = logging.getLogger(__name__)
 
@@ -7,12 +7,13 @@ LOG = logging.getLogger(__name__)
 class PeriodicChecker(object):
     def __init__(self, period_ms):
         self.period_ms = period_ms
-        self.last_exec_tmstmp_ms = int(datetime.datetime.now(tz=datetime.timezone.utc).timestamp() * 1000)
+        self.period_ns = period_ms * 10**6
+        self.last_exec_tmstmp_ns = time.monotonic_ns()
 
     def check(self) -> bool:
-        now_tmstmp_ms = int(datetime.datetime.now(tz=datetime.timezone.utc).timestamp() * 1000)
-        if self.last_exec_tmstmp_ms + self.period_ms < now_tmstmp_ms:
-            self.last_exec_tmstmp_ms = now_tmstmp_ms
+        now_tmstmp_ns = time.monotonic_ns()
+        if self.last_exec_tmstmp_ns + self.period_ns < now_tmstmp_ns:
+            self.last_exec_tmstmp_ns = now_tmstmp_ns
             return True
         else:
             return False
\ No newline at end of file
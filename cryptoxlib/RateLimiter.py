@@ -0,0 +1,218 @@
+import asyncio
+import collections
+import enum
+import logging
+import time
+from typing import List, Dict, Mapping
+
+from cryptoxlib.exceptions import CryptoXLibException
+
+LOG = logging.getLogger(__name__)
+
+# limit name -> weight consumed by a request
+RequestCostType = Dict[str, int]
+
+
+class RestCallPriority(enum.Enum):
+    # order placement and cancellation
+    CRITICAL = 0
+    NORMAL = 1
+    # bulk and background reads, e.g. historical data
+    BULK = 2
+
+
+class RateLimit(object):
+    # Sliding window limit, i.e. the total weight of requests sent within any interval_ms long window must not
+    # exceed the capacity. The usage can be additionally synchronized with the usage reported by the exchange which
+    # accounts also for requests sent by other processes. Exchanges count the reported usage in windows aligned to
+    # the wall clock.
+
+    def __init__(self, name: str, capacity: int, interval_ms: int) -> None:
+        self.name = name
+        self.capacity = capacity
+        self.interval_ns = interval_ms * 10**6
+
+        # (timestamp, weight) of requests within the window
+        self.requests = collections.deque()
+        self.usage = 0
+
+        # usage reported by the exchange, valid until the end of the reported window
+        self.reported_usage = 0
+        self.reported_until_ns = 0
+        # total weight ever consumed and the total at the time the last reported request was sent, the difference is
+        # the weight of requests sent after the reported one (including those still in flight)
+        self.consumed_total = 0
+        self.reported_consumed_total = 0
+
+    def get_usage(self, now_ns: int = None) -> int:
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        self._expire(now_ns)
+
+        if now_ns < self.reported_until_ns:
+            return max(self.usage, self.reported_usage + self.get_consumed_since_report())
+
+        return self.usage
+
+    def get_budget(self, now_ns: int = None) -> int:
+        return self.capacity - self.get_usage(now_ns)
+
+    def get_wait_ns(self, weight: int, now_ns: int, headroom: int = 0) -> int:
+        # time until the weight fits into the window while leaving the headroom unused
+        self._expire(now_ns)
+
+        capacity = self.capacity - headroom
+
+        # the reported usage drops only at the end of the reported window
+        wait_reported_ns = 0
+        if now_ns < self.reported_until_ns and \
+                self.reported_usage + self.get_consumed_since_report() + weight > capacity:
+            wait_reported_ns = self.reported_until_ns - now_ns
+
+        excess = self.usage + weight - capacity
+        if excess <= 0:
+            return wait_reported_ns
+
+        for (tmstmp_ns, request_weight) in self.requests:
+            excess -= request_weight
+            if excess <= 0:
+                return max(wait_reported_ns, tmstmp_ns + self.interval_ns - now_ns)
+
+        return max(wait_reported_ns, self.interval_ns)
+
+    def consume(self, weight: int, now_ns: int) -> None:
+        self.requests.append((now_ns, weight))
+        self.usage += weight
+        self.consumed_total += weight
+
+    def get_consumed_since_report(self) -> int:
+        return self.consumed_total - self.reported_consumed_total
+
+    def sync(self, reported_usage: int, now_ns: int, consumed_total: int = None) -> None:
+        # consumed_total is the value of self.consumed_total right after the reported request was sent, if not provided
+        # all requests sent so far are assumed to be included in the reported usage
+        if consumed_total is None:
+            consumed_total = self.consumed_total
+
+        # responses may arrive out of order, a report older than the current one must not override it
+        if consumed_total < self.reported_consumed_total and now_ns < self.reported_until_ns:
+            return
+
+        self.reported_usage = reported_usage
+        self.reported_consumed_total = consumed_total
+
+        interval_ms = self.interval_ns // 10**6
+        remaining_ms = interval_ms - int(time.time() * 1000) % interval_ms
+        self.reported_until_ns = now_ns + remaining_ms * 10**6
+
+    def _expire(self, now_ns: int) -> None:
+        window_start_ns = now_ns - self.interval_ns
+        while len(self.requests) > 0 and self.requests[0][0] <= window_start_ns:
+            self.usage -= self.requests.popleft()[1]
+
+    def __str__(self):
+        return f"{self.name}: [{self.get_usage()}/{self.capacity}] per [{self.interval_ns // 10**6} ms]"
+
+
+class RateLimiter(object):
+    # Client side rate limiter. Requests exceeding any of the limits are queued until the limits allow them to be sent.
+    # Requests of the same priority are served in the order they arrived, requests of different priorities wait
+    # independently of each other. Lower priorities have to leave a part of each limit unused so that the headroom
+    # remains available for critical requests.
+    #
+    # Exchanges declare their limits and request weights by subclassing the limiter and overriding get_request_cost.
+
+    # fraction of a limit a request of the priority must leave unused
+    DEFAULT_HEADROOM = {
+        RestCallPriority.CRITICAL: 0.0,
+        RestCallPriority.NORMAL: 0.1,
+        RestCallPriority.BULK: 0.3
+    }
+
+    # response header -> name of the limit whose usage the header reports
+    USAGE_HEADERS: Dict[str, str] = {}
+
+    def __init__(self, limits: List[RateLimit], headroom: Dict[RestCallPriority, float] = None) -> None:
+        self.limits: Dict[str, RateLimit] = {limit.name: limit for limit in limits}
+        self.headroom = dict(RateLimiter.DEFAULT_HEADROOM)
+        if headroom is not None:
+            self.headroom.update(headroom)
+
+        # all requests are suspended until this time, e.g. after the exchange rejected a request due to rate limits
+        self.suspended_until_ns = 0
+
+        # locks are created lazily in order to be bound to the running event loop
+        self.locks: Dict[RestCallPriority, asyncio.Lock] = {}
+
+    def get_request_cost(self, rest_call_type: enum.Enum, path: str, params: dict) -> RequestCostType:
+        # path is the resource path relative to the REST API URI
+        return {}
+
+    def get_request_priority(self, rest_call_type: enum.Enum, path: str) -> RestCallPriority:
+        return RestCallPriority.NORMAL
+
+    async def acquire(self, cost: RequestCostType, priority: RestCallPriority = RestCallPriority.NORMAL) -> Dict[str, int]:
+        # returns the consumed totals of all limits once the request was admitted, they have to be passed along with
+        # the response headers to update_from_headers so that requests sent in the meantime are not lost from the usage
+        if len(cost) == 0 and self.suspended_until_ns <= time.monotonic_ns():
+            return self._get_consumed_totals()
+
+        for name, weight in cost.items():
+            if weight > self.limits[name].capacity:
+                raise CryptoXLibException(f"Request weight [{weight}] exceeds capacity of rate limit {self.limits[name]}.")
+
+        lock = self.locks.get(priority)
+        if lock is None:
+            lock = asyncio.Lock()
+            self.locks[priority] = lock
+
+        async with lock:
+            while True:
+                now_ns = time.monotonic_ns()
+                wait_ns = max([self.suspended_until_ns - now_ns] +
+                              [self.limits[name].get_wait_ns(weight, now_ns, self._get_headroom(name, weight, priority))
+                               for name, weight in cost.items()])
+                if wait_ns <= 0:
+                    for name, weight in cost.items():
+                        self.limits[name].consume(weight, now_ns)
+                    return self._get_consumed_totals()
+
+                LOG.debug("Request with cost %s and priority %s delayed by %s ms due to rate limits.", cost,
+                          priority.name, wait_ns / 10**6)
+                await asyncio.sleep(wait_ns / 10**9)
+
+    def update_from_headers(self, headers: Mapping[str, str], consumed_totals: Dict[str, int] = None) -> None:
+        # consumed_totals are the values returned by acquire for the request the headers belong to
+        now_ns = time.monotonic_ns()
+        for header, name in self.USAGE_HEADERS.items():
+            value = headers.get(header)
+            if value is not None:
+                consumed_total = consumed_totals.get(name) if consumed_totals is not None else None
+                self.limits[name].sync(int(value), now_ns, consumed_total)
+
+    def suspend(self, duration_ms: float) -> None:
+        LOG.warning(f"Rate limit exceeded, all requests suspended for {duration_ms} ms.")
+        self.suspended_until_ns = max(self.suspended_until_ns, time.monotonic_ns() + int(duration_ms * 10**6))
+
+    def get_usage(self) -> Dict[str, int]:
+        return {name: limit.get_usage() for name, limit in self.limits.items()}
+
+    def get_budget(self, priority: RestCallPriority = None) -> Dict[str, int]:
+        # remaining capacity of every limit, if priority is provided only the capacity available to the priority
+        if priority is None:
+            return {name: limit.get_budget() for name, limit in self.limits.items()}
+
+        return {name: max(0, limit.get_budget() - int(limit.capacity * self.headroom[priority]))
+                for name, limit in self.limits.items()}
+
+    def _get_consumed_totals(self) -> Dict[str, int]:
+        return {name: limit.consumed_total for name, limit in self.limits.items()}
+
+    def _get_headroom(self, name: str, weight: int, priority: RestCallPriority) -> int:
+        limit = self.limits[name]
+
+        # a request heavier than the remaining capacity would never be sent otherwise
+        return min(int(limit.capacity * self.headroom[priority]), limit.capacity - weight)
+
+    def __str__(self):
+        return ", ".join(str(limit) for limit in self.limits.values())
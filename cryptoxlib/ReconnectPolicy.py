@@ -0,0 +1,109 @@
+import enum
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from cryptoxlib.exceptions import CryptoXLibException
+
+LOG = logging.getLogger(__name__)
+
+
+class CircuitState(enum.Enum):
+    # reconnection attempts are performed according to the backoff
+    CLOSED = enum.auto()
+    # too many consecutive failures, reconnection attempts are suspended
+    OPEN = enum.auto()
+    # suspension period is over, the next attempt decides whether the circuit gets closed or opened again
+    HALF_OPEN = enum.auto()
+
+
+class ReconnectPolicy(ABC):
+    # Decides how long a websocket manager waits before the next reconnection attempt. Every websocket manager works
+    # with its own instance obtained via clone().
+
+    @abstractmethod
+    def get_next_delay_ms(self) -> Optional[float]:
+        # Invoked before every reconnection attempt. Returns the delay before the attempt or None if no further
+        # attempt shall be made.
+        pass
+
+    @abstractmethod
+    def on_connection_established(self) -> None:
+        # Invoked when the connection has been proven to work, i.e. when the first message has been received.
+        pass
+
+    @abstractmethod
+    def clone(self) -> 'ReconnectPolicy':
+        pass
+
+
+class ExponentialBackoffReconnectPolicy(ReconnectPolicy):
+    def __init__(self, initial_delay_ms: float = 100, max_delay_ms: float = 30000, multiplier: float = 2.0,
+                 jitter: float = 0.5, max_attempts: int = None, circuit_failure_threshold: int = None,
+                 circuit_open_ms: float = 60000) -> None:
+        if not 0 <= jitter <= 1:
+            raise CryptoXLibException(f"Jitter [{jitter}] must be between 0 and 1.")
+
+        if multiplier < 1:
+            raise CryptoXLibException(f"Multiplier [{multiplier}] must be at least 1.")
+
+        self.initial_delay_ms = initial_delay_ms
+        self.max_delay_ms = max_delay_ms
+        self.multiplier = multiplier
+        self.jitter = jitter
+        # max number of consecutive failed attempts, unlimited if None
+        self.max_attempts = max_attempts
+        # number of consecutive failed attempts after which the circuit gets opened, never opened if None
+        self.circuit_failure_threshold = circuit_failure_threshold
+        self.circuit_open_ms = circuit_open_ms
+
+        self.failure_count = 0
+        self.circuit_state = CircuitState.CLOSED
+        self.circuit_open_until_ns = 0
+
+    def get_circuit_state(self) -> CircuitState:
+        if self.circuit_state == CircuitState.OPEN and time.monotonic_ns() >= self.circuit_open_until_ns:
+            self.circuit_state = CircuitState.HALF_OPEN
+
+        return self.circuit_state
+
+    def get_next_delay_ms(self) -> Optional[float]:
+        self.failure_count += 1
+
+        if self.max_attempts is not None and self.failure_count > self.max_attempts:
+            LOG.warning(f"Max number of reconnection attempts [{self.max_attempts}] reached.")
+            return None
+
+        if self.circuit_failure_threshold is not None and self.failure_count >= self.circuit_failure_threshold:
+            if self.get_circuit_state() != CircuitState.OPEN:
+                LOG.warning(f"Reconnection circuit opened after {self.failure_count} failed attempts.")
+            self.circuit_state = CircuitState.OPEN
+            self.circuit_open_until_ns = time.monotonic_ns() + int(self.circuit_open_ms * 10**6)
+
+            return self.circuit_open_ms
+
+        # the first reconnection is attempted immediately
+        if self.failure_count == 1:
+            return 0
+
+        delay_ms = min(self.max_delay_ms, self.initial_delay_ms * self.multiplier ** (self.failure_count - 2))
+
+        return delay_ms * (1 - self.jitter * random.random())
+
+    def on_connection_established(self) -> None:
+        if self.circuit_state != CircuitState.CLOSED:
+            LOG.info("Reconnection circuit closed.")
+
+        self.failure_count = 0
+        self.circuit_state = CircuitState.CLOSED
+
+    def clone(self) -> 'ExponentialBackoffReconnectPolicy':
+        return ExponentialBackoffReconnectPolicy(initial_delay_ms = self.initial_delay_ms,
+                                                 max_delay_ms = self.max_delay_ms,
+                                                 multiplier = self.multiplier,
+                                                 jitter = self.jitter,
+                                                 max_attempts = self.max_attempts,
+                                                 circuit_failure_threshold = self.circuit_failure_threshold,
+                                                 circuit_open_ms = self.circuit_open_ms)
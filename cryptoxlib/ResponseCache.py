@@ -0,0 +1,146 @@
+import collections
+import logging
+import os
+import time
+from multidict import CIMultiDict, CIMultiDictProxy
+from typing import Dict, Optional
+
+from cryptoxlib.JsonCodec import JsonCodec, get_default_json_codec
+from cryptoxlib.RestMiddleware import RestMiddleware, RestRequest, RestHandlerType
+
+LOG = logging.getLogger(__name__)
+
+
+class CachedResponse(object):
+    def __init__(self, response: dict, expires_at_ns: int) -> None:
+        self.response = response
+        # monotonic time
+        self.expires_at_ns = expires_at_ns
+
+
+class ResponseCacheMiddleware(RestMiddleware):
+    # Caches successful responses of unsigned GET calls of slow-changing endpoints. Every cached endpoint has its own
+    # time to live, endpoints without a TTL are never cached. The least recently used responses are evicted once the
+    # cache holds max_entries responses. Responses served from the cache are shared by all callers and must not be
+    # modified.
+    #
+    # The cache can be persisted to a file and loaded again after restart, expiration of the loaded responses is
+    # preserved.
+
+    DEFAULT_MAX_ENTRIES = 100
+
+    def __init__(self, ttls_sec: Dict[str, float], max_entries: int = DEFAULT_MAX_ENTRIES,
+                 json_codec: JsonCodec = None) -> None:
+        # endpoint path relative to the REST API URI (e.g. 'api/v3/exchangeInfo') -> time to live in seconds
+        self.ttls_sec = dict(ttls_sec)
+        self.max_entries = max_entries
+        self.json_codec = json_codec if json_codec is not None else get_default_json_codec()
+
+        self.entries: 'collections.OrderedDict[tuple, CachedResponse]' = collections.OrderedDict()
+
+        self.hit_count = 0
+        self.miss_count = 0
+
+    async def process(self, request: RestRequest, next_handler: RestHandlerType) -> dict:
+        # raw responses are not cached since they could not be persisted
+        if request.signed or request.raw or not request.is_idempotent():
+            return await next_handler(request)
+
+        ttl_sec = self.ttls_sec.get(request.get_endpoint()[1])
+        if ttl_sec is None:
+            return await next_handler(request)
+
+        key = request.get_key()
+        cached_response = self._get(key)
+        if cached_response is not None:
+            self.hit_count += 1
+            LOG.debug("REST call [%s] served from cache.", request)
+            return cached_response
+
+        self.miss_count += 1
+        response = await next_handler(request)
+        if 200 <= response['status_code'] < 300:
+            self._put(key, response, time.monotonic_ns() + int(ttl_sec * 10**9))
+
+        return response
+
+    def invalidate(self, endpoint: str = None) -> None:
+        # drops all cached responses of the endpoint path or the whole cache if no endpoint is provided
+        if endpoint is None:
+            self.entries.clear()
+            return
+
+        for key in [key for key in self.entries.keys() if key[1].split('?', 1)[0] == endpoint]:
+            del self.entries[key]
+
+    def save(self, file_path: str) -> None:
+        # responses are saved with their remaining time to live converted to wall clock time
+        now_ns = time.monotonic_ns()
+        now_wall_ns = time.time_ns()
+
+        entries = []
+        for key, cached_response in self.entries.items():
+            if cached_response.expires_at_ns <= now_ns:
+                continue
+
+            entries.append({
+                "key": list(key),
+                "expires_at": now_wall_ns + cached_response.expires_at_ns - now_ns,
+                "status_code": cached_response.response['status_code'],
+                "headers": list(cached_response.response['headers'].items()),
+                "response": cached_response.response['response']
+            })
+
+        tmp_file_path = file_path + ".tmp"
+        with open(tmp_file_path, "w") as file:
+            file.write(self.json_codec.dumps(entries))
+        os.replace(tmp_file_path, file_path)
+
+    def load(self, file_path: str) -> None:
+        if not os.path.exists(file_path):
+            LOG.info(f"Response cache file [{file_path}] does not exist, cache starts empty.")
+            return
+
+        with open(file_path, "rb") as file:
+            entries = self.json_codec.loads(file.read())
+
+        now_ns = time.monotonic_ns()
+        now_wall_ns = time.time_ns()
+        for entry in entries:
+            if entry['expires_at'] <= now_wall_ns:
+                continue
+
+            response = {
+                "status_code": entry['status_code'],
+                "headers": CIMultiDictProxy(CIMultiDict(entry['headers'])),
+                "response": entry['response']
+            }
+            self._put(tuple(entry['key']), response, now_ns + entry['expires_at'] - now_wall_ns)
+
+        LOG.info(f"{len(self.entries)} responses loaded into response cache from [{file_path}].")
+
+    def get_stats(self) -> dict:
+        return {
+            'entry_count': len(self.entries),
+            'hit_count': self.hit_count,
+            'miss_count': self.miss_count
+        }
+
+    def _get(self, key: tuple) -> Optional[dict]:
+        cached_response = self.entries.get(key)
+        if cached_response is None:
+            return None
+
+        if cached_response.expires_at_ns <= time.monotonic_ns():
+            del self.entries[key]
+            return None
+
+        self.entries.move_to_end(key)
+        return cached_response.response
+
+    def _put(self, key: tuple, response: dict, expires_at_ns: int) -> None:
+        self.entries[key] = CachedResponse(response, expires_at_ns)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last = False)
@@ -0,0 +1,75 @@
+import inspect
+import logging
+import ssl
+import aiohttp
+from typing import Optional
+
+LOG = logging.getLogger(__name__)
+
+
+class RestConnectionPool(object):
+    # Connection pool of REST sessions. A pool can be shared by several clients connecting to the same host
+    # (e.g. binance spot and futures clients) and is closed once the last of them is closed.
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 0, keepalive_timeout: float = 30,
+                 ttl_dns_cache: int = 300, happy_eyeballs: bool = False, ssl_context: ssl.SSLContext = None) -> None:
+        # max number of simultaneous connections, unlimited if 0
+        self.limit = limit
+        # max number of simultaneous connections to one host, unlimited if 0
+        self.limit_per_host = limit_per_host
+        # time an idle connection is kept open
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        # if disabled, addresses of a host are tried sequentially instead of racing IPv6 and IPv4 connections
+        # (supported by aiohttp >= 3.10)
+        self.happy_eyeballs = happy_eyeballs
+        self.ssl_context = ssl_context
+
+        self.connector: Optional[aiohttp.TCPConnector] = None
+        self.client_count = 0
+
+    def acquire(self) -> aiohttp.TCPConnector:
+        self.client_count += 1
+
+        return self.get_connector()
+
+    async def release(self) -> None:
+        self.client_count -= 1
+        if self.client_count <= 0:
+            self.client_count = 0
+            await self.close()
+
+    def get_connector(self) -> aiohttp.TCPConnector:
+        if self.connector is None or self.connector.closed:
+            self.connector = aiohttp.TCPConnector(**self._get_connector_kwargs())
+            LOG.debug("REST connection pool created: %s", self)
+
+        return self.connector
+
+    async def close(self) -> None:
+        if self.connector is not None:
+            await self.connector.close()
+            self.connector = None
+
+    def _get_connector_kwargs(self) -> dict:
+        kwargs = {
+            'limit': self.limit,
+            'limit_per_host': self.limit_per_host,
+            'keepalive_timeout': self.keepalive_timeout,
+            'use_dns_cache': True,
+            'ttl_dns_cache': self.ttl_dns_cache
+        }
+
+        if self.ssl_context is not None:
+            kwargs['ssl'] = self.ssl_context
+
+        if not self.happy_eyeballs and \
+                'happy_eyeballs_delay' in inspect.signature(aiohttp.TCPConnector.__init__).parameters:
+            kwargs['happy_eyeballs_delay'] = None
+
+        return kwargs
+
+    def __str__(self):
+        return f"limit [{self.limit}], limit per host [{self.limit_per_host}], " \
+               f"keepalive timeout [{self.keepalive_timeout} s], DNS cache TTL [{self.ttl_dns_cache} s], " \
+               f"happy eyeballs [{self.happy_eyeballs}]"
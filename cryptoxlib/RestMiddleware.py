@@ -0,0 +1,272 @@
+import asyncio
+import aiohttp
+import enum
+import functools
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Awaitable, Any, Set, Optional, Dict, Tuple
+
+from cryptoxlib.version_conversions import async_create_task
+from cryptoxlib.RateLimiter import RestCallPriority
+from cryptoxlib.LatencyTracker import LatencyTracker, EndpointType
+
+LOG = logging.getLogger(__name__)
+
+# REST responses are dicts with status_code, headers and response keys
+RestHandlerType = Callable[['RestRequest'], Awaitable[dict]]
+
+
+class RestRequest(object):
+    def __init__(self, rest_call_type: enum.Enum, resource: str, data: Any = None, params: dict = None,
+                 headers: dict = None, signed: bool = False, api_variable_path: str = None,
+                 priority: RestCallPriority = RestCallPriority.NORMAL, raw: bool = False) -> None:
+        self.rest_call_type = rest_call_type
+        self.resource = resource
+        self.data = data
+        self.params = params
+        self.headers = headers
+        self.signed = signed
+        self.api_variable_path = api_variable_path
+        self.priority = priority
+        # response body is returned undecoded
+        self.raw = raw
+
+        # resource path relative to the REST API URI
+        self.path = resource if api_variable_path is None else api_variable_path + resource
+
+    def get_endpoint(self) -> EndpointType:
+        # identifies the endpoint irrespective of the query string
+        return self.rest_call_type.name, self.path.split('?', 1)[0]
+
+    def get_key(self) -> Tuple[str, str, str, str, str, bool]:
+        # identifies the request including its payload, values are compared by their string representation
+        return (self.rest_call_type.name, self.path,
+                repr(sorted((key, str(value)) for key, value in self.params.items())) if self.params is not None else '',
+                repr(sorted((key, str(value)) for key, value in self.headers.items())) if self.headers is not None else '',
+                repr(self.data), self.raw)
+
+    def is_idempotent(self) -> bool:
+        return self.rest_call_type.name == "GET"
+
+    def __str__(self):
+        return f"{self.rest_call_type.name} {self.path}"
+
+
+class RestMiddleware(ABC):
+    # Middlewares wrap every REST call made by a client in the order they were added, i.e. the first middleware is
+    # the outermost one. A middleware may modify the request, invoke next_handler any number of times (e.g. to retry)
+    # or not at all (e.g. to serve the response from a cache). Every invocation of next_handler signs and sends the
+    # request anew and counts towards the rate limits. The exchange specific response checks are applied only to the
+    # final response.
+
+    @abstractmethod
+    async def process(self, request: RestRequest, next_handler: RestHandlerType) -> dict:
+        pass
+
+
+class LatencyTrackingMiddleware(RestMiddleware):
+    # Measures latency of all calls passing through the middleware, including retries of the inner middlewares.
+
+    def __init__(self, latency_tracker: LatencyTracker = None) -> None:
+        self.latency_tracker = latency_tracker if latency_tracker is not None else LatencyTracker()
+
+    async def process(self, request: RestRequest, next_handler: RestHandlerType) -> dict:
+        start_ns = time.perf_counter_ns()
+        response = await next_handler(request)
+        self.latency_tracker.add(request.get_endpoint(), (time.perf_counter_ns() - start_ns) / 10**6)
+
+        return response
+
+
+class RetryMiddleware(RestMiddleware):
+    # Retries idempotent (GET) calls which failed due to a connection error, timeout or a server error. The delay
+    # between retries grows exponentially and is randomized by the jitter so that retries of concurrent calls do not
+    # hit the server at the same time. Calls which are not idempotent are passed through untouched since it is
+    # unknown whether the failed request was processed by the exchange.
+
+    DEFAULT_RETRY_STATUS_CODES = {500, 502, 503, 504}
+    RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
+
+    def __init__(self, max_retries: int = 3, initial_delay_ms: int = 100, max_delay_ms: int = 2000,
+                 multiplier: float = 2.0, jitter: float = 0.5, timeout_ms: int = None,
+                 retry_status_codes: Set[int] = None) -> None:
+        self.max_retries = max_retries
+        self.initial_delay_ms = initial_delay_ms
+        self.max_delay_ms = max_delay_ms
+        self.multiplier = multiplier
+        # fraction of the delay randomized
+        self.jitter = jitter
+        # timeout of a single attempt, no timeout if not set
+        self.timeout_ms = timeout_ms
+        self.retry_status_codes = retry_status_codes if retry_status_codes is not None else RetryMiddleware.DEFAULT_RETRY_STATUS_CODES
+
+        self.retry_count = 0
+
+    async def process(self, request: RestRequest, next_handler: RestHandlerType) -> dict:
+        if not request.is_idempotent():
+            return await next_handler(request)
+
+        attempt = 0
+        while True:
+            try:
+                if self.timeout_ms is not None:
+                    response = await asyncio.wait_for(next_handler(request), timeout = self.timeout_ms / 1000.0)
+                else:
+                    response = await next_handler(request)
+
+                if response['status_code'] not in self.retry_status_codes or attempt >= self.max_retries:
+                    return response
+
+                reason = f"status code {response['status_code']}"
+            except RetryMiddleware.RETRY_EXCEPTIONS as e:
+                if attempt >= self.max_retries:
+                    raise
+
+                reason = repr(e)
+
+            delay_ms = self.get_delay_ms(attempt)
+            attempt += 1
+            self.retry_count += 1
+
+            LOG.info(f"REST call [{request}] failed due to {reason}, retry #{attempt} in {delay_ms:.0f} ms.")
+            await asyncio.sleep(delay_ms / 1000.0)
+
+    def get_delay_ms(self, attempt: int) -> float:
+        delay_ms = min(self.max_delay_ms, self.initial_delay_ms * self.multiplier ** attempt)
+
+        return delay_ms * (1 - self.jitter * random.random())
+
+
+class HedgingMiddleware(RestMiddleware):
+    # Sends a second copy of an idempotent (GET) call if the first one has not been answered within the given latency
+    # percentile of the endpoint and returns whichever response arrives first, the other call is cancelled. This cuts
+    # the tail latency caused by a slow connection or server at the cost of additional requests (which count towards
+    # the rate limits). Endpoints are not hedged until enough latency samples are collected and the number of hedged
+    # calls is capped by max_hedge_ratio.
+
+    def __init__(self, percentile: float = 95, min_samples: int = 20, max_hedge_ratio: float = 0.1,
+                 latency_tracker: LatencyTracker = None) -> None:
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.latency_tracker = latency_tracker if latency_tracker is not None else LatencyTracker()
+
+        self.call_count = 0
+        self.hedged_count = 0
+        # number of calls answered by the hedged copy first
+        self.hedge_win_count = 0
+
+    async def process(self, request: RestRequest, next_handler: RestHandlerType) -> dict:
+        if not request.is_idempotent():
+            return await next_handler(request)
+
+        self.call_count += 1
+        endpoint = request.get_endpoint()
+        start_ns = time.perf_counter_ns()
+
+        hedge_delay_ms = self._get_hedge_delay_ms(endpoint)
+        if hedge_delay_ms is None:
+            response = await next_handler(request)
+            self.latency_tracker.add(endpoint, (time.perf_counter_ns() - start_ns) / 10**6)
+
+            return response
+        else:
+            return await self._hedge(request, next_handler, hedge_delay_ms, endpoint, start_ns)
+
+    def _get_hedge_delay_ms(self, endpoint: EndpointType) -> Optional[float]:
+        if self.latency_tracker.get_sample_count(endpoint) < self.min_samples:
+            return None
+
+        if self.hedged_count >= self.call_count * self.max_hedge_ratio:
+            return None
+
+        return self.latency_tracker.get_percentile(endpoint, self.percentile)
+
+    async def _hedge(self, request: RestRequest, next_handler: RestHandlerType, hedge_delay_ms: float,
+                     endpoint: EndpointType, start_ns: int) -> dict:
+        primary = async_create_task(next_handler(request))
+        primary.add_done_callback(functools.partial(self._on_primary_done, endpoint, start_ns))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout = hedge_delay_ms / 1000.0)
+            if len(done) > 0:
+                return primary.result()
+
+            LOG.debug("REST call [%s] not answered within %s ms, sending hedged request.", request, hedge_delay_ms)
+            self.hedged_count += 1
+            tasks.append(async_create_task(next_handler(request)))
+
+            while True:
+                done, _ = await asyncio.wait(tasks, return_when = asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tasks.remove(task)
+                    # the remaining call may still succeed if one of them failed
+                    if task.exception() is None or len(tasks) == 0:
+                        if task is not primary:
+                            self.hedge_win_count += 1
+
+                        return task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _on_primary_done(self, endpoint: EndpointType, start_ns: int, task: asyncio.Task) -> None:
+        # Only the latency of the primary call is sampled, the hedged copy answering faster would pull the percentile
+        # and hence the hedge delay down with every hedged call. A primary call cancelled in favour of the hedged copy
+        # is sampled with the time it had been waiting, i.e. it stays in the tail of the distribution.
+        if task.cancelled() or task.exception() is None:
+            self.latency_tracker.add(endpoint, (time.perf_counter_ns() - start_ns) / 10**6)
+
+    def get_stats(self) -> dict:
+        return {
+            'call_count': self.call_count,
+            'hedged_count': self.hedged_count,
+            'hedge_win_count': self.hedge_win_count
+        }
+
+
+class SingleFlightMiddleware(RestMiddleware):
+    # Concurrent identical unsigned GET calls (same endpoint, params and headers) share one in-flight HTTP request and
+    # all of them receive the same response object, hence the response must not be modified. Signed calls are never
+    # coalesced since each of them carries its own timestamp and signature. A caller cancelled while waiting does not
+    # cancel the shared request.
+
+    def __init__(self) -> None:
+        self.in_flight: Dict[tuple, asyncio.Task] = {}
+
+        self.call_count = 0
+        # number of calls served by a request sent by another call
+        self.coalesced_count = 0
+
+    async def process(self, request: RestRequest, next_handler: RestHandlerType) -> dict:
+        if request.signed or not request.is_idempotent():
+            return await next_handler(request)
+
+        self.call_count += 1
+        key = request.get_key()
+        task = self.in_flight.get(key)
+        if task is not None:
+            self.coalesced_count += 1
+            LOG.debug("REST call [%s] coalesced with an in-flight call.", request)
+        else:
+            task = async_create_task(next_handler(request))
+            self.in_flight[key] = task
+            task.add_done_callback(functools.partial(self._on_done, key))
+
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: tuple, task: asyncio.Task) -> None:
+        if self.in_flight.get(key) is task:
+            del self.in_flight[key]
+
+        # the exception is retrieved so that it is not reported as unhandled if all callers have been cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> dict:
+        return {
+            'call_count': self.call_count,
+            'coalesced_count': self.coalesced_count
+        }
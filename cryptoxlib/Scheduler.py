@@ -0,0 +1,125 @@
+import asyncio
+import heapq
+import logging
+import time
+from typing import List, Callable, Awaitable, Optional
+
+from cryptoxlib.version_conversions import async_create_task
+
+LOG = logging.getLogger(__name__)
+
+JobCallbackType = Callable[[], Awaitable[None]]
+
+
+class ScheduledJob(object):
+    def __init__(self, scheduler: 'Scheduler', callback: JobCallbackType, period_ms: float) -> None:
+        self.scheduler = scheduler
+        self.callback = callback
+        self.period_ns = int(period_ms * 10**6)
+
+        self.due_ns = 0
+        self.execution_count = 0
+        self.cancelled = False
+        self.task: Optional[asyncio.Task] = None
+        # resolved when the job is cancelled or fails
+        self.finished: Optional[asyncio.Future] = None
+
+    def cancel(self) -> None:
+        if self.cancelled:
+            return
+
+        self.cancelled = True
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+        if not self.finished.done():
+            self.finished.set_result(None)
+
+    async def wait(self) -> None:
+        # returns when the job has been cancelled, raises the exception the job failed with
+        await asyncio.shield(self.finished)
+
+
+class Scheduler(object):
+    # Single monotonic clock scheduler shared by all websocket managers of a client. Jobs are kept in a heap ordered
+    # by due time and only one event loop timer is armed for the earliest of them, irrespective of the number of jobs.
+
+    TIMER_TOLERANCE_NS = 10**6
+
+    def __init__(self) -> None:
+        # (due time, sequence, job)
+        self.heap: List[tuple] = []
+        self.seq = 0
+
+        self.timer_handle: Optional[asyncio.TimerHandle] = None
+        self.timer_due_ns: Optional[int] = None
+
+    def schedule_periodic(self, callback: JobCallbackType, period_ms: float, initial_delay_ms: float = 0) -> ScheduledJob:
+        # Executes the callback every period_ms, measured from the end of the previous execution. Executions of
+        # the same job never overlap.
+        job = ScheduledJob(self, callback, period_ms)
+        job.finished = asyncio.get_event_loop().create_future()
+        self._push(job, time.monotonic_ns() + int(initial_delay_ms * 10**6))
+
+        return job
+
+    def get_job_count(self) -> int:
+        return sum(1 for (_, _, job) in self.heap if not job.cancelled)
+
+    def _push(self, job: ScheduledJob, due_ns: int) -> None:
+        job.due_ns = due_ns
+        heapq.heappush(self.heap, (due_ns, self.seq, job))
+        self.seq += 1
+
+        if self.timer_due_ns is None or due_ns < self.timer_due_ns:
+            self._arm_timer()
+
+    def _arm_timer(self) -> None:
+        if self.timer_handle is not None:
+            self.timer_handle.cancel()
+            self.timer_handle = None
+            self.timer_due_ns = None
+
+        # cancelled jobs are removed lazily
+        while len(self.heap) > 0 and self.heap[0][2].cancelled:
+            heapq.heappop(self.heap)
+
+        if len(self.heap) == 0:
+            return
+
+        self.timer_due_ns = self.heap[0][0]
+        delay_sec = max(0, self.timer_due_ns - time.monotonic_ns()) / 10**9
+        self.timer_handle = asyncio.get_event_loop().call_later(delay_sec, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self.timer_handle = None
+        self.timer_due_ns = None
+
+        # event loop timers may fire slightly ahead of time
+        now_ns = time.monotonic_ns() + Scheduler.TIMER_TOLERANCE_NS
+        while len(self.heap) > 0 and self.heap[0][0] <= now_ns:
+            job = heapq.heappop(self.heap)[2]
+            if not job.cancelled:
+                self._execute(job)
+
+        self._arm_timer()
+
+    def _execute(self, job: ScheduledJob) -> None:
+        job.task = async_create_task(job.callback())
+        job.task.add_done_callback(lambda task: self._on_job_done(job, task))
+
+    def _on_job_done(self, job: ScheduledJob, task: asyncio.Task) -> None:
+        job.task = None
+        if job.cancelled or task.cancelled():
+            return
+
+        job.execution_count += 1
+
+        e = task.exception()
+        if e is not None:
+            LOG.debug("Scheduled job failed: %s", e)
+            job.cancelled = True
+            if not job.finished.done():
+                job.finished.set_exception(e)
+            return
+
+        self._push(job, time.monotonic_ns() + job.period_ns)
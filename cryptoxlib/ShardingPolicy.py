@@ -0,0 +1,80 @@
+import logging
+from typing import List, Callable, Optional
+
+from cryptoxlib.WebsocketMgr import Subscription
+from cryptoxlib.exceptions import CryptoXLibException
+
+LOG = logging.getLogger(__name__)
+
+MessageRateEstimatorType = Callable[[Subscription], float]
+
+
+class ShardingPolicy(object):
+    # message rate assumed for every subscription if no estimator is provided
+    DEFAULT_MESSAGE_RATE = 1.0
+
+    def __init__(self, max_subscriptions_per_connection: int = None, max_messages_per_second: float = None,
+                 message_rate_estimator: MessageRateEstimatorType = None) -> None:
+        if max_subscriptions_per_connection is None and max_messages_per_second is None:
+            raise CryptoXLibException("Sharding policy requires max number of subscriptions or max message rate per connection.")
+
+        if max_subscriptions_per_connection is not None and max_subscriptions_per_connection < 1:
+            raise CryptoXLibException(f"Max number of subscriptions per connection [{max_subscriptions_per_connection}] must be a positive number.")
+
+        if max_messages_per_second is not None and max_messages_per_second <= 0:
+            raise CryptoXLibException(f"Max number of messages per second [{max_messages_per_second}] must be a positive number.")
+
+        self.max_subscriptions_per_connection = max_subscriptions_per_connection
+        self.max_messages_per_second = max_messages_per_second
+        self.message_rate_estimator = message_rate_estimator
+
+    def estimate_message_rate(self, subscription: Subscription) -> float:
+        if self.message_rate_estimator is None:
+            return ShardingPolicy.DEFAULT_MESSAGE_RATE
+
+        return self.message_rate_estimator(subscription)
+
+    def estimate_load(self, subscriptions: List[Subscription]) -> float:
+        return sum(self.estimate_message_rate(subscription) for subscription in subscriptions)
+
+    def fits(self, subscription_count: int, load: float, subscription: Subscription) -> bool:
+        # a connection always accepts at least one subscription, otherwise subscriptions exceeding the message rate
+        # on their own could not be placed anywhere
+        if subscription_count == 0:
+            return True
+
+        if self.max_subscriptions_per_connection is not None and \
+                subscription_count + 1 > self.max_subscriptions_per_connection:
+            return False
+
+        if self.max_messages_per_second is not None and \
+                load + self.estimate_message_rate(subscription) > self.max_messages_per_second:
+            return False
+
+        return True
+
+    def find_shard(self, shards: List[List[Subscription]], subscription: Subscription) -> Optional[int]:
+        # first shard with enough capacity for the subscription
+        for i, shard in enumerate(shards):
+            if self.fits(len(shard), self.estimate_load(shard), subscription):
+                return i
+
+        return None
+
+    def split(self, subscriptions: List[Subscription]) -> List[List[Subscription]]:
+        shards: List[List[Subscription]] = []
+        loads: List[float] = []
+        for subscription in subscriptions:
+            rate = self.estimate_message_rate(subscription)
+            for i, shard in enumerate(shards):
+                if self.fits(len(shard), loads[i], subscription):
+                    shard.append(subscription)
+                    loads[i] += rate
+                    break
+            else:
+                shards.append([subscription])
+                loads.append(rate)
+
+        LOG.debug("%s subscriptions split into %s shards.", len(subscriptions), len(shards))
+
+        return shards
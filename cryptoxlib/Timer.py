@@ -13,9 +13,12 @@ class Timer(object):
         self.start_tmstmp_ms = None
 
     def __enter__(self) -> None:
-        if self.active:
+        # the timer only reports via debug log, hence no need to measure anything if debug log is off
+        if self.active and LOG.isEnabledFor(logging.DEBUG):
             self.start_tmstmp_ms = get_current_time_ms()
+        else:
+            self.start_tmstmp_ms = None
 
     def __exit__(self, type, value, traceback) -> None:
-        if self.active:
-            LOG.debug(f'Timer {self.name} finished. Took {round((get_current_time_ms() - self.start_tmstmp_ms), 3)} ms.')
\ No newline at end of file
+        if self.start_tmstmp_ms is not None:
+            LOG.debug("Timer %s finished. Took %s ms.", self.name, round((get_current_time_ms() - self.start_tmstmp_ms), 3))
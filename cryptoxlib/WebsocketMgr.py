@@ -1,14 +1,21 @@
 import websockets
-import json
 import logging
 import asyncio
 import ssl
 import aiohttp
 import enum
+import re
+import time
+import urllib.parse
 from abc import ABC, abstractmethod
-from typing import List, Callable, Any, Optional, Union
+from typing import List, Callable, Any, Optional, Union, Dict, Hashable
 
 from cryptoxlib.version_conversions import async_create_task
+from cryptoxlib.JsonCodec import JsonCodec, get_default_json_codec
+from cryptoxlib.MessageDeduplicator import MessageDeduplicator
+from cryptoxlib.ReconnectPolicy import ReconnectPolicy, ExponentialBackoffReconnectPolicy
+from cryptoxlib.DnsCache import DnsCache
+from cryptoxlib.Scheduler import Scheduler
 from cryptoxlib.exceptions import CryptoXLibException, WebsocketReconnectionException, WebsocketClosed, WebsocketError
 
 LOG = logging.getLogger(__name__)
@@ -16,12 +23,159 @@ LOG = logging.getLogger(__name__)
 CallbacksType = List[Callable[..., Any]]
 
 
+def get_subscription_key(subscription_id: Any) -> Hashable:
+    # Subscription ids are not required to be hashable (e.g. bitforex builds them from dictionaries). In order to be
+    # able to index subscriptions by their ids, they are converted into a canonical hashable form.
+    if isinstance(subscription_id, dict):
+        try:
+            return frozenset(subscription_id.items())
+        except TypeError:
+            # nested unhashable values
+            return frozenset((key, get_subscription_key(value)) for key, value in subscription_id.items())
+    elif isinstance(subscription_id, (list, tuple)):
+        return tuple(get_subscription_key(value) for value in subscription_id)
+    else:
+        return subscription_id
+
+
+# (field, is_str) -> (compact key, compact prefix, quote, backslash, prefix regex, regex)
+JSON_STRING_FIELD_PATTERNS: Dict[tuple, tuple] = {}
+
+
+def _get_json_string_field_patterns(field: str, is_str: bool) -> tuple:
+    patterns = JSON_STRING_FIELD_PATTERNS.get((field, is_str))
+    if patterns is None:
+        key = '"' + field + '":"'
+        regex = r'"' + re.escape(field) + r'"\s*:\s*"([^"\\]*)"'
+        prefix_regex = r'\{\s*' + regex
+        patterns = (key, '{' + key, '"', '\\', re.compile(prefix_regex), re.compile(regex))
+        if not is_str:
+            patterns = tuple(item.encode('utf-8') for item in patterns[:4]) + \
+                       (re.compile(prefix_regex.encode('utf-8')), re.compile(regex.encode('utf-8')))
+        JSON_STRING_FIELD_PATTERNS[(field, is_str)] = patterns
+
+    return patterns
+
+
+def extract_json_string_field(message: Union[str, bytes], field: str, prefix_only: bool = False) -> Optional[str]:
+    # Cheap extraction of a string field from a raw JSON message without decoding the whole message. The first
+    # occurrence of the field is returned, hence it is suitable only for fields which do not appear nested before
+    # the top-level one. If prefix_only is set, the field has to be the very first element of the top-level object.
+    # None is returned if the field cannot be extracted this way (e.g. escaped values).
+    is_str = isinstance(message, str)
+    key, prefix, quote, backslash, prefix_regex, regex = _get_json_string_field_patterns(field, is_str)
+
+    # fast path for compact JSON
+    if prefix_only:
+        start = len(prefix) if message.startswith(prefix) else -1
+    else:
+        start = message.find(key)
+        if start >= 0:
+            start += len(key)
+
+    if start >= 0:
+        end = message.find(quote, start)
+        if end < 0:
+            return None
+        value = message[start:end]
+        # escaped values are left to the full decoder
+        if backslash in value:
+            return None
+    else:
+        # JSON with whitespaces
+        match = prefix_regex.match(message) if prefix_only else regex.search(message)
+        if match is None:
+            return None
+        value = match.group(1)
+
+    return value if is_str else value.decode('utf-8')
+
+
 class WebsocketMgrMode(enum.Enum):
     STOPPED = enum.auto()
     RUNNING = enum.auto()
     CLOSING = enum.auto()
 
 
+class QueueOverflowPolicy(enum.Enum):
+    # wait until the processing task frees a slot in the queue
+    BLOCK = enum.auto()
+    # discard the oldest queued message to make space for the new one
+    DROP_OLDEST = enum.auto()
+    # discard the newly received message
+    DROP_NEWEST = enum.auto()
+    # close the connection (and reconnect if auto reconnection is enabled)
+    DISCONNECT = enum.auto()
+
+
+class CallbackExecutionMode(enum.Enum):
+    # a single callback is awaited directly, multiple callbacks are executed concurrently
+    AUTO = enum.auto()
+    # callbacks are awaited one after another in the order of registration
+    SEQUENTIAL = enum.auto()
+    # every callback is wrapped into a task and all tasks are gathered
+    CONCURRENT = enum.auto()
+    # callbacks are plain (non-coroutine) functions which are called directly
+    SYNCHRONOUS = enum.auto()
+    # callbacks are scheduled as tasks and not awaited, the number of tasks in flight is bounded
+    FIRE_AND_FORGET = enum.auto()
+
+
+class MessageQueueStats(object):
+    def __init__(self):
+        self.received_count = 0
+        self.processed_count = 0
+        self.dropped_count = 0
+        self.overflow_count = 0
+        self.max_depth = 0
+
+    def __str__(self):
+        return f"received [{self.received_count}], processed [{self.processed_count}], dropped [{self.dropped_count}], " \
+               f"overflows [{self.overflow_count}], max depth [{self.max_depth}]"
+
+
+class ConnectionStats(object):
+    def __init__(self):
+        self.connection_attempt_count = 0
+        self.connection_count = 0
+        # duration of the last successful connection handshake
+        self.last_connect_time_ms: Optional[float] = None
+        # time from the start of the last connection attempt until the first message was received
+        self.last_time_to_first_message_ms: Optional[float] = None
+        # time from the last disconnection until the first message of the next connection was received
+        self.last_downtime_ms: Optional[float] = None
+
+        self.connect_start_ns: Optional[int] = None
+        self.disconnect_ns: Optional[int] = None
+
+    def on_connecting(self) -> None:
+        self.connection_attempt_count += 1
+        self.connect_start_ns = time.monotonic_ns()
+
+    def on_connected(self) -> None:
+        self.connection_count += 1
+        # connection may have been established without on_connecting (e.g. main_loop driven directly)
+        if self.connect_start_ns is not None:
+            self.last_connect_time_ms = (time.monotonic_ns() - self.connect_start_ns) / 10**6
+
+    def on_first_message(self) -> None:
+        now_ns = time.monotonic_ns()
+        if self.connect_start_ns is not None:
+            self.last_time_to_first_message_ms = (now_ns - self.connect_start_ns) / 10**6
+        if self.disconnect_ns is not None:
+            self.last_downtime_ms = (now_ns - self.disconnect_ns) / 10**6
+            self.disconnect_ns = None
+
+    def on_disconnected(self) -> None:
+        if self.disconnect_ns is None:
+            self.disconnect_ns = time.monotonic_ns()
+
+    def __str__(self):
+        return f"attempts [{self.connection_attempt_count}], connections [{self.connection_count}], " \
+               f"connect time [{self.last_connect_time_ms} ms], time to first message [{self.last_time_to_first_message_ms} ms], " \
+               f"downtime [{self.last_downtime_ms} ms]"
+
+
 class Websocket(ABC):
     def __init__(self):
         pass
@@ -49,13 +203,14 @@ class Websocket(ABC):
 
 class FullWebsocket(Websocket):
     def __init__(self, websocket_uri: str, builtin_ping_interval: Optional[float] = 20,
-                 max_message_size: int = 2**20, ssl_context: ssl.SSLContext = None):
+                 max_message_size: int = 2**20, ssl_context: ssl.SSLContext = None, dns_cache: DnsCache = None):
         super().__init__()
 
         self.websocket_uri = websocket_uri
         self.builtin_ping_interval = builtin_ping_interval
         self.max_message_size = max_message_size
         self.ssl_context = ssl_context
+        self.dns_cache = dns_cache
 
         self.ws = None
 
@@ -63,11 +218,30 @@ class FullWebsocket(Websocket):
         if self.ws is not None:
             raise CryptoXLibException("Websocket reattempted to make connection while previous one is still active.")
 
-        LOG.debug(f"Connecting to websocket {self.websocket_uri}")
-        self.ws = await websockets.connect(self.websocket_uri,
-                                           ping_interval = self.builtin_ping_interval,
-                                           max_size = self.max_message_size,
-                                           ssl = self.ssl_context)
+        LOG.debug("Connecting to websocket %s", self.websocket_uri)
+        if self.dns_cache is None:
+            self.ws = await websockets.connect(self.websocket_uri,
+                                               ping_interval = self.builtin_ping_interval,
+                                               max_size = self.max_message_size,
+                                               ssl = self.ssl_context)
+            return
+
+        # connect to a pre-resolved address in order to save the DNS lookup on reconnection
+        uri = urllib.parse.urlsplit(self.websocket_uri)
+        port = uri.port if uri.port is not None else (443 if uri.scheme == 'wss' else 80)
+        address = await self.dns_cache.resolve(uri.hostname, port)
+        try:
+            self.ws = await websockets.connect(self.websocket_uri,
+                                               ping_interval = self.builtin_ping_interval,
+                                               max_size = self.max_message_size,
+                                               ssl = self.ssl_context,
+                                               host = address,
+                                               port = port,
+                                               server_hostname = uri.hostname if uri.scheme == 'wss' else None)
+        except Exception:
+            # the address may not be valid anymore
+            self.dns_cache.invalidate(uri.hostname, port)
+            raise
 
     async def is_open(self):
         return self.ws is not None
@@ -94,26 +268,35 @@ class FullWebsocket(Websocket):
 
 class AiohttpWebsocket(Websocket):
     def __init__(self, websocket_uri: str, builtin_ping_interval: Optional[float] = 20,
-                 max_message_size: int = 2 ** 20, ssl_context: ssl.SSLContext = None):
+                 max_message_size: int = 2 ** 20, ssl_context: ssl.SSLContext = None,
+                 connector: aiohttp.BaseConnector = None):
         super().__init__()
 
         self.websocket_uri = websocket_uri
         self.builtin_ping_interval = builtin_ping_interval
         self.max_message_size = max_message_size
         self.ssl_context = ssl_context
+        # connector outliving the websocket, keeps e.g. DNS cache across reconnections
+        self.connector = connector
 
         self.ws = None
+        self.session = None
 
     async def connect(self):
         if self.ws is not None:
             raise CryptoXLibException("Websocket reattempted to make connection while previous one is still active.")
 
-        self.session = aiohttp.ClientSession()
-        self.ws = await self.session.ws_connect(url = self.websocket_uri,
-                                           max_msg_size = self.max_message_size,
-                                           autoping = True,
-                                           heartbeat = self.builtin_ping_interval,
-                                           ssl = self.ssl_context)
+        self.session = aiohttp.ClientSession(connector = self.connector, connector_owner = self.connector is None)
+        try:
+            self.ws = await self.session.ws_connect(url = self.websocket_uri,
+                                               max_msg_size = self.max_message_size,
+                                               autoping = True,
+                                               heartbeat = self.builtin_ping_interval,
+                                               ssl = self.ssl_context)
+        except Exception:
+            await self.session.close()
+            self.session = None
+            raise
 
     async def is_open(self):
         return self.ws is not None
@@ -157,20 +340,21 @@ class WebsocketOutboundMessage(ABC):
 
 
 class ClientWebsocketHandle(object):
-    def __init__(self, websocket: Websocket):
+    def __init__(self, websocket: Websocket, json_codec: JsonCodec = None):
         self.websocket = websocket
+        self.json_codec = json_codec if json_codec is not None else get_default_json_codec()
 
     async def send(self, message: Union[str, dict, WebsocketOutboundMessage]):
         if isinstance(message, str):
             pass
         elif isinstance(message, dict):
-            message = json.dumps(message)
+            message = self.json_codec.dumps(message)
         elif isinstance(message, WebsocketOutboundMessage):
-            message = json.dumps(message.to_json())
+            message = self.json_codec.dumps(message.to_json())
         else:
             raise CryptoXLibException("Only string or JSON serializable objects can be sent over the websocket.")
 
-        LOG.debug(f"> {message}")
+        LOG.debug("> %s", message)
         return await self.websocket.send(message)
 
     async def receive(self):
@@ -187,10 +371,21 @@ class WebsocketMessage(object):
 class Subscription(ABC):
     INTERNAL_SUBSCRIPTION_ID_SEQ = 0
 
+    DEFAULT_MAX_IN_FLIGHT_CALLBACKS = 1000
+
     def __init__(self, callbacks: CallbacksType = None):
         self.callbacks = callbacks
 
+        self.callback_execution_mode = CallbackExecutionMode.AUTO
+        self.max_in_flight_callbacks = Subscription.DEFAULT_MAX_IN_FLIGHT_CALLBACKS
+        self.in_flight_callbacks = set()
+        self.in_flight_semaphore = None
+
+        # in raw mode callbacks receive the undecoded websocket frame
+        self.raw_mode = False
+
         self.subscription_id = None
+        self.subscription_key = None
         self.internal_subscription_id = Subscription.INTERNAL_SUBSCRIPTION_ID_SEQ
         Subscription.INTERNAL_SUBSCRIPTION_ID_SEQ += 1
 
@@ -208,27 +403,108 @@ class Subscription(ABC):
     def get_subscription_id(self) -> Any:
         if self.subscription_id is None:
             self.subscription_id = self.construct_subscription_id()
-            LOG.debug(f"New subscription id constructed: {self.subscription_id}")
+            LOG.debug("New subscription id constructed: %s", self.subscription_id)
 
         return self.subscription_id
 
+    def get_subscription_key(self) -> Hashable:
+        if self.subscription_key is None:
+            self.subscription_key = get_subscription_key(self.get_subscription_id())
+
+        return self.subscription_key
+
+    def get_subscription_keys(self) -> List[Hashable]:
+        # keys of all message subscription ids routed to the subscription, a subscription may receive messages of
+        # several channels
+        return [self.get_subscription_key()]
+
+    def reset_subscription_id(self) -> None:
+        # subscription id is constructed again, e.g. after the subscription has been reinitialized
+        self.subscription_id = None
+        self.subscription_key = None
+
     async def initialize(self, **kwargs) -> None:
         pass
 
+    async def close(self) -> None:
+        # invoked when the websocket manager stops, background tasks of the subscription are to be cancelled here.
+        # Callbacks still in flight (CallbackExecutionMode.FIRE_AND_FORGET) are cancelled.
+        in_flight_callbacks = list(self.in_flight_callbacks)
+        for task in in_flight_callbacks:
+            task.cancel()
+        if len(in_flight_callbacks) > 0:
+            await asyncio.gather(*in_flight_callbacks, return_exceptions = True)
+
     async def process_message(self, message: WebsocketMessage) -> None:
         await self.process_callbacks(message)
 
+    def set_raw_mode(self, raw_mode: bool = True) -> None:
+        # Messages of the subscription are routed by a routing key extracted directly from the raw frame and the frame
+        # is passed to the callbacks as received (str or bytes) without being decoded. Messages which cannot be routed
+        # this way (e.g. control messages) are still decoded and delivered as usual. Has to be set before the
+        # subscription is handed over to the websocket manager.
+        self.raw_mode = raw_mode
+
+    def set_callback_execution_mode(self, mode: CallbackExecutionMode, max_in_flight_callbacks: int = None) -> None:
+        self.callback_execution_mode = mode
+
+        if max_in_flight_callbacks is not None:
+            if max_in_flight_callbacks < 1:
+                raise CryptoXLibException(f"Max number of callbacks in flight [{max_in_flight_callbacks}] must be a positive number.")
+
+            self.max_in_flight_callbacks = max_in_flight_callbacks
+            # semaphore is created lazily within the running event loop
+            self.in_flight_semaphore = None
+
     async def process_callbacks(self, message: WebsocketMessage) -> None:
-        if self.callbacks is not None:
-            tasks = []
+        if not self.callbacks:
+            return
+
+        # If message contains a websocket, then the websocket handle will be passed to the callbacks.
+        # This is useful for duplex websockets
+        if message.websocket is not None:
+            args = (message.message, message.websocket)
+        else:
+            args = (message.message,)
+
+        mode = self.callback_execution_mode
+        if mode == CallbackExecutionMode.AUTO:
+            if len(self.callbacks) == 1:
+                await self.callbacks[0](*args)
+            else:
+                await asyncio.gather(*[async_create_task(cb(*args)) for cb in self.callbacks])
+        elif mode == CallbackExecutionMode.SEQUENTIAL:
+            for cb in self.callbacks:
+                await cb(*args)
+        elif mode == CallbackExecutionMode.CONCURRENT:
+            await asyncio.gather(*[async_create_task(cb(*args)) for cb in self.callbacks])
+        elif mode == CallbackExecutionMode.SYNCHRONOUS:
             for cb in self.callbacks:
-                # If message contains a websocket, then the websocket handle will be passed to the callbacks.
-                # This is useful for duplex websockets
-                if message.websocket is not None:
-                    tasks.append(async_create_task(cb(message.message, message.websocket)))
-                else:
-                    tasks.append(async_create_task(cb(message.message)))
-            await asyncio.gather(*tasks)
+                cb(*args)
+        elif mode == CallbackExecutionMode.FIRE_AND_FORGET:
+            await self._fire_callbacks(args)
+        else:
+            raise CryptoXLibException(f"Unsupported callback execution mode {mode}.")
+
+    async def _fire_callbacks(self, args: tuple) -> None:
+        if self.in_flight_semaphore is None:
+            self.in_flight_semaphore = asyncio.Semaphore(self.max_in_flight_callbacks)
+        semaphore = self.in_flight_semaphore
+
+        for cb in self.callbacks:
+            # wait for a free slot if the limit of callbacks in flight has been reached
+            await semaphore.acquire()
+
+            task = async_create_task(cb(*args))
+            self.in_flight_callbacks.add(task)
+            task.add_done_callback(lambda t: self._on_callback_done(t, semaphore))
+
+    def _on_callback_done(self, task: asyncio.Task, semaphore: asyncio.Semaphore) -> None:
+        self.in_flight_callbacks.discard(task)
+        semaphore.release()
+
+        if not task.cancelled() and task.exception() is not None:
+            LOG.error(f"Callback of subscription {self.subscription_id} failed: {task.exception()}")
 
     def __eq__(self, other):
         return self.internal_subscription_id == other.internal_subscription_id
@@ -239,12 +515,14 @@ class WebsocketMgr(ABC):
 
     def __init__(self, websocket_uri: str, subscriptions: List[Subscription], builtin_ping_interval: Optional[float] = 20,
                  max_message_size: int = 2**20, periodic_timeout_sec: int = None, ssl_context = None,
-                 auto_reconnect: bool = False, startup_delay_ms: int = 0) -> None:
+                 auto_reconnect: bool = False, startup_delay_ms: int = 0, periodic_initial_delay_sec: int = 0) -> None:
         self.websocket_uri = websocket_uri
         self.subscriptions = subscriptions
         self.builtin_ping_interval = builtin_ping_interval
         self.max_message_size = max_message_size
         self.periodic_timeout_sec = periodic_timeout_sec
+        # delay of the first periodic processing after a connection has been established
+        self.periodic_initial_delay_sec = periodic_initial_delay_sec
         self.ssl_context = ssl_context
         self.auto_reconnect = auto_reconnect
         self.startup_delay_ms = startup_delay_ms
@@ -254,11 +532,93 @@ class WebsocketMgr(ABC):
 
         self.websocket = None
         self.mode: WebsocketMgrMode = WebsocketMgrMode.STOPPED
+        self.connected = False
+        self.first_message_received = False
+
+        self.reconnect_policy: ReconnectPolicy = ExponentialBackoffReconnectPolicy()
+        self.connection_stats = ConnectionStats()
+        # DNS cache and aiohttp connector are kept across reconnections
+        self.dns_cache = DnsCache()
+        self.aiohttp_connector: Optional[aiohttp.TCPConnector] = None
+
+        # scheduler of the periodic processing, shared by all managers of a client
+        self.scheduler = Scheduler()
+
+        # set if the manager is one of several redundant connections receiving the same messages
+        self.replica_id = 0
+        self.message_deduplicator: Optional[MessageDeduplicator] = None
+        self.json_codec: JsonCodec = get_default_json_codec()
+
+        # subscription key -> subscription, used to route incoming messages without scanning all subscriptions
+        self.subscription_index: Dict[Hashable, Subscription] = {}
+        # subset of the index containing only subscriptions in raw mode
+        self.raw_subscription_index: Dict[Hashable, Subscription] = {}
+
+        self._validate_raw_mode(self.subscriptions)
+
+        # optional queue decoupling reading from the socket and processing of the messages
+        self.message_queue_size: Optional[int] = None
+        self.queue_overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK
+        self.message_queue: Optional[asyncio.Queue] = None
+        self.message_queue_stats = MessageQueueStats()
+
+    def configure_message_queue(self, max_size: Optional[int],
+                                overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK) -> None:
+        # If max_size is set, the websocket is read by a dedicated task which only puts incoming messages into a bounded
+        # queue. The messages are processed by a separate task so that slow callbacks do not stall the socket.
+        # If max_size is None, messages are processed inline (default).
+        if max_size is not None and max_size < 1:
+            raise CryptoXLibException(f"Message queue size [{max_size}] must be a positive number.")
+
+        self.message_queue_size = max_size
+        self.queue_overflow_policy = overflow_policy
+
+    def get_message_queue_depth(self) -> int:
+        if self.message_queue is None:
+            return 0
+
+        return self.message_queue.qsize()
 
     @abstractmethod
     async def _process_message(self, websocket: Websocket, response: str) -> None:
         pass
 
+    def _extract_raw_subscription_id(self, message: Union[str, bytes]) -> Optional[Any]:
+        # Websockets supporting raw mode override this method to extract subscription id from an undecoded message.
+        # None means the message has to be decoded and processed by _process_message.
+        return None
+
+    def get_message_sequence_key(self, message: WebsocketMessage) -> Optional[Hashable]:
+        # Websockets supporting redundant connections override this method to identify the same message received
+        # over different connections (typically by an exchange sequence number). Messages without the key are
+        # delivered only by the leading connection.
+        return None
+
+    def _supports_raw_mode(self) -> bool:
+        return type(self)._extract_raw_subscription_id is not WebsocketMgr._extract_raw_subscription_id
+
+    def _validate_raw_mode(self, subscriptions: List[Subscription]) -> None:
+        if not self._supports_raw_mode():
+            for subscription in subscriptions:
+                if subscription.raw_mode:
+                    raise CryptoXLibException(f"Raw mode is not supported by {type(self).__name__}.")
+
+    async def _dispatch_message(self, websocket: Websocket, message: Union[str, bytes]) -> None:
+        if self.raw_subscription_index:
+            subscription_id = self._extract_raw_subscription_id(message)
+            if subscription_id is not None:
+                subscription = self.raw_subscription_index.get(get_subscription_key(subscription_id))
+                if subscription is not None:
+                    # identical frames received over redundant connections are recognized by their hash
+                    if self.message_deduplicator is not None and \
+                            not self.message_deduplicator.is_first_arrival(self, (subscription_id, hash(message))):
+                        return
+
+                    await subscription.process_callbacks(WebsocketMessage(subscription_id = subscription_id, message = message))
+                    return
+
+        await self._process_message(websocket, message)
+
     async def _process_periodic(self, websocket: Websocket) -> None:
         pass
 
@@ -270,21 +630,28 @@ class WebsocketMgr(ABC):
 
     def get_full_websocket(self) -> Websocket:
         uri = self.websocket_uri + self.get_websocket_uri_variable_part()
-        LOG.debug(f"Websocket URI: {uri}")
+        LOG.debug("Websocket URI: %s", uri)
 
         return FullWebsocket(websocket_uri = uri,
                       builtin_ping_interval = self.builtin_ping_interval,
                       max_message_size = self.max_message_size,
-                      ssl_context = self.ssl_context)
+                      ssl_context = self.ssl_context,
+                      dns_cache = self.dns_cache)
 
     def get_aiohttp_websocket(self) -> Websocket:
         uri = self.websocket_uri + self.get_websocket_uri_variable_part()
-        LOG.debug(f"Websocket URI: {uri}")
+        LOG.debug("Websocket URI: %s", uri)
+
+        if self.aiohttp_connector is None or self.aiohttp_connector.closed:
+            # websocket connections must not be limited by the connection pool
+            self.aiohttp_connector = aiohttp.TCPConnector(limit = 0, use_dns_cache = True,
+                                                          ttl_dns_cache = self.dns_cache.ttl_sec)
 
         return AiohttpWebsocket(websocket_uri = uri,
                       builtin_ping_interval = self.builtin_ping_interval,
                       max_message_size = self.max_message_size,
-                      ssl_context = self.ssl_context)
+                      ssl_context = self.ssl_context,
+                      connector = self.aiohttp_connector)
 
     async def validate_subscriptions(self, subscriptions: List[Subscription]) -> None:
         pass
@@ -293,11 +660,20 @@ class WebsocketMgr(ABC):
         for subscription in subscriptions:
             await subscription.initialize()
 
+    async def close_subscriptions(self, subscriptions: List[Subscription]) -> None:
+        for subscription in subscriptions:
+            try:
+                await subscription.close()
+            except Exception as e:
+                LOG.error(f"[{self.id}] Subscription {subscription.get_subscription_id()} could not be closed: {e}")
+
     async def subscribe(self, new_subscriptions: List[Subscription]):
+        self._validate_raw_mode(new_subscriptions)
         await self.validate_subscriptions(new_subscriptions)
         await self.initialize_subscriptions(new_subscriptions)
 
         self.subscriptions += new_subscriptions
+        self._rebuild_subscription_index()
 
         await self.send_subscription_message(new_subscriptions)
 
@@ -306,11 +682,12 @@ class WebsocketMgr(ABC):
         for subscription in subscriptions:
             subscription_messages.append(subscription.get_subscription_message())
 
-        LOG.debug(f"> {subscription_messages}")
-        await self.websocket.send(json.dumps(subscription_messages))
+        LOG.debug("> %s", subscription_messages)
+        await self.websocket.send(self.json_codec.dumps(subscription_messages))
 
     async def unsubscribe(self, subscriptions: List[Subscription]):
         self.subscriptions = [subscription for subscription in self.subscriptions if subscription not in subscriptions]
+        self._rebuild_subscription_index()
         await self.send_unsubscription_message(subscriptions)
 
     async def send_unsubscription_message(self, subscriptions: List[Subscription]):
@@ -324,17 +701,84 @@ class WebsocketMgr(ABC):
         await self.send_subscription_message(self.subscriptions)
 
         # start processing incoming messages
+        if self.message_queue_size is None:
+            while True:
+                message = await self.websocket.receive()
+                if not self.first_message_received:
+                    self._on_first_message()
+                if LOG.isEnabledFor(logging.DEBUG):
+                    LOG.debug("< %s", message)
+
+                await self._dispatch_message(self.websocket, message)
+        else:
+            await self._queued_main_loop()
+
+    async def _queued_main_loop(self):
+        self.message_queue = asyncio.Queue(maxsize = self.message_queue_size)
+
+        tasks = [async_create_task(self._reader_loop(self.message_queue)),
+                 async_create_task(self._processor_loop(self.message_queue))]
+        try:
+            done, pending = await asyncio.wait(tasks, return_when = asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions = True)
+
+            # messages of a closed connection are not processed any more
+            self.message_queue = None
+
+    async def _reader_loop(self, queue: asyncio.Queue):
+        stats = self.message_queue_stats
         while True:
             message = await self.websocket.receive()
-            LOG.debug(f"< {message}")
+            if not self.first_message_received:
+                self._on_first_message()
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug("< %s", message)
+            stats.received_count += 1
+
+            if queue.full():
+                stats.overflow_count += 1
+
+                if self.queue_overflow_policy == QueueOverflowPolicy.BLOCK:
+                    await queue.put(message)
+                elif self.queue_overflow_policy == QueueOverflowPolicy.DROP_NEWEST:
+                    stats.dropped_count += 1
+                    continue
+                elif self.queue_overflow_policy == QueueOverflowPolicy.DROP_OLDEST:
+                    queue.get_nowait()
+                    stats.dropped_count += 1
+                    queue.put_nowait(message)
+                elif self.queue_overflow_policy == QueueOverflowPolicy.DISCONNECT:
+                    LOG.warning(f"[{self.id}] Message queue overflow, connection will be closed. Queue stats: {stats}")
+                    raise WebsocketReconnectionException(f"Message queue overflow (size {self.message_queue_size}).")
+            else:
+                queue.put_nowait(message)
+
+            depth = queue.qsize()
+            if depth > stats.max_depth:
+                stats.max_depth = depth
 
-            await self._process_message(self.websocket, message)
+    async def _processor_loop(self, queue: asyncio.Queue):
+        while True:
+            message = await queue.get()
+            await self._dispatch_message(self.websocket, message)
+            self.message_queue_stats.processed_count += 1
 
     async def periodic_loop(self):
         if self.periodic_timeout_sec is not None:
-            while True:
-                await self._process_periodic(self.websocket)
-                await asyncio.sleep(self.periodic_timeout_sec)
+            job = self.scheduler.schedule_periodic(lambda: self._process_periodic(self.websocket),
+                                                   period_ms = self.periodic_timeout_sec * 1000,
+                                                   initial_delay_ms = self.periodic_initial_delay_sec * 1000)
+            try:
+                # raises if the periodic processing fails
+                await job.wait()
+            finally:
+                job.cancel()
 
     async def run(self) -> None:
         self.mode = WebsocketMgrMode.RUNNING
@@ -342,19 +786,33 @@ class WebsocketMgr(ABC):
         await self.validate_subscriptions(self.subscriptions)
         await self.initialize_subscriptions(self.subscriptions)
 
+        reconnection = False
         try:
             # main loop ensuring proper reconnection if required
             while True:
-                LOG.debug(f"[{self.id}] Initiating websocket connection.")
+                LOG.debug("[%s] Initiating websocket connection.", self.id)
                 self.websocket = None
                 try:
-                        # sleep for the requested period before initiating the connection. This is useful when client
-                        # opens many connections at the same time and server cannot handle the load
-                        await asyncio.sleep(self.startup_delay_ms / 1000.0)
-                        LOG.debug(f"[{self.id}] Websocket initiation delayed by {self.startup_delay_ms}ms.")
-
+                        if not reconnection:
+                            # sleep for the requested period before initiating the connection. This is useful when
+                            # client opens many connections at the same time and server cannot handle the load
+                            await asyncio.sleep(self.startup_delay_ms / 1000.0)
+                            LOG.debug("[%s] Websocket initiation delayed by %sms.", self.id, self.startup_delay_ms)
+                        else:
+                            await self._prepare_reconnection()
+                        reconnection = True
+
+                        # subscription ids may be known only after (re)initialization, hence the index is
+                        # rebuilt for every new connection
+                        self._rebuild_subscription_index()
+
+                        self.connection_stats.on_connecting()
+                        self.first_message_received = False
                         self.websocket = self.get_websocket()
                         await self.websocket.connect()
+                        self.connected = True
+                        self.connection_stats.on_connected()
+                        LOG.debug("[%s] Websocket connected in %s ms.", self.id, self.connection_stats.last_connect_time_ms)
 
                         done, pending = await asyncio.wait(
                             [async_create_task(self.main_loop()),
@@ -365,7 +823,7 @@ class WebsocketMgr(ABC):
                             try:
                                 task.result()
                             except Exception as e:
-                                LOG.debug(f"[{self.id}] Websocket processing has led to an exception, all pending tasks are going to be cancelled.")
+                                LOG.debug("[%s] Websocket processing has led to an exception, all pending tasks are going to be cancelled.", self.id)
                                 for task in pending:
                                     if not task.cancelled():
                                         task.cancel()
@@ -376,19 +834,21 @@ class WebsocketMgr(ABC):
                                         await asyncio.wait(pending, return_when = asyncio.ALL_COMPLETED)
                                         raise
                                     finally:
-                                        LOG.debug(f"[{self.id}] All pending tasks cancelled successfully.")
+                                        LOG.debug("[%s] All pending tasks cancelled successfully.", self.id)
                                 raise
                 # recoverable exceptions
                 except (websockets.ConnectionClosedError,
                         websockets.ConnectionClosedOK,
                         websockets.InvalidStatusCode,
-                        ConnectionResetError,
+                        OSError,
+                        asyncio.TimeoutError,
+                        aiohttp.ClientError,
                         WebsocketClosed,
                         WebsocketError,
                         WebsocketReconnectionException) as e:
                     LOG.info(f"[{self.id}] Exception [{type(e)}]: {e}")
                     if self.mode == WebsocketMgrMode.CLOSING:
-                        LOG.debug(f"[{self.id}] Websocket is going to be shut down.")
+                        LOG.debug("[%s] Websocket is going to be shut down.", self.id)
                         # exit the main infinite loop
                         break
                     elif self.auto_reconnect:
@@ -397,9 +857,11 @@ class WebsocketMgr(ABC):
                     else:
                         raise
                 finally:
+                    self.connected = False
+                    self.connection_stats.on_disconnected()
                     if self.websocket is not None:
                         if await self.websocket.is_open():
-                            LOG.debug(f"[{self.id}] Closing websocket connection.")
+                            LOG.debug("[%s] Closing websocket connection.", self.id)
                             await self.websocket.close()
         except asyncio.CancelledError:
             LOG.warning(f"[{self.id}] The websocket was requested to be cancelled.")
@@ -407,13 +869,65 @@ class WebsocketMgr(ABC):
             LOG.error(f"[{self.id}] An exception [{e}] occurred. The websocket manager will be closed.")
             self._print_subscriptions()
             raise
+        finally:
+            await self.close_subscriptions(self.subscriptions)
 
-    async def publish_message(self, message: WebsocketMessage) -> None:
+            if self.aiohttp_connector is not None:
+                await self.aiohttp_connector.close()
+                self.aiohttp_connector = None
+
+    async def _prepare_reconnection(self) -> None:
+        while True:
+            delay_ms = self.reconnect_policy.get_next_delay_ms()
+            if delay_ms is None:
+                raise CryptoXLibException(f"[{self.id}] Websocket could not be reconnected.")
+
+            if delay_ms > 0:
+                LOG.info(f"[{self.id}] Websocket reconnection delayed by {round(delay_ms)} ms.")
+                await asyncio.sleep(delay_ms / 1000.0)
+
+            # Subscriptions are initialized again since the data obtained during initialization may not be valid
+            # anymore (e.g. expired listen keys). Subscription ids may depend on them, hence they are constructed again
+            # as well.
+            for subscription in self.subscriptions:
+                subscription.reset_subscription_id()
+            try:
+                await self.initialize_subscriptions(self.subscriptions)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # initialization may depend on REST calls, their failure is retried like a failed connection
+                LOG.warning(f"[{self.id}] Subscriptions could not be initialized [{e}], initialization will be retried.")
+
+    def _on_first_message(self) -> None:
+        self.first_message_received = True
+        self.connection_stats.on_first_message()
+        self.reconnect_policy.on_connection_established()
+
+        LOG.debug("[%s] First message received. Connection stats: %s", self.id, self.connection_stats)
+
+    def _rebuild_subscription_index(self) -> None:
+        subscription_index = {}
         for subscription in self.subscriptions:
-            if subscription.get_subscription_id() == message.subscription_id:
-                await subscription.process_message(message)
+            for subscription_key in subscription.get_subscription_keys():
+                # in case of duplicate ids the first subscription wins
+                subscription_index.setdefault(subscription_key, subscription)
+
+        self.subscription_index = subscription_index
+        self.raw_subscription_index = {key: subscription for key, subscription in subscription_index.items()
+                                       if subscription.raw_mode}
+
+    async def publish_message(self, message: WebsocketMessage) -> None:
+        subscription = self.subscription_index.get(get_subscription_key(message.subscription_id))
+        if subscription is not None:
+            if self.message_deduplicator is not None and \
+                    not self.message_deduplicator.is_first_arrival(self, self.get_message_sequence_key(message)):
                 return
 
+            await subscription.process_message(message)
+            return
+
         LOG.warning(f"[{self.id}] Websocket message with subscription id {message.subscription_id} did not identify any subscription!")
 
     def _print_subscriptions(self):
@@ -424,11 +938,11 @@ class WebsocketMgr(ABC):
 
     async def shutdown(self):
         if self.mode == WebsocketMgrMode.CLOSING:
-            LOG.debug(f"[{self.id}] Websocket manager already being shut down.")
+            LOG.debug("[%s] Websocket manager already being shut down.", self.id)
             return
 
         self.mode = WebsocketMgrMode.CLOSING
         if self.websocket is not None:
-            LOG.debug(f"[{self.id}] Manually closing websocket connection.")
+            LOG.debug("[%s] Manually closing websocket connection.", self.id)
             if await self.websocket.is_open():
                 await self.websocket.close()
\ No newline at end of file
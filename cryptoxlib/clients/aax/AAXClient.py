@@ -1,12 +1,12 @@
 import ssl
 import logging
-import hmac
 import hashlib
 import json
 from multidict import CIMultiDictProxy
 from typing import List, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType, RestCallPriority
+from cryptoxlib.HmacSigner import HmacSigner
 from cryptoxlib.clients.aax import enums
 from cryptoxlib.Pair import Pair
 from cryptoxlib.clients.aax.exceptions import AAXRestException
@@ -26,27 +26,33 @@ class AAXClient(CryptoXLibClient):
 
         self.api_key = api_key
         self.sec_key = sec_key
+        self.hmac_signer = HmacSigner(sec_key, hashlib.sha256)
 
     def _get_rest_api_uri(self) -> str:
         return self.REST_API_URI
 
     def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None,
-                      headers: dict = None) -> None:
+                      headers: dict = None) -> Optional[bytes]:
         timestamp = self._get_current_timestamp_ms()
 
-        signature_string = f"{timestamp}:{rest_call_type.value}/v2/{resource}"
+        signature_string = f"{timestamp}:{rest_call_type.value}/v2/{resource}".encode('utf-8')
+        # the signed body is sent as is
+        body = None
         if data is not None:
-            signature_string += json.dumps(data)
+            body = json.dumps(data).encode('utf-8')
+            signature_string += body
         if params is not None:
-            signature_string += json.dumps(params)
+            signature_string += json.dumps(params).encode('utf-8')
 
-        LOG.debug(f"Signature input string: {signature_string}")
-        signature = hmac.new(self.sec_key.encode('utf-8'), signature_string.encode('utf-8'), hashlib.sha256).hexdigest()
+        LOG.debug("Signature input string: %s", signature_string)
+        signature = self.hmac_signer.hexdigest(signature_string)
 
         headers['X-ACCESS-KEY'] = self.api_key
         headers['X-ACCESS-NONCE'] = str(timestamp)
         headers['X-ACCESS-SIGN'] = signature
 
+        return body
+
     def _preprocess_rest_response(self, status_code: int, headers: 'CIMultiDictProxy[str]', body: Optional[dict]) -> None:
         if str(status_code)[0] != '2':
             raise AAXRestException(status_code, body)
@@ -80,7 +86,7 @@ class AAXClient(CryptoXLibClient):
         if time_in_force is not None:
             data['timeInForce'] = time_in_force.value
 
-        return await self._create_post("spot/orders", data = data, signed = True)
+        return await self._create_post("spot/orders", data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def update_spot_order(self, order_id: str, amount: str, price: str = None, stop_price: str = None) -> dict:
         data = self._clean_request_params({
@@ -90,10 +96,10 @@ class AAXClient(CryptoXLibClient):
             "stopPrice": stop_price
         })
 
-        return await self._create_put("spot/orders", data = data, signed = True)
+        return await self._create_put("spot/orders", data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_spot_order(self, order_id: str) -> dict:
-        return await self._create_delete(f"spot/orders/cancel/{order_id}", signed = True)
+        return await self._create_delete(f"spot/orders/cancel/{order_id}", signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_batch_spot_order(self, pair: Pair, order_id: str = None, client_id: str = None) -> dict:
         data = self._clean_request_params({
@@ -102,11 +108,11 @@ class AAXClient(CryptoXLibClient):
             "clOrdID": client_id
         })
 
-        return await self._create_delete("spot/orders/cancel/all", data = data, signed = True)
+        return await self._create_delete("spot/orders/cancel/all", data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_all_spot_order(self, timeout_ms: int) -> dict:
         data = {
             "timeout": timeout_ms
         }
 
-        return await self._create_post("spot/orders/cancelAllOnTimeout", data = data, signed = True)
\ No newline at end of file
+        return await self._create_post("spot/orders/cancelAllOnTimeout", data = data, signed = True, priority = RestCallPriority.CRITICAL)
\ No newline at end of file
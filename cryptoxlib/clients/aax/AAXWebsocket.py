@@ -1,4 +1,3 @@
-import json
 import logging
 import datetime
 import hashlib
@@ -11,7 +10,6 @@ from cryptoxlib.Pair import Pair
 from cryptoxlib.clients.aax import enums
 from cryptoxlib.clients.aax.exceptions import AAXException
 from cryptoxlib.clients.aax.functions import map_pair
-from cryptoxlib.PeriodicChecker import PeriodicChecker
 
 LOG = logging.getLogger(__name__)
 
@@ -24,8 +22,7 @@ class AAXWebsocket(WebsocketMgr):
         super().__init__(websocket_uri = self.WEBSOCKET_URI, subscriptions = subscriptions,
                          ssl_context = ssl_context,
                          builtin_ping_interval = None,
-                         auto_reconnect = True,
-                         periodic_timeout_sec = 5)
+                         auto_reconnect = True)
 
         self.api_key = api_key
         self.sec_key = sec_key
@@ -42,10 +39,10 @@ class AAXWebsocket(WebsocketMgr):
 
         if requires_authentication:
             handshake_message = '{"event":"#handshake","cid":1}'
-            LOG.debug(f"> {handshake_message}")
+            LOG.debug("> %s", handshake_message)
             await self.websocket.send(handshake_message)
             handshake_response = await self.websocket.receive()
-            LOG.debug(f"< {handshake_response}")
+            LOG.debug("< %s", handshake_response)
 
             timestamp_ms = int(datetime.datetime.now(tz = datetime.timezone.utc).timestamp() * 1000)
             signature_string = f"{timestamp_ms}:{self.api_key}"
@@ -61,11 +58,11 @@ class AAXWebsocket(WebsocketMgr):
                 }
             }
 
-            LOG.debug(f"> {authentication_message}")
-            await self.websocket.send(json.dumps(authentication_message))
+            LOG.debug("> %s", authentication_message)
+            await self.websocket.send(self.json_codec.dumps(authentication_message))
 
-            message = json.loads(await self.websocket.receive())
-            LOG.debug(f"< {message}")
+            message = self.json_codec.loads(await self.websocket.receive())
+            LOG.debug("< %s", message)
 
             if 'data' in message and 'isAuthenticated' in message['data'] and message['data']['isAuthenticated'] is True:
                 LOG.info(f"Websocket authenticated successfully.")
@@ -74,8 +71,8 @@ class AAXWebsocket(WebsocketMgr):
 
     async def send_subscription_message(self, subscriptions: List[Subscription]):
         for subscription in subscriptions:
-            LOG.debug(f"> {subscription.get_subscription_message()}")
-            await self.websocket.send(json.dumps(subscription.get_subscription_message()))
+            LOG.debug("> %s", subscription.get_subscription_message())
+            await self.websocket.send(self.json_codec.dumps(subscription.get_subscription_message()))
 
     async def validate_subscriptions(self, subscriptions: List[Subscription]) -> None:
         pass
@@ -86,11 +83,11 @@ class AAXWebsocket(WebsocketMgr):
     async def _process_message(self, websocket: Websocket, message: str) -> None:
         if message == '#1':
             pong = '#2'
-            LOG.debug(f"> {pong}")
+            LOG.debug("> %s", pong)
             await websocket.send(pong)
             return
 
-        message = json.loads(message)
+        message = self.json_codec.loads(message)
 
         if message['e'] == 'empty':
             pass
@@ -1,12 +1,12 @@
 import ssl
 import logging
 import json
-import hmac
 import hashlib
 from multidict import CIMultiDictProxy
 from typing import List, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType, RestCallPriority
+from cryptoxlib.HmacSigner import HmacSigner
 from cryptoxlib.clients.bibox import enums
 from cryptoxlib.clients.bibox.exceptions import BiboxException
 from cryptoxlib.clients.bibox.functions import map_pair
@@ -27,6 +27,7 @@ class BiboxClient(CryptoXLibClient):
 
         self.api_key = api_key
         self.sec_key = sec_key
+        self.hmac_signer = HmacSigner(sec_key, hashlib.md5)
 
     def _get_rest_api_uri(self) -> str:
         return self.REST_API_URI
@@ -34,17 +35,22 @@ class BiboxClient(CryptoXLibClient):
     def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> None:
         cmds = data['cmds']
 
-        signature = hmac.new(self.sec_key.encode('utf-8'), cmds.encode('utf-8'), hashlib.md5).hexdigest()
+        signature = self.hmac_signer.hexdigest(cmds)
 
         data['apikey'] = self.api_key
         data['sign'] = signature
 
-        LOG.debug(f"Signed data: {data}")
+        LOG.debug("Signed data: %s", data)
 
     def _preprocess_rest_response(self, status_code: int, headers: 'CIMultiDictProxy[str]', body: Optional[dict]) -> None:
         if body is not None and 'error' in body:
             raise BiboxException(f"BiboxException: status [{status_code}], response [{body}]")
 
+    def _preprocess_raw_rest_response(self, status_code: int, headers: 'CIMultiDictProxy[str]', body: bytes) -> None:
+        # errors are reported within successful responses, only responses containing an error are decoded
+        if b'"error"' in body:
+            self._preprocess_rest_response(status_code, headers, self._decode_rest_response_body(body))
+
     def _get_websocket_mgr(self, subscriptions: List[Subscription], startup_delay_ms: int = 0,
                            ssl_context = None) -> WebsocketMgr:
         return BiboxWebsocket(subscriptions, self.api_key, self.sec_key, ssl_context)
@@ -98,7 +104,7 @@ class BiboxClient(CryptoXLibClient):
             }])
         }
 
-        return await self._create_post("orderpending", data = data, signed = True)
+        return await self._create_post("orderpending", data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_order(self, order_id: str) -> dict:
         data = {
@@ -111,5 +117,5 @@ class BiboxClient(CryptoXLibClient):
             }])
         }
 
-        return await self._create_post("orderpending", data = data, signed = True)
+        return await self._create_post("orderpending", data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
@@ -24,7 +24,7 @@ class BiboxWebsocket(WebsocketMgr):
 
     def __init__(self, subscriptions: List[Subscription], api_key: str = None, sec_key: str = None, ssl_context = None) -> None:
         super().__init__(websocket_uri = self.WEBSOCKET_URI, subscriptions = subscriptions,
-                         builtin_ping_interval = None, periodic_timeout_sec = 10, ssl_context = ssl_context,
+                         builtin_ping_interval = None, ssl_context = ssl_context,
                          auto_reconnect = True)
 
         self.api_key = api_key
@@ -32,21 +32,21 @@ class BiboxWebsocket(WebsocketMgr):
 
     async def send_subscription_message(self, subscriptions: List[Subscription]):
         for subscription in subscriptions:
-            subscription_message = json.dumps(
+            subscription_message = self.json_codec.dumps(
                 subscription.get_subscription_message(api_key = self.api_key, sec_key = self.sec_key))
 
-            LOG.debug(f"> {subscription_message}")
+            LOG.debug("> %s", subscription_message)
             await self.websocket.send(subscription_message)
 
     async def _process_message(self, websocket: Websocket, message: str) -> None:
-        messages = json.loads(message)
+        messages = self.json_codec.loads(message)
 
         if "ping" in messages:
             pong_message = {
                 "pong": messages['ping']
             }
-            LOG.debug(f"> {pong_message}")
-            await websocket.send(json.dumps(pong_message))
+            LOG.debug("> %s", pong_message)
+            await websocket.send(self.json_codec.dumps(pong_message))
         elif 'error' in messages:
             raise BiboxException(f"BiboxException: Bibox error received: {message}")
         else:
@@ -55,7 +55,7 @@ class BiboxWebsocket(WebsocketMgr):
                     data = message['data']
                     if 'binary' in message and message['binary'] == '1':
                         data = zlib.decompress(base64.b64decode(data), zlib.MAX_WBITS | 32)
-                        message['data'] = json.loads(data.decode("utf-8"))
+                        message['data'] = self.json_codec.loads(data)
                     await self.publish_message(WebsocketMessage(subscription_id = message['channel'], message = message))
                 else:
                     LOG.warning(f"No data element received: {message}")
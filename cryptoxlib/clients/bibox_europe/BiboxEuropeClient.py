@@ -1,12 +1,12 @@
 import ssl
 import logging
 import json
-import hmac
 import hashlib
 from multidict import CIMultiDictProxy
 from typing import List, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType, RestCallPriority
+from cryptoxlib.HmacSigner import HmacSigner
 from cryptoxlib.clients.bibox_europe import enums
 from cryptoxlib.clients.bibox_europe.exceptions import BiboxEuropeException
 from cryptoxlib.clients.bibox_europe.functions import map_pair
@@ -26,6 +26,7 @@ class BiboxEuropeClient(CryptoXLibClient):
 
         self.api_key = api_key
         self.sec_key = sec_key
+        self.hmac_signer = HmacSigner(sec_key, hashlib.md5)
 
     def _get_rest_api_uri(self) -> str:
         return self.REST_API_URI
@@ -33,12 +34,12 @@ class BiboxEuropeClient(CryptoXLibClient):
     def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> None:
         cmds = data['cmds']
 
-        signature = hmac.new(self.sec_key.encode('utf-8'), cmds.encode('utf-8'), hashlib.md5).hexdigest()
+        signature = self.hmac_signer.hexdigest(cmds)
 
         data['apikey'] = self.api_key
         data['sign'] = signature
 
-        LOG.debug(f"Signed data: {data}")
+        LOG.debug("Signed data: %s", data)
 
     @staticmethod
     def _get_headers():
@@ -100,7 +101,7 @@ class BiboxEuropeClient(CryptoXLibClient):
             }])
         }
 
-        return await self._create_post("orderpending", data = data, headers = self._get_headers(), signed = True)
+        return await self._create_post("orderpending", data = data, headers = self._get_headers(), signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_order(self, order_id: str) -> dict:
         data = {
@@ -113,5 +114,5 @@ class BiboxEuropeClient(CryptoXLibClient):
             }])
         }
 
-        return await self._create_post("orderpending", data = data, headers = self._get_headers(), signed = True)
+        return await self._create_post("orderpending", data = data, headers = self._get_headers(), signed = True, priority = RestCallPriority.CRITICAL)
 
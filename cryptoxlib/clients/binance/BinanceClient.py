@@ -2,10 +2,11 @@ import ssl
 import logging
 from typing import List, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallPriority
 from cryptoxlib.clients.binance.BinanceCommonClient import BinanceCommonClient
 from cryptoxlib.clients.binance import enums
 from cryptoxlib.clients.binance.functions import map_pair
+from cryptoxlib.clients.binance.rate_limits import BinanceRateLimiter
 from cryptoxlib.Pair import Pair
 from cryptoxlib.WebsocketMgr import WebsocketMgr, Subscription
 from cryptoxlib.clients.binance.BinanceWebsocket import BinanceWebsocket, BinanceTestnetWebsocket
@@ -17,12 +18,19 @@ class BinanceClient(BinanceCommonClient):
     API_V3 = "api/v3/"
     SAPI_V1 = "sapi/v1/"
 
+    RESPONSE_CACHE_TTLS_SEC = {
+        API_V3 + "exchangeInfo": 300,
+        SAPI_V1 + "margin/allPairs": 3600,
+        SAPI_V1 + "bswap/pools": 3600
+    }
+
     def __init__(self, api_key: str = None, sec_key: str = None, api_trace_log: bool = False,
                  api_cluster: enums.APICluster = enums.APICluster.CLUSTER_DEFAULT,
                  ssl_context: ssl.SSLContext = None) -> None:
         super().__init__(api_key = api_key, sec_key = sec_key, api_trace_log = api_trace_log, ssl_context = ssl_context)
 
         self.rest_api_uri = f"https://{api_cluster.value}.binance.com/"
+        self.rate_limiter = BinanceRateLimiter()
 
     def _get_rest_api_uri(self) -> str:
         return self.rest_api_uri
@@ -35,7 +43,7 @@ class BinanceClient(BinanceCommonClient):
     async def ping(self) -> dict:
         return await self._create_get("ping", api_variable_path = BinanceClient.API_V3)
 
-    async def get_exchange_info(self, pairs: List[Pair] = None) -> dict:
+    async def get_exchange_info(self, pairs: List[Pair] = None, raw: bool = False) -> dict:
         resource_path = "exchangeInfo"
 
         if pairs is not None:
@@ -48,12 +56,12 @@ class BinanceClient(BinanceCommonClient):
                 symbols_str = ",".join(wrapped_symbols)
                 resource_path += "?symbols=" + "[" + symbols_str + "]"
 
-        return await self._create_get(resource_path, api_variable_path = BinanceClient.API_V3)
+        return await self._create_get(resource_path, api_variable_path = BinanceClient.API_V3, raw = raw)
 
     async def get_time(self) -> dict:
         return await self._create_get("time", api_variable_path = BinanceClient.API_V3)
 
-    async def get_orderbook(self, pair: Pair, limit: enums.DepthLimit = None) -> dict:
+    async def get_orderbook(self, pair: Pair, limit: enums.DepthLimit = None, raw: bool = False) -> dict:
         params = CryptoXLibClient._clean_request_params({
             "symbol": map_pair(pair),
         })
@@ -61,27 +69,27 @@ class BinanceClient(BinanceCommonClient):
         if limit:
             params['limit'] = limit.value
 
-        return await self._create_get("depth", params = params, api_variable_path = BinanceClient.API_V3)
+        return await self._create_get("depth", params = params, api_variable_path = BinanceClient.API_V3, raw = raw)
 
-    async def get_trades(self, pair: Pair, limit: int = None) -> dict:
+    async def get_trades(self, pair: Pair, limit: int = None, raw: bool = False) -> dict:
         params = CryptoXLibClient._clean_request_params({
             "symbol": map_pair(pair),
             "limit": limit
         })
 
-        return await self._create_get("trades", params = params, api_variable_path = BinanceClient.API_V3)
+        return await self._create_get("trades", params = params, api_variable_path = BinanceClient.API_V3, raw = raw)
 
-    async def get_historical_trades(self, pair: Pair, limit: int = None, from_id: int = None) -> dict:
+    async def get_historical_trades(self, pair: Pair, limit: int = None, from_id: int = None, raw: bool = False) -> dict:
         params = CryptoXLibClient._clean_request_params({
             "symbol": map_pair(pair),
             "limit": limit,
             "fromId": from_id
         })
 
-        return await self._create_get("historicalTrades", params = params, headers = self._get_header(), api_variable_path = BinanceClient.API_V3)
+        return await self._create_get("historicalTrades", params = params, headers = self._get_header(), api_variable_path = BinanceClient.API_V3, raw = raw)
 
     async def get_aggregate_trades(self, pair: Pair, limit: int = None, from_id: int = None,
-                                   start_tmstmp_ms: int = None, end_tmstmp_ms: int = None) -> dict:
+                                   start_tmstmp_ms: int = None, end_tmstmp_ms: int = None, raw: bool = False) -> dict:
         params = CryptoXLibClient._clean_request_params({
             "symbol": map_pair(pair),
             "limit": limit,
@@ -90,10 +98,10 @@ class BinanceClient(BinanceCommonClient):
             "endTime": end_tmstmp_ms
         })
 
-        return await self._create_get("aggTrades", params = params, api_variable_path = BinanceClient.API_V3)
+        return await self._create_get("aggTrades", params = params, api_variable_path = BinanceClient.API_V3, raw = raw)
 
     async def get_candlesticks(self, pair: Pair, limit: int = None, interval: enums.Interval = None,
-                               start_tmstmp_ms: int = None, end_tmstmp_ms: int = None) -> dict:
+                               start_tmstmp_ms: int = None, end_tmstmp_ms: int = None, raw: bool = False) -> dict:
         params = CryptoXLibClient._clean_request_params({
             "symbol": map_pair(pair),
             "limit": limit,
@@ -104,7 +112,7 @@ class BinanceClient(BinanceCommonClient):
         if interval:
             params['interval'] = interval.value
 
-        return await self._create_get("klines", params = params, api_variable_path = BinanceClient.API_V3)
+        return await self._create_get("klines", params = params, api_variable_path = BinanceClient.API_V3, raw = raw)
 
     async def get_average_price(self, pair: Pair) -> dict:
         params = CryptoXLibClient._clean_request_params({
@@ -164,7 +172,7 @@ class BinanceClient(BinanceCommonClient):
         if new_order_response_type:
             params['newOrderRespType'] = new_order_response_type.value
 
-        return await self._create_post("order", params = params, headers = self._get_header(), signed = True, api_variable_path = BinanceClient.API_V3)
+        return await self._create_post("order", params = params, headers = self._get_header(), signed = True, api_variable_path = BinanceClient.API_V3, priority = RestCallPriority.CRITICAL)
 
     async def create_test_order(self, pair: Pair, side: enums.OrderSide, type: enums.OrderType,
                                 quantity: str,
@@ -222,7 +230,7 @@ class BinanceClient(BinanceCommonClient):
             "timestamp": self._get_current_timestamp_ms()
         })
 
-        return await self._create_delete("order", params = params, headers = self._get_header(), signed = True, api_variable_path = BinanceClient.API_V3)
+        return await self._create_delete("order", params = params, headers = self._get_header(), signed = True, api_variable_path = BinanceClient.API_V3, priority = RestCallPriority.CRITICAL)
 
     async def cancel_all_open_orders(self, pair: Pair, recv_window_ms: int = None) -> dict:
         params = CryptoXLibClient._clean_request_params({
@@ -232,7 +240,7 @@ class BinanceClient(BinanceCommonClient):
         })
         
         return await self._create_delete("openOrders", params = params, headers = self._get_header(),
-                                      signed = True, api_variable_path = BinanceClient.API_V3)
+                                      signed = True, api_variable_path = BinanceClient.API_V3, priority = RestCallPriority.CRITICAL)
 
     async def get_open_orders(self, pair: Pair = None, recv_window_ms: int = None) -> dict:
         params = CryptoXLibClient._clean_request_params({
@@ -296,7 +304,7 @@ class BinanceClient(BinanceCommonClient):
             params['newOrderRespType'] = new_order_response_type.value
 
         return await self._create_post("order/oco", params = params, headers = self._get_header(),
-                                       signed = True, api_variable_path = BinanceClient.API_V3)
+                                       signed = True, api_variable_path = BinanceClient.API_V3, priority = RestCallPriority.CRITICAL)
 
     async def cancel_oco_order(self, pair: Pair, order_list_id: str = None, list_client_order_id: str = None,
                                new_client_order_id: str = None, recv_window_ms: int = None) -> dict:
@@ -310,7 +318,7 @@ class BinanceClient(BinanceCommonClient):
         })
 
         return await self._create_delete("orderList", params = params, headers = self._get_header(),
-                                         signed = True, api_variable_path = BinanceClient.API_V3)
+                                         signed = True, api_variable_path = BinanceClient.API_V3, priority = RestCallPriority.CRITICAL)
 
     async def get_oco_order(self, order_list_id: int = None, orig_client_order_id: int = None,
                             recv_window_ms: int = None) -> dict:
@@ -708,7 +716,8 @@ class BinanceClient(BinanceCommonClient):
             headers = self._get_header(),
             params = params,
             signed = True,
-            api_variable_path = BinanceClient.SAPI_V1)
+            api_variable_path = BinanceClient.SAPI_V1,
+            priority = RestCallPriority.CRITICAL)
 
     async def cancel_margin_order(self,
                                   pair: Pair,
@@ -757,7 +766,8 @@ class BinanceClient(BinanceCommonClient):
             headers = self._get_header(),
             params = params,
             signed = True,
-            api_variable_path = BinanceClient.SAPI_V1)
+            api_variable_path = BinanceClient.SAPI_V1,
+            priority = RestCallPriority.CRITICAL)
 
     async def cancel_margin_open_orders(self, pair: Pair, is_isolated: Optional[bool] = False,
                                        recv_window_ms: Optional[int] = None) -> dict:
@@ -794,7 +804,8 @@ class BinanceClient(BinanceCommonClient):
             headers = self._get_header(),
             params = params,
             signed = True,
-            api_variable_path = BinanceClient.SAPI_V1)
+            api_variable_path = BinanceClient.SAPI_V1,
+            priority = RestCallPriority.CRITICAL)
 
     async def get_margin_transfer_history(
             self,
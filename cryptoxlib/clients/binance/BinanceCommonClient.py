@@ -1,23 +1,26 @@
 import ssl
 import logging
-import hmac
 import hashlib
 from multidict import CIMultiDictProxy
 from typing import Optional
 
 from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.HmacSigner import HmacSigner
 from cryptoxlib.clients.binance.exceptions import BinanceRestException
 
 LOG = logging.getLogger(__name__)
 
 
 class BinanceCommonClient(CryptoXLibClient):
+    DEFAULT_RETRY_AFTER_SEC = 60
+
     def __init__(self, api_key: str = None, sec_key: str = None, api_trace_log: bool = False,
                  ssl_context: ssl.SSLContext = None) -> None:
         super().__init__(api_trace_log, ssl_context)
 
         self.api_key = api_key
         self.sec_key = sec_key
+        self.hmac_signer = HmacSigner(sec_key, hashlib.sha256)
 
     def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> None:
         params_string = ""
@@ -29,11 +32,14 @@ class BinanceCommonClient(CryptoXLibClient):
         if data is not None and len(data) > 0:
             data_string = '&'.join(["{}={}".format(param[0], param[1]) for param in data])
 
-        m = hmac.new(self.sec_key.encode('utf-8'), (params_string + data_string).encode('utf-8'), hashlib.sha256)
-
-        params['signature'] = m.hexdigest()
+        params['signature'] = self.hmac_signer.hexdigest(params_string + data_string)
 
     def _preprocess_rest_response(self, status_code: int, headers: 'CIMultiDictProxy[str]', body: Optional[dict]) -> None:
+        if self.rate_limiter is not None:
+            # 429 - rate limit exceeded, 418 - IP banned for exceeding the rate limit
+            if status_code in [429, 418]:
+                self.rate_limiter.suspend(int(headers.get('Retry-After', BinanceCommonClient.DEFAULT_RETRY_AFTER_SEC)) * 1000)
+
         if str(status_code)[0] != '2':
             raise BinanceRestException(status_code, body)
 
@@ -1,8 +1,12 @@
-import json
+import asyncio
 import logging
-from typing import List, Any
+from abc import abstractmethod
+from typing import List, Any, Union, Optional, Hashable, Callable
 
-from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr, WebsocketMessage, Websocket, CallbacksType
+from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr, WebsocketMessage, Websocket, CallbacksType, \
+    extract_json_string_field
+from cryptoxlib.OrderBook import OrderBook, OrderBookReader
+from cryptoxlib.version_conversions import async_create_task
 
 LOG = logging.getLogger(__name__)
 
@@ -45,8 +49,8 @@ class BinanceCommonWebsocket(WebsocketMgr):
             "id": BinanceCommonWebsocket.SUBSCRIPTION_ID
         }
 
-        LOG.debug(f"> {subscription_message}")
-        await self.websocket.send(json.dumps(subscription_message))
+        LOG.debug("> %s", subscription_message)
+        await self.websocket.send(self.json_codec.dumps(subscription_message))
 
     async def send_unsubscription_message(self, subscriptions: List[Subscription]):
         BinanceCommonWebsocket.SUBSCRIPTION_ID += 1
@@ -59,8 +63,8 @@ class BinanceCommonWebsocket(WebsocketMgr):
             "id": BinanceCommonWebsocket.SUBSCRIPTION_ID
         }
 
-        LOG.debug(f"> {subscription_message}")
-        await self.websocket.send(json.dumps(subscription_message))
+        LOG.debug("> %s", subscription_message)
+        await self.websocket.send(self.json_codec.dumps(subscription_message))
 
     @staticmethod
     def _is_subscription_confirmation(response):
@@ -69,11 +73,43 @@ class BinanceCommonWebsocket(WebsocketMgr):
         else:
             return False
 
+    def _extract_raw_subscription_id(self, message: Union[str, bytes]) -> Optional[Any]:
+        # combined stream messages always start with {"stream":"<stream name>"
+        return extract_json_string_field(message, 'stream', prefix_only = True)
+
+    def get_message_sequence_key(self, message: WebsocketMessage) -> Optional[Hashable]:
+        data = message.message.get('data')
+        if not isinstance(data, dict):
+            return None
+
+        event = data.get('e')
+        if event in [None, 'depthUpdate', 'bookTicker'] and 'u' in data:
+            # diff depth and book ticker
+            sequence = data['u']
+        elif event is None and 'lastUpdateId' in data:
+            # partial depth
+            sequence = data['lastUpdateId']
+        elif event == 'aggTrade':
+            sequence = data['a']
+        elif event == 'trade':
+            sequence = data['t']
+        elif event == 'executionReport':
+            # trade id is -1 for executions without a trade (e.g. NEW, CANCELED) which occur once per order
+            sequence = data['i'], data['x'], data['t']
+        elif event == 'ORDER_TRADE_UPDATE':
+            sequence = data['o']['i'], data['o']['x'], data['o']['t']
+        else:
+            # events without a unique id (e.g. klines, tickers, account updates) are delivered by the leading
+            # connection only, event time is not unique within a stream
+            return None
+
+        return message.subscription_id, event, sequence
+
     async def _process_message(self, websocket: Websocket, message: str) -> None:
         if message is None:
             return
 
-        message = json.loads(message)
+        message = self.json_codec.loads(message)
 
         if self._is_subscription_confirmation(message):
             LOG.info(f"Subscription updated for id: {message['id']}")
@@ -103,4 +139,164 @@ class BinanceSubscription(Subscription):
         return False
 
     def is_cross_margin_authenticated(self) -> bool:
-        return False
\ No newline at end of file
+        return False
+
+
+class BinanceManagedOrderBookSubscription(BinanceSubscription):
+    # Order book maintained locally from the diff depth stream and REST snapshots. Diffs received while the snapshot is
+    # being fetched are buffered and applied on top of the snapshot. Every diff is checked to follow the previous one,
+    # a gap (e.g. after a reconnection) triggers a new synchronization. Callbacks receive a read-only OrderBookReader
+    # of the live book after every applied diff, use get_view() to keep its state.
+
+    # snapshots are heavy REST calls (weight up to 50), consecutive attempts are at least a delay apart
+    SNAPSHOT_RETRY_DELAY_SEC = 1
+    MAX_SNAPSHOT_ATTEMPTS = 5
+
+    def __init__(self, symbol: Any, depth_limit, callbacks: CallbacksType = None,
+                 order_book_factory: Callable[[Any], Any] = OrderBook):
+        super().__init__(callbacks)
+
+        self.depth_limit = depth_limit
+        # creates a book with the OrderBook interface for the symbol, e.g. CompactOrderBook
+        self.order_book = order_book_factory(symbol)
+        self.order_book_reader = OrderBookReader(self.order_book)
+
+        self.binance_client = None
+        self.synchronized = False
+        # the first diff after a snapshot has to overlap the snapshot instead of following the previous diff
+        self.first_update_pending = True
+        self.buffered_updates: List[dict] = []
+        self.synchronization_task: Optional[asyncio.Task] = None
+        self.synchronization_count = 0
+
+    async def initialize(self, **kwargs):
+        self.binance_client = kwargs['binance_client']
+
+    async def close(self) -> None:
+        await super().close()
+
+        if self.synchronization_task is not None:
+            self.synchronization_task.cancel()
+            try:
+                await self.synchronization_task
+            except asyncio.CancelledError:
+                pass
+            # a task cancelled before it started does not reset the attribute itself
+            self.synchronization_task = None
+
+    def get_order_book(self) -> OrderBookReader:
+        return self.order_book_reader
+
+    @abstractmethod
+    async def _get_snapshot(self) -> dict:
+        pass
+
+    @abstractmethod
+    def _is_outdated(self, update: dict, snapshot_sequence: int) -> bool:
+        pass
+
+    @abstractmethod
+    def _is_first_update(self, update: dict, snapshot_sequence: int) -> bool:
+        pass
+
+    @abstractmethod
+    def _is_next_update(self, update: dict, sequence: int) -> bool:
+        pass
+
+    async def process_message(self, message: WebsocketMessage) -> None:
+        update = message.message['data']
+
+        if self.synchronized:
+            in_sequence = self._check_update(update)
+            if in_sequence is None:
+                return
+            elif in_sequence:
+                self._apply_update(update)
+                await self.process_callbacks(WebsocketMessage(subscription_id = message.subscription_id,
+                                                              message = self.order_book_reader,
+                                                              websocket = message.websocket))
+                return
+
+            LOG.warning(f"Gap in order book updates of [{self.order_book.symbol}] detected (update {update['U']} - "
+                        f"{update['u']} after {self.order_book.sequence}), order book will be synchronized again.")
+            self.synchronized = False
+            self.buffered_updates = []
+
+        self.buffered_updates.append(update)
+        if self.synchronization_task is None:
+            self.synchronization_task = async_create_task(self._synchronize(message))
+            self.synchronization_task.add_done_callback(self._on_synchronization_done)
+
+    async def _synchronize(self, message: WebsocketMessage) -> None:
+        try:
+            for attempt in range(self.MAX_SNAPSHOT_ATTEMPTS):
+                if attempt > 0:
+                    await asyncio.sleep(self.SNAPSHOT_RETRY_DELAY_SEC)
+
+                try:
+                    snapshot = await self._get_snapshot()
+                except Exception as e:
+                    LOG.error(f"Order book snapshot of [{self.order_book.symbol}] could not be fetched: {e}")
+                    continue
+
+                # buffered updates are applied without interruption, updates received in the meantime are buffered
+                if self._apply_snapshot(snapshot):
+                    self.synchronized = True
+                    self.synchronization_count += 1
+                    LOG.info(f"Order book of [{self.order_book.symbol}] synchronized at {self.order_book.sequence}.")
+                    break
+            else:
+                LOG.error(f"Order book of [{self.order_book.symbol}] could not be synchronized in "
+                          f"{self.MAX_SNAPSHOT_ATTEMPTS} attempts, next update triggers a new synchronization.")
+                self.buffered_updates = []
+                return
+        finally:
+            self.synchronization_task = None
+
+        await self.process_callbacks(WebsocketMessage(subscription_id = message.subscription_id,
+                                                      message = self.order_book_reader,
+                                                      websocket = message.websocket))
+
+    def _on_synchronization_done(self, task: asyncio.Task) -> None:
+        # exceptions of the task (e.g. raised by the callbacks) would not be reported otherwise
+        if not task.cancelled() and task.exception() is not None:
+            LOG.error(f"Order book synchronization of [{self.order_book.symbol}] failed: {task.exception()}")
+
+    def _apply_snapshot(self, snapshot: dict) -> bool:
+        self.order_book.apply_snapshot(snapshot['bids'], snapshot['asks'], snapshot['lastUpdateId'])
+        self.first_update_pending = True
+
+        for i, update in enumerate(self.buffered_updates):
+            in_sequence = self._check_update(update)
+            if in_sequence is None:
+                continue
+            elif not in_sequence:
+                # snapshot older than the buffered updates or updates missing, the remaining updates are kept for
+                # the next snapshot
+                LOG.debug("Order book snapshot of [%s] at %s does not match buffered update %s - %s.",
+                          self.order_book.symbol, self.order_book.sequence, update['U'], update['u'])
+                self.buffered_updates = self.buffered_updates[i:]
+                # the book is not left partially synchronized, it stays empty until the next snapshot matches
+                self.order_book.clear()
+                return False
+
+            self._apply_update(update)
+
+        self.buffered_updates = []
+        return True
+
+    def _check_update(self, update: dict) -> Optional[bool]:
+        # None if the update precedes the order book, True if the update follows the order book, False otherwise
+        if self.first_update_pending:
+            if self._is_outdated(update, self.order_book.sequence):
+                return None
+
+            return self._is_first_update(update, self.order_book.sequence)
+
+        return self._is_next_update(update, self.order_book.sequence)
+
+    def _apply_update(self, update: dict) -> None:
+        self.order_book.update_bids(update['b'])
+        self.order_book.update_asks(update['a'])
+        self.order_book.sequence = update['u']
+        self.first_update_pending = False
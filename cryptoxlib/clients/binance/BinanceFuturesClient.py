@@ -2,12 +2,13 @@ import ssl
 import logging
 from typing import List, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallPriority
 from cryptoxlib.clients.binance.BinanceCommonClient import BinanceCommonClient
 from cryptoxlib.clients.binance.BinanceFuturesWebsocket import BinanceUSDSMFuturesWebsocket, \
     BinanceUSDSMFuturesTestnetWebsocket, BinanceCOINMFuturesWebsocket, BinanceCOINMFuturesTestnetWebsocket
 from cryptoxlib.clients.binance import enums
 from cryptoxlib.clients.binance.functions import map_pair, extract_symbol
+from cryptoxlib.clients.binance.rate_limits import BinanceFuturesRateLimiter
 from cryptoxlib.clients.binance.types import PairSymbolType
 from cryptoxlib.Pair import Pair
 from cryptoxlib.WebsocketMgr import WebsocketMgr, Subscription
@@ -20,6 +21,8 @@ class BinanceFuturesClient(BinanceCommonClient):
                  ssl_context: ssl.SSLContext = None) -> None:
         super().__init__(api_key = api_key, sec_key = sec_key, api_trace_log = api_trace_log, ssl_context = ssl_context)
 
+        self.rate_limiter = BinanceFuturesRateLimiter()
+
     def get_api_v1(self) -> str:
         pass
 
@@ -32,13 +35,13 @@ class BinanceFuturesClient(BinanceCommonClient):
     async def ping(self) -> dict:
         return await self._create_get("ping", api_variable_path = self.get_api_v1())
 
-    async def get_exchange_info(self) -> dict:
-        return await self._create_get("exchangeInfo", api_variable_path = self.get_api_v1())
+    async def get_exchange_info(self, raw: bool = False) -> dict:
+        return await self._create_get("exchangeInfo", api_variable_path = self.get_api_v1(), raw = raw)
 
     async def get_time(self) -> dict:
         return await self._create_get("time", api_variable_path = self.get_api_v1())
 
-    async def get_orderbook(self, symbol: PairSymbolType, limit: enums.DepthLimit = None) -> dict:
+    async def get_orderbook(self, symbol: PairSymbolType, limit: enums.DepthLimit = None, raw: bool = False) -> dict:
         params = CryptoXLibClient._clean_request_params({
             "symbol": extract_symbol(symbol),
         })
@@ -46,17 +49,17 @@ class BinanceFuturesClient(BinanceCommonClient):
         if limit is not None:
             params['limit'] = limit.value
 
-        return await self._create_get("depth", params = params, api_variable_path = self.get_api_v1())
+        return await self._create_get("depth", params = params, api_variable_path = self.get_api_v1(), raw = raw)
 
-    async def get_trades(self, symbol: PairSymbolType, limit: int = None) -> dict:
+    async def get_trades(self, symbol: PairSymbolType, limit: int = None, raw: bool = False) -> dict:
         params = CryptoXLibClient._clean_request_params({
             "symbol": extract_symbol(symbol),
             "limit": limit
         })
 
-        return await self._create_get("trades", params = params, api_variable_path = self.get_api_v1())
+        return await self._create_get("trades", params = params, api_variable_path = self.get_api_v1(), raw = raw)
 
-    async def get_historical_trades(self, symbol: PairSymbolType, limit: int = None, from_id: int = None) -> dict:
+    async def get_historical_trades(self, symbol: PairSymbolType, limit: int = None, from_id: int = None, raw: bool = False) -> dict:
         params = CryptoXLibClient._clean_request_params({
             "symbol": extract_symbol(symbol),
             "limit": limit,
@@ -64,10 +67,10 @@ class BinanceFuturesClient(BinanceCommonClient):
         })
 
         return await self._create_get("historicalTrades", params = params, headers = self._get_header(),
-                                      api_variable_path = self.get_api_v1())
+                                      api_variable_path = self.get_api_v1(), raw = raw)
 
     async def get_aggregate_trades(self, symbol: PairSymbolType, limit: int = None, from_id: int = None,
-                                   start_tmstmp_ms: int = None, end_tmstmp_ms: int = None) -> dict:
+                                   start_tmstmp_ms: int = None, end_tmstmp_ms: int = None, raw: bool = False) -> dict:
         params = CryptoXLibClient._clean_request_params({
             "symbol": extract_symbol(symbol),
             "limit": limit,
@@ -76,10 +79,10 @@ class BinanceFuturesClient(BinanceCommonClient):
             "endTime": end_tmstmp_ms
         })
 
-        return await self._create_get("aggTrades", params = params, api_variable_path = self.get_api_v1())
+        return await self._create_get("aggTrades", params = params, api_variable_path = self.get_api_v1(), raw = raw)
 
     async def get_candlesticks(self, symbol: PairSymbolType, interval: enums.Interval, limit: int = None,
-                               start_tmstmp_ms: int = None, end_tmstmp_ms: int = None) -> dict:
+                               start_tmstmp_ms: int = None, end_tmstmp_ms: int = None, raw: bool = False) -> dict:
         params = CryptoXLibClient._clean_request_params({
             "symbol": extract_symbol(symbol),
             "limit": limit,
@@ -90,7 +93,7 @@ class BinanceFuturesClient(BinanceCommonClient):
         if interval:
             params['interval'] = interval.value
 
-        return await self._create_get("klines", params = params, api_variable_path = self.get_api_v1())
+        return await self._create_get("klines", params = params, api_variable_path = self.get_api_v1(), raw = raw)
 
     async def get_cont_contract_candlesticks(self, pair: Pair, interval: enums.Interval,
                                              contract_type: enums.ContractType, limit: int = None,
@@ -215,7 +218,7 @@ class BinanceFuturesClient(BinanceCommonClient):
             params['newOrderRespType'] = new_order_response_type.value
 
         return await self._create_post("order", params = params, headers = self._get_header(), signed = True,
-                                       api_variable_path = self.get_api_v1())
+                                       api_variable_path = self.get_api_v1(), priority = RestCallPriority.CRITICAL)
 
     async def get_order(self, symbol: PairSymbolType, order_id: int = None, orig_client_order_id: int = None,
                         recv_window_ms: int = None) -> dict:
@@ -242,7 +245,7 @@ class BinanceFuturesClient(BinanceCommonClient):
         })
 
         return await self._create_delete("order", params = params, headers = self._get_header(), signed = True,
-                                         api_variable_path = self.get_api_v1())
+                                         api_variable_path = self.get_api_v1(), priority = RestCallPriority.CRITICAL)
 
     async def cancel_all_orders(self, symbol: PairSymbolType, recv_window_ms: int = None) -> dict:
         params = CryptoXLibClient._clean_request_params({
@@ -252,7 +255,7 @@ class BinanceFuturesClient(BinanceCommonClient):
         })
 
         return await self._create_delete("allOpenOrders", params = params, headers = self._get_header(), signed = True,
-                                         api_variable_path = self.get_api_v1())
+                                         api_variable_path = self.get_api_v1(), priority = RestCallPriority.CRITICAL)
 
     async def auto_cancel_orders(self, symbol: PairSymbolType, countdown_time_ms: int,
                                  recv_window_ms: int = None) -> dict:
@@ -264,7 +267,7 @@ class BinanceFuturesClient(BinanceCommonClient):
         })
 
         return await self._create_delete("countdownCancelAll", params = params, headers = self._get_header(), signed = True,
-                                         api_variable_path = self.get_api_v1())
+                                         api_variable_path = self.get_api_v1(), priority = RestCallPriority.CRITICAL)
 
     async def get_open_order(self, symbol: PairSymbolType, order_id: int = None, orig_client_order_id: int = None,
                         recv_window_ms: int = None) -> dict:
@@ -1,11 +1,13 @@
 import logging
-from typing import List
+from typing import List, Any, Callable
 
 from cryptoxlib.WebsocketMgr import Subscription, CallbacksType, Websocket
 from cryptoxlib.Pair import Pair
+from cryptoxlib.OrderBook import OrderBook
 from cryptoxlib.clients.binance.exceptions import BinanceException
 from cryptoxlib.clients.binance.functions import map_ws_pair, extract_ws_symbol
-from cryptoxlib.clients.binance.BinanceCommonWebsocket import BinanceCommonWebsocket, BinanceSubscription
+from cryptoxlib.clients.binance.BinanceCommonWebsocket import BinanceCommonWebsocket, BinanceSubscription, \
+    BinanceManagedOrderBookSubscription
 from cryptoxlib.clients.binance import enums
 from cryptoxlib.clients.binance.types import PairSymbolType
 
@@ -279,6 +281,40 @@ class DepthSubscription(BinanceSubscription):
         return f"{self.symbol}@depth{level_str}{frequency_str}"
 
 
+class ManagedOrderBookSubscription(BinanceManagedOrderBookSubscription):
+    # Local order book synchronized from the diff depth stream, see BinanceManagedOrderBookSubscription. Serves both
+    # USDS-M and COIN-M futures depending on the client the subscription is started with.
+
+    def __init__(self, symbol: PairSymbolType, frequency: int = DepthSubscription.DEFAULT_FREQUENCY,
+                 depth_limit: enums.DepthLimit = enums.DepthLimit.L_1000, callbacks: CallbacksType = None,
+                 order_book_factory: Callable[[Any], Any] = OrderBook):
+        super().__init__(symbol, depth_limit, callbacks, order_book_factory)
+
+        if frequency not in [100, 250, 500]:
+            raise BinanceException(f"Frequency [{frequency}] must be one of 100, 250 or 500.")
+
+        self.symbol = symbol
+        self.frequency = frequency
+
+    def get_channel_name(self):
+        if self.frequency == DepthSubscription.DEFAULT_FREQUENCY:
+            return f"{extract_ws_symbol(self.symbol)}@depth"
+
+        return f"{extract_ws_symbol(self.symbol)}@depth@{self.frequency}ms"
+
+    async def _get_snapshot(self) -> dict:
+        return (await self.binance_client.get_orderbook(self.symbol, self.depth_limit))['response']
+
+    def _is_outdated(self, update: dict, snapshot_sequence: int) -> bool:
+        return update['u'] < snapshot_sequence
+
+    def _is_first_update(self, update: dict, snapshot_sequence: int) -> bool:
+        return update['U'] <= snapshot_sequence <= update['u']
+
+    def _is_next_update(self, update: dict, sequence: int) -> bool:
+        return update['pu'] == sequence
+
+
 class BlvtSubscription(BinanceSubscription):
     def __init__(self, pair: Pair, callbacks: CallbacksType = None):
         super().__init__(callbacks)
@@ -320,7 +356,7 @@ class AccountSubscription(BinanceSubscription):
         binance_client = kwargs['binance_client']
         listen_key_response = await binance_client.get_listen_key()
         self.listen_key = listen_key_response["response"]["listenKey"]
-        LOG.debug(f'Listen key: {self.listen_key}')
+        LOG.debug("Listen key: %s", self.listen_key)
 
     def get_channel_name(self):
         return self.listen_key
@@ -1,13 +1,15 @@
 import logging
-from typing import List
+from typing import List, Any, Callable
 
 from cryptoxlib.WebsocketMgr import Subscription, CallbacksType, Websocket
 from cryptoxlib.Pair import Pair
+from cryptoxlib.OrderBook import OrderBook
 from cryptoxlib.clients.binance.BinanceCommonWebsocket import BinanceCommonWebsocket
-from cryptoxlib.clients.binance.BinanceCommonWebsocket import BinanceSubscription
+from cryptoxlib.clients.binance.BinanceCommonWebsocket import BinanceSubscription, \
+    BinanceManagedOrderBookSubscription
 from cryptoxlib.clients.binance.exceptions import BinanceException
 from cryptoxlib.clients.binance.functions import map_ws_pair
-from cryptoxlib.clients.binance.enums import Interval
+from cryptoxlib.clients.binance.enums import Interval, DepthLimit
 
 LOG = logging.getLogger(__name__)
 
@@ -116,7 +118,7 @@ class AccountSubscription(BinanceSubscription):
         binance_client = kwargs['binance_client']
         listen_key_response = await binance_client.get_spot_listen_key()
         self.listen_key = listen_key_response["response"]["listenKey"]
-        LOG.debug(f'Listen key: {self.listen_key}')
+        LOG.debug("Listen key: %s", self.listen_key)
 
     def get_channel_name(self):
         return self.listen_key
@@ -136,7 +138,7 @@ class AccountIsolatedMarginSubscription(BinanceSubscription):
         binance_client = kwargs['binance_client']
         listen_key_response = await binance_client.get_isolated_margin_listen_key(self.pair)
         self.listen_key = listen_key_response["response"]["listenKey"]
-        LOG.debug(f'Listen key: {self.listen_key}')
+        LOG.debug("Listen key: %s", self.listen_key)
 
     def get_channel_name(self):
         return self.listen_key
@@ -155,7 +157,7 @@ class AccountCrossMarginSubscription(BinanceSubscription):
         binance_client = kwargs['binance_client']
         listen_key_response = await binance_client.get_cross_margin_listen_key()
         self.listen_key = listen_key_response["response"]["listenKey"]
-        LOG.debug(f'Listen key: {self.listen_key}')
+        LOG.debug("Listen key: %s", self.listen_key)
 
     def get_channel_name(self):
         return self.listen_key
@@ -193,4 +195,37 @@ class DepthSubscription(BinanceSubscription):
         else:
             frequency_str = f"@{self.frequency}ms"
 
-        return f"{map_ws_pair(self.pair)}@depth{level_str}{frequency_str}"
\ No newline at end of file
+        return f"{map_ws_pair(self.pair)}@depth{level_str}{frequency_str}"
+
+
+class ManagedOrderBookSubscription(BinanceManagedOrderBookSubscription):
+    # Local order book synchronized from the diff depth stream, see BinanceManagedOrderBookSubscription.
+    DEFAULT_FREQUENCY = 100
+
+    def __init__(self, pair: Pair, frequency: int = DEFAULT_FREQUENCY, depth_limit: DepthLimit = DepthLimit.L_1000,
+                 callbacks: CallbacksType = None, order_book_factory: Callable[[Any], Any] = OrderBook):
+        super().__init__(pair, depth_limit, callbacks, order_book_factory)
+
+        if frequency not in [100, 1000]:
+            raise BinanceException(f"Frequency [{frequency}] must be one of 100 or 1000.")
+
+        self.pair = pair
+        self.frequency = frequency
+
+    def get_channel_name(self):
+        if self.frequency == DepthSubscription.DEFAULT_FREQUENCY:
+            return f"{map_ws_pair(self.pair)}@depth"
+
+        return f"{map_ws_pair(self.pair)}@depth@{self.frequency}ms"
+
+    async def _get_snapshot(self) -> dict:
+        return (await self.binance_client.get_orderbook(self.pair, self.depth_limit))['response']
+
+    def _is_outdated(self, update: dict, snapshot_sequence: int) -> bool:
+        return update['u'] <= snapshot_sequence
+
+    def _is_first_update(self, update: dict, snapshot_sequence: int) -> bool:
+        return update['U'] <= snapshot_sequence + 1 <= update['u']
+
+    def _is_next_update(self, update: dict, sequence: int) -> bool:
+        return update['U'] == sequence + 1
@@ -0,0 +1,301 @@
+from typing import Dict, Tuple, Union, Callable, Set
+
+from cryptoxlib.CryptoXLibClient import RestCallType
+from cryptoxlib.RateLimiter import RateLimiter, RateLimit, RequestCostType, RestCallPriority
+
+# Request weights as published in the binance API documentation. A weight is either a constant or a function of
+# the request parameters.
+WeightType = Union[int, Callable[[dict], int]]
+
+REQUEST_WEIGHT = "REQUEST_WEIGHT"
+ORDERS_10S = "ORDERS_10S"
+ORDERS_1M = "ORDERS_1M"
+ORDERS_1D = "ORDERS_1D"
+SAPI_IP_WEIGHT = "SAPI_IP_WEIGHT"
+FUTURES_DATA_WEIGHT = "FUTURES_DATA_WEIGHT"
+
+# weight of requests missing in the tables
+DEFAULT_WEIGHT = 1
+
+
+def _by_limit(default_limit: int, weights: Tuple[Tuple[int, int], ...]) -> Callable[[dict], int]:
+    # weights is a tuple of (max limit, weight) in ascending order
+    def weight(params: dict) -> int:
+        limit = int(params.get('limit', default_limit))
+        for max_limit, limit_weight in weights:
+            if limit <= max_limit:
+                return limit_weight
+
+        return weights[-1][1]
+
+    return weight
+
+
+def _by_symbol(single_weight: int, all_weight: int, symbol_param: str = 'symbol') -> Callable[[dict], int]:
+    def weight(params: dict) -> int:
+        return single_weight if symbol_param in params else all_weight
+
+    return weight
+
+
+SPOT_WEIGHTS: Dict[Tuple[RestCallType, str], WeightType] = {
+    (RestCallType.GET, "api/v3/ping"): 1,
+    (RestCallType.GET, "api/v3/time"): 1,
+    (RestCallType.GET, "api/v3/exchangeInfo"): 20,
+    (RestCallType.GET, "api/v3/depth"): _by_limit(100, ((100, 5), (500, 25), (1000, 50), (5000, 250))),
+    (RestCallType.GET, "api/v3/trades"): 25,
+    (RestCallType.GET, "api/v3/historicalTrades"): 25,
+    (RestCallType.GET, "api/v3/aggTrades"): 2,
+    (RestCallType.GET, "api/v3/klines"): 2,
+    (RestCallType.GET, "api/v3/avgPrice"): 2,
+    (RestCallType.GET, "api/v3/ticker/24hr"): _by_symbol(2, 80),
+    (RestCallType.GET, "api/v3/ticker/price"): _by_symbol(2, 4),
+    (RestCallType.GET, "api/v3/ticker/bookTicker"): _by_symbol(2, 4),
+    (RestCallType.POST, "api/v3/order"): 1,
+    (RestCallType.POST, "api/v3/order/test"): 1,
+    (RestCallType.GET, "api/v3/order"): 4,
+    (RestCallType.DELETE, "api/v3/order"): 1,
+    (RestCallType.DELETE, "api/v3/openOrders"): 1,
+    (RestCallType.GET, "api/v3/openOrders"): _by_symbol(6, 80),
+    (RestCallType.GET, "api/v3/allOrders"): 20,
+    (RestCallType.POST, "api/v3/order/oco"): 1,
+    (RestCallType.DELETE, "api/v3/orderList"): 1,
+    (RestCallType.GET, "api/v3/orderList"): 4,
+    (RestCallType.GET, "api/v3/allOrderList"): 20,
+    (RestCallType.GET, "api/v3/openOrderList"): 6,
+    (RestCallType.GET, "api/v3/account"): 20,
+    (RestCallType.GET, "api/v3/myTrades"): 20,
+    (RestCallType.POST, "api/v3/userDataStream"): 2,
+    (RestCallType.PUT, "api/v3/userDataStream"): 2,
+    (RestCallType.GET, "sapi/v1/margin/account"): 10,
+    (RestCallType.GET, "sapi/v1/margin/allOrders"): 200,
+    (RestCallType.GET, "sapi/v1/margin/myTrades"): 10,
+    (RestCallType.GET, "sapi/v1/margin/openOrders"): 10,
+    (RestCallType.GET, "sapi/v1/margin/order"): 10,
+    (RestCallType.GET, "sapi/v1/margin/maxBorrowable"): 50,
+    (RestCallType.GET, "sapi/v1/margin/maxTransferable"): 50,
+    (RestCallType.GET, "sapi/v1/margin/isolated/account"): 10,
+    (RestCallType.GET, "sapi/v1/margin/isolated/allPairs"): 10,
+    (RestCallType.GET, "sapi/v1/margin/isolated/pair"): 10,
+    (RestCallType.GET, "sapi/v1/margin/allAssets"): 1,
+    (RestCallType.GET, "sapi/v1/margin/allPairs"): 1,
+    (RestCallType.GET, "sapi/v1/margin/priceIndex"): 10,
+    (RestCallType.GET, "sapi/v1/margin/interestHistory"): 1,
+    (RestCallType.GET, "sapi/v1/margin/interestRateHistory"): 1,
+    (RestCallType.GET, "sapi/v1/capital/deposit/hisrec"): 1,
+}
+
+# number of orders placed by a request, counted by the order limits
+SPOT_ORDER_COUNTS: Dict[Tuple[RestCallType, str], int] = {
+    (RestCallType.POST, "api/v3/order"): 1,
+    (RestCallType.POST, "api/v3/order/oco"): 2,
+    (RestCallType.POST, "sapi/v1/margin/order"): 1,
+}
+
+# order actions which must not be delayed by other requests
+SPOT_CRITICAL_REQUESTS: Set[Tuple[RestCallType, str]] = {
+    (RestCallType.POST, "api/v3/order"),
+    (RestCallType.DELETE, "api/v3/order"),
+    (RestCallType.DELETE, "api/v3/openOrders"),
+    (RestCallType.POST, "api/v3/order/oco"),
+    (RestCallType.DELETE, "api/v3/orderList"),
+    (RestCallType.POST, "sapi/v1/margin/order"),
+    (RestCallType.DELETE, "sapi/v1/margin/order"),
+    (RestCallType.DELETE, "sapi/v1/margin/openOrders"),
+}
+
+# historical data which are first to be slowed down when approaching the limits
+SPOT_BULK_REQUESTS: Set[Tuple[RestCallType, str]] = {
+    (RestCallType.GET, "api/v3/historicalTrades"),
+    (RestCallType.GET, "api/v3/aggTrades"),
+    (RestCallType.GET, "api/v3/klines"),
+    (RestCallType.GET, "api/v3/allOrders"),
+    (RestCallType.GET, "api/v3/allOrderList"),
+    (RestCallType.GET, "api/v3/myTrades"),
+    (RestCallType.GET, "sapi/v1/margin/allOrders"),
+    (RestCallType.GET, "sapi/v1/margin/myTrades"),
+    (RestCallType.GET, "sapi/v1/margin/transfer"),
+    (RestCallType.GET, "sapi/v1/margin/loan"),
+    (RestCallType.GET, "sapi/v1/margin/repay"),
+    (RestCallType.GET, "sapi/v1/margin/interestHistory"),
+    (RestCallType.GET, "sapi/v1/margin/interestRateHistory"),
+    (RestCallType.GET, "sapi/v1/margin/forceLiquidationRec"),
+    (RestCallType.GET, "sapi/v1/capital/deposit/hisrec"),
+}
+
+# paths relative to the API version, e.g. fapi/v1/depth -> depth
+FUTURES_WEIGHTS: Dict[Tuple[RestCallType, str], WeightType] = {
+    (RestCallType.GET, "ping"): 1,
+    (RestCallType.GET, "time"): 1,
+    (RestCallType.GET, "exchangeInfo"): 1,
+    (RestCallType.GET, "depth"): _by_limit(500, ((50, 2), (100, 5), (500, 10), (1000, 20))),
+    (RestCallType.GET, "trades"): 5,
+    (RestCallType.GET, "historicalTrades"): 20,
+    (RestCallType.GET, "aggTrades"): 20,
+    (RestCallType.GET, "klines"): _by_limit(500, ((99, 1), (499, 2), (1000, 5), (1500, 10))),
+    (RestCallType.GET, "continuousKlines"): _by_limit(500, ((99, 1), (499, 2), (1000, 5), (1500, 10))),
+    (RestCallType.GET, "indexPriceKlines"): _by_limit(500, ((99, 1), (499, 2), (1000, 5), (1500, 10))),
+    (RestCallType.GET, "markPriceKlines"): _by_limit(500, ((99, 1), (499, 2), (1000, 5), (1500, 10))),
+    (RestCallType.GET, "premiumIndex"): 1,
+    (RestCallType.GET, "fundingRate"): 1,
+    (RestCallType.GET, "ticker/24hr"): _by_symbol(1, 40),
+    (RestCallType.GET, "ticker/price"): _by_symbol(1, 2),
+    (RestCallType.GET, "ticker/bookTicker"): _by_symbol(2, 5),
+    (RestCallType.GET, "openInterest"): 1,
+    (RestCallType.GET, "allForceOrders"): _by_symbol(20, 50),
+    (RestCallType.POST, "positionSide/dual"): 1,
+    (RestCallType.GET, "positionSide/dual"): 30,
+    (RestCallType.POST, "order"): 1,
+    (RestCallType.GET, "order"): 1,
+    (RestCallType.DELETE, "order"): 1,
+    (RestCallType.DELETE, "allOpenOrders"): 1,
+    (RestCallType.DELETE, "countdownCancelAll"): 10,
+    (RestCallType.GET, "openOrder"): 1,
+    (RestCallType.GET, "openOrders"): _by_symbol(1, 40),
+    (RestCallType.GET, "allOrders"): 5,
+    (RestCallType.GET, "balance"): 5,
+    (RestCallType.GET, "account"): 5,
+    (RestCallType.GET, "positionRisk"): 5,
+    (RestCallType.GET, "userTrades"): 5,
+    (RestCallType.GET, "income"): 30,
+    (RestCallType.POST, "leverage"): 1,
+    (RestCallType.POST, "marginType"): 1,
+    (RestCallType.POST, "positionMargin"): 1,
+    (RestCallType.GET, "positionMargin/history"): 1,
+    (RestCallType.GET, "leverageBracket"): 1,
+    (RestCallType.GET, "forceOrders"): _by_symbol(20, 50),
+    (RestCallType.GET, "adlQuantile"): 5,
+    (RestCallType.GET, "commissionRate"): 20,
+    (RestCallType.GET, "apiTradingStatus"): 1,
+    (RestCallType.POST, "listenKey"): 1,
+    (RestCallType.PUT, "listenKey"): 1,
+}
+
+FUTURES_ORDER_COUNTS: Dict[Tuple[RestCallType, str], int] = {
+    (RestCallType.POST, "order"): 1,
+}
+
+
+FUTURES_CRITICAL_REQUESTS: Set[Tuple[RestCallType, str]] = {
+    (RestCallType.POST, "order"),
+    (RestCallType.DELETE, "order"),
+    (RestCallType.DELETE, "allOpenOrders"),
+    (RestCallType.DELETE, "countdownCancelAll"),
+}
+
+FUTURES_BULK_REQUESTS: Set[Tuple[RestCallType, str]] = {
+    (RestCallType.GET, "historicalTrades"),
+    (RestCallType.GET, "aggTrades"),
+    (RestCallType.GET, "klines"),
+    (RestCallType.GET, "continuousKlines"),
+    (RestCallType.GET, "indexPriceKlines"),
+    (RestCallType.GET, "markPriceKlines"),
+    (RestCallType.GET, "fundingRate"),
+    (RestCallType.GET, "allOrders"),
+    (RestCallType.GET, "userTrades"),
+    (RestCallType.GET, "income"),
+    (RestCallType.GET, "positionMargin/history"),
+    (RestCallType.GET, "forceOrders"),
+    (RestCallType.GET, "allForceOrders"),
+}
+
+
+def _get_priority(critical_requests: Set[Tuple[RestCallType, str]], bulk_requests: Set[Tuple[RestCallType, str]],
+                  rest_call_type: RestCallType, path: str) -> RestCallPriority:
+    if (rest_call_type, path) in critical_requests:
+        return RestCallPriority.CRITICAL
+    elif (rest_call_type, path) in bulk_requests:
+        return RestCallPriority.BULK
+    else:
+        return RestCallPriority.NORMAL
+
+
+def _get_futures_path(path: str) -> str:
+    # strip API version, e.g. fapi/v1/
+    return _strip_query(path).split('/', 2)[-1]
+
+
+def _get_weight(weights: Dict[Tuple[RestCallType, str], WeightType], rest_call_type: RestCallType, path: str,
+                params: dict) -> int:
+    weight = weights.get((rest_call_type, path), DEFAULT_WEIGHT)
+    if callable(weight):
+        return weight(params)
+
+    return weight
+
+
+def _strip_query(path: str) -> str:
+    # some resources are constructed with the query string included
+    return path.split('?', 1)[0]
+
+
+class BinanceRateLimiter(RateLimiter):
+    USAGE_HEADERS = {
+        "X-MBX-USED-WEIGHT-1M": REQUEST_WEIGHT,
+        "X-MBX-ORDER-COUNT-10S": ORDERS_10S,
+        "X-MBX-ORDER-COUNT-1D": ORDERS_1D,
+        "X-SAPI-USED-IP-WEIGHT-1M": SAPI_IP_WEIGHT
+    }
+
+    def __init__(self, request_weight_per_minute: int = 6000, orders_per_10s: int = 100, orders_per_day: int = 200000,
+                 sapi_weight_per_minute: int = 12000) -> None:
+        super().__init__([
+            RateLimit(REQUEST_WEIGHT, request_weight_per_minute, 60 * 1000),
+            RateLimit(ORDERS_10S, orders_per_10s, 10 * 1000),
+            RateLimit(ORDERS_1D, orders_per_day, 24 * 3600 * 1000),
+            RateLimit(SAPI_IP_WEIGHT, sapi_weight_per_minute, 60 * 1000),
+        ])
+
+    def get_request_priority(self, rest_call_type: RestCallType, path: str) -> RestCallPriority:
+        return _get_priority(SPOT_CRITICAL_REQUESTS, SPOT_BULK_REQUESTS, rest_call_type, _strip_query(path))
+
+    def get_request_cost(self, rest_call_type: RestCallType, path: str, params: dict) -> RequestCostType:
+        path = _strip_query(path)
+        weight = _get_weight(SPOT_WEIGHTS, rest_call_type, path, params)
+
+        if path.startswith("sapi/"):
+            cost = {SAPI_IP_WEIGHT: weight}
+        else:
+            cost = {REQUEST_WEIGHT: weight}
+
+        order_count = SPOT_ORDER_COUNTS.get((rest_call_type, path))
+        if order_count is not None:
+            cost[ORDERS_10S] = order_count
+            cost[ORDERS_1D] = order_count
+
+        return cost
+
+
+class BinanceFuturesRateLimiter(RateLimiter):
+    USAGE_HEADERS = {
+        "X-MBX-USED-WEIGHT-1M": REQUEST_WEIGHT,
+        "X-MBX-ORDER-COUNT-10S": ORDERS_10S,
+        "X-MBX-ORDER-COUNT-1M": ORDERS_1M
+    }
+
+    def __init__(self, request_weight_per_minute: int = 2400, orders_per_10s: int = 300, orders_per_minute: int = 1200,
+                 futures_data_weight_per_5_minutes: int = 1000) -> None:
+        super().__init__([
+            RateLimit(REQUEST_WEIGHT, request_weight_per_minute, 60 * 1000),
+            RateLimit(ORDERS_10S, orders_per_10s, 10 * 1000),
+            RateLimit(ORDERS_1M, orders_per_minute, 60 * 1000),
+            RateLimit(FUTURES_DATA_WEIGHT, futures_data_weight_per_5_minutes, 5 * 60 * 1000),
+        ])
+
+    def get_request_priority(self, rest_call_type: RestCallType, path: str) -> RestCallPriority:
+        return _get_priority(FUTURES_CRITICAL_REQUESTS, FUTURES_BULK_REQUESTS, rest_call_type, _get_futures_path(path))
+
+    def get_request_cost(self, rest_call_type: RestCallType, path: str, params: dict) -> RequestCostType:
+        # futures data endpoints are limited separately
+        if path.startswith("futures/data/"):
+            return {FUTURES_DATA_WEIGHT: 1}
+
+        path = _get_futures_path(path)
+        cost = {REQUEST_WEIGHT: _get_weight(FUTURES_WEIGHTS, rest_call_type, path, params)}
+
+        order_count = FUTURES_ORDER_COUNTS.get((rest_call_type, path))
+        if order_count is not None:
+            cost[ORDERS_10S] = order_count
+            cost[ORDERS_1M] = order_count
+
+        return cost
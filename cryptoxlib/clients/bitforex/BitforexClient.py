@@ -1,11 +1,12 @@
 import ssl
 import logging
-import hmac
 import hashlib
+import re
 from multidict import CIMultiDictProxy
 from typing import List, Tuple, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType, RestCallPriority
+from cryptoxlib.HmacSigner import HmacSigner
 from cryptoxlib.clients.bitforex import enums
 from cryptoxlib.Pair import Pair
 from cryptoxlib.clients.bitforex.exceptions import BitforexRestException
@@ -20,12 +21,20 @@ class BitforexClient(CryptoXLibClient):
     REST_API_VERSION_URI = "/api/v1/"
     REST_API_URI = "https://api.bitforex.com" + REST_API_VERSION_URI
 
+    RESPONSE_CACHE_TTLS_SEC = {
+        "market/symbols": 300
+    }
+
+    # error flag of the raw response body, JSON whitespaces are allowed
+    RAW_ERROR_PATTERN = re.compile(rb'"success"\s*:\s*false')
+
     def __init__(self, api_key: str = None, sec_key: str = None, api_trace_log: bool = False,
                  ssl_context: ssl.SSLContext = None) -> None:
         super().__init__(api_trace_log, ssl_context)
 
         self.api_key = api_key
         self.sec_key = sec_key
+        self.hmac_signer = HmacSigner(sec_key, hashlib.sha256)
 
     def _get_rest_api_uri(self) -> str:
         return BitforexClient.REST_API_URI
@@ -43,14 +52,17 @@ class BitforexClient(CryptoXLibClient):
         if data is not None:
             data_string = '&'.join(["{}={}".format(param[0], param[1]) for param in data])
 
-        m = hmac.new(self.sec_key.encode('utf-8'), (params_string + data_string).encode('utf-8'), hashlib.sha256)
-
-        params['signData'] = m.hexdigest()
+        params['signData'] = self.hmac_signer.hexdigest(params_string + data_string)
 
     def _preprocess_rest_response(self, status_code: int, headers: 'CIMultiDictProxy[str]', body: Optional[dict]) -> None:
         if body['success'] is False:
             raise BitforexRestException(status_code, body)
 
+    def _preprocess_raw_rest_response(self, status_code: int, headers: 'CIMultiDictProxy[str]', body: bytes) -> None:
+        # errors are reported within successful responses, only responses containing an error are decoded
+        if str(status_code)[0] != '2' or BitforexClient.RAW_ERROR_PATTERN.search(body) is not None:
+            self._preprocess_rest_response(status_code, headers, self._decode_rest_response_body(body))
+
     def _get_websocket_mgr(self, subscriptions: List[Subscription], startup_delay_ms: int = 0,
                            ssl_context = None) -> WebsocketMgr:
         return BitforexWebsocket(subscriptions, ssl_context)
@@ -114,7 +126,7 @@ class BitforexClient(CryptoXLibClient):
             "nonce": self._get_current_timestamp_ms()
         })
 
-        return await self._create_post("trade/placeOrder", params = params, signed = True)
+        return await self._create_post("trade/placeOrder", params = params, signed = True, priority = RestCallPriority.CRITICAL)
 
     # orders is a list of tuples where each tuple represents an order. Members of the tuple represent following attributes:
     # (price, quantity, side)
@@ -133,7 +145,7 @@ class BitforexClient(CryptoXLibClient):
             "nonce": self._get_current_timestamp_ms()
         })
 
-        return await self._create_post("trade/placeMultiOrder", params = params, signed = True)
+        return await self._create_post("trade/placeMultiOrder", params = params, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_order(self, pair: Pair, order_id: str) -> dict:
         params = CryptoXLibClient._clean_request_params({
@@ -142,7 +154,7 @@ class BitforexClient(CryptoXLibClient):
             "nonce": self._get_current_timestamp_ms()
         })
 
-        return await self._create_post("trade/cancelOrder", params = params, signed = True)
+        return await self._create_post("trade/cancelOrder", params = params, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_multi_order(self, pair: Pair, order_ids: List[str]) -> dict:
         params = CryptoXLibClient._clean_request_params({
@@ -151,7 +163,7 @@ class BitforexClient(CryptoXLibClient):
             "nonce": self._get_current_timestamp_ms()
         })
 
-        return await self._create_post("trade/cancelMultiOrder", params = params, signed = True)
+        return await self._create_post("trade/cancelMultiOrder", params = params, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_all_orders(self, pair: Pair) -> dict:
         params = CryptoXLibClient._clean_request_params({
@@ -159,7 +171,7 @@ class BitforexClient(CryptoXLibClient):
             "nonce": self._get_current_timestamp_ms()
         })
 
-        return await self._create_post("trade/cancelAllOrder", params = params, signed = True)
+        return await self._create_post("trade/cancelAllOrder", params = params, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def get_order(self, pair: Pair, order_id: str) -> dict:
         params = CryptoXLibClient._clean_request_params({
@@ -1,4 +1,3 @@
-import json
 import logging
 import websockets
 from abc import abstractmethod
@@ -9,7 +8,6 @@ from cryptoxlib.Pair import Pair
 from cryptoxlib.clients.bitforex import enums
 from cryptoxlib.clients.bitforex.exceptions import BitforexException
 from cryptoxlib.clients.bitforex.functions import map_pair
-from cryptoxlib.PeriodicChecker import PeriodicChecker
 
 LOG = logging.getLogger(__name__)
 
@@ -19,21 +17,21 @@ class BitforexWebsocket(WebsocketMgr):
 
     PING_MSG = 'ping_p'
     PONG_MSG = 'pong_p'
+    PING_INTERVAL_SEC = 30
 
     def __init__(self, subscriptions: List[Subscription], ssl_context = None) -> None:
         super().__init__(websocket_uri = BitforexWebsocket.WEBSOCKET_URI, subscriptions = subscriptions,
-                         builtin_ping_interval = None, periodic_timeout_sec = 10, ssl_context = ssl_context)
-
-        self.ping_checker = PeriodicChecker(period_ms = 30 * 1000)
+                         builtin_ping_interval = None, ssl_context = ssl_context,
+                         periodic_timeout_sec = BitforexWebsocket.PING_INTERVAL_SEC,
+                         periodic_initial_delay_sec = BitforexWebsocket.PING_INTERVAL_SEC)
 
     async def _process_periodic(self, websocket: Websocket) -> None:
-        if self.ping_checker.check():
-            LOG.debug(f"> {BitforexWebsocket.PING_MSG}")
-            await websocket.send(BitforexWebsocket.PING_MSG)
+        LOG.debug("> %s", BitforexWebsocket.PING_MSG)
+        await websocket.send(BitforexWebsocket.PING_MSG)
 
     async def _process_message(self, websocket: Websocket, message: str) -> None:
         if message != BitforexWebsocket.PONG_MSG:
-            message = json.loads(message)
+            message = self.json_codec.loads(message)
             subscription_id = BitforexSubscription.make_subscription_id(message['event'], message['param'])
             await self.publish_message(WebsocketMessage(subscription_id = subscription_id, message = message))
 
@@ -1,12 +1,12 @@
 import ssl
 import logging
-import hmac
 import json
 import hashlib
 from multidict import CIMultiDictProxy
 from typing import List, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType, RestCallPriority
+from cryptoxlib.HmacSigner import HmacSigner
 from cryptoxlib.clients.bitvavo import enums
 from cryptoxlib.clients.bitvavo.exceptions import BitvavoException
 from cryptoxlib.clients.bitvavo.functions import map_pair
@@ -28,11 +28,12 @@ class BitvavoClient(CryptoXLibClient):
 
         self.api_key = api_key
         self.sec_key = sec_key
+        self.hmac_signer = HmacSigner(sec_key, hashlib.sha256)
 
     def _get_rest_api_uri(self) -> str:
         return self.REST_API_URI
 
-    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> None:
+    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> Optional[bytes]:
         timestamp = self._get_current_timestamp_ms()
 
         resource_string = resource
@@ -45,18 +46,23 @@ class BitvavoClient(CryptoXLibClient):
                 resource_string += "?"
             resource_string += params_string
 
-        signature_string = str(timestamp) + rest_call_type.value + '/v2/' + resource_string
+        signature_string = (str(timestamp) + rest_call_type.value + '/v2/' + resource_string).encode('utf-8')
+        # the signed body is sent as is
+        body = None
         if data is not None:
-            signature_string += json.dumps(data, separators=(',',':'))
+            body = json.dumps(data, separators=(',',':')).encode('utf-8')
+            signature_string += body
 
-        LOG.debug(f"Signature input string: {signature_string}")
-        signature = hmac.new(self.sec_key.encode('utf-8'), signature_string.encode('utf-8'), hashlib.sha256).hexdigest()
+        LOG.debug("Signature input string: %s", signature_string)
+        signature = self.hmac_signer.hexdigest(signature_string)
 
         headers['Bitvavo-Access-Key'] = self.api_key
         headers['Bitvavo-Access-Signature'] = signature
         headers['Bitvavo-Access-Timestamp'] = str(timestamp)
         headers['Bitvavo-Access-Window'] = str(self.VALIDITY_WINDOW_MS)
 
+        return body
+
     def _preprocess_rest_response(self, status_code: int, headers: 'CIMultiDictProxy[str]', body: Optional[dict]) -> None:
         if str(status_code)[0] != '2':
             raise BitvavoException(f"BitvavoException: status [{status_code}], response [{body}]")
@@ -104,7 +110,7 @@ class BitvavoClient(CryptoXLibClient):
         if time_in_force is not None:
             data['selfTradePrevention'] = self_trade_prevention.value
 
-        return await self._create_post("order", data = data, signed = True)
+        return await self._create_post("order", data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_order(self, pair: Pair, order_id: str) -> dict:
         params = self._clean_request_params({
@@ -112,7 +118,7 @@ class BitvavoClient(CryptoXLibClient):
             "orderId": order_id
         })
 
-        return await self._create_delete("order", params = params, signed = True)
+        return await self._create_delete("order", params = params, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def get_balance(self, coin: str = None) -> dict:
         params = self._clean_request_params({
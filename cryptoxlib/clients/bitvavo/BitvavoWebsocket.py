@@ -1,4 +1,3 @@
-import json
 import logging
 import websockets
 import hmac
@@ -47,18 +46,18 @@ class BitvavoWebsocket(WebsocketMgr):
                 "timestamp": timestamp
             }
 
-            LOG.debug(f"> {authentication_message}")
-            await self.websocket.send(json.dumps(authentication_message))
+            LOG.debug("> %s", authentication_message)
+            await self.websocket.send(self.json_codec.dumps(authentication_message))
 
             message = await self.websocket.receive()
-            LOG.debug(f"< {message}")
+            LOG.debug("< %s", message)
 
-            message = json.loads(message)
+            message = self.json_codec.loads(message)
             if 'event' in message and message['event'] == 'authenticate' and \
                     'authenticated' in message and message['authenticated'] is True:
                 LOG.info(f"Websocket authenticated successfully.")
             else:
-                raise BitvavoException(f"Authentication error. Response [{json.dumps(message)}]")
+                raise BitvavoException(f"Authentication error. Response [{self.json_codec.dumps(message)}]")
 
     async def send_subscription_message(self, subscriptions: List[Subscription]):
         subscription_message = {
@@ -68,22 +67,22 @@ class BitvavoWebsocket(WebsocketMgr):
             ]
         }
 
-        LOG.debug(f"> {subscription_message}")
-        await self.websocket.send(json.dumps(subscription_message))
+        LOG.debug("> %s", subscription_message)
+        await self.websocket.send(self.json_codec.dumps(subscription_message))
 
     async def _process_message(self, websocket: websockets.WebSocketClientProtocol, message: str) -> None:
-        message = json.loads(message)
+        message = self.json_codec.loads(message)
 
         # subscription negative response
         if 'action' in message and message['action'] == 'subscribe' and "error" in message:
-            raise BitvavoException(f"Subscription error. Response [{json.dumps(message)}]")
+            raise BitvavoException(f"Subscription error. Response [{self.json_codec.dumps(message)}]")
 
         # subscription positive response
         if 'event' in message and message['event'] == 'subscribed':
             if len(message['subscriptions']) > 0:
                 LOG.info(f"Subscription confirmed for channels [{message['subscriptions']}]")
             else:
-                raise BitvavoException(f"Subscription error. No subscription confirmed. Response [{json.dumps(message)}]")
+                raise BitvavoException(f"Subscription error. No subscription confirmed. Response [{self.json_codec.dumps(message)}]")
 
         # regular message
         else:
@@ -2,13 +2,13 @@ import ssl
 import logging
 import datetime
 import pytz
-import hmac
 import hashlib
 import json
 from multidict import CIMultiDictProxy
 from typing import List, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType, RestCallPriority
+from cryptoxlib.HmacSigner import HmacSigner
 from cryptoxlib.clients.btse import enums
 from cryptoxlib.clients.btse.exceptions import BtseRestException
 from cryptoxlib.clients.btse.functions import map_pair
@@ -29,24 +29,30 @@ class BtseClient(CryptoXLibClient):
 
         self.api_key = api_key
         self.sec_key = sec_key
+        self.hmac_signer = HmacSigner(sec_key, hashlib.sha384)
 
     def _get_rest_api_uri(self) -> str:
         return self.REST_API_URI
 
-    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> None:
+    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> Optional[bytes]:
         timestamp = self._get_current_timestamp_ms()
 
-        signature_string = f"/api/v3.1/{resource}{timestamp}"
+        signature_string = f"/api/v3.1/{resource}{timestamp}".encode('utf-8')
+        # the signed body is sent as is
+        body = None
         if data is not None:
-            signature_string += json.dumps(data)
+            body = json.dumps(data).encode('utf-8')
+            signature_string += body
 
-        LOG.debug(f"Signature input string: {signature_string}")
-        signature = hmac.new(self.sec_key.encode('utf-8'), signature_string.encode('utf-8'), hashlib.sha384).hexdigest()
+        LOG.debug("Signature input string: %s", signature_string)
+        signature = self.hmac_signer.hexdigest(signature_string)
 
         headers['btse-api'] = self.api_key
         headers['btse-nonce'] = str(timestamp)
         headers['btse-sign'] = signature
 
+        return body
+
     def _preprocess_rest_response(self, status_code: int, headers: 'CIMultiDictProxy[str]', body: Optional[dict]) -> None:
         if str(status_code)[0] != '2':
             raise BtseRestException(status_code, body)
@@ -132,7 +138,7 @@ class BtseClient(CryptoXLibClient):
         if transction_type is not None:
             data['txType'] = transction_type.value
 
-        return await self._create_post("order", data = data, headers = self._get_header(), signed = True)
+        return await self._create_post("order", data = data, headers = self._get_header(), signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_order(self, pair: Pair, order_id: str = None, client_order_id: str = None) -> dict:
         params = self._clean_request_params({
@@ -141,4 +147,4 @@ class BtseClient(CryptoXLibClient):
             "clOrderID": client_order_id
         })
 
-        return await self._create_delete("order", params = params, headers = self._get_header(), signed = True)
\ No newline at end of file
+        return await self._create_delete("order", params = params, headers = self._get_header(), signed = True, priority = RestCallPriority.CRITICAL)
\ No newline at end of file
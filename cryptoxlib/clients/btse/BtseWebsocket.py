@@ -1,22 +1,22 @@
-import json
 import logging
 import datetime
 import websockets
 import hmac
 import hashlib
-from typing import List, Callable, Any, Optional
+from typing import List, Callable, Any, Optional, Union
 
-from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr, WebsocketMessage, Websocket, CallbacksType
+from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr, WebsocketMessage, Websocket, CallbacksType, \
+    extract_json_string_field
 from cryptoxlib.Pair import Pair
 from cryptoxlib.clients.btse.functions import map_pair
 from cryptoxlib.clients.btse.exceptions import BtseException
-from cryptoxlib.PeriodicChecker import PeriodicChecker
 
 LOG = logging.getLogger(__name__)
 
 
 class BtseWebsocket(WebsocketMgr):
     WEBSOCKET_URI = "wss://ws.btse.com/spotWS"
+    PING_INTERVAL_SEC = 30
 
     def __init__(self, subscriptions: List[Subscription], api_key: str = None, sec_key: str = None,
                  ssl_context = None) -> None:
@@ -24,19 +24,17 @@ class BtseWebsocket(WebsocketMgr):
                          ssl_context = ssl_context,
                          builtin_ping_interval = None,
                          auto_reconnect = True,
-                         periodic_timeout_sec = 5)
+                         periodic_timeout_sec = BtseWebsocket.PING_INTERVAL_SEC,
+                         periodic_initial_delay_sec = BtseWebsocket.PING_INTERVAL_SEC)
 
         self.api_key = api_key
         self.sec_key = sec_key
 
-        self.ping_checker = PeriodicChecker(period_ms = 30 * 1000)
-
     def get_websocket(self) -> Websocket:
         return self.get_aiohttp_websocket()
 
     async def _process_periodic(self, websocket: Websocket) -> None:
-        if self.ping_checker.check():
-            await websocket.send("2")
+        await websocket.send("2")
 
     async def send_authentication_message(self):
         requires_authentication = False
@@ -56,13 +54,13 @@ class BtseWebsocket(WebsocketMgr):
                 "args": [self.api_key, timestamp_ms, signature]
             }
 
-            LOG.debug(f"> {authentication_message}")
-            await self.websocket.send(json.dumps(authentication_message))
+            LOG.debug("> %s", authentication_message)
+            await self.websocket.send(self.json_codec.dumps(authentication_message))
 
             message = await self.websocket.receive()
-            LOG.debug(f"< {message}")
+            LOG.debug("< %s", message)
 
-            message = json.loads(message)
+            message = self.json_codec.loads(message)
             if 'success' in message and message['success'] is True:
                 LOG.info(f"Authenticated websocket connected successfully.")
             else:
@@ -78,14 +76,14 @@ class BtseWebsocket(WebsocketMgr):
             "args": subscription_list
         }
 
-        LOG.debug(f"> {subscription_message}")
-        await self.websocket.send(json.dumps(subscription_message))
+        LOG.debug("> %s", subscription_message)
+        await self.websocket.send(self.json_codec.dumps(subscription_message))
 
         message = await self.websocket.receive()
-        LOG.debug(f"< {message}")
+        LOG.debug("< %s", message)
 
         try:
-            message = json.loads(message)
+            message = self.json_codec.loads(message)
             if message['event'] == 'subscribe' and len(message['channel']) > 0:
                 LOG.info(f"Websocket subscribed successfully.")
             else:
@@ -93,8 +91,15 @@ class BtseWebsocket(WebsocketMgr):
         except:
             raise BtseException(f"Subscription error. Response [{message}]")
 
+    def _extract_raw_subscription_id(self, message: Union[str, bytes]) -> Optional[Any]:
+        topic = extract_json_string_field(message, 'topic')
+        if topic is None:
+            return None
+
+        return topic.split(':')[0]
+
     async def _process_message(self, websocket: Websocket, message: str) -> None:
-        message = json.loads(message)
+        message = self.json_codec.loads(message)
         topic = message['topic']
         channel = topic.split(':')[0]
 
@@ -1,13 +1,14 @@
 import ssl
 import logging
 import datetime
-import hmac
 import hashlib
+import re
 import pytz
 from multidict import CIMultiDictProxy
 from typing import List, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType, RestCallPriority
+from cryptoxlib.HmacSigner import HmacSigner
 from cryptoxlib.clients.coinmate.functions import map_pair
 from cryptoxlib.clients.coinmate.exceptions import CoinmateRestException, CoinmateException
 from cryptoxlib.clients.coinmate import enums
@@ -22,6 +23,9 @@ LOG = logging.getLogger(__name__)
 class CoinmateClient(CryptoXLibClient):
     REST_API_URI = "https://coinmate.io/api/"
 
+    # error flag of the raw response body, JSON whitespaces are allowed
+    RAW_ERROR_PATTERN = re.compile(rb'"error"\s*:\s*true')
+
     def __init__(self, user_id: str = None, api_key: str = None, sec_key: str = None, api_trace_log: bool = False,
                  ssl_context: ssl.SSLContext = None) -> None:
         super().__init__(api_trace_log, ssl_context)
@@ -29,6 +33,7 @@ class CoinmateClient(CryptoXLibClient):
         self.user_id = user_id
         self.api_key = api_key
         self.sec_key = sec_key
+        self.hmac_signer = HmacSigner(sec_key, hashlib.sha256)
 
     def _get_rest_api_uri(self) -> str:
         return self.REST_API_URI
@@ -37,9 +42,7 @@ class CoinmateClient(CryptoXLibClient):
         nonce = self._get_current_timestamp_ms()
         input_message = str(nonce) + str(self.user_id) + self.api_key
 
-        m = hmac.new(self.sec_key.encode('utf-8'), input_message.encode('utf-8'), hashlib.sha256)
-
-        params['signature'] = m.hexdigest().upper()
+        params['signature'] = self.hmac_signer.hexdigest(input_message).upper()
         params['clientId'] = self.user_id
         params['publicKey'] = self.api_key
         params['nonce'] = nonce
@@ -51,6 +54,11 @@ class CoinmateClient(CryptoXLibClient):
             if "error" in body and body['error'] is True:
                 raise CoinmateRestException(status_code, body)
 
+    def _preprocess_raw_rest_response(self, status_code: int, headers: 'CIMultiDictProxy[str]', body: bytes) -> None:
+        # errors are reported within successful responses, only responses containing an error are decoded
+        if str(status_code)[0] != '2' or CoinmateClient.RAW_ERROR_PATTERN.search(body) is not None:
+            self._preprocess_rest_response(status_code, headers, self._decode_rest_response_body(body))
+
     def _get_websocket_mgr(self, subscriptions: List[Subscription], startup_delay_ms: int = 0,
                            ssl_context = None) -> WebsocketMgr:
         return CoinmateWebsocket(subscriptions = subscriptions,
@@ -210,7 +218,7 @@ class CoinmateClient(CryptoXLibClient):
             "orderId": order_id
         }
 
-        return await self._create_post("cancelOrder", params = params, signed = True)
+        return await self._create_post("cancelOrder", params = params, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_all_orders(self, pair: Pair = None) -> dict:
         params = {}
@@ -218,7 +226,7 @@ class CoinmateClient(CryptoXLibClient):
         if pair is not None:
             params["currencyPair"] = map_pair(pair)
 
-        return await self._create_post("cancelAllOpenOrders", params = params, signed = True)
+        return await self._create_post("cancelAllOpenOrders", params = params, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def create_order(self, type: enums.OrderType,
                            pair: Pair,
@@ -265,4 +273,4 @@ class CoinmateClient(CryptoXLibClient):
         if time_in_force == enums.TimeInForce.IMMEDIATE_OR_CANCELLED:
             params["immediateOrCancel"] = "1"
 
-        return await self._create_post(endpoint, params = params, signed = True)
\ No newline at end of file
+        return await self._create_post(endpoint, params = params, signed = True, priority = RestCallPriority.CRITICAL)
\ No newline at end of file
@@ -1,11 +1,11 @@
-import json
 import logging
 import datetime
 import hmac
 import hashlib
-from typing import List, Any
+from typing import List, Any, Union, Optional
 
-from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr, WebsocketMessage, Websocket, CallbacksType
+from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr, WebsocketMessage, Websocket, CallbacksType, \
+    extract_json_string_field
 from cryptoxlib.Pair import Pair
 from cryptoxlib.clients.coinmate.functions import map_pair
 from cryptoxlib.clients.coinmate.exceptions import CoinmateException
@@ -59,13 +59,13 @@ class CoinmateWebsocket(WebsocketMgr):
                 subscription_message['data']['publicKey'] = self.api_key
                 subscription_message['data']['nonce'] = nonce
 
-            LOG.debug(f"> {subscription_message}")
-            await self.websocket.send(json.dumps(subscription_message))
+            LOG.debug("> %s", subscription_message)
+            await self.websocket.send(self.json_codec.dumps(subscription_message))
 
             message = await self.websocket.receive()
-            LOG.debug(f"< {message}")
+            LOG.debug("< %s", message)
 
-            message = json.loads(message)
+            message = self.json_codec.loads(message)
             if message['event'] == 'subscribe_success':
                 LOG.info(f"Channel {subscription.get_subscription_message()} subscribed successfully.")
             else:
@@ -75,11 +75,17 @@ class CoinmateWebsocket(WebsocketMgr):
     async def send_unsubscription_message(self, subscriptions: List[Subscription]):
         unsubscription_message = self._get_unsubscription_message(subscriptions)
 
-        LOG.debug(f"> {unsubscription_message}")
-        await self.websocket.send(json.dumps(unsubscription_message))
+        LOG.debug("> %s", unsubscription_message)
+        await self.websocket.send(self.json_codec.dumps(unsubscription_message))
+
+    def _extract_raw_subscription_id(self, message: Union[str, bytes]) -> Optional[Any]:
+        if extract_json_string_field(message, 'event') != "data":
+            return None
+
+        return extract_json_string_field(message, 'channel')
 
     async def _process_message(self, websocket: Websocket, message: str) -> None:
-        message = json.loads(message)
+        message = self.json_codec.loads(message)
 
         # data message
         if "event" in message and message['event'] == "data":
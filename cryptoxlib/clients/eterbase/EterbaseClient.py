@@ -1,14 +1,14 @@
 import ssl
 import logging
 import datetime
-import hmac
 import hashlib
 import json
 import base64
 from multidict import CIMultiDictProxy
 from typing import List, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType, RestCallPriority
+from cryptoxlib.HmacSigner import HmacSigner
 from cryptoxlib.clients.eterbase import enums
 from cryptoxlib.clients.eterbase.exceptions import EterbaseRestException
 from cryptoxlib.WebsocketMgr import WebsocketMgr, Subscription
@@ -28,27 +28,33 @@ class EterbaseClient(CryptoXLibClient):
         self.account_id = account_id
         self.api_key = api_key
         self.sec_key = sec_key
+        self.hmac_signer = HmacSigner(sec_key, hashlib.sha256)
 
     def _get_rest_api_uri(self) -> str:
         return self.REST_API_URI
 
-    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> None:
+    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> Optional[bytes]:
         http_date = datetime.datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S GMT")
 
         headers["Date"] = http_date
         message = 'date' + ':' + ' ' + http_date + "\n" + rest_call_type.value + ' ' + '/api/v1/' + resource + ' HTTP/1.1'
         headers_line = 'date request-line'
+        # the digested body is sent as is
+        body = None
         if data is not None:
             headers_line += ' digest'
-            digest = "SHA-256=" + base64.b64encode(hashlib.new("sha256", json.dumps(data).encode('utf-8')).digest()).decode()
+            body = json.dumps(data).encode('utf-8')
+            digest = "SHA-256=" + base64.b64encode(hashlib.sha256(body).digest()).decode()
             message += "\ndigest" + ':' + ' ' + digest
             headers['Digest'] = digest
-        signature = base64.b64encode(hmac.new(self.sec_key.encode('utf-8'), message.encode('utf-8'), hashlib.sha256).digest()).decode()
+        signature = base64.b64encode(self.hmac_signer.digest(message)).decode()
         headers["Authorization"] = 'hmac username="' + self.api_key + \
                                    '",algorithm="hmac-sha256",headers="' + headers_line + '",' + \
                                    'signature="' + signature + '"'
         headers["Content-Type"] = "application/json"
 
+        return body
+
     def _preprocess_rest_response(self, status_code: int, headers: 'CIMultiDictProxy[str]', body: Optional[dict]) -> None:
         if str(status_code)[0] != '2':
             raise EterbaseRestException(status_code, body)
@@ -94,7 +100,7 @@ class EterbaseClient(CryptoXLibClient):
         if time_in_force is not None:
             data['timeInForce'] = time_in_force.value
 
-        return await self._create_post("orders", data = data, signed = True)
+        return await self._create_post("orders", data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_order(self, order_id: str) -> dict:
-        return await self._create_delete(f"orders/{order_id}", signed = True)
+        return await self._create_delete(f"orders/{order_id}", signed = True, priority = RestCallPriority.CRITICAL)
@@ -1,11 +1,11 @@
-import json
 import logging
 import datetime
 import hmac
 import hashlib
-from typing import List, Any
+from typing import List, Any, Callable, Optional
 
 from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr, WebsocketMessage, Websocket, CallbacksType
+from cryptoxlib.OrderBook import OrderBook, OrderBookReader, OrderBookCollection
 from cryptoxlib.clients.eterbase.exceptions import EterbaseException
 
 LOG = logging.getLogger(__name__)
@@ -46,17 +46,17 @@ class EterbaseWebsocket(WebsocketMgr):
         ping_msg = {
             "type": "ping"
         }
-        LOG.debug(f"> {ping_msg}")
-        await websocket.send(json.dumps(ping_msg))
+        LOG.debug("> %s", ping_msg)
+        await websocket.send(self.json_codec.dumps(ping_msg))
 
     async def send_subscription_message(self, subscriptions: List[Subscription]):
         for subscription in subscriptions:
             subscription_message = subscription.get_subscription_message(account_id = self.account_id)
-            LOG.debug(f"> {subscription_message}")
-            await self.websocket.send(json.dumps(subscription_message))
+            LOG.debug("> %s", subscription_message)
+            await self.websocket.send(self.json_codec.dumps(subscription_message))
 
     async def _process_message(self, websocket: Websocket, message: str) -> None:
-        message = json.loads(message)
+        message = self.json_codec.loads(message)
 
         if 'type' not in message:
             LOG.error(f"ERROR: Message without 'type' property received: {message}")
@@ -116,7 +116,7 @@ class AccountSubscription(EterbaseSubscription):
         eterbase_client = kwargs['eterbase_client']
         token_response = await eterbase_client.get_token()
         self.token = token_response["response"]["wstoken"]
-        LOG.debug(f'Token: {self.token}')
+        LOG.debug("Token: %s", self.token)
 
 
 class OrderbookSubscription(EterbaseSubscription):
@@ -136,6 +136,45 @@ class OrderbookSubscription(EterbaseSubscription):
         return f"order_book"
 
 
+class ManagedOrderBookSubscription(OrderbookSubscription):
+    # Order books of the markets maintained locally from ob_snapshot and ob_update messages. Callbacks receive a read-only
+    # OrderBookReader of the updated market's book, the book of a market is available once its snapshot is received.
+    # The books are cleared on reconnection until new snapshots arrive.
+
+    def __init__(self, market_ids: List[str], callbacks: CallbacksType = None,
+                 order_book_factory: Callable[[str], Any] = OrderBook):
+        super().__init__(market_ids, callbacks)
+
+        # books by market id, created with order_book_factory, e.g. CompactOrderBook
+        self.order_books = OrderBookCollection(order_book_factory)
+
+    async def initialize(self, **kwargs) -> None:
+        # snapshots are sent again after (re)subscription
+        self.order_books.reset()
+
+    def get_order_book(self, market_id: str) -> Optional[OrderBookReader]:
+        return self.order_books.get_reader(str(market_id))
+
+    async def process_message(self, message: WebsocketMessage) -> None:
+        market_id = str(message.message['marketId'])
+        bids = self._get_levels(message.message['bids'])
+        asks = self._get_levels(message.message['asks'])
+
+        if message.message['type'] == 'ob_snapshot':
+            order_book_reader = self.order_books.apply_snapshot(market_id, bids, asks)
+        else:
+            order_book_reader = self.order_books.apply_update(market_id, bids, asks)
+            if order_book_reader is None:
+                return
+
+        await self.process_callbacks(WebsocketMessage(subscription_id = message.subscription_id,
+                                                      message = order_book_reader))
+
+    @staticmethod
+    def _get_levels(levels: List[dict]) -> list:
+        return [(level['price'], level['qty']) for level in levels]
+
+
 class OHLCVSubscription(EterbaseSubscription):
     def __init__(self, market_ids: List[str], callbacks: CallbacksType = None):
         super().__init__(callbacks)
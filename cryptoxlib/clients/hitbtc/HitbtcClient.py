@@ -6,7 +6,7 @@ import pytz
 from multidict import CIMultiDictProxy
 from typing import List, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType, RestCallPriority
 from cryptoxlib.clients.hitbtc import enums
 from cryptoxlib.clients.hitbtc.exceptions import HitbtcRestException
 from cryptoxlib.clients.hitbtc.functions import map_pair
@@ -115,14 +115,14 @@ class HitbtcClient(CryptoXLibClient):
         if expire_time:
             data["expireTime"] = expire_time.astimezone(pytz.utc).isoformat()
 
-        return await self._create_post("order", data = data, signed = True)
+        return await self._create_post("order", data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_orders(self, pair: Pair = None) -> dict:
         params = {}
         if pair is not None:
             params['symbol'] = map_pair(pair)
 
-        return await self._create_delete(f"order", params = params, signed = True)
+        return await self._create_delete(f"order", params = params, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_order(self, client_id: str) -> dict:
-        return await self._create_delete(f"order/{client_id}", signed = True)
\ No newline at end of file
+        return await self._create_delete(f"order/{client_id}", signed = True, priority = RestCallPriority.CRITICAL)
\ No newline at end of file
@@ -1,14 +1,14 @@
-import json
 import logging
 import datetime
 import hmac
 import pytz
 import hashlib
-from typing import List, Any
+from typing import List, Any, Optional, Hashable, Callable
 
 from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr, WebsocketMessage, Websocket, CallbacksType, \
     ClientWebsocketHandle, WebsocketOutboundMessage
 from cryptoxlib.Pair import Pair
+from cryptoxlib.OrderBook import OrderBook, OrderBookReader
 from cryptoxlib.clients.hitbtc.functions import map_pair
 from cryptoxlib.clients.hitbtc.exceptions import HitbtcException
 from cryptoxlib.clients.hitbtc import enums
@@ -35,6 +35,19 @@ class HitbtcWebsocket(WebsocketMgr):
     def get_websocket(self) -> Websocket:
         return self.get_aiohttp_websocket()
 
+    async def validate_subscriptions(self, subscriptions: List[Subscription]) -> None:
+        # a managed orderbook resubscribes over the connection it belongs to, with redundant connections it would
+        # resubscribe over one of them while updates are deduplicated across all of them
+        if self.message_deduplicator is not None:
+            for subscription in subscriptions:
+                if isinstance(subscription, ManagedOrderBookSubscription):
+                    raise HitbtcException(f"Managed orderbook of [{subscription.pair}] does not support redundant "
+                                          f"connections.")
+
+    async def initialize_subscriptions(self, subscriptions: List[Subscription]) -> None:
+        for subscription in subscriptions:
+            await subscription.initialize(websocket_mgr = self)
+
     async def send_authentication_message(self):
         requires_authentication = False
         for subscription in self.subscriptions:
@@ -57,13 +70,13 @@ class HitbtcWebsocket(WebsocketMgr):
                 }
             }
 
-            LOG.debug(f"> {authentication_message}")
-            await self.websocket.send(json.dumps(authentication_message))
+            LOG.debug("> %s", authentication_message)
+            await self.websocket.send(self.json_codec.dumps(authentication_message))
 
             message = await self.websocket.receive()
-            LOG.debug(f"< {message}")
+            LOG.debug("< %s", message)
 
-            message = json.loads(message)
+            message = self.json_codec.loads(message)
             if 'result' in message and message['result'] == True:
                 LOG.info(f"Authenticated websocket connected successfully.")
             else:
@@ -72,11 +85,11 @@ class HitbtcWebsocket(WebsocketMgr):
     async def send_subscription_message(self, subscriptions: List[Subscription]):
         for subscription in subscriptions:
             subscription_message = subscription.get_subscription_message()
-            LOG.debug(f"> {subscription_message}")
-            await self.websocket.send(json.dumps(subscription_message))
+            LOG.debug("> %s", subscription_message)
+            await self.websocket.send(self.json_codec.dumps(subscription_message))
 
     async def _process_message(self, websocket: Websocket, message: str) -> None:
-        message = json.loads(message)
+        message = self.json_codec.loads(message)
 
         if 'id' in message and 'result' in message and message['result'] == True:
             # subscription confirmation
@@ -86,7 +99,7 @@ class HitbtcWebsocket(WebsocketMgr):
                         await self.publish_message(WebsocketMessage(
                             subscription_id = 'account',
                             message = message,
-                            websocket = ClientWebsocketHandle(websocket = websocket)
+                            websocket = ClientWebsocketHandle(websocket = websocket, json_codec = self.json_codec)
                         ))
         else:
             # regular message
@@ -95,10 +108,26 @@ class HitbtcWebsocket(WebsocketMgr):
                 subscription_id = subscription_id,
                 message = message,
                 # for account channel communicate also the websocket handle
-                websocket = ClientWebsocketHandle(websocket = websocket) if subscription_id == 'account' else None
+                websocket = ClientWebsocketHandle(websocket = websocket, json_codec = self.json_codec) if subscription_id == 'account' else None
             )
             )
 
+    def get_message_sequence_key(self, message: WebsocketMessage) -> Optional[Hashable]:
+        params = message.message.get('params')
+        if not isinstance(params, dict):
+            return None
+
+        method = message.message.get('method')
+        if 'sequence' in params:
+            # orderbook, snapshot and update may share the sequence number
+            return message.subscription_id, method, params['sequence']
+        elif method == 'ticker' and 'timestamp' in params:
+            return message.subscription_id, method, params['timestamp']
+        elif method in ['snapshotTrades', 'updateTrades'] and len(params.get('data', [])) > 0:
+            return message.subscription_id, method, params['data'][-1]['id']
+
+        return None
+
     def _map_message_to_subscription_id(self, message: dict):
         if 'method' in message:
             if message['method'] in ['snapshotOrderbook', 'updateOrderbook']:
@@ -174,6 +203,88 @@ class OrderbookSubscription(HitbtcSubscription):
         return f"orderbook{map_pair(self.pair)}"
 
 
+class ManagedOrderBookSubscription(OrderbookSubscription):
+    # Order book maintained locally from snapshotOrderbook and updateOrderbook messages. Every update must follow the
+    # previous one by sequence number, on a gap only the symbol is resubscribed in order to receive a new snapshot.
+    # Callbacks receive a read-only OrderBookReader of the live book after a snapshot and then only when the best bid
+    # or ask price moves, use get_view() to keep its state.
+
+    def __init__(self, pair: Pair, callbacks: CallbacksType = None,
+                 order_book_factory: Callable[[Any], Any] = OrderBook):
+        super().__init__(pair, callbacks)
+
+        # creates a book with the OrderBook interface for the pair, e.g. CompactOrderBook
+        self.order_book = order_book_factory(pair)
+        self.order_book_reader = OrderBookReader(self.order_book)
+
+        self.websocket_mgr: Optional[HitbtcWebsocket] = None
+        self.synchronized = False
+        self.best_prices = (None, None)
+        self.resubscription_count = 0
+
+    async def initialize(self, **kwargs) -> None:
+        self.websocket_mgr = kwargs['websocket_mgr']
+
+    def get_order_book(self) -> OrderBookReader:
+        return self.order_book_reader
+
+    async def process_message(self, message: WebsocketMessage) -> None:
+        method = message.message.get('method')
+        params = message.message.get('params')
+        if method == 'snapshotOrderbook':
+            self.order_book.apply_snapshot(self._get_levels(params['bid']), self._get_levels(params['ask']),
+                                           params['sequence'])
+            self.synchronized = True
+        elif method == 'updateOrderbook':
+            # updates preceding the snapshot or received while waiting for a new one are dropped
+            if not self.synchronized or params['sequence'] <= self.order_book.sequence:
+                return
+
+            if params['sequence'] != self.order_book.sequence + 1:
+                LOG.warning(f"Gap in orderbook updates of [{params['symbol']}] detected (update {params['sequence']} "
+                            f"after {self.order_book.sequence}), symbol will be resubscribed.")
+                self.synchronized = False
+                await self._resubscribe()
+                return
+
+            self.order_book.update_bids(self._get_levels(params['bid']))
+            self.order_book.update_asks(self._get_levels(params['ask']))
+            self.order_book.sequence = params['sequence']
+        else:
+            # e.g. error related to the subscription
+            await self.process_callbacks(message)
+            return
+
+        best_prices = (self._get_price(self.order_book.get_best_bid()), self._get_price(self.order_book.get_best_ask()))
+        if method == 'snapshotOrderbook' or best_prices != self.best_prices:
+            self.best_prices = best_prices
+            await self.process_callbacks(WebsocketMessage(subscription_id = message.subscription_id,
+                                                          message = self.order_book_reader))
+
+    async def _resubscribe(self) -> None:
+        # other subscriptions of the connection are not affected
+        self.resubscription_count += 1
+
+        websocket = ClientWebsocketHandle(websocket = self.websocket_mgr.websocket,
+                                          json_codec = self.websocket_mgr.json_codec)
+        await websocket.send({
+            "method": "unsubscribeOrderbook",
+            "params": {
+                "symbol": map_pair(self.pair),
+            },
+            "id": HitbtcSubscription.generate_new_external_id()
+        })
+        await websocket.send(self.get_subscription_message())
+
+    @staticmethod
+    def _get_levels(levels: List[dict]) -> list:
+        return [(level['price'], level['size']) for level in levels]
+
+    @staticmethod
+    def _get_price(level: Optional[tuple]) -> Optional[float]:
+        return level[0] if level is not None else None
+
+
 class TickerSubscription(HitbtcSubscription):
     def __init__(self, pair: Pair, callbacks: CallbacksType = None):
         super().__init__(callbacks)
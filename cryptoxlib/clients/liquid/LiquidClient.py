@@ -4,7 +4,7 @@ import jwt
 from multidict import CIMultiDictProxy
 from typing import List, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType, RestCallPriority
 from cryptoxlib.clients.liquid import enums
 from cryptoxlib.clients.liquid.exceptions import LiquidException
 from cryptoxlib.WebsocketMgr import WebsocketMgr, Subscription
@@ -33,7 +33,7 @@ class LiquidClient(CryptoXLibClient):
             "token_id": self.api_key
         }
 
-        LOG.debug(f"Authentication payload: {authentication_payload}")
+        LOG.debug("Authentication payload: %s", authentication_payload)
 
         signature = jwt.encode(authentication_payload, self.sec_key, 'HS256')
         headers["X-Quoine-Auth"] = signature.decode('utf-8')
@@ -81,10 +81,10 @@ class LiquidClient(CryptoXLibClient):
             "client_order_id": client_order_id
         })
 
-        return await self._create_post("orders", data = data, headers = self._get_headers(), signed = True)
+        return await self._create_post("orders", data = data, headers = self._get_headers(), signed = True, priority = RestCallPriority.CRITICAL)
 
     async def cancel_order(self, order_id: str) -> dict:
-        return await self._create_put("orders/" + order_id + "/cancel", headers = self._get_headers(), signed = True)
+        return await self._create_put("orders/" + order_id + "/cancel", headers = self._get_headers(), signed = True, priority = RestCallPriority.CRITICAL)
 
     async def get_crypto_accounts(self) -> dict:
         return await self._create_get("crypto_accounts", headers = self._get_headers(), signed = True)
@@ -1,32 +1,37 @@
-import json
 import jwt
 import time
 import logging
 import websockets
 from abc import abstractmethod
-from typing import List, Callable, Any, Optional
+from typing import List, Callable, Any, Optional, Union, Hashable
 
-from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr, WebsocketMessage, Websocket
+from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr, WebsocketMessage, Websocket, extract_json_string_field
+from cryptoxlib.JsonCodec import JsonCodec, get_default_json_codec
+from cryptoxlib.OrderBook import OrderBook, OrderBookReader, OrderBookUpdate
 from cryptoxlib.Pair import Pair
 from cryptoxlib.clients.liquid.functions import map_pair
 from cryptoxlib.clients.liquid import enums
 from cryptoxlib.clients.liquid.exceptions import LiquidException
-from cryptoxlib.PeriodicChecker import PeriodicChecker
 
 LOG = logging.getLogger(__name__)
 
 
 class LiquidWebsocket(WebsocketMgr):
     WEBSOCKET_URI = "wss://tap.liquid.com/app/LiquidTapClient"
+    PING_INTERVAL_SEC = 60
 
     def __init__(self, subscriptions: List[Subscription], api_key: str = None, sec_key: str = None, ssl_context = None) -> None:
         super().__init__(websocket_uri = self.WEBSOCKET_URI, subscriptions = subscriptions,
-                         builtin_ping_interval = None, periodic_timeout_sec = 10, ssl_context = ssl_context)
+                         builtin_ping_interval = None, ssl_context = ssl_context,
+                         periodic_timeout_sec = LiquidWebsocket.PING_INTERVAL_SEC,
+                         periodic_initial_delay_sec = LiquidWebsocket.PING_INTERVAL_SEC)
 
         self.api_key = api_key
         self.sec_key = sec_key
 
-        self.ping_checker = PeriodicChecker(period_ms = 60 * 1000)
+    async def initialize_subscriptions(self, subscriptions: List[Subscription]) -> None:
+        for subscription in subscriptions:
+            await subscription.initialize(json_codec = self.json_codec)
 
     async def send_subscription_message(self, subscriptions: List[Subscription]):
         authentication_payload = {
@@ -34,7 +39,7 @@ class LiquidWebsocket(WebsocketMgr):
             "path": '/realtime',
             "nonce": int(time.time_ns())
         }
-        LOG.debug(f"Authentication payload: {authentication_payload}")
+        LOG.debug("Authentication payload: %s", authentication_payload)
         signature = jwt.encode(authentication_payload, self.sec_key, 'HS256')
 
         authentication_data = {
@@ -48,20 +53,26 @@ class LiquidWebsocket(WebsocketMgr):
             "event": "quoine:auth_request",
             "data": authentication_data
         }
-        LOG.debug(f"> {authentication_request}")
-        await self.websocket.send(json.dumps(authentication_request))
+        LOG.debug("> %s", authentication_request)
+        await self.websocket.send(self.json_codec.dumps(authentication_request))
 
     async def _process_periodic(self, websocket: Websocket) -> None:
-        if self.ping_checker.check():
-            ping_message = {
-                "event": "pusher:ping",
-                "data": ''
-            }
-            LOG.debug(f"> {ping_message}")
-            await websocket.send(json.dumps(ping_message))
+        ping_message = {
+            "event": "pusher:ping",
+            "data": ''
+        }
+        LOG.debug("> %s", ping_message)
+        await websocket.send(self.json_codec.dumps(ping_message))
+
+    def _extract_raw_subscription_id(self, message: Union[str, bytes]) -> Optional[Any]:
+        # data of the message are serialized into a string, hence channel and event fields cannot appear nested
+        if extract_json_string_field(message, 'event') != "updated":
+            return None
+
+        return extract_json_string_field(message, 'channel')
 
     async def _process_message(self, websocket: Websocket, message: str) -> None:
-        message = json.loads(message)
+        message = self.json_codec.loads(message)
 
         if message['event'] == "pusher:connection_established":
             pass
@@ -70,11 +81,10 @@ class LiquidWebsocket(WebsocketMgr):
         elif message['event'] == "quoine:auth_success":
             subscription_messages = []
             for subscription in self.subscriptions:
-                subscription_message = subscription.get_subscription_message()
-                subscription_messages.append(subscription_message)
+                subscription_messages.extend(subscription.get_subscription_messages())
 
-            LOG.debug(f"> {subscription_messages}")
-            await websocket.send(json.dumps(subscription_messages))
+            LOG.debug("> %s", subscription_messages)
+            await websocket.send(self.json_codec.dumps(subscription_messages))
         elif message['event'] == "quoine:auth_failure":
             raise LiquidException(f"Websocket authentication error: {message}")
         elif message['event'] == "pusher_internal:subscription_succeeded":
@@ -96,11 +106,26 @@ class LiquidSubscription(Subscription):
     def construct_subscription_id(self) -> Any:
         return self.get_channel_name()
 
+    def get_channel_names(self) -> List[str]:
+        # channels the subscription receives messages from
+        return [self.get_channel_name()]
+
+    def get_subscription_keys(self) -> List[Hashable]:
+        # messages are routed by their channel
+        return self.get_channel_names()
+
     def get_subscription_message(self, **kwargs) -> dict:
+        return self.get_channel_subscription_message(self.get_channel_name())
+
+    def get_subscription_messages(self) -> List[dict]:
+        return [self.get_channel_subscription_message(channel_name) for channel_name in self.get_channel_names()]
+
+    @staticmethod
+    def get_channel_subscription_message(channel_name: str) -> dict:
         return {
             "event": "pusher:subscribe",
             "data": {
-                "channel": self.get_channel_name()
+                "channel": channel_name
             },
         }
 
@@ -116,6 +141,85 @@ class OrderBookSideSubscription(LiquidSubscription):
         return f"price_ladders_cash_{map_pair(self.pair)}_{self.order_side.value}"
 
 
+class ManagedOrderBookSubscription(LiquidSubscription):
+    # Two-sided order book assembled from the buy and sell price ladder channels. Every ladder replaces a whole side,
+    # it is compared to the previous ladder of the side and only the changed levels are applied to the book. Callbacks
+    # are invoked only when a side changes and receive an OrderBookUpdate, i.e. a read-only reader of the live book
+    # carrying the changed levels of the side.
+
+    def __init__(self, pair: Pair, callbacks: Optional[List[Callable[[dict], Any]]] = None,
+                 order_book_factory: Callable[[Any], Any] = OrderBook):
+        super().__init__(callbacks)
+
+        self.pair = pair
+
+        # creates a book with the OrderBook interface for the pair, e.g. CompactOrderBook
+        self.order_book = order_book_factory(pair)
+        self.order_book_reader = OrderBookReader(self.order_book)
+        self.json_codec: JsonCodec = get_default_json_codec()
+
+        # previous ladder of every side as received and as price -> quantity
+        self.ladder_data = {enums.OrderSide.BUY: None, enums.OrderSide.SELL: None}
+        self.levels = {enums.OrderSide.BUY: {}, enums.OrderSide.SELL: {}}
+
+    def get_channel_name(self):
+        # the subscription is identified by the buy side channel
+        return self.get_side_channel_name(enums.OrderSide.BUY)
+
+    def get_channel_names(self) -> List[str]:
+        return [self.get_side_channel_name(enums.OrderSide.BUY), self.get_side_channel_name(enums.OrderSide.SELL)]
+
+    def get_side_channel_name(self, order_side: enums.OrderSide) -> str:
+        return f"price_ladders_cash_{map_pair(self.pair)}_{order_side.value}"
+
+    def get_order_book(self) -> OrderBookReader:
+        return self.order_book_reader
+
+    async def initialize(self, **kwargs) -> None:
+        self.json_codec = kwargs['json_codec']
+
+    async def process_message(self, message: WebsocketMessage) -> None:
+        order_side = enums.OrderSide.BUY if message.subscription_id.endswith('_buy') else enums.OrderSide.SELL
+
+        ladder_data = message.message['data']
+        # the ladder is repeated unchanged frequently, hence it is compared before decoding
+        if ladder_data == self.ladder_data[order_side]:
+            return
+        self.ladder_data[order_side] = ladder_data
+
+        # every ladder is a complete side, hence the book stays consistent also across reconnections
+        changes = self._merge_ladder(self.levels[order_side], self.json_codec.loads(ladder_data))
+        if len(changes) == 0:
+            return
+
+        if order_side == enums.OrderSide.BUY:
+            self.order_book.update_bids(changes)
+            update = OrderBookUpdate(self.order_book, bid_changes = changes)
+        else:
+            self.order_book.update_asks(changes)
+            update = OrderBookUpdate(self.order_book, ask_changes = changes)
+
+        await self.process_callbacks(WebsocketMessage(subscription_id = message.subscription_id, message = update))
+
+    @staticmethod
+    def _merge_ladder(levels: dict, ladder: List[list]) -> List[tuple]:
+        # updates the levels of the side in place and returns the changed levels, removed levels with zero quantity
+        changes = []
+        prices = set()
+        for price, quantity in ladder:
+            prices.add(price)
+            if levels.get(price) != quantity:
+                levels[price] = quantity
+                changes.append((price, quantity))
+
+        if len(prices) < len(levels):
+            for price in [price for price in levels.keys() if price not in prices]:
+                del levels[price]
+                changes.append((price, "0"))
+
+        return changes
+
+
 class OrderBookSubscription(LiquidSubscription):
     def __init__(self, pair: Pair, callbacks: Optional[List[Callable[[dict], Any]]] = None):
         super().__init__(callbacks)
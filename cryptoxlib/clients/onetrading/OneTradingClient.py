@@ -5,7 +5,7 @@ import pytz
 from multidict import CIMultiDictProxy
 from typing import List, Optional
 
-from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType, RestCallPriority
 from cryptoxlib.clients.onetrading import enums
 from cryptoxlib.clients.onetrading.exceptions import OneTradingRestException, OneTradingException
 from cryptoxlib.clients.onetrading.functions import map_pair
@@ -20,6 +20,11 @@ LOG = logging.getLogger(__name__)
 class OneTradingClient(CryptoXLibClient):
     REST_API_URI = "https://api.onetrading.com/public/v1/"
 
+    RESPONSE_CACHE_TTLS_SEC = {
+        "instruments": 300,
+        "currencies": 3600
+    }
+
     def __init__(self, api_key: str = None, api_trace_log: bool = False,
                  ssl_context: ssl.SSLContext = None) -> None:
         super().__init__(api_trace_log, ssl_context)
@@ -117,7 +122,7 @@ class OneTradingClient(CryptoXLibClient):
         if client_id is not None:
             data['client_id'] = client_id
 
-        return await self._create_post("account/orders", data = data, signed = True)
+        return await self._create_post("account/orders", data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def create_limit_order(self, pair: Pair, side: enums.OrderSide, amount: str, limit_price: str,
                                  time_in_force: enums.TimeInForce = None, client_id: str = None) -> dict:
@@ -135,7 +140,7 @@ class OneTradingClient(CryptoXLibClient):
         if time_in_force is not None:
             data['time_in_force'] = time_in_force.value
 
-        return await self._create_post("account/orders", data = data, signed = True)
+        return await self._create_post("account/orders", data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def create_stop_limit_order(self, pair: Pair, side: enums.OrderSide, amount: str, limit_price: str,
                                       stop_price: str,
@@ -155,7 +160,7 @@ class OneTradingClient(CryptoXLibClient):
         if time_in_force is not None:
             data['time_in_force'] = time_in_force.value
 
-        return await self._create_post("account/orders", data = data, signed = True)
+        return await self._create_post("account/orders", data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def delete_account_orders(self, pair: Pair = None, ids: List[str] = None) -> dict:
         params = {}
@@ -166,7 +171,7 @@ class OneTradingClient(CryptoXLibClient):
         if ids is not None:
             params['ids'] = ','.join(ids)
 
-        return await self._create_delete("account/orders", params = params, signed = True)
+        return await self._create_delete("account/orders", params = params, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def delete_account_order(self, order_id: str = None, client_id: str = None) -> dict:
         if order_id is None and client_id is None:
@@ -176,9 +181,9 @@ class OneTradingClient(CryptoXLibClient):
             raise OneTradingException('Only one of order_id/client_id can be provided.')
 
         if order_id is not None:
-            return await self._create_delete("account/orders/" + order_id, signed = True)
+            return await self._create_delete("account/orders/" + order_id, signed = True, priority = RestCallPriority.CRITICAL)
         else:
-            return await self._create_delete("account/orders/client/" + client_id, signed = True)
+            return await self._create_delete("account/orders/client/" + client_id, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def update_order(self, amount: str, order_id: str = None, client_id: str = None) -> dict:
         if order_id is None and client_id is None:
@@ -192,9 +197,9 @@ class OneTradingClient(CryptoXLibClient):
         }
 
         if order_id is not None:
-            return await self._create_put("account/orders/" + order_id, data = data, signed = True)
+            return await self._create_put("account/orders/" + order_id, data = data, signed = True, priority = RestCallPriority.CRITICAL)
         else:
-            return await self._create_put("account/orders/client/" + client_id, data = data, signed = True)
+            return await self._create_put("account/orders/client/" + client_id, data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def get_candlesticks(self, pair: Pair, unit: enums.TimeUnit, period: str, from_timestamp: datetime.datetime,
                                to_timestamp: datetime.datetime) -> dict:
@@ -364,7 +369,7 @@ class OneTradingClient(CryptoXLibClient):
             'timeout': timeout_ms
         }
 
-        return await self._create_post("account/orders/cancel-all-after", data = data, signed = True)
+        return await self._create_post("account/orders/cancel-all-after", data = data, signed = True, priority = RestCallPriority.CRITICAL)
 
     async def delete_auto_cancel_all_orders(self) -> dict:
-        return await self._create_delete("account/orders/cancel-all-after", signed = True)
+        return await self._create_delete("account/orders/cancel-all-after", signed = True, priority = RestCallPriority.CRITICAL)
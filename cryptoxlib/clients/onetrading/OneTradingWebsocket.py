@@ -1,10 +1,10 @@
-import json
 import logging
-from typing import List, Any
+from typing import List, Any, Union, Optional, Callable
 
 from cryptoxlib.Pair import Pair
+from cryptoxlib.OrderBook import OrderBook, OrderBookReader, OrderBookCollection
 from cryptoxlib.WebsocketMgr import Subscription, WebsocketMgr, WebsocketMessage, Websocket, CallbacksType, \
-    ClientWebsocketHandle, WebsocketOutboundMessage
+    ClientWebsocketHandle, WebsocketOutboundMessage, extract_json_string_field
 from cryptoxlib.clients.onetrading import enums
 from cryptoxlib.clients.onetrading.exceptions import OneTradingException
 from cryptoxlib.clients.onetrading.functions import map_pair, map_multiple_pairs
@@ -43,13 +43,13 @@ class OneTradingWebsocket(WebsocketMgr):
                 "api_token": self.api_key
             }
 
-            LOG.debug(f"> {authentication_message}")
-            await self.websocket.send(json.dumps(authentication_message))
+            LOG.debug("> %s", authentication_message)
+            await self.websocket.send(self.json_codec.dumps(authentication_message))
 
             message = await self.websocket.receive()
-            LOG.debug(f"< {message}")
+            LOG.debug("< %s", message)
 
-            message = json.loads(message)
+            message = self.json_codec.loads(message)
             if 'type' in message and message['type'] == 'AUTHENTICATED':
                 LOG.info(f"Websocket authenticated successfully.")
             else:
@@ -74,22 +74,25 @@ class OneTradingWebsocket(WebsocketMgr):
     async def send_subscription_message(self, subscriptions: List[Subscription]):
         subscription_message =  self._get_subscription_message(subscriptions)
 
-        LOG.debug(f"> {subscription_message}")
-        await self.websocket.send(json.dumps(subscription_message))
+        LOG.debug("> %s", subscription_message)
+        await self.websocket.send(self.json_codec.dumps(subscription_message))
 
     async def send_unsubscription_message(self, subscriptions: List[Subscription]):
         unsubscription_message = self._get_unsubscription_message(subscriptions)
 
-        LOG.debug(f"> {unsubscription_message}")
-        await self.websocket.send(json.dumps(unsubscription_message))
+        LOG.debug("> %s", unsubscription_message)
+        await self.websocket.send(self.json_codec.dumps(unsubscription_message))
+
+    def _extract_raw_subscription_id(self, message: Union[str, bytes]) -> Optional[Any]:
+        return extract_json_string_field(message, 'channel_name')
 
     async def _process_message(self, websocket: Websocket, message: str) -> None:
-        message = json.loads(message)
+        message = self.json_codec.loads(message)
 
         # subscription negative response
         if "error" in message or message['type'] == "ERROR":
             raise OneTradingException(
-                f"Subscription error. Request [{json.dumps(self._get_subscription_message())}] Response [{json.dumps(message)}]")
+                f"Subscription error. Request [{self.json_codec.dumps(self._get_subscription_message())}] Response [{self.json_codec.dumps(message)}]")
 
         # subscription positive response
         elif message['type'] == "SUBSCRIPTIONS":
@@ -101,7 +104,7 @@ class OneTradingWebsocket(WebsocketMgr):
                 await self.publish_message(WebsocketMessage(
                     subscription_id = 'ORDERS',
                     message = message,
-                    websocket = ClientWebsocketHandle(websocket = websocket)
+                    websocket = ClientWebsocketHandle(websocket = websocket, json_codec = self.json_codec)
                 ))
 
         # remote termination with an opportunity to reconnect
@@ -119,7 +122,7 @@ class OneTradingWebsocket(WebsocketMgr):
                 subscription_id = message['channel_name'],
                 message = message,
                 # for ORDERS channel communicate also the websocket handle
-                websocket = ClientWebsocketHandle(websocket = websocket) if message['channel_name'] == 'ORDERS' else None
+                websocket = ClientWebsocketHandle(websocket = websocket, json_codec = self.json_codec) if message['channel_name'] == 'ORDERS' else None
             ))
 
 
@@ -191,6 +194,50 @@ class OrderbookSubscription(OneTradingSubscription):
         }
 
 
+class ManagedOrderBookSubscription(OrderbookSubscription):
+    # Order books of the instruments maintained locally from ORDER_BOOK_SNAPSHOT and ORDER_BOOK_UPDATE messages.
+    # Callbacks receive a read-only OrderBookReader of the updated instrument's book, the book of an instrument is
+    # available once its snapshot is received. The books are cleared on reconnection until new snapshots arrive.
+
+    def __init__(self, pairs: List[Pair], depth: str, callbacks: CallbacksType = None,
+                 order_book_factory: Callable[[str], Any] = OrderBook):
+        super().__init__(pairs, depth, callbacks)
+
+        # books by instrument code, created with order_book_factory, e.g. CompactOrderBook
+        self.order_books = OrderBookCollection(order_book_factory)
+
+    async def initialize(self, **kwargs) -> None:
+        # snapshots are sent again after (re)subscription
+        self.order_books.reset()
+
+    def get_order_book(self, pair: Pair) -> Optional[OrderBookReader]:
+        return self.order_books.get_reader(map_pair(pair))
+
+    async def process_message(self, message: WebsocketMessage) -> None:
+        if message.message['type'] == 'ORDER_BOOK_SNAPSHOT':
+            order_book_reader = self.order_books.apply_snapshot(message.message['instrument_code'],
+                                                                message.message['bids'], message.message['asks'])
+        elif message.message['type'] == 'ORDER_BOOK_UPDATE':
+            # changes are [side, price, amount] triplets, zero amount removes the level
+            bids = []
+            asks = []
+            for side, price, amount in message.message['changes']:
+                if side == 'BUY':
+                    bids.append((price, amount))
+                else:
+                    asks.append((price, amount))
+
+            order_book_reader = self.order_books.apply_update(message.message['instrument_code'], bids, asks)
+            if order_book_reader is None:
+                return
+        else:
+            await self.process_callbacks(message)
+            return
+
+        await self.process_callbacks(WebsocketMessage(subscription_id = message.subscription_id,
+                                                      message = order_book_reader))
+
+
 class CandlesticksSubscriptionParams(object):
     def __init__(self, pair : Pair, unit : enums.TimeUnit, period: int):
         self.pair = pair
@@ -4,7 +4,8 @@ import os
 from cryptoxlib.CryptoXLib import CryptoXLib
 from cryptoxlib.clients.liquid import enums
 from cryptoxlib.Pair import Pair
-from cryptoxlib.clients.liquid.LiquidWebsocket import OrderBookSideSubscription, OrderBookSubscription, OrderSubscription
+from cryptoxlib.clients.liquid.LiquidWebsocket import OrderBookSideSubscription, OrderBookSubscription, OrderSubscription, \
+    ManagedOrderBookSubscription
 from cryptoxlib.version_conversions import async_run
 
 LOG = logging.getLogger("cryptoxlib")
@@ -26,6 +27,12 @@ async def order_book_update3(response : dict) -> None:
     print(f"Callback order_book_update3: [{response}]")
 
 
+async def managed_order_book_update(order_book) -> None:
+    print(f"Callback managed_order_book_update: best bid [{order_book.get_best_bid()}], "
+          f"best ask [{order_book.get_best_ask()}], changed bids [{order_book.bid_changes}], "
+          f"changed asks [{order_book.ask_changes}]")
+
+
 async def order_update(response : dict) -> None:
     print(f"Callback order_update: [{response}]")
 
@@ -44,6 +51,11 @@ async def run():
         OrderSubscription(quote = "USD", callbacks = [order_update])
     ])
 
+    # Order book assembled from both price ladder channels in a separate websocket
+    liquid.compose_subscriptions([
+        ManagedOrderBookSubscription(pair = Pair('BTC', 'USD'), callbacks = [managed_order_book_update])
+    ])
+
     # Execute all websockets asynchronously
     await liquid.start_websockets()
 
@@ -34,5 +34,9 @@ setuptools.setup(
         "Typing :: Typed",
     ],
     install_requires=requirements,
+    extras_require={
+        "orjson": ["orjson"],
+        "numpy": ["numpy"],
+    },
     python_requires='>=3.6.1',
 )
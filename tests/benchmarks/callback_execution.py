@@ -0,0 +1,68 @@
+# Compares callback execution modes of a subscription on a synthetic feed of 100k messages.
+# Run from the repository root: python tests/benchmarks/callback_execution.py
+import asyncio
+import time
+from typing import Any
+
+from cryptoxlib.WebsocketMgr import Subscription, WebsocketMessage, CallbackExecutionMode
+from cryptoxlib.version_conversions import async_run
+
+MESSAGE_COUNT = 100000
+
+
+class BenchmarkSubscription(Subscription):
+    def construct_subscription_id(self) -> Any:
+        return "depth"
+
+    def get_subscription_message(self, **kwargs) -> dict:
+        return {}
+
+
+class Counter(object):
+    def __init__(self):
+        self.count = 0
+
+    async def async_callback(self, message: dict) -> None:
+        self.count += 1
+
+    def sync_callback(self, message: dict) -> None:
+        self.count += 1
+
+
+async def measure(mode: CallbackExecutionMode, callback_count: int) -> float:
+    counters = [Counter() for _ in range(callback_count)]
+    if mode == CallbackExecutionMode.SYNCHRONOUS:
+        callbacks = [counter.sync_callback for counter in counters]
+    else:
+        callbacks = [counter.async_callback for counter in counters]
+
+    subscription = BenchmarkSubscription(callbacks = callbacks)
+    subscription.set_callback_execution_mode(mode, max_in_flight_callbacks = 1000)
+
+    message = WebsocketMessage(subscription_id = "depth", message = {"e": "depthUpdate", "b": [], "a": []})
+
+    start = time.perf_counter()
+    for _ in range(MESSAGE_COUNT):
+        await subscription.process_message(message)
+
+    # let all fire-and-forget callbacks finish
+    while len(subscription.in_flight_callbacks) > 0:
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    assert all(counter.count == MESSAGE_COUNT for counter in counters)
+
+    return elapsed
+
+
+async def run():
+    print(f"{MESSAGE_COUNT} messages")
+    print(f"{'mode':>16} {'callbacks':>10} {'total [ms]':>12} {'per message [ns]':>18}")
+    for callback_count in [1, 3]:
+        for mode in CallbackExecutionMode:
+            elapsed = await measure(mode, callback_count)
+            print(f"{mode.name:>16} {callback_count:>10} {elapsed * 1000:>12.1f} {elapsed / MESSAGE_COUNT * 10**9:>18.0f}")
+
+
+if __name__ == "__main__":
+    async_run(run())
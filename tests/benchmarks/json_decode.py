@@ -0,0 +1,87 @@
+# Measures decoding time of typical exchange websocket messages with every available JSON codec.
+# Run from the repository root: python tests/benchmarks/json_decode.py
+import time
+import json
+from typing import List
+
+from cryptoxlib.JsonCodec import JsonCodec, StdlibJsonCodec, OrjsonCodec, UjsonCodec, RapidjsonCodec
+from cryptoxlib.exceptions import CryptoXLibException
+
+ITERATIONS = 20000
+
+
+def levels(count: int, price: float) -> List[List[str]]:
+    return [[f"{price + i * 0.01:.8f}", f"{1.5 + i:.8f}"] for i in range(count)]
+
+
+MESSAGES = {
+    "binance_depth": {
+        "stream": "btcusdt@depth20@100ms",
+        "data": {"lastUpdateId": 160, "bids": levels(20, 30000.0), "asks": levels(20, 30010.0)}
+    },
+    "binance_trade": {
+        "stream": "btcusdt@trade",
+        "data": {"e": "trade", "E": 123456789, "s": "BTCUSDT", "t": 12345, "p": "0.001", "q": "100",
+                 "b": 88, "a": 50, "T": 123456785, "m": True, "M": True}
+    },
+    "bitforex_depth": {
+        "event": "depth10", "param": {"businessType": "coin-usdt-btc", "dType": 0},
+        "data": {"bids": [{"price": 30000.0 + i, "amount": 1.5} for i in range(10)],
+                 "asks": [{"price": 30010.0 + i, "amount": 1.5} for i in range(10)]}
+    },
+    "bitvavo_book": {
+        "event": "book", "market": "BTC-EUR", "nonce": 1234,
+        "bids": levels(50, 30000.0), "asks": levels(50, 30010.0)
+    },
+    "btse_orderbook": {
+        "topic": "orderBook:BTC-USD_0", "data": {
+            "buyQuote": [{"price": "30000.0", "size": "1.5"}] * 50,
+            "sellQuote": [{"price": "30010.0", "size": "1.5"}] * 50,
+            "currency": "USD", "timestamp": 1600000000000, "symbol": "BTC-USD"}
+    },
+    "hitbtc_orderbook": {
+        "jsonrpc": "2.0", "method": "snapshotOrderbook", "params": {
+            "ask": [{"price": "30010.00", "size": "1.5"}] * 100,
+            "bid": [{"price": "30000.00", "size": "1.5"}] * 100,
+            "symbol": "BTCUSD", "sequence": 8073827, "timestamp": "2018-11-19T05:00:28.193Z"}
+    },
+    "liquid_price_levels": {
+        "channel": "price_ladders_cash_btcjpy_buy", "event": "updated",
+        "data": json.dumps(levels(40, 30000.0))
+    },
+    "onetrading_book": {
+        "type": "ORDER_BOOK_SNAPSHOT", "channel_name": "ORDER_BOOK", "instrument_code": "BTC_EUR",
+        "time": "2019-01-01T01:01:01Z", "bids": levels(100, 30000.0), "asks": levels(100, 30010.0)
+    },
+}
+
+
+def get_codecs() -> List[JsonCodec]:
+    codecs = [StdlibJsonCodec()]
+    for codec_type in [OrjsonCodec, UjsonCodec, RapidjsonCodec]:
+        try:
+            codecs.append(codec_type())
+        except CryptoXLibException:
+            pass
+
+    return codecs
+
+
+def run():
+    codecs = get_codecs()
+
+    print(f"{'message':<24}{'size [B]':>10}" + "".join(f"{type(codec).__name__:>20}" for codec in codecs))
+    for name, message in MESSAGES.items():
+        data = json.dumps(message).encode('utf-8')
+
+        line = f"{name:<24}{len(data):>10}"
+        for codec in codecs:
+            start = time.perf_counter()
+            for _ in range(ITERATIONS):
+                codec.loads(data)
+            line += f"{(time.perf_counter() - start) / ITERATIONS * 1e6:>17.2f} us"
+        print(line)
+
+
+if __name__ == "__main__":
+    run()
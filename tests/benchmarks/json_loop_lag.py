@@ -0,0 +1,121 @@
+# Measures the longest event loop stall while large REST responses (exchange info, order book) are decoded, with the
+# regular and with the incremental JSON decoding. Run from the repository root: python tests/benchmarks/json_loop_lag.py
+import asyncio
+import gc
+import json
+import time
+from aiohttp import web
+
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.version_conversions import async_run, async_create_task
+
+HOST = "127.0.0.1"
+PORT = 8768
+CALL_COUNT = 10
+
+EXCHANGE_INFO = json.dumps({
+    "timezone": "UTC",
+    "serverTime": 1600000000000,
+    "symbols": [{
+        "symbol": f"SYM{i}USDT",
+        "status": "TRADING",
+        "baseAsset": f"SYM{i}",
+        "quoteAsset": "USDT",
+        "orderTypes": ["LIMIT", "LIMIT_MAKER", "MARKET", "STOP_LOSS_LIMIT", "TAKE_PROFIT_LIMIT"],
+        "filters": [{"filterType": "PRICE_FILTER", "minPrice": "0.01", "maxPrice": "1000000.00", "tickSize": "0.01"},
+                    {"filterType": "LOT_SIZE", "minQty": "0.00001", "maxQty": "9000.00", "stepSize": "0.00001"},
+                    {"filterType": "NOTIONAL", "minNotional": "5.00", "applyMinToMarket": True}]
+    } for i in range(5000)]
+}).encode('utf-8')
+
+ORDER_BOOK = json.dumps({
+    "lastUpdateId": 1027024,
+    "bids": [[f"{40000 - i * 0.01:.2f}", "0.12345"] for i in range(5000)],
+    "asks": [[f"{40000 + i * 0.01:.2f}", "0.12345"] for i in range(5000)]
+}).encode('utf-8')
+
+
+class BenchmarkClient(CryptoXLibClient):
+    def _get_rest_api_uri(self) -> str:
+        return f"http://{HOST}:{PORT}/"
+
+    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> None:
+        pass
+
+    def _preprocess_rest_response(self, status_code: int, headers, body) -> None:
+        pass
+
+    def _get_websocket_mgr(self, subscriptions, startup_delay_ms = 0, ssl_context = None):
+        pass
+
+
+async def handle_exchange_info(request):
+    return web.Response(body = EXCHANGE_INFO, content_type = 'application/json')
+
+
+async def handle_order_book(request):
+    return web.Response(body = ORDER_BOOK, content_type = 'application/json')
+
+
+async def measure_stall(stop: asyncio.Event) -> float:
+    # the longest time the event loop did not get back to this task, i.e. was blocked by other tasks
+    max_stall_ms = 0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0)
+        now = time.perf_counter()
+        max_stall_ms = max(max_stall_ms, (now - last) * 1000)
+        last = now
+
+    return max_stall_ms
+
+
+async def measure(resource: str, incremental_json_threshold: int = None, gc_enabled: bool = True) -> tuple:
+    client = BenchmarkClient()
+    client.incremental_json_threshold = incremental_json_threshold
+    # connection established in advance so that only the response processing is measured
+    await client._create_get(resource)
+
+    if not gc_enabled:
+        gc.disable()
+
+    # responses are kept so that their deallocation does not stall the loop during the measurement
+    responses = []
+    stop = asyncio.Event()
+    stall_task = async_create_task(measure_stall(stop))
+    start = time.perf_counter()
+    for _ in range(CALL_COUNT):
+        responses.append(await client._create_get(resource))
+    call_ms = (time.perf_counter() - start) * 1000 / CALL_COUNT
+    stop.set()
+    max_stall_ms = await stall_task
+
+    gc.enable()
+    await client.close()
+
+    return call_ms, max_stall_ms
+
+
+async def run():
+    app = web.Application()
+    app.router.add_get('/exchangeInfo', handle_exchange_info)
+    app.router.add_get('/depth', handle_order_book)
+    runner = web.AppRunner(app, access_log = None)
+    await runner.setup()
+    await web.TCPSite(runner, HOST, PORT).start()
+
+    print(f"exchange info {len(EXCHANGE_INFO) / 10**6:.1f} MB, order book {len(ORDER_BOOK) / 10**6:.1f} MB")
+    # garbage collection of the freshly allocated objects stalls the loop regardless of the decoding
+    print(f"{'response':<16}{'decoding':<14}{'gc':<6}{'call [ms]':>12}{'max stall [ms]':>18}")
+    try:
+        for resource in ["exchangeInfo", "depth"]:
+            for name, threshold in [("regular", None), ("incremental", 64 * 1024)]:
+                for gc_enabled in [True, False]:
+                    call_ms, max_stall_ms = await measure(resource, threshold, gc_enabled)
+                    print(f"{resource:<16}{name:<14}{'on' if gc_enabled else 'off':<6}{call_ms:>12.1f}{max_stall_ms:>18.2f}")
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    async_run(run())
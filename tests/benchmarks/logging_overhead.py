@@ -0,0 +1,137 @@
+# Measures the per-message cost of debug logging on the hot paths while debug logging is disabled and fails if it exceeds a fixed budget.
+# Run from the repository root: python tests/benchmarks/logging_overhead.py
+import logging
+import json
+import time
+from typing import List
+
+from cryptoxlib.WebsocketMgr import WebsocketMgr, Subscription, Websocket, LOG as WEBSOCKET_LOG
+from cryptoxlib.Timer import Timer
+from cryptoxlib.version_conversions import async_run
+
+MESSAGE_COUNT = 100000
+REPEAT = 5
+
+# maximal allowed overhead with debug logging disabled, per websocket message and per REST call
+MESSAGE_BUDGET_NS = 500
+REST_CALL_BUDGET_NS = 5000
+
+# a depth snapshot of a few KB, formatting of such message is what used to dominate the logging cost
+MESSAGE = json.dumps({
+    "stream": "btcusdt@depth20@100ms",
+    "data": {
+        "lastUpdateId": 160,
+        "bids": [[f"{30000.0 + i * 0.01:.8f}", f"{1.5 + i:.8f}"] for i in range(100)],
+        "asks": [[f"{30010.0 + i * 0.01:.8f}", f"{1.5 + i:.8f}"] for i in range(100)]
+    }
+})
+
+
+class BenchmarkWebsocket(Websocket):
+    def __init__(self, message_count: int):
+        super().__init__()
+
+        self.remaining = message_count
+
+    async def connect(self):
+        pass
+
+    async def is_open(self):
+        return True
+
+    async def close(self):
+        pass
+
+    async def receive(self):
+        if self.remaining == 0:
+            raise StopAsyncIteration()
+
+        self.remaining -= 1
+        return MESSAGE
+
+    async def send(self, message: str):
+        pass
+
+
+class BenchmarkWebsocketMgr(WebsocketMgr):
+    def __init__(self, subscriptions: List[Subscription]):
+        super().__init__(websocket_uri = "", subscriptions = subscriptions)
+
+    async def send_subscription_message(self, subscriptions: List[Subscription]):
+        pass
+
+    async def _process_message(self, websocket: Websocket, message: str) -> None:
+        pass
+
+
+async def measure_main_loop() -> float:
+    websocket_mgr = BenchmarkWebsocketMgr([])
+    websocket_mgr.websocket = BenchmarkWebsocket(MESSAGE_COUNT)
+
+    start = time.perf_counter()
+    try:
+        await websocket_mgr.main_loop()
+    except StopAsyncIteration:
+        pass
+
+    return (time.perf_counter() - start) / MESSAGE_COUNT * 10**9
+
+
+def measure(statement) -> float:
+    # best of several repetitions to filter out noise of other processes
+    results = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for _ in range(MESSAGE_COUNT):
+            statement()
+        results.append((time.perf_counter() - start) / MESSAGE_COUNT * 10**9)
+
+    return min(results)
+
+
+def eager_log():
+    # the way messages were logged before
+    WEBSOCKET_LOG.debug(f"< {MESSAGE}")
+
+
+def lazy_log():
+    WEBSOCKET_LOG.debug("< %s", MESSAGE)
+
+
+def guarded_log():
+    # the way messages are logged in the websocket receive loop
+    if WEBSOCKET_LOG.isEnabledFor(logging.DEBUG):
+        WEBSOCKET_LOG.debug("< %s", MESSAGE)
+
+
+def rest_call_logging():
+    # timer and both log statements executed by every REST call
+    with Timer('RestCall'):
+        WEBSOCKET_LOG.debug("> rest type [%s], uri [%s], params [%s], headers [%s], data [%s]", "GET", "uri", {}, {}, None)
+        WEBSOCKET_LOG.debug("<: status [%s], response [%s]", 200, MESSAGE)
+
+
+async def run():
+    logging.basicConfig(level = logging.INFO)
+
+    results = {
+        "eager f-string log": measure(eager_log),
+        "lazy log": measure(lazy_log),
+        "guarded log": measure(guarded_log),
+        "REST call logging": measure(rest_call_logging),
+    }
+    for name, result in results.items():
+        print(f"{name:<24}{result:>10.0f} ns/msg")
+
+    main_loop = await measure_main_loop()
+    print(f"{'main loop':<24}{main_loop:>10.0f} ns/msg (message size {len(MESSAGE)} B)")
+
+    for name, budget in [("guarded log", MESSAGE_BUDGET_NS), ("REST call logging", REST_CALL_BUDGET_NS)]:
+        if results[name] > budget:
+            raise AssertionError(f"Overhead of [{name}] {results[name]:.0f} ns exceeds the budget of {budget} ns.")
+
+    print("All hot-path logging overheads are within the budget.")
+
+
+if __name__ == "__main__":
+    async_run(run())
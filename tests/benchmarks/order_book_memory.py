@@ -0,0 +1,77 @@
+# Measures memory and update speed of 5000-level order books kept as decoded depth messages, as OrderBook and as
+# CompactOrderBook. Run from the repository root: python tests/benchmarks/order_book_memory.py
+import gc
+import random
+import timeit
+import tracemalloc
+
+from cryptoxlib.CompactOrderBook import CompactOrderBook
+from cryptoxlib.OrderBook import OrderBook
+
+LEVEL_COUNT = 5000
+BOOK_COUNT = 20
+# memory is extrapolated to this number of books
+SYMBOL_COUNT = 200
+UPDATE_COUNT = 100000
+
+
+def generate_levels(mid_price: float, step: int) -> list:
+    return [[f"{mid_price + step * (i + 1) * 0.01:.2f}", f"{random.randint(1, 100000) / 10**5:.5f}"]
+            for i in range(LEVEL_COUNT)]
+
+
+def generate_snapshot() -> dict:
+    return {
+        "lastUpdateId": 1027024,
+        "bids": generate_levels(40000, -1),
+        "asks": generate_levels(40000, 1)
+    }
+
+
+def measure_memory(create_book) -> int:
+    gc.collect()
+    tracemalloc.start()
+    books = [create_book(generate_snapshot()) for _ in range(BOOK_COUNT)]
+    # the snapshots themselves are released once the books are built
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del books
+
+    return size // BOOK_COUNT
+
+
+def create_order_book(snapshot: dict) -> OrderBook:
+    order_book = OrderBook()
+    order_book.apply_snapshot(snapshot['bids'], snapshot['asks'], snapshot['lastUpdateId'])
+    return order_book
+
+
+def create_compact_order_book(snapshot: dict) -> CompactOrderBook:
+    order_book = CompactOrderBook(price_decimals = 2, quantity_decimals = 5)
+    order_book.apply_snapshot(snapshot['bids'], snapshot['asks'], snapshot['lastUpdateId'])
+    return order_book
+
+
+def measure_update_us(order_book) -> float:
+    # updates concentrated close to the top of the book, a third of them removes a level
+    updates = [(f"{40000 - random.randint(1, 200) * 0.01:.2f}",
+                "0" if random.random() < 0.3 else f"{random.randint(1, 100000) / 10**5:.5f}")
+               for _ in range(UPDATE_COUNT)]
+
+    return timeit.timeit(lambda: order_book.update_bids(updates), number = 1) * 10**6 / UPDATE_COUNT
+
+
+def run():
+    print(f"{BOOK_COUNT} books with {LEVEL_COUNT} levels per side, memory extrapolated to {SYMBOL_COUNT} books")
+    print(f"{'book':<20}{'per book [MB]':>16}{f'{SYMBOL_COUNT} books [MB]':>18}{'update [us]':>14}")
+    for name, create_book in [("depth message", lambda snapshot: snapshot),
+                              ("OrderBook", create_order_book),
+                              ("CompactOrderBook", create_compact_order_book)]:
+        size = measure_memory(create_book)
+        update_us = measure_update_us(create_book(generate_snapshot())) if name != "depth message" else float('nan')
+        print(f"{name:<20}{size / 10**6:>16.2f}{size * SYMBOL_COUNT / 10**6:>18.1f}{update_us:>14.2f}")
+
+
+if __name__ == "__main__":
+    run()
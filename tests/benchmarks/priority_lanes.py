@@ -0,0 +1,79 @@
+# Measures latency of a critical (e.g. cancel order) and a normal REST call issued while a bulk backfill occupies the
+# connection pool. Run from the repository root: python tests/benchmarks/priority_lanes.py
+import asyncio
+import time
+from aiohttp import web
+
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType, RestCallPriority
+from cryptoxlib.RestConnectionPool import RestConnectionPool
+from cryptoxlib.version_conversions import async_run, async_create_task
+
+HOST = "127.0.0.1"
+PORT = 8766
+SERVER_LATENCY_MS = 50
+POOL_LIMIT = 20
+BULK_CALL_COUNT = 400
+
+
+class BenchmarkClient(CryptoXLibClient):
+    def _get_rest_api_uri(self) -> str:
+        return f"http://{HOST}:{PORT}/"
+
+    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> None:
+        pass
+
+    def _preprocess_rest_response(self, status_code: int, headers, body) -> None:
+        pass
+
+    def _get_websocket_mgr(self, subscriptions, startup_delay_ms = 0, ssl_context = None):
+        pass
+
+
+async def handle(request):
+    await asyncio.sleep(SERVER_LATENCY_MS / 1000.0)
+    return web.Response(body = b'[]', content_type = 'application/json')
+
+
+async def timed_call(client: CryptoXLibClient, resource: str, priority: RestCallPriority) -> float:
+    start = time.perf_counter()
+    await client._create_get(resource, priority = priority)
+
+    return (time.perf_counter() - start) * 1000
+
+
+async def measure(bulk_priority: RestCallPriority) -> tuple:
+    client = BenchmarkClient()
+    client.rest_connection_pool = RestConnectionPool(limit = POOL_LIMIT)
+
+    backfill = [async_create_task(client._create_get("aggTrades", priority = bulk_priority))
+                for _ in range(BULK_CALL_COUNT)]
+    await asyncio.sleep(0.2)
+
+    critical_ms = await timed_call(client, "order", RestCallPriority.CRITICAL)
+    normal_ms = await timed_call(client, "depth", RestCallPriority.NORMAL)
+
+    await asyncio.gather(*backfill)
+    await client.close()
+
+    return critical_ms, normal_ms
+
+
+async def run():
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handle)
+    runner = web.AppRunner(app, access_log = None)
+    await runner.setup()
+    await web.TCPSite(runner, HOST, PORT).start()
+
+    print(f"{BULK_CALL_COUNT} backfill calls, pool limit {POOL_LIMIT}, server latency {SERVER_LATENCY_MS} ms")
+    print(f"{'backfill priority':<20}{'critical [ms]':>16}{'normal [ms]':>14}")
+    try:
+        for priority in [RestCallPriority.NORMAL, RestCallPriority.BULK]:
+            critical_ms, normal_ms = await measure(priority)
+            print(f"{priority.name:<20}{critical_ms:>16.1f}{normal_ms:>14.1f}")
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    async_run(run())
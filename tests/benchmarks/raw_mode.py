@@ -0,0 +1,57 @@
+# Compares processing of binance combined stream messages in the regular (decoded) mode and in the raw mode.
+# Run from the repository root: python tests/benchmarks/raw_mode.py
+import time
+import json
+
+from cryptoxlib.Pair import Pair
+from cryptoxlib.clients.binance.BinanceWebsocket import BinanceWebsocket, DepthSubscription, TradeSubscription
+from cryptoxlib.version_conversions import async_run
+
+MESSAGE_COUNT = 50000
+
+MESSAGES = {
+    "trade": json.dumps({
+        "stream": "btcusdt@trade",
+        "data": {"e": "trade", "E": 123456789, "s": "BTCUSDT", "t": 12345, "p": "0.001", "q": "100",
+                 "b": 88, "a": 50, "T": 123456785, "m": True, "M": True}
+    }, separators = (',', ':')),
+    "depth": json.dumps({
+        "stream": "btcusdt@depth20@100ms",
+        "data": {"lastUpdateId": 160,
+                 "bids": [[f"{30000.0 + i * 0.01:.8f}", f"{1.5 + i:.8f}"] for i in range(20)],
+                 "asks": [[f"{30010.0 + i * 0.01:.8f}", f"{1.5 + i:.8f}"] for i in range(20)]}
+    }, separators = (',', ':')),
+}
+
+
+async def callback(message) -> None:
+    pass
+
+
+async def measure(raw_mode: bool, message: str) -> float:
+    subscriptions = [TradeSubscription(Pair('BTC', 'USDT'), callbacks = [callback]),
+                     DepthSubscription(Pair('BTC', 'USDT'), 20, 100, callbacks = [callback])]
+    for subscription in subscriptions:
+        subscription.set_raw_mode(raw_mode)
+
+    websocket_mgr = BinanceWebsocket(subscriptions = subscriptions, binance_client = None)
+    websocket_mgr._rebuild_subscription_index()
+
+    start = time.perf_counter()
+    for _ in range(MESSAGE_COUNT):
+        await websocket_mgr._dispatch_message(None, message)
+
+    return (time.perf_counter() - start) / MESSAGE_COUNT * 10**9
+
+
+async def run():
+    print(f"JSON codec: {type(BinanceWebsocket([], None).json_codec).__name__}")
+    print(f"{'message':<10}{'size [B]':>10}{'decoded [ns/msg]':>20}{'raw [ns/msg]':>16}")
+    for name, message in MESSAGES.items():
+        decoded = await measure(False, message)
+        raw = await measure(True, message)
+        print(f"{name:<10}{len(message):>10}{decoded:>20.0f}{raw:>16.0f}")
+
+
+if __name__ == "__main__":
+    async_run(run())
@@ -0,0 +1,132 @@
+# Measures p50/p99 latency of bursts of concurrent REST GETs against a local stand-in server emulating network round
+# trips and TCP/TLS handshakes for several connection pool configurations. Run from the repository root:
+# python tests/benchmarks/rest_connection_pool.py
+import asyncio
+import multiprocessing
+import time
+import statistics
+import aiohttp
+from aiohttp import web
+from typing import List
+
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.RestConnectionPool import RestConnectionPool
+from cryptoxlib.version_conversions import async_run
+
+HOST = "127.0.0.1"
+PORT = 8765
+BURST_SIZE = 300
+BURST_COUNT = 4
+# idle time between bursts
+IDLE_SEC = 2
+# request round trip and server processing time
+SERVER_LATENCY_MS = 30
+# TCP and TLS handshakes take two additional round trips on a new connection
+HANDSHAKE_LATENCY_MS = 60
+
+
+class HandshakeDelayConnector(aiohttp.TCPConnector):
+    # a localhost connection is established immediately, hence the handshake latency is emulated
+    async def _create_connection(self, req, traces, timeout):
+        await asyncio.sleep(HANDSHAKE_LATENCY_MS / 1000.0)
+        return await super()._create_connection(req, traces, timeout)
+
+
+class BenchmarkConnectionPool(RestConnectionPool):
+    def get_connector(self) -> aiohttp.TCPConnector:
+        if self.connector is None or self.connector.closed:
+            self.connector = HandshakeDelayConnector(**self._get_connector_kwargs())
+
+        return self.connector
+
+
+class BenchmarkClient(CryptoXLibClient):
+    def _get_rest_api_uri(self) -> str:
+        return f"http://{HOST}:{PORT}/"
+
+    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> None:
+        pass
+
+    def _preprocess_rest_response(self, status_code: int, headers, body) -> None:
+        pass
+
+    def _get_websocket_mgr(self, subscriptions, startup_delay_ms = 0, ssl_context = None):
+        pass
+
+
+async def handle(request):
+    await asyncio.sleep(SERVER_LATENCY_MS / 1000.0)
+    return web.Response(body = b'{"lastUpdateId":1,"bids":[],"asks":[]}', content_type = 'application/json')
+
+
+async def timed_get(client: CryptoXLibClient) -> float:
+    start = time.perf_counter()
+    await client._create_get("api/v3/depth", params = {"symbol": "BTCUSDT"})
+
+    return (time.perf_counter() - start) * 1000
+
+
+async def measure(pool: RestConnectionPool, prewarm_count: int) -> List[List[float]]:
+    client = BenchmarkClient()
+    client.rest_connection_pool = pool
+    if prewarm_count > 0:
+        await client.prewarm_rest_connections(prewarm_count)
+
+    bursts = []
+    for i in range(BURST_COUNT):
+        if i > 0:
+            await asyncio.sleep(IDLE_SEC)
+        bursts.append(await asyncio.gather(*[timed_get(client) for _ in range(BURST_SIZE)]))
+    await client.close()
+
+    return bursts
+
+
+def get_percentiles(latencies: List[float]) -> (float, float):
+    percentiles = statistics.quantiles(latencies, n = 100)
+    return percentiles[49], percentiles[98]
+
+
+def run_server():
+    # the server runs in its own process so that it does not compete with the client for the event loop
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handle)
+    web.run_app(app, host = HOST, port = PORT, access_log = None, print = None)
+
+
+async def wait_for_server():
+    while True:
+        try:
+            await asyncio.open_connection(HOST, PORT)
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+
+
+async def run():
+    await wait_for_server()
+
+    configurations = [
+        ("limit 100 (default)", BenchmarkConnectionPool(limit = 100), 0),
+        (f"limit {BURST_SIZE}", BenchmarkConnectionPool(limit = BURST_SIZE), 0),
+        (f"limit {BURST_SIZE}, prewarmed", BenchmarkConnectionPool(limit = BURST_SIZE), BURST_SIZE),
+        (f"limit {BURST_SIZE}, keepalive 1 s", BenchmarkConnectionPool(limit = BURST_SIZE, keepalive_timeout = 1), 0),
+    ]
+
+    print(f"{BURST_COUNT} bursts of {BURST_SIZE} concurrent GETs, {IDLE_SEC} s apart, server latency "
+          f"{SERVER_LATENCY_MS} ms, handshake latency {HANDSHAKE_LATENCY_MS} ms")
+    print(f"{'pool':<32}{'first burst p50/p99 [ms]':>26}{'next bursts p50/p99 [ms]':>26}")
+    for name, pool, prewarm_count in configurations:
+        bursts = await measure(pool, prewarm_count)
+        first_p50, first_p99 = get_percentiles(bursts[0])
+        next_p50, next_p99 = get_percentiles([latency for burst in bursts[1:] for latency in burst])
+        print(f"{name:<32}{first_p50:>12.1f} / {first_p99:>9.1f}{next_p50:>12.1f} / {next_p99:>9.1f}")
+
+
+if __name__ == "__main__":
+    server = multiprocessing.Process(target = run_server, daemon = True)
+    server.start()
+    try:
+        async_run(run())
+    finally:
+        server.terminate()
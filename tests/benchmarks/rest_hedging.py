@@ -0,0 +1,79 @@
+# Measures tail latency of REST calls served by a server with occasional slow responses, with and without hedged
+# requests. Run from the repository root: python tests/benchmarks/rest_hedging.py
+import asyncio
+import random
+import time
+from aiohttp import web
+
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.RestMiddleware import HedgingMiddleware
+from cryptoxlib.version_conversions import async_run
+
+HOST = "127.0.0.1"
+PORT = 8767
+SERVER_LATENCY_MS = 5
+SLOW_SERVER_LATENCY_MS = 200
+SLOW_RESPONSE_RATIO = 0.03
+CALL_COUNT = 1000
+
+
+class BenchmarkClient(CryptoXLibClient):
+    def _get_rest_api_uri(self) -> str:
+        return f"http://{HOST}:{PORT}/"
+
+    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> None:
+        pass
+
+    def _preprocess_rest_response(self, status_code: int, headers, body) -> None:
+        pass
+
+    def _get_websocket_mgr(self, subscriptions, startup_delay_ms = 0, ssl_context = None):
+        pass
+
+
+async def handle(request):
+    if random.random() < SLOW_RESPONSE_RATIO:
+        await asyncio.sleep(SLOW_SERVER_LATENCY_MS / 1000.0)
+    else:
+        await asyncio.sleep(SERVER_LATENCY_MS / 1000.0)
+
+    return web.Response(body = b'[]', content_type = 'application/json')
+
+
+async def measure(hedging_middleware: HedgingMiddleware = None) -> list:
+    client = BenchmarkClient()
+    if hedging_middleware is not None:
+        client.add_rest_middleware(hedging_middleware)
+
+    latencies_ms = []
+    for _ in range(CALL_COUNT):
+        start = time.perf_counter()
+        await client._create_get("depth")
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+    await client.close()
+
+    return sorted(latencies_ms)
+
+
+async def run():
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handle)
+    runner = web.AppRunner(app, access_log = None)
+    await runner.setup()
+    await web.TCPSite(runner, HOST, PORT).start()
+
+    print(f"{CALL_COUNT} sequential calls, {SLOW_RESPONSE_RATIO * 100:.0f}% of responses delayed by {SLOW_SERVER_LATENCY_MS} ms")
+    print(f"{'':<12}{'p50 [ms]':>10}{'p99 [ms]':>10}{'max [ms]':>10}{'hedged':>8}")
+    try:
+        hedging_middleware = HedgingMiddleware()
+        for name, middleware in [("plain", None), ("hedged", hedging_middleware)]:
+            latencies_ms = await measure(middleware)
+            hedged_count = middleware.hedged_count if middleware is not None else 0
+            print(f"{name:<12}{latencies_ms[len(latencies_ms) // 2]:>10.1f}{latencies_ms[int(len(latencies_ms) * 0.99)]:>10.1f}"
+                  f"{latencies_ms[-1]:>10.1f}{hedged_count:>8}")
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    async_run(run())
@@ -0,0 +1,84 @@
+# Compares CPU time and event loop timers spent on periodic processing of many websocket managers when every manager
+# runs its own sleeping task and when all of them share one scheduler. Run from the repository root:
+# python tests/benchmarks/scheduler.py
+import asyncio
+import time
+
+from cryptoxlib.Scheduler import Scheduler
+from cryptoxlib.version_conversions import async_run, async_create_task
+
+JOB_COUNT = 1000
+PERIOD_MS = 50
+DURATION_SEC = 3
+
+
+class Counter(object):
+    def __init__(self):
+        self.count = 0
+
+    async def process_periodic(self) -> None:
+        self.count += 1
+
+
+async def sleeping_tasks(counter: Counter) -> None:
+    async def periodic_loop():
+        while True:
+            await counter.process_periodic()
+            await asyncio.sleep(PERIOD_MS / 1000.0)
+
+    tasks = [async_create_task(periodic_loop()) for _ in range(JOB_COUNT)]
+    await asyncio.sleep(DURATION_SEC)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions = True)
+
+
+async def shared_scheduler(counter: Counter) -> None:
+    scheduler = Scheduler()
+    jobs = [scheduler.schedule_periodic(counter.process_periodic, PERIOD_MS) for _ in range(JOB_COUNT)]
+    await asyncio.sleep(DURATION_SEC)
+    for job in jobs:
+        job.cancel()
+
+
+class TimerCounter(object):
+    # counts timers armed in the event loop and the max number of timers pending at once
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.call_at = loop.call_at
+        self.armed_count = 0
+        self.max_pending_count = 0
+
+    def __enter__(self):
+        def call_at(*args, **kwargs):
+            self.armed_count += 1
+            self.max_pending_count = max(self.max_pending_count, len(self.loop._scheduled) + 1)
+            return self.call_at(*args, **kwargs)
+
+        self.loop.call_at = call_at
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        del self.loop.call_at
+
+
+async def measure(f) -> tuple:
+    counter = Counter()
+    with TimerCounter(asyncio.get_event_loop()) as timer_counter:
+        start = time.process_time()
+        await f(counter)
+        cpu_us = (time.process_time() - start) / counter.count * 10**6
+
+    return counter.count, cpu_us, timer_counter.armed_count, timer_counter.max_pending_count
+
+
+async def run():
+    print(f"{JOB_COUNT} jobs with period {PERIOD_MS} ms")
+    print(f"{'mode':<20}{'executions':>12}{'CPU [us/execution]':>22}{'timers armed':>16}{'max pending timers':>22}")
+    for name, f in [("sleeping tasks", sleeping_tasks), ("shared scheduler", shared_scheduler)]:
+        count, cpu_us, armed_count, max_pending_count = await measure(f)
+        print(f"{name:<20}{count:>12}{cpu_us:>22.1f}{armed_count:>16}{max_pending_count:>22}")
+
+
+if __name__ == "__main__":
+    async_run(run())
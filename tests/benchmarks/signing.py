@@ -0,0 +1,87 @@
+# Measures throughput of request signing of all exchanges signing with HMAC, compared to keying a new HMAC for every
+# request. Run from the repository root: python tests/benchmarks/signing.py
+import hashlib
+import hmac
+import timeit
+
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.clients.aax.AAXClient import AAXClient
+from cryptoxlib.clients.bibox.BiboxClient import BiboxClient
+from cryptoxlib.clients.bibox_europe.BiboxEuropeClient import BiboxEuropeClient
+from cryptoxlib.clients.binance.BinanceClient import BinanceClient
+from cryptoxlib.clients.bitforex.BitforexClient import BitforexClient
+from cryptoxlib.clients.bitvavo.BitvavoClient import BitvavoClient
+from cryptoxlib.clients.btse.BtseClient import BtseClient
+from cryptoxlib.clients.coinmate.CoinmateClient import CoinmateClient
+from cryptoxlib.clients.eterbase.EterbaseClient import EterbaseClient
+
+SIGNATURE_COUNT = 50000
+
+API_KEY = "vmPUZE6mv9SD5VNHk4HlWFsOr6aKE2zvsw0MuIgwCIPy6utIco14y7Ju91duEh8A"
+SEC_KEY = "NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j"
+
+ORDER_PARAMS = {
+    "symbol": "BTCUSDT",
+    "side": "BUY",
+    "type": "LIMIT",
+    "timeInForce": "GTC",
+    "quantity": "0.001",
+    "price": "40000.00",
+    "recvWindow": 5000,
+    "timestamp": 1600000000000
+}
+
+ORDER_DATA = {
+    "market": "BTC-EUR",
+    "side": "buy",
+    "orderType": "limit",
+    "amount": "0.001",
+    "price": "40000.00"
+}
+
+BIBOX_DATA = {
+    "cmds": '[{"cmd":"orderpending/trade","body":{"pair":"BTC_USDT","account_type":0,"order_type":2,"order_side":1,'
+            '"price":"40000.00","amount":"0.001"}}]'
+}
+
+# client, data, params, digest used by the client
+SIGNERS = [
+    (BinanceClient(api_key = API_KEY, sec_key = SEC_KEY), None, ORDER_PARAMS, hashlib.sha256),
+    (BitforexClient(api_key = API_KEY, sec_key = SEC_KEY), None, ORDER_PARAMS, hashlib.sha256),
+    (CoinmateClient(user_id = "12345", api_key = API_KEY, sec_key = SEC_KEY), None, ORDER_PARAMS, hashlib.sha256),
+    (BitvavoClient(api_key = API_KEY, sec_key = SEC_KEY), ORDER_DATA, None, hashlib.sha256),
+    (BtseClient(api_key = API_KEY, sec_key = SEC_KEY), ORDER_DATA, None, hashlib.sha384),
+    (EterbaseClient(account_id = "12345", api_key = API_KEY, sec_key = SEC_KEY), ORDER_DATA, None, hashlib.sha256),
+    (AAXClient(api_key = API_KEY, sec_key = SEC_KEY), ORDER_DATA, None, hashlib.sha256),
+    (BiboxClient(api_key = API_KEY, sec_key = SEC_KEY), BIBOX_DATA, None, hashlib.md5),
+    (BiboxEuropeClient(api_key = API_KEY, sec_key = SEC_KEY), BIBOX_DATA, None, hashlib.md5),
+]
+
+
+def sign(client: CryptoXLibClient, data: dict, params: dict) -> None:
+    # signing modifies the payload, hence every request signs its own copy
+    client._sign_payload(RestCallType.POST, "order",
+                         dict(data) if data is not None else None,
+                         dict(params) if params is not None else {},
+                         {})
+
+
+def sign_with_new_hmac(message: bytes, digestmod) -> str:
+    return hmac.new(SEC_KEY.encode('utf-8'), message, digestmod).hexdigest()
+
+
+def run():
+    print(f"{SIGNATURE_COUNT} signatures of an order request")
+    print(f"{'exchange':<20}{'sign [us]':>12}{'signatures/s':>16}{'hmac only [us]':>18}{'new hmac [us]':>16}")
+    message = b"&".join(f"{key}={value}".encode('utf-8') for key, value in ORDER_PARAMS.items())
+    for client, data, params, digestmod in SIGNERS:
+        sign_us = timeit.timeit(lambda: sign(client, data, params), number = SIGNATURE_COUNT) * 10**6 / SIGNATURE_COUNT
+        hmac_us = timeit.timeit(lambda: client.hmac_signer.hexdigest(message),
+                                number = SIGNATURE_COUNT) * 10**6 / SIGNATURE_COUNT
+        new_hmac_us = timeit.timeit(lambda: sign_with_new_hmac(message, digestmod),
+                                    number = SIGNATURE_COUNT) * 10**6 / SIGNATURE_COUNT
+        print(f"{type(client).__name__:<20}{sign_us:>12.2f}{1 / sign_us * 10**6:>16.0f}{hmac_us:>18.2f}{new_hmac_us:>16.2f}")
+
+
+if __name__ == "__main__":
+    run()
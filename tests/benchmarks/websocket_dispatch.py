@@ -0,0 +1,99 @@
+# Measures the cost of routing a single websocket message to its subscription for a growing number of subscriptions.
+# Run from the repository root: python tests/benchmarks/websocket_dispatch.py
+import time
+from typing import Any, List
+
+from cryptoxlib.WebsocketMgr import WebsocketMgr, Subscription, WebsocketMessage, Websocket
+from cryptoxlib.clients.bitforex.BitforexWebsocket import BitforexSubscription, OrderBookSubscription
+from cryptoxlib.Pair import Pair
+from cryptoxlib.version_conversions import async_run
+
+MESSAGE_COUNT = 100000
+SUBSCRIPTION_COUNTS = [1, 10, 100, 1000]
+
+
+class BenchmarkSubscription(Subscription):
+    def __init__(self, channel: str):
+        super().__init__()
+
+        self.channel = channel
+
+    def construct_subscription_id(self) -> Any:
+        return self.channel
+
+    def get_subscription_message(self, **kwargs) -> dict:
+        return {}
+
+
+class BenchmarkWebsocketMgr(WebsocketMgr):
+    def __init__(self, subscriptions: List[Subscription]):
+        super().__init__(websocket_uri = "", subscriptions = subscriptions)
+
+        self._rebuild_subscription_index()
+
+    async def _process_message(self, websocket: Websocket, message: str) -> None:
+        pass
+
+
+async def linear_publish_message(websocket_mgr: WebsocketMgr, message: WebsocketMessage) -> None:
+    # routing as implemented before the subscription index was introduced
+    for subscription in websocket_mgr.subscriptions:
+        if subscription.get_subscription_id() == message.subscription_id:
+            await subscription.process_message(message)
+            return
+
+
+async def measure(publish, websocket_mgr: WebsocketMgr, messages: List[WebsocketMessage]) -> float:
+    start = time.perf_counter()
+    for message in messages:
+        await publish(websocket_mgr, message)
+
+    return (time.perf_counter() - start) / len(messages) * 10**9
+
+
+async def run_string_ids():
+    print("String subscription ids (e.g. binance streams)")
+    print(f"{'subscriptions':>14} {'indexed [ns/msg]':>18} {'linear [ns/msg]':>18}")
+    for subscription_count in SUBSCRIPTION_COUNTS:
+        subscriptions = [BenchmarkSubscription(f"pair{i}usdt@bookTicker") for i in range(subscription_count)]
+        websocket_mgr = BenchmarkWebsocketMgr(subscriptions)
+
+        # messages are spread uniformly over all subscriptions
+        messages = [WebsocketMessage(subscription_id = f"pair{i % subscription_count}usdt@bookTicker", message = {})
+                    for i in range(MESSAGE_COUNT)]
+
+        indexed = await measure(WebsocketMgr.publish_message, websocket_mgr, messages)
+        linear = await measure(linear_publish_message, websocket_mgr, messages)
+
+        print(f"{subscription_count:>14} {indexed:>18.0f} {linear:>18.0f}")
+
+
+async def run_dict_ids():
+    print("Dictionary subscription ids (bitforex)")
+    print(f"{'subscriptions':>14} {'indexed [ns/msg]':>18} {'linear [ns/msg]':>18}")
+    for subscription_count in SUBSCRIPTION_COUNTS:
+        subscriptions = [OrderBookSubscription(Pair(f"PAIR{i}", "USDT"), depth = "0")
+                         for i in range(subscription_count)]
+        websocket_mgr = BenchmarkWebsocketMgr(subscriptions)
+
+        messages = []
+        for i in range(MESSAGE_COUNT):
+            params = subscriptions[i % subscription_count].get_params()
+            messages.append(WebsocketMessage(
+                subscription_id = BitforexSubscription.make_subscription_id(OrderBookSubscription.get_channel_name(), params),
+                message = {}))
+
+        indexed = await measure(WebsocketMgr.publish_message, websocket_mgr, messages)
+        linear = await measure(linear_publish_message, websocket_mgr, messages)
+
+        print(f"{subscription_count:>14} {indexed:>18.0f} {linear:>18.0f}")
+
+
+async def run():
+    await run_string_ids()
+    print()
+    await run_dict_ids()
+
+
+if __name__ == "__main__":
+    async_run(run())
@@ -5,8 +5,11 @@ import datetime
 
 from cryptoxlib.CryptoXLib import CryptoXLib
 from cryptoxlib.clients.binance import enums
-from cryptoxlib.clients.binance.BinanceWebsocket import CandlestickSubscription, DepthSubscription
+from cryptoxlib.clients.binance.BinanceWebsocket import CandlestickSubscription, DepthSubscription, \
+    ManagedOrderBookSubscription
 from cryptoxlib.Pair import Pair
+from cryptoxlib.WebsocketMgr import QueueOverflowPolicy
+from cryptoxlib.ShardingPolicy import ShardingPolicy
 
 from CryptoXLibTest import CryptoXLibTest, WsMessageCounter
 
@@ -48,6 +51,20 @@ class BinanceRestApi(CryptoXLibTest):
         response = await self.client.get_exchange_info(pairs = [Pair('BTC', 'USDT'), Pair('BNB', 'USDT')])
         self.assertTrue(self.check_positive_response(response))
 
+    async def test_rate_limiter_weight(self):
+        response = await self.client.get_orderbook(Pair('BTC', 'USDT'), limit = enums.DepthLimit.L_1000)
+        self.assertTrue(self.check_positive_response(response))
+        # local usage, the usage reported by the exchange may include other requests from the same IP
+        self.assertEqual(self.client.rate_limiter.limits['REQUEST_WEIGHT'].usage, 50)
+
+    async def test_rate_limit_budget(self):
+        response = await self.client.get_orderbook(Pair('BTC', 'USDT'), limit = enums.DepthLimit.L_1000)
+        self.assertTrue(self.check_positive_response(response))
+
+        reported_usage = int(response['headers']['X-MBX-USED-WEIGHT-1M'])
+        self.assertEqual(self.client.get_rate_limit_budget()['REQUEST_WEIGHT'],
+                         self.client.rate_limiter.limits['REQUEST_WEIGHT'].capacity - max(50, reported_usage))
+
 
 class BinanceWs(CryptoXLibTest):
     @classmethod
@@ -100,6 +117,48 @@ class BinanceWs(CryptoXLibTest):
 
         await self.assertWsMessageCount(message_counter)
 
+    async def test_managed_order_book(self):
+        message_counter = WsMessageCounter()
+        self.client.compose_subscriptions([
+            ManagedOrderBookSubscription(Pair('BTC', 'USDT'), callbacks = [message_counter.generate_callback(3)])
+        ])
+
+        await self.assertWsMessageCount(message_counter)
+
+    async def test_detph_message_queue(self):
+        message_counter = WsMessageCounter()
+        self.client.compose_subscriptions([
+            DepthSubscription(Pair('BTC', 'USDT'), 0, 100, callbacks = [message_counter.generate_callback(10)])
+        ], message_queue_size = 100, queue_overflow_policy = QueueOverflowPolicy.DROP_OLDEST)
+
+        await self.assertWsMessageCount(message_counter)
+
+    async def test_detph_raw_mode(self):
+        message_counter = WsMessageCounter()
+        subscription = DepthSubscription(Pair('BTC', 'USDT'), 0, 100, callbacks = [message_counter.generate_callback(10)])
+        subscription.set_raw_mode()
+        self.client.compose_subscriptions([subscription])
+
+        await self.assertWsMessageCount(message_counter)
+
+    async def test_detph_sharded(self):
+        message_counter = WsMessageCounter()
+        self.client.compose_subscriptions([
+            DepthSubscription(Pair('BTC', 'USDT'), 0, 100, callbacks = [message_counter.generate_callback(5, name = "BTCUSDT")]),
+            DepthSubscription(Pair('ETH', 'USDT'), 0, 100, callbacks = [message_counter.generate_callback(5, name = "ETHUSDT")]),
+            DepthSubscription(Pair('ETH', 'BTC'), 0, 100, callbacks = [message_counter.generate_callback(5, name = "ETHBTC")])
+        ], sharding_policy = ShardingPolicy(max_subscriptions_per_connection = 2))
+
+        await self.assertWsMessageCount(message_counter)
+
+    async def test_detph_redundant(self):
+        message_counter = WsMessageCounter()
+        self.client.compose_subscriptions([
+            DepthSubscription(Pair('BTC', 'USDT'), 0, 100, callbacks = [message_counter.generate_callback(10)])
+        ], redundancy = 2)
+
+        await self.assertWsMessageCount(message_counter)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
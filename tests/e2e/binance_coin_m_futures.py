@@ -9,7 +9,7 @@ from cryptoxlib.clients.binance.BinanceFuturesWebsocket import AggregateTradeSub
     AllMarketTickersSubscription, MiniTickerSubscription, OrderBookTickerSubscription, \
     OrderBookSymbolTickerSubscription, LiquidationOrdersSubscription, BlvtCandlestickSubscription, \
     BlvtSubscription, CompositeIndexSubscription, DepthSubscription, CandlestickSubscription, \
-    ContContractCandlestickSubscription, TickerSubscription
+    ContContractCandlestickSubscription, TickerSubscription, ManagedOrderBookSubscription
 from cryptoxlib.clients.binance.exceptions import BinanceRestException
 from cryptoxlib.Pair import Pair
 
@@ -436,6 +436,14 @@ class BinanceCOINMFuturesMarketWs(CryptoXLibTest):
 
         await self.assertWsMessageCount(message_counter)
 
+    async def test_managed_order_book(self):
+        message_counter = WsMessageCounter()
+        self.client.compose_subscriptions([
+            ManagedOrderBookSubscription(symbol = "BTCUSD_PERP", callbacks = [message_counter.generate_callback(3)])
+        ])
+
+        await self.assertWsMessageCount(message_counter)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
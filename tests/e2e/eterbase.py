@@ -6,7 +6,7 @@ import uuid
 from cryptoxlib.CryptoXLib import CryptoXLib
 from cryptoxlib.clients.eterbase import enums
 from cryptoxlib.clients.eterbase.exceptions import EterbaseRestException
-from cryptoxlib.clients.eterbase.EterbaseWebsocket import OrderbookSubscription
+from cryptoxlib.clients.eterbase.EterbaseWebsocket import OrderbookSubscription, ManagedOrderBookSubscription
 
 from CryptoXLibTest import CryptoXLibTest, WsMessageCounter
 
@@ -101,6 +101,16 @@ class EterbaseWs(CryptoXLibTest):
 
         await self.assertWsMessageCount(message_counter)
 
+    async def test_managed_order_book_subscription(self):
+        ethusdt_id = await self.get_market_id('ETHUSDT')
+
+        message_counter = WsMessageCounter()
+        self.client.compose_subscriptions([
+            ManagedOrderBookSubscription(market_ids = [ethusdt_id], callbacks = [message_counter.generate_callback(2)]),
+        ])
+
+        await self.assertWsMessageCount(message_counter)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,7 +5,7 @@ import logging
 from cryptoxlib.CryptoXLib import CryptoXLib
 from cryptoxlib.clients.hitbtc import enums
 from cryptoxlib.clients.hitbtc.HitbtcWebsocket import OrderbookSubscription, TickerSubscription, TradesSubscription, \
-    AccountSubscription
+    AccountSubscription, ManagedOrderBookSubscription
 from cryptoxlib.Pair import Pair
 from cryptoxlib.clients.hitbtc.exceptions import HitbtcRestException
 
@@ -133,6 +133,15 @@ class HitbtcWs(CryptoXLibTest):
 
         await self.assertWsMessageCount(message_counter)
 
+    #@unittest.skip
+    async def test_managed_order_book_subscription(self):
+        message_counter = WsMessageCounter()
+        self.client.compose_subscriptions([
+            ManagedOrderBookSubscription(Pair('BTC', 'USD'), callbacks = [message_counter.generate_callback(2)]),
+        ])
+
+        await self.assertWsMessageCount(message_counter)
+
     #@unittest.skip
     async def test_ticker_subscription(self):
         message_counter = WsMessageCounter()
@@ -8,7 +8,7 @@ from cryptoxlib.CryptoXLib import CryptoXLib
 from cryptoxlib.Pair import Pair
 from cryptoxlib.clients.onetrading import enums
 from cryptoxlib.clients.onetrading.OneTradingWebsocket import PricesSubscription, AccountSubscription, \
-    OrderbookSubscription, \
+    OrderbookSubscription, ManagedOrderBookSubscription, \
     CandlesticksSubscription, CandlesticksSubscriptionParams, MarketTickerSubscription
 from cryptoxlib.clients.onetrading.exceptions import OneTradingRestException
 
@@ -278,6 +278,14 @@ class OneTradingWs(CryptoXLibTest):
 
         await self.assertWsMessageCount(message_counter)
 
+    async def test_managed_order_book_subscription(self):
+        message_counter = WsMessageCounter()
+        self.client.compose_subscriptions([
+            ManagedOrderBookSubscription([Pair("BTC", "EUR")], "50", [message_counter.generate_callback(2)]),
+        ])
+
+        await self.assertWsMessageCount(message_counter)
+
     @unittest.skip
     async def test_candlesticks_subscription(self):
         message_counter = WsMessageCounter()
@@ -0,0 +1,85 @@
+import asyncio
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from cryptoxlib.CryptoXLibClient import CryptoXLibClient, RestCallType
+from cryptoxlib.RateLimiter import RestCallPriority
+from cryptoxlib.RestMiddleware import RestRequest
+
+
+def response(status_code: int = 200, body: dict = None) -> dict:
+    return {
+        "status_code": status_code,
+        "headers": CIMultiDictProxy(CIMultiDict([("Content-Type", "application/json")])),
+        "response": body if body is not None else {}
+    }
+
+
+class StubHandler(object):
+    # next_handler answering the calls with the scripted outcomes one after another, an outcome is a response,
+    # an exception or a (delay in seconds, outcome) tuple. Without outcomes every call is answered with a new response
+    # carrying the call number.
+    def __init__(self, *outcomes) -> None:
+        self.outcomes = list(outcomes)
+        self.call_count = 0
+        self.cancelled_count = 0
+
+    async def __call__(self, request: RestRequest) -> dict:
+        self.call_count += 1
+        if len(self.outcomes) == 0:
+            return response(200, {"call": self.call_count})
+
+        outcome = self.outcomes[min(self.call_count - 1, len(self.outcomes) - 1)]
+
+        if isinstance(outcome, tuple):
+            delay_sec, outcome = outcome
+            try:
+                await asyncio.sleep(delay_sec)
+            except asyncio.CancelledError:
+                self.cancelled_count += 1
+                raise
+
+        if isinstance(outcome, Exception):
+            raise outcome
+
+        return outcome
+
+
+class StubClient(CryptoXLibClient):
+    # Client without network access. REST requests are answered by the handler (e.g. StubHandler) if given, otherwise
+    # they pass the rate limiter and the sent calls are answered by the test through futures in pending_responses.
+    def __init__(self, handler = None) -> None:
+        super().__init__()
+
+        self.handler = handler
+        self.pending_responses = []
+        # processing steps in the order of execution
+        self.calls = []
+
+    def _get_rest_api_uri(self) -> str:
+        return "https://stub/"
+
+    def _sign_payload(self, rest_call_type: RestCallType, resource: str, data: dict = None, params: dict = None, headers: dict = None) -> None:
+        pass
+
+    def _preprocess_rest_response(self, status_code: int, headers, body) -> None:
+        self.calls.append("preprocess")
+
+    def _get_websocket_mgr(self, subscriptions, startup_delay_ms = 0, ssl_context = None):
+        pass
+
+    def _get_rest_session(self, priority: RestCallPriority = RestCallPriority.NORMAL):
+        return None
+
+    async def _execute_rest_request(self, request: RestRequest) -> dict:
+        if self.handler is None:
+            return await super()._execute_rest_request(request)
+
+        self.calls.append(f"send {request}")
+        return await self.handler(request)
+
+    async def _send_rest_call(self, session, rest_call_type, resource_uri, data, params, headers, raw = False,
+                              serialized_data = None) -> dict:
+        response = asyncio.get_event_loop().create_future()
+        self.pending_responses.append(response)
+
+        return await response
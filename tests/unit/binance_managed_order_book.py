@@ -0,0 +1,185 @@
+import unittest
+import asyncio
+import aiounittest
+
+from cryptoxlib.Pair import Pair
+from cryptoxlib.WebsocketMgr import WebsocketMessage
+from cryptoxlib.clients.binance import BinanceWebsocket, BinanceFuturesWebsocket
+
+
+class SnapshotClient(object):
+    # stand-in for the REST client returning the prepared snapshots one after another, a snapshot is returned only
+    # once the gate is open so that updates can be buffered in the meantime
+    def __init__(self, snapshots: list) -> None:
+        self.snapshots = snapshots
+        self.call_count = 0
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def get_orderbook(self, symbol, limit):
+        await self.gate.wait()
+
+        snapshot = self.snapshots[min(self.call_count, len(self.snapshots) - 1)]
+        self.call_count += 1
+        if isinstance(snapshot, Exception):
+            raise snapshot
+
+        return {'response': snapshot}
+
+
+def snapshot(sequence: int, bids: list, asks: list) -> dict:
+    return {'lastUpdateId': sequence, 'bids': bids, 'asks': asks}
+
+
+def update(first: int, last: int, bids: list = None, asks: list = None, previous: int = None) -> dict:
+    data = {'e': 'depthUpdate', 'U': first, 'u': last, 'b': bids or [], 'a': asks or []}
+    if previous is not None:
+        data['pu'] = previous
+
+    return data
+
+
+class BinanceManagedOrderBookTest(aiounittest.AsyncTestCase):
+    async def init_subscription(self, subscription, snapshots: list):
+        self.views = []
+
+        async def callback(reader):
+            self.views.append(reader.get_view())
+
+        self.subscription = subscription
+        self.subscription.callbacks = [callback]
+        self.subscription.SNAPSHOT_RETRY_DELAY_SEC = 0
+        self.client = SnapshotClient(snapshots)
+        await self.subscription.initialize(binance_client = self.client)
+
+    async def send(self, *updates):
+        for data in updates:
+            await self.subscription.process_message(WebsocketMessage(subscription_id = "btcusdt@depth@100ms",
+                                                                     message = {'data': data}))
+
+    async def wait_for_synchronization(self):
+        if self.subscription.synchronization_task is not None:
+            await self.subscription.synchronization_task
+
+    async def test_spot_buffered_updates(self):
+        await self.init_subscription(BinanceWebsocket.ManagedOrderBookSubscription(Pair('BTC', 'USDT')),
+                                     [snapshot(7, [['100', '1']], [['101', '1']])])
+        self.client.gate.clear()
+
+        await self.send(update(1, 5, bids = [['99', '5']]),
+                        update(6, 9, bids = [['100', '2']]),
+                        update(10, 12, asks = [['101', '0'], ['102', '3']]))
+        self.client.gate.set()
+        await self.wait_for_synchronization()
+
+        order_book = self.subscription.get_order_book()
+        self.assertTrue(self.subscription.synchronized)
+        self.assertEqual(order_book.sequence, 12)
+        # the first update precedes the snapshot and must not be applied
+        self.assertEqual(order_book.get_bids(), [(100.0, 2.0)])
+        self.assertEqual(order_book.get_asks(), [(102.0, 3.0)])
+        self.assertEqual(len(self.views), 1)
+
+        await self.send(update(13, 13, bids = [['100.5', '1']]))
+        self.assertEqual(order_book.get_best_bid(), (100.5, 1.0))
+        self.assertEqual(len(self.views), 2)
+        self.assertEqual(self.client.call_count, 1)
+
+    async def test_spot_gap_resynchronizes(self):
+        await self.init_subscription(BinanceWebsocket.ManagedOrderBookSubscription(Pair('BTC', 'USDT')),
+                                     [snapshot(7, [['100', '1']], []), snapshot(15, [['100', '4']], [])])
+        await self.send(update(8, 9))
+        await self.wait_for_synchronization()
+        self.assertEqual(self.subscription.get_order_book().sequence, 9)
+
+        # update 10 - 13 is missing
+        await self.send(update(14, 16, bids = [['99', '1']]))
+        self.assertFalse(self.subscription.synchronized)
+        await self.wait_for_synchronization()
+
+        order_book = self.subscription.get_order_book()
+        self.assertTrue(self.subscription.synchronized)
+        self.assertEqual(self.subscription.synchronization_count, 2)
+        self.assertEqual(order_book.sequence, 16)
+        self.assertEqual(order_book.get_bids(), [(100.0, 4.0), (99.0, 1.0)])
+
+    async def test_spot_snapshot_older_than_updates(self):
+        await self.init_subscription(BinanceWebsocket.ManagedOrderBookSubscription(Pair('BTC', 'USDT')),
+                                     [snapshot(10, [], []), snapshot(22, [['100', '1']], [])])
+        await self.send(update(20, 25, bids = [['99', '1']]))
+        await self.wait_for_synchronization()
+
+        order_book = self.subscription.get_order_book()
+        self.assertEqual(self.client.call_count, 2)
+        self.assertEqual(order_book.sequence, 25)
+        self.assertEqual(order_book.get_bids(), [(100.0, 1.0), (99.0, 1.0)])
+
+    async def test_snapshot_attempts_capped(self):
+        await self.init_subscription(BinanceWebsocket.ManagedOrderBookSubscription(Pair('BTC', 'USDT')),
+                                     [Exception("snapshot not available")])
+        await self.send(update(8, 9))
+        await self.wait_for_synchronization()
+
+        self.assertFalse(self.subscription.synchronized)
+        self.assertEqual(self.client.call_count, self.subscription.MAX_SNAPSHOT_ATTEMPTS)
+        self.assertEqual(self.subscription.buffered_updates, [])
+        self.assertEqual(self.views, [])
+
+    async def test_book_cleared_when_snapshot_does_not_match(self):
+        await self.init_subscription(BinanceWebsocket.ManagedOrderBookSubscription(Pair('BTC', 'USDT')),
+                                     [snapshot(10, [['100', '1']], [['101', '1']])])
+        await self.send(update(20, 25, bids = [['99', '1']]))
+        await self.wait_for_synchronization()
+
+        # no snapshot matches the buffered update, the book must not keep the unsynchronized snapshot
+        order_book = self.subscription.get_order_book()
+        self.assertFalse(self.subscription.synchronized)
+        self.assertEqual(order_book.get_bids(), [])
+        self.assertEqual(order_book.get_asks(), [])
+        self.assertIsNone(order_book.sequence)
+
+    async def test_close_cancels_synchronization(self):
+        await self.init_subscription(BinanceWebsocket.ManagedOrderBookSubscription(Pair('BTC', 'USDT')),
+                                     [snapshot(7, [['100', '1']], [])])
+        self.client.gate.clear()
+        await self.send(update(8, 9))
+        synchronization_task = self.subscription.synchronization_task
+
+        await BinanceWebsocket.BinanceWebsocket([self.subscription], binance_client = self.client) \
+            .close_subscriptions([self.subscription])
+
+        self.assertTrue(synchronization_task.cancelled())
+        self.assertIsNone(self.subscription.synchronization_task)
+        self.assertFalse(self.subscription.synchronized)
+
+    async def test_futures_previous_update_id(self):
+        await self.init_subscription(BinanceFuturesWebsocket.ManagedOrderBookSubscription(Pair('BTC', 'USDT')),
+                                     [snapshot(100, [['100', '1']], []), snapshot(110, [['100', '3']], [])])
+        self.client.gate.clear()
+
+        await self.send(update(95, 99, bids = [['99', '1']], previous = 94),
+                        update(98, 102, bids = [['100', '2']], previous = 97),
+                        update(103, 105, asks = [['101', '1']], previous = 102))
+        self.client.gate.set()
+        await self.wait_for_synchronization()
+
+        order_book = self.subscription.get_order_book()
+        self.assertEqual(order_book.sequence, 105)
+        self.assertEqual(order_book.get_bids(), [(100.0, 2.0)])
+        self.assertEqual(order_book.get_asks(), [(101.0, 1.0)])
+
+        # futures updates are chained by the previous update id rather than by consecutive ids
+        await self.send(update(107, 108, previous = 105))
+        self.assertEqual(order_book.sequence, 108)
+
+        await self.send(update(110, 112, previous = 109))
+        self.assertFalse(self.subscription.synchronized)
+        await self.wait_for_synchronization()
+
+        self.assertEqual(self.subscription.synchronization_count, 2)
+        self.assertEqual(order_book.sequence, 112)
+        self.assertEqual(order_book.get_bids(), [(100.0, 3.0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import asyncio
+import aiounittest
+
+from cryptoxlib.WebsocketMgr import WebsocketMgr, Websocket, Subscription, WebsocketMessage, CallbackExecutionMode
+
+
+class StubSubscription(Subscription):
+    def construct_subscription_id(self):
+        return "stub"
+
+    def get_subscription_message(self, **kwargs) -> dict:
+        return {}
+
+
+class UnreachableWebsocket(Websocket):
+    async def connect(self):
+        raise OSError("unreachable")
+
+    async def is_open(self):
+        return False
+
+    async def close(self):
+        pass
+
+    async def receive(self):
+        pass
+
+    async def send(self, message: str):
+        pass
+
+
+class StubWebsocketMgr(WebsocketMgr):
+    def __init__(self, subscriptions: list) -> None:
+        super().__init__(websocket_uri = "wss://stub", subscriptions = subscriptions)
+
+    def get_websocket(self) -> Websocket:
+        return UnreachableWebsocket()
+
+    async def _process_message(self, websocket: Websocket, message: str) -> None:
+        pass
+
+
+class FireAndForgetCallbacksTest(aiounittest.AsyncTestCase):
+    def create_subscription(self) -> StubSubscription:
+        self.started_count = 0
+        self.cancelled_count = 0
+
+        async def callback(message):
+            self.started_count += 1
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                self.cancelled_count += 1
+                raise
+
+        subscription = StubSubscription(callbacks = [callback])
+        subscription.set_callback_execution_mode(CallbackExecutionMode.FIRE_AND_FORGET)
+
+        return subscription
+
+    async def test_in_flight_callbacks_cancelled_on_close(self):
+        subscription = self.create_subscription()
+
+        for _ in range(3):
+            await subscription.process_message(WebsocketMessage(subscription_id = "stub", message = {}))
+        await asyncio.sleep(0)
+        self.assertEqual(len(subscription.in_flight_callbacks), 3)
+
+        await subscription.close()
+
+        self.assertEqual(self.cancelled_count, 3)
+        self.assertEqual(len(subscription.in_flight_callbacks), 0)
+        # slots of the cancelled callbacks are released
+        self.assertFalse(subscription.in_flight_semaphore.locked())
+
+    async def test_subscriptions_closed_when_manager_stops(self):
+        subscription = self.create_subscription()
+        await subscription.process_message(WebsocketMessage(subscription_id = "stub", message = {}))
+        await asyncio.sleep(0)
+
+        # connection fails and the manager without auto reconnection stops
+        with self.assertRaises(OSError):
+            await StubWebsocketMgr([subscription]).run()
+
+        self.assertEqual(self.started_count, 1)
+        self.assertEqual(self.cancelled_count, 1)
+        self.assertEqual(len(subscription.in_flight_callbacks), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import unittest
+import random
+from unittest import mock
+
+from cryptoxlib import CompactOrderBook as compact_order_book_module
+from cryptoxlib.CompactOrderBook import CompactOrderBook, to_fixed_point
+from cryptoxlib.OrderBook import OrderBook
+from cryptoxlib.Pair import Pair
+from cryptoxlib.exceptions import CryptoXLibException
+
+UPDATE_COUNT = 5000
+
+
+def generate_level(rng: random.Random, mid_price: int, side: int) -> tuple:
+    # prices with 2 decimals on one side of the mid price, a quarter of the updates removes a level
+    price = f"{(mid_price + side * rng.randint(1, 300)) / 100:.2f}"
+    quantity = "0" if rng.random() < 0.25 else f"{rng.randint(1, 10**5) / 10**5:.5f}"
+
+    return price, quantity
+
+
+class CompactOrderBookTest(unittest.TestCase):
+    def create_books(self, seed: int) -> tuple:
+        rng = random.Random(seed)
+        mid_price = 4000000
+
+        order_book = OrderBook('BTCUSDT')
+        compact_order_book = CompactOrderBook('BTCUSDT', price_decimals = 2, quantity_decimals = 5)
+
+        bids = [generate_level(rng, mid_price, -1) for _ in range(200)]
+        asks = [generate_level(rng, mid_price, 1) for _ in range(200)]
+        order_book.apply_snapshot(bids, asks, 1)
+        compact_order_book.apply_snapshot(bids, asks, 1)
+
+        for _ in range(UPDATE_COUNT):
+            side = rng.choice([-1, 1])
+            level = generate_level(rng, mid_price, side)
+            if side < 0:
+                order_book.update_bids([level])
+                compact_order_book.update_bids([level])
+            else:
+                order_book.update_asks([level])
+                compact_order_book.update_asks([level])
+
+        return order_book, compact_order_book
+
+    def assert_books_equal(self, order_book: OrderBook, compact_order_book: CompactOrderBook):
+        self.assertEqual(order_book.get_best_bid(), compact_order_book.get_best_bid())
+        self.assertEqual(order_book.get_best_ask(), compact_order_book.get_best_ask())
+        self.assertEqual(order_book.get_mid_price(), compact_order_book.get_mid_price())
+        for depth in [None, 1, 10, 1000]:
+            view = order_book.get_view(depth)
+            compact_view = compact_order_book.get_view(depth)
+            self.assertEqual(view.bids, compact_view.bids)
+            self.assertEqual(view.asks, compact_view.asks)
+
+    def assert_queries_match(self, order_book: OrderBook, compact_order_book: CompactOrderBook):
+        bids = order_book.get_view().bids
+        prices = [price for price, _ in bids[:20]] + [1.0, 10**6]
+        self.assertEqual(compact_order_book.bids.get_quantities(prices),
+                         [order_book.bids.get_quantity(price) for price in prices])
+
+        for price, _ in bids[::10]:
+            expected = sum(quantity for level_price, quantity in bids if level_price >= price)
+            self.assertAlmostEqual(compact_order_book.bids.get_depth_at_price(price), expected, places = 5)
+
+        cumulative_quantities = compact_order_book.bids.get_cumulative_quantities(50)
+        expected_total = 0
+        for (_, quantity), cumulative_quantity in zip(bids[:50], cumulative_quantities):
+            expected_total += quantity
+            self.assertAlmostEqual(cumulative_quantity, expected_total, places = 5)
+
+        asks = order_book.get_view().asks
+        quantity = sum(level_quantity for _, level_quantity in asks[:5]) + asks[5][1] / 2
+        notional = sum(price * level_quantity for price, level_quantity in asks[:5]) + asks[5][0] * asks[5][1] / 2
+        self.assertAlmostEqual(compact_order_book.asks.get_vwap(f"{quantity:.5f}"), notional / quantity, places = 4)
+        self.assertIsNone(compact_order_book.asks.get_vwap(sum(level_quantity for _, level_quantity in asks) + 1))
+
+    def test_equivalent_to_order_book(self):
+        for seed in range(5):
+            order_book, compact_order_book = self.create_books(seed)
+            self.assert_books_equal(order_book, compact_order_book)
+
+    @unittest.skipUnless(compact_order_book_module.numpy is not None, "numpy is not installed")
+    def test_queries_with_numpy(self):
+        order_book, compact_order_book = self.create_books(0)
+        self.assert_queries_match(order_book, compact_order_book)
+
+    def test_queries_without_numpy(self):
+        with mock.patch.object(compact_order_book_module, 'numpy', None):
+            order_book, compact_order_book = self.create_books(0)
+            self.assert_queries_match(order_book, compact_order_book)
+
+    def test_snapshot_replaces_levels(self):
+        compact_order_book = CompactOrderBook(price_decimals = 2, quantity_decimals = 5)
+        compact_order_book.apply_snapshot([('100', '1'), ('101', '2')], [('102', '1')], 1)
+        compact_order_book.apply_snapshot([('99', '1'), ('99.5', '0')], [], 2)
+
+        self.assertEqual(compact_order_book.get_view().bids, [(99.0, 1.0)])
+        self.assertEqual(compact_order_book.get_view().asks, [])
+        self.assertIsNone(compact_order_book.get_mid_price())
+        self.assertEqual(compact_order_book.sequence, 2)
+
+    def test_out_of_range(self):
+        compact_order_book = CompactOrderBook(price_decimals = 8, quantity_decimals = 8)
+
+        with self.assertRaises(CryptoXLibException):
+            compact_order_book.update_bids([('1', '123456789012')])
+        with self.assertRaises(CryptoXLibException):
+            compact_order_book.apply_snapshot([('1', '1')], [('1e12', '1')])
+        self.assertEqual(len(compact_order_book.bids), 0)
+
+        # the same quantity fits with fewer decimals
+        compact_order_book = CompactOrderBook(price_decimals = 2, quantity_decimals = 2)
+        compact_order_book.update_bids([('1', '123456789012')])
+        self.assertEqual(compact_order_book.get_best_bid(), (1.0, 123456789012.0))
+
+    def test_factory(self):
+        create_order_book = CompactOrderBook.create_factory({'BTC/USDT': (2, 6), 'ETHBTC': (6, 4)})
+
+        order_book = create_order_book(Pair('BTC', 'USDT'))
+        self.assertEqual((order_book.bids.price_decimals, order_book.bids.quantity_decimals), (2, 6))
+        order_book = create_order_book('ETHBTC')
+        self.assertEqual((order_book.asks.price_decimals, order_book.asks.quantity_decimals), (6, 4))
+        self.assertEqual(order_book.symbol, 'ETHBTC')
+
+        with self.assertRaises(CryptoXLibException):
+            create_order_book('XRPBTC')
+
+    def test_to_fixed_point(self):
+        self.assertEqual(to_fixed_point("40000.12", 2), 4000012)
+        self.assertEqual(to_fixed_point("0.1", 8), 10000000)
+        self.assertEqual(to_fixed_point("1e-5", 5), 1)
+        self.assertEqual(to_fixed_point("0.123456", 2), 12)
+        self.assertEqual(to_fixed_point(0.29, 2), 29)
+        self.assertEqual(to_fixed_point(3, 2), 300)
+
+
+if __name__ == '__main__':
+    unittest.main()
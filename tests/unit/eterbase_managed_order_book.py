@@ -0,0 +1,69 @@
+import unittest
+import json
+import aiounittest
+
+from cryptoxlib.clients.eterbase.EterbaseWebsocket import EterbaseWebsocket, ManagedOrderBookSubscription
+
+
+def order_book_frame(message_type: str, market_id: int, bids: list, asks: list) -> str:
+    return json.dumps({
+        'type': message_type,
+        'marketId': market_id,
+        'bids': [{'price': price, 'qty': quantity} for price, quantity in bids],
+        'asks': [{'price': price, 'qty': quantity} for price, quantity in asks]
+    })
+
+
+class EterbaseManagedOrderBookTest(aiounittest.AsyncTestCase):
+    async def init_subscription(self):
+        self.updates = []
+
+        async def callback(order_book):
+            self.updates.append((order_book.symbol, order_book.get_view()))
+
+        self.subscription = ManagedOrderBookSubscription([51, 52], callbacks = [callback])
+        self.websocket_mgr = EterbaseWebsocket([self.subscription], eterbase_client = None)
+        self.websocket_mgr._rebuild_subscription_index()
+        await self.websocket_mgr.initialize_subscriptions([self.subscription])
+
+    async def send(self, frame: str):
+        await self.websocket_mgr._process_message(None, frame)
+
+    async def test_books_per_market(self):
+        await self.init_subscription()
+
+        await self.send(order_book_frame('ob_snapshot', 51, [(100, 1), (99, 2)], [(101, 1)]))
+        await self.send(order_book_frame('ob_snapshot', 52, [(10, 5)], [(11, 5)]))
+        await self.send(order_book_frame('ob_update', 51, [(100, 0), (98, 3)], [(101, 2)]))
+
+        order_book = self.subscription.get_order_book(51)
+        self.assertEqual(order_book.get_bids(), [(99.0, 2.0), (98.0, 3.0)])
+        self.assertEqual(order_book.get_asks(), [(101.0, 2.0)])
+        self.assertEqual(self.subscription.get_order_book(52).get_bids(), [(10.0, 5.0)])
+        self.assertEqual([symbol for symbol, _ in self.updates], ['51', '52', '51'])
+
+    async def test_updates_before_snapshot_dropped(self):
+        await self.init_subscription()
+
+        await self.send(order_book_frame('ob_update', 51, [(100, 1)], []))
+        self.assertIsNone(self.subscription.get_order_book(51))
+        self.assertEqual(self.updates, [])
+
+    async def test_books_reset_on_reconnection(self):
+        await self.init_subscription()
+        await self.send(order_book_frame('ob_snapshot', 51, [(100, 1)], [(101, 1)]))
+        order_book = self.subscription.get_order_book(51)
+
+        await self.websocket_mgr.initialize_subscriptions([self.subscription])
+        self.assertEqual(order_book.get_bids(), [])
+
+        # updates are dropped until the book is synchronized by a new snapshot
+        await self.send(order_book_frame('ob_update', 51, [(99, 1)], []))
+        self.assertEqual(order_book.get_bids(), [])
+        await self.send(order_book_frame('ob_snapshot', 51, [(98, 1)], [(102, 1)]))
+        self.assertEqual(order_book.get_bids(), [(98.0, 1.0)])
+        self.assertEqual(len(self.updates), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+import json
+import aiounittest
+
+from cryptoxlib.Pair import Pair
+from cryptoxlib.MessageDeduplicator import MessageDeduplicator
+from cryptoxlib.WebsocketMgr import WebsocketMessage
+from cryptoxlib.clients.hitbtc.HitbtcWebsocket import HitbtcWebsocket, ManagedOrderBookSubscription
+from cryptoxlib.clients.hitbtc.exceptions import HitbtcException
+
+
+class RecordingWebsocket(object):
+    def __init__(self) -> None:
+        self.sent_messages = []
+
+    async def send(self, message: str) -> None:
+        self.sent_messages.append(json.loads(message))
+
+
+def orderbook_message(method: str, sequence: int, bids: list = None, asks: list = None) -> dict:
+    return {
+        'jsonrpc': '2.0',
+        'method': method,
+        'params': {
+            'symbol': 'ETHBTC',
+            'sequence': sequence,
+            'bid': [{'price': price, 'size': size} for price, size in bids or []],
+            'ask': [{'price': price, 'size': size} for price, size in asks or []]
+        }
+    }
+
+
+class HitbtcManagedOrderBookTest(aiounittest.AsyncTestCase):
+    async def init_subscription(self):
+        self.views = []
+
+        async def callback(reader):
+            self.views.append(reader.get_view())
+
+        self.subscription = ManagedOrderBookSubscription(Pair('ETH', 'BTC'), callbacks = [callback])
+        self.websocket_mgr = HitbtcWebsocket([self.subscription])
+        self.websocket_mgr.websocket = RecordingWebsocket()
+        await self.websocket_mgr.initialize_subscriptions([self.subscription])
+
+    async def send(self, message: dict):
+        await self.subscription.process_message(WebsocketMessage(subscription_id = "orderbookETHBTC",
+                                                                 message = message))
+
+    async def test_updates_follow_snapshot(self):
+        await self.init_subscription()
+
+        await self.send(orderbook_message('updateOrderbook', 9, bids = [('0.05', '1')]))
+        await self.send(orderbook_message('snapshotOrderbook', 10, bids = [('0.05', '2')], asks = [('0.06', '1')]))
+        await self.send(orderbook_message('updateOrderbook', 10, bids = [('0.05', '3')]))
+        await self.send(orderbook_message('updateOrderbook', 11, asks = [('0.055', '1')]))
+        await self.send(orderbook_message('updateOrderbook', 12, bids = [('0.05', '4')]))
+
+        order_book = self.subscription.get_order_book()
+        self.assertEqual(order_book.sequence, 12)
+        self.assertEqual(order_book.get_bids(), [(0.05, 4.0)])
+        self.assertEqual(order_book.get_asks(), [(0.055, 1.0), (0.06, 1.0)])
+        # the snapshot and the move of the best ask, quantity changes only are not reported
+        self.assertEqual(len(self.views), 2)
+        self.assertEqual(self.websocket_mgr.websocket.sent_messages, [])
+
+    async def test_gap_resubscribes(self):
+        await self.init_subscription()
+
+        await self.send(orderbook_message('snapshotOrderbook', 10, bids = [('0.05', '2')], asks = [('0.06', '1')]))
+        await self.send(orderbook_message('updateOrderbook', 12, bids = [('0.051', '1')]))
+
+        self.assertFalse(self.subscription.synchronized)
+        self.assertEqual(self.subscription.resubscription_count, 1)
+        self.assertEqual([message['method'] for message in self.websocket_mgr.websocket.sent_messages],
+                         ['unsubscribeOrderbook', 'subscribeOrderbook'])
+        self.assertEqual(self.websocket_mgr.websocket.sent_messages[1]['params']['symbol'], 'ETHBTC')
+
+        # updates are dropped until the new snapshot arrives
+        await self.send(orderbook_message('updateOrderbook', 13, bids = [('0.052', '1')]))
+        order_book = self.subscription.get_order_book()
+        self.assertEqual(order_book.sequence, 10)
+        self.assertEqual(order_book.get_best_bid(), (0.05, 2.0))
+
+        await self.send(orderbook_message('snapshotOrderbook', 20, bids = [('0.053', '1')]))
+        await self.send(orderbook_message('updateOrderbook', 21, bids = [('0.054', '1')]))
+
+        self.assertTrue(self.subscription.synchronized)
+        self.assertEqual(order_book.sequence, 21)
+        self.assertEqual(order_book.get_bids(), [(0.054, 1.0), (0.053, 1.0)])
+        self.assertEqual(self.subscription.resubscription_count, 1)
+
+    async def test_other_messages_passed_through(self):
+        await self.init_subscription()
+
+        received = []
+
+        async def callback(message):
+            received.append(message)
+
+        self.subscription.callbacks = [callback]
+        error = {'jsonrpc': '2.0', 'error': {'code': 2001, 'message': 'Symbol not found'}, 'id': 1}
+        await self.send(error)
+
+        self.assertEqual(received, [error])
+
+    async def test_redundancy_rejected(self):
+        await self.init_subscription()
+        MessageDeduplicator().add_replica(self.websocket_mgr)
+
+        with self.assertRaises(HitbtcException):
+            await self.websocket_mgr.validate_subscriptions([self.subscription])
+
+    def test_snapshot_and_update_keys_differ(self):
+        websocket_mgr = HitbtcWebsocket([])
+
+        snapshot_key = websocket_mgr.get_message_sequence_key(
+            WebsocketMessage("orderbookETHBTC", orderbook_message('snapshotOrderbook', 10)))
+        update_key = websocket_mgr.get_message_sequence_key(
+            WebsocketMessage("orderbookETHBTC", orderbook_message('updateOrderbook', 10)))
+
+        self.assertNotEqual(snapshot_key, update_key)
+
+
+if __name__ == '__main__':
+    unittest.main()
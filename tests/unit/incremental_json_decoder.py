@@ -0,0 +1,94 @@
+import unittest
+import asyncio
+import json
+import aiounittest
+from unittest import mock
+
+from cryptoxlib.IncrementalJsonDecoder import IncrementalJsonDecoder
+
+DOCUMENTS = [
+    '{"symbols": [{"symbol": "BTCUSDT", "filters": [{"minPrice": "0.01"}]}, {"symbol": "ETHBTC"}], "serverTime": 1}',
+    ' [ 1 , -2.5e-3 , 12345678901234567890 , true , false , null , "" , [ ] , { } ] ',
+    '{"escapes": "quote \\" backslash \\\\ slash \\/ \\b\\f\\n\\r\\t unicode \\u00e9 \\ud83d\\ude00"}',
+    '{"multibyte": ["été", "€ 100", "\U0001f600\U0001f680", "中文"], "ü": 1.5}',
+    '{"a": {"b": {"c": {"d": [[[1, 2], [3]], {"e": "f"}]}}}, "nan": NaN, "inf": [Infinity, -Infinity]}',
+    '"top-level string"',
+    '-0.0',
+]
+
+INVALID_DOCUMENTS = [
+    '',
+    '   ',
+    '{"a": [1, 2',
+    '{"a": [1, 2]',
+    '{"a"',
+    '{"a": ',
+    '{"a": "unterminated',
+    '{"a": 1,}',
+    '[1, 2,]',
+    '[1 2]',
+    '{"a" 1}',
+    '{a: 1}',
+    '{"a": 1} extra',
+    '{"a": 1}{"b": 2}',
+    '[1, tru]',
+    '{"a": "\\x"}',
+    '{"a": 01}',
+]
+
+
+class IncrementalJsonDecoderTest(aiounittest.AsyncTestCase):
+    async def assert_decoded_as_json_loads(self, data, **kwargs):
+        decoded = await IncrementalJsonDecoder(**kwargs).decode(data)
+        expected = json.loads(data if isinstance(data, str) else bytes(data))
+        # NaN is not equal to itself
+        self.assertEqual(json.dumps(decoded), json.dumps(expected), data)
+
+    async def test_equivalent_to_json_loads(self):
+        for document in DOCUMENTS:
+            for max_depth in range(5):
+                await self.assert_decoded_as_json_loads(document, max_depth = max_depth, time_slice_ms = 0)
+                await self.assert_decoded_as_json_loads(document.encode('utf-8'), max_depth = max_depth)
+
+    async def test_chunked_bytes(self):
+        # small chunks split the input inside multibyte UTF-8 sequences, escapes and numbers at every offset
+        for chunk_size in range(1, 9):
+            with mock.patch.object(IncrementalJsonDecoder, 'TEXT_CHUNK_SIZE', chunk_size):
+                for document in DOCUMENTS:
+                    data = document.encode('utf-8')
+                    await self.assert_decoded_as_json_loads(data, time_slice_ms = 0)
+                    await self.assert_decoded_as_json_loads(bytearray(data))
+                    await self.assert_decoded_as_json_loads(memoryview(data))
+
+    async def test_invalid_documents(self):
+        decoder = IncrementalJsonDecoder(time_slice_ms = 0)
+
+        for document in INVALID_DOCUMENTS:
+            with self.assertRaises(json.JSONDecodeError, msg = document):
+                json.loads(document)
+            with self.assertRaises(json.JSONDecodeError, msg = document):
+                await decoder.decode(document)
+            with self.assertRaises(json.JSONDecodeError, msg = document):
+                await decoder.decode(document.encode('utf-8'))
+
+    async def test_invalid_utf8(self):
+        data = '{"a": "é€"}'.encode('utf-8')
+
+        # truncated and invalid sequences, split into chunks or not
+        for invalid_data in [data[:-3], data[:8] + data[9:], b'{"a": "\xff"}']:
+            for chunk_size in [1, 3, 1024]:
+                with mock.patch.object(IncrementalJsonDecoder, 'TEXT_CHUNK_SIZE', chunk_size):
+                    with self.assertRaises(ValueError, msg = invalid_data):
+                        await IncrementalJsonDecoder().decode(invalid_data)
+
+    async def test_decode_yields_to_event_loop(self):
+        document = json.dumps({"symbols": [{"symbol": f"SYMBOL{i}", "filters": [i] * 10} for i in range(1000)]})
+        decoder = IncrementalJsonDecoder(time_slice_ms = 0)
+
+        with mock.patch('asyncio.sleep', wraps = asyncio.sleep) as sleep:
+            self.assertEqual(await decoder.decode(document), json.loads(document))
+        self.assertGreater(sleep.call_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
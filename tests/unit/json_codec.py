@@ -0,0 +1,45 @@
+import unittest
+import json
+
+from cryptoxlib import JsonCodec as json_codec_module
+from cryptoxlib.JsonCodec import StdlibJsonCodec, OrjsonCodec
+
+
+@unittest.skipUnless(json_codec_module.orjson is not None, "orjson is not installed")
+class OrjsonCodecTest(unittest.TestCase):
+    def assert_decoded_as_stdlib(self, codec: OrjsonCodec, document: str):
+        for data in [document, document.encode('utf-8'), bytearray(document.encode('utf-8')),
+                     memoryview(document.encode('utf-8'))]:
+            # NaN is not equal to itself
+            self.assertEqual(repr(codec.loads(data)), repr(StdlibJsonCodec().loads(data)), document)
+
+    def test_non_standard_numbers(self):
+        codec = OrjsonCodec()
+
+        for document in ['{"price": NaN}', '[Infinity, -Infinity]', '{"a": {"b": [1, NaN]}}', '1e400']:
+            self.assert_decoded_as_stdlib(codec, document)
+
+    def test_invalid_documents(self):
+        codec = OrjsonCodec()
+
+        for document in ['', '{"a": 1', '[1, 2,]', '{"a": nan}', '{"a": NaN', b'{"a": "\xff"}']:
+            with self.assertRaises(ValueError, msg = document):
+                codec.loads(document)
+
+    def test_big_integers(self):
+        document = '{"id": 123456789012345678901234567890, "ids": [18446744073709551616, -9223372036854775809]}'
+
+        # precision is lost by default
+        self.assertIsInstance(OrjsonCodec().loads(document)['id'], float)
+
+        codec = OrjsonCodec(exact_big_integers = True)
+        self.assert_decoded_as_stdlib(codec, document)
+        self.assertEqual(codec.loads(document)['id'], 123456789012345678901234567890)
+
+        # documents without big integers are decoded by orjson
+        self.assertEqual(codec.loads('{"id": 18446744073709551615, "price": "0.1"}'),
+                         json.loads('{"id": 18446744073709551615, "price": "0.1"}'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import json
+import aiounittest
+
+from cryptoxlib.Pair import Pair
+from cryptoxlib.clients.liquid import enums
+from cryptoxlib.clients.liquid.LiquidWebsocket import LiquidWebsocket, ManagedOrderBookSubscription
+
+
+def ladder_frame(side: str, levels: list) -> str:
+    # ladder data are serialized into a string within the frame
+    return json.dumps({
+        'channel': f"price_ladders_cash_btcusd_{side}",
+        'data': json.dumps(levels),
+        'event': 'updated'
+    })
+
+
+class LiquidManagedOrderBookTest(aiounittest.AsyncTestCase):
+    async def init_subscription(self):
+        self.updates = []
+
+        async def callback(update):
+            self.updates.append((update.bid_changes, update.ask_changes, update.get_view()))
+
+        self.subscription = ManagedOrderBookSubscription(Pair('BTC', 'USD'), callbacks = [callback])
+        self.websocket_mgr = LiquidWebsocket([self.subscription])
+        self.websocket_mgr._rebuild_subscription_index()
+        await self.websocket_mgr.initialize_subscriptions([self.subscription])
+
+    async def send(self, frame: str):
+        await self.websocket_mgr._process_message(None, frame)
+
+    async def test_ladders_merged_into_book(self):
+        await self.init_subscription()
+
+        await self.send(ladder_frame('buy', [["100.0", "1.0"], ["99.0", "2.0"]]))
+        await self.send(ladder_frame('sell', [["101.0", "1.5"]]))
+
+        order_book = self.subscription.get_order_book()
+        self.assertEqual(order_book.get_bids(), [(100.0, 1.0), (99.0, 2.0)])
+        self.assertEqual(order_book.get_asks(), [(101.0, 1.5)])
+        self.assertEqual(self.updates[0][:2], ([("100.0", "1.0"), ("99.0", "2.0")], []))
+        self.assertEqual(self.updates[1][:2], ([], [("101.0", "1.5")]))
+
+    async def test_delta(self):
+        await self.init_subscription()
+
+        await self.send(ladder_frame('buy', [["100.0", "1.0"], ["99.0", "2.0"], ["98.0", "3.0"]]))
+        # 100 changed, 99 unchanged, 98 removed, 97 added
+        await self.send(ladder_frame('buy', [["100.0", "0.5"], ["99.0", "2.0"], ["97.0", "4.0"]]))
+
+        bid_changes, ask_changes, view = self.updates[-1]
+        self.assertEqual(sorted(bid_changes), [("100.0", "0.5"), ("97.0", "4.0"), ("98.0", "0")])
+        self.assertEqual(ask_changes, [])
+        self.assertEqual(view.bids, [(100.0, 0.5), (99.0, 2.0), (97.0, 4.0)])
+        self.assertEqual(self.subscription.levels[enums.OrderSide.BUY], {"100.0": "0.5", "99.0": "2.0", "97.0": "4.0"})
+
+    async def test_unchanged_ladder_skipped(self):
+        await self.init_subscription()
+
+        await self.send(ladder_frame('sell', [["101.0", "1.0"]]))
+        await self.send(ladder_frame('sell', [["101.0", "1.0"]]))
+        # same levels serialized differently are decoded, but nothing changes
+        await self.send(ladder_frame('sell', [["101.0", "1.0"]]).replace(', ', ',  '))
+
+        self.assertEqual(len(self.updates), 1)
+
+    async def test_empty_ladder_clears_side(self):
+        await self.init_subscription()
+
+        await self.send(ladder_frame('sell', [["101.0", "1.0"], ["102.0", "1.0"]]))
+        await self.send(ladder_frame('sell', []))
+
+        self.assertEqual(sorted(self.updates[-1][1]), [("101.0", "0"), ("102.0", "0")])
+        self.assertEqual(self.subscription.get_order_book().get_asks(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
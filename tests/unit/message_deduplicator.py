@@ -0,0 +1,132 @@
+import unittest
+import aiounittest
+
+from cryptoxlib.Pair import Pair
+from cryptoxlib.MessageDeduplicator import MessageDeduplicator
+from cryptoxlib.WebsocketMgr import WebsocketMessage
+from cryptoxlib.clients.binance.enums import Interval
+from cryptoxlib.clients.binance.BinanceWebsocket import BinanceWebsocket, TradeSubscription, CandlestickSubscription
+
+
+class Replica(object):
+    def __init__(self, connected: bool = True) -> None:
+        self.connected = connected
+
+
+def trade_message(trade_id: int) -> WebsocketMessage:
+    return WebsocketMessage(subscription_id = "btcusdt@trade",
+                            message = {'stream': "btcusdt@trade",
+                                       'data': {'e': 'trade', 'E': 1000, 's': 'BTCUSDT', 't': trade_id}})
+
+
+def kline_message() -> WebsocketMessage:
+    return WebsocketMessage(subscription_id = "btcusdt@kline_1m",
+                            message = {'stream': "btcusdt@kline_1m",
+                                       'data': {'e': 'kline', 'E': 1000, 's': 'BTCUSDT', 'k': {}}})
+
+
+def execution_report(order_id: int, execution_type: str, trade_id: int) -> WebsocketMessage:
+    return WebsocketMessage(subscription_id = "listenkey",
+                            message = {'stream': "listenkey",
+                                       'data': {'e': 'executionReport', 'E': 1000, 'i': order_id,
+                                                'x': execution_type, 't': trade_id}})
+
+
+class MessageDeduplicatorTest(unittest.TestCase):
+    def test_first_arrival_wins(self):
+        deduplicator = MessageDeduplicator()
+        replicas = [Replica(), Replica()]
+        for replica in replicas:
+            deduplicator.add_replica(replica)
+
+        self.assertTrue(deduplicator.is_first_arrival(replicas[1], "key1"))
+        self.assertFalse(deduplicator.is_first_arrival(replicas[0], "key1"))
+        self.assertTrue(deduplicator.is_first_arrival(replicas[0], "key2"))
+        self.assertFalse(deduplicator.is_first_arrival(replicas[1], "key2"))
+
+        stats = deduplicator.get_stats()
+        self.assertEqual([(s.win_count, s.duplicate_count) for s in stats], [(1, 1), (1, 1)])
+        self.assertIsNotNone(stats[0].get_average_lag_ms())
+
+    def test_unkeyed_messages_delivered_by_leader(self):
+        deduplicator = MessageDeduplicator()
+        replicas = [Replica(), Replica()]
+        for replica in replicas:
+            deduplicator.add_replica(replica)
+
+        self.assertTrue(deduplicator.is_first_arrival(replicas[0], None))
+        self.assertFalse(deduplicator.is_first_arrival(replicas[1], None))
+
+        # leadership passes to the next connected replica
+        replicas[0].connected = False
+        self.assertFalse(deduplicator.is_first_arrival(replicas[0], None))
+        self.assertTrue(deduplicator.is_first_arrival(replicas[1], None))
+        self.assertEqual([s.unkeyed_count for s in deduplicator.get_stats()], [1, 1])
+
+    def test_window(self):
+        deduplicator = MessageDeduplicator(window_size = 2)
+        replica = Replica()
+        deduplicator.add_replica(replica)
+
+        for key in ["key1", "key2", "key3"]:
+            self.assertTrue(deduplicator.is_first_arrival(replica, key))
+
+        # the oldest key has left the window
+        self.assertTrue(deduplicator.is_first_arrival(replica, "key1"))
+        self.assertFalse(deduplicator.is_first_arrival(replica, "key3"))
+        self.assertEqual(len(deduplicator.window), 2)
+
+
+class BinanceDeduplicationTest(aiounittest.AsyncTestCase):
+    def create_replicas(self) -> list:
+        self.messages = []
+
+        async def callback(message):
+            self.messages.append(message)
+
+        subscriptions = [TradeSubscription(Pair('BTC', 'USDT'), callbacks = [callback]),
+                         CandlestickSubscription(Pair('BTC', 'USDT'), Interval.I_1MIN, callbacks = [callback])]
+
+        deduplicator = MessageDeduplicator()
+        replicas = []
+        for _ in range(2):
+            # redundant connections share the subscriptions
+            replica = BinanceWebsocket(list(subscriptions), binance_client = None)
+            replica._rebuild_subscription_index()
+            replica.connected = True
+            deduplicator.add_replica(replica)
+            replicas.append(replica)
+
+        return replicas
+
+    async def test_messages_delivered_once(self):
+        replicas = self.create_replicas()
+
+        for trade_id in [1, 2]:
+            for replica in replicas:
+                await replica.publish_message(trade_message(trade_id))
+        self.assertEqual([message['data']['t'] for message in self.messages], [1, 2])
+
+        await replicas[1].publish_message(kline_message())
+        await replicas[0].publish_message(kline_message())
+        self.assertEqual(len(self.messages), 3)
+
+    def test_sequence_keys(self):
+        websocket = BinanceWebsocket([], binance_client = None)
+
+        self.assertEqual(websocket.get_message_sequence_key(trade_message(1)),
+                         websocket.get_message_sequence_key(trade_message(1)))
+        self.assertNotEqual(websocket.get_message_sequence_key(trade_message(1)),
+                            websocket.get_message_sequence_key(trade_message(2)))
+
+        # events without a unique id are not keyed even though they carry the event time
+        self.assertIsNone(websocket.get_message_sequence_key(kline_message()))
+
+        # executions of the same order are told apart by their type and trade id
+        keys = [websocket.get_message_sequence_key(execution_report(10, execution_type, trade_id))
+                for execution_type, trade_id in [('NEW', -1), ('TRADE', 100), ('TRADE', 101), ('CANCELED', -1)]]
+        self.assertEqual(len(set(keys)), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
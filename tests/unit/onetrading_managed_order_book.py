@@ -0,0 +1,103 @@
+import unittest
+import json
+import aiounittest
+
+from cryptoxlib.Pair import Pair
+from cryptoxlib.OrderBook import OrderBook
+from cryptoxlib.clients.onetrading.OneTradingWebsocket import OneTradingWebsocket, ManagedOrderBookSubscription
+
+
+def snapshot_frame(instrument_code: str, bids: list, asks: list) -> str:
+    return json.dumps({
+        'type': 'ORDER_BOOK_SNAPSHOT',
+        'channel_name': 'ORDER_BOOK',
+        'instrument_code': instrument_code,
+        'bids': bids,
+        'asks': asks
+    })
+
+
+def update_frame(instrument_code: str, changes: list) -> str:
+    return json.dumps({
+        'type': 'ORDER_BOOK_UPDATE',
+        'channel_name': 'ORDER_BOOK',
+        'instrument_code': instrument_code,
+        'changes': changes
+    })
+
+
+class RecordingOrderBook(OrderBook):
+    # counts the update calls, every update message has to be applied with a single call per side
+    def __init__(self, symbol = None) -> None:
+        super().__init__(symbol)
+        self.update_call_count = 0
+
+    def update_bids(self, bids) -> None:
+        self.update_call_count += 1
+        super().update_bids(bids)
+
+    def update_asks(self, asks) -> None:
+        self.update_call_count += 1
+        super().update_asks(asks)
+
+
+class OneTradingManagedOrderBookTest(aiounittest.AsyncTestCase):
+    async def init_subscription(self):
+        self.updates = []
+
+        async def callback(order_book):
+            self.updates.append((order_book.symbol, order_book.get_view()))
+
+        self.subscription = ManagedOrderBookSubscription([Pair('BTC', 'EUR'), Pair('ETH', 'EUR')], "50",
+                                                         callbacks = [callback],
+                                                         order_book_factory = RecordingOrderBook)
+        self.websocket_mgr = OneTradingWebsocket([self.subscription])
+        self.websocket_mgr._rebuild_subscription_index()
+        await self.websocket_mgr.initialize_subscriptions([self.subscription])
+
+    async def send(self, frame: str):
+        await self.websocket_mgr._process_message(None, frame)
+
+    async def test_books_per_instrument(self):
+        await self.init_subscription()
+
+        await self.send(snapshot_frame('BTC_EUR', [["100", "1"], ["99", "2"]], [["101", "1"]]))
+        await self.send(snapshot_frame('ETH_EUR', [["10", "5"]], [["11", "5"]]))
+        self.subscription.order_books.order_books['BTC_EUR'].update_call_count = 0
+        await self.send(update_frame('BTC_EUR', [["BUY", "100", "0"], ["BUY", "98", "3"], ["SELL", "101", "2"],
+                                                 ["SELL", "102", "1"]]))
+
+        order_book = self.subscription.get_order_book(Pair('BTC', 'EUR'))
+        self.assertEqual(order_book.get_bids(), [(99.0, 2.0), (98.0, 3.0)])
+        self.assertEqual(order_book.get_asks(), [(101.0, 2.0), (102.0, 1.0)])
+        self.assertEqual(self.subscription.get_order_book(Pair('ETH', 'EUR')).get_asks(), [(11.0, 5.0)])
+        self.assertEqual([symbol for symbol, _ in self.updates], ['BTC_EUR', 'ETH_EUR', 'BTC_EUR'])
+
+        # the changes of each side are applied at once
+        self.assertEqual(self.subscription.order_books.order_books['BTC_EUR'].update_call_count, 2)
+
+    async def test_updates_before_snapshot_dropped(self):
+        await self.init_subscription()
+
+        await self.send(update_frame('BTC_EUR', [["BUY", "100", "1"]]))
+        self.assertIsNone(self.subscription.get_order_book(Pair('BTC', 'EUR')))
+        self.assertEqual(self.updates, [])
+
+    async def test_books_reset_on_reconnection(self):
+        await self.init_subscription()
+        await self.send(snapshot_frame('BTC_EUR', [["100", "1"]], [["101", "1"]]))
+        order_book = self.subscription.get_order_book(Pair('BTC', 'EUR'))
+
+        await self.websocket_mgr.initialize_subscriptions([self.subscription])
+        self.assertEqual(order_book.get_asks(), [])
+
+        # updates are dropped until the book is synchronized by a new snapshot
+        await self.send(update_frame('BTC_EUR', [["SELL", "102", "1"]]))
+        self.assertEqual(order_book.get_asks(), [])
+        await self.send(snapshot_frame('BTC_EUR', [["99", "1"]], [["103", "1"]]))
+        self.assertEqual(order_book.get_asks(), [(103.0, 1.0)])
+        self.assertEqual(len(self.updates), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import unittest
+import asyncio
+import aiounittest
+
+from cryptoxlib.CryptoXLibClient import RestCallType
+from cryptoxlib.RateLimiter import RateLimiter, RateLimit, RestCallPriority
+from cryptoxlib.exceptions import CryptoXLibException
+from cryptoxlib.clients.binance.rate_limits import BinanceRateLimiter, REQUEST_WEIGHT, ORDERS_10S, ORDERS_1D
+
+from CryptoXLibStubs import StubClient
+
+INTERVAL_MS = 60 * 1000
+
+
+class UsageRateLimiter(RateLimiter):
+    USAGE_HEADERS = {
+        "X-USED-WEIGHT": "WEIGHT"
+    }
+
+    def __init__(self, capacity: int = 100) -> None:
+        super().__init__([RateLimit("WEIGHT", capacity, INTERVAL_MS)])
+
+    def get_request_cost(self, rest_call_type: RestCallType, path: str, params: dict) -> dict:
+        return {"WEIGHT": params['weight']}
+
+
+async def is_blocked(acquisition) -> bool:
+    try:
+        await asyncio.wait_for(acquisition, timeout = 0.05)
+        return False
+    except asyncio.TimeoutError:
+        return True
+
+
+class RateLimitTest(unittest.TestCase):
+    def test_sliding_window(self):
+        limit = RateLimit("WEIGHT", 100, INTERVAL_MS)
+        interval_ns = INTERVAL_MS * 10**6
+
+        limit.consume(60, 0)
+        limit.consume(30, interval_ns // 2)
+        self.assertEqual(limit.get_usage(interval_ns // 2), 90)
+        # the first request leaves the window first
+        self.assertEqual(limit.get_wait_ns(20, interval_ns // 2), interval_ns // 2)
+        self.assertEqual(limit.get_wait_ns(10, interval_ns // 2), 0)
+
+        self.assertEqual(limit.get_usage(interval_ns), 30)
+        self.assertEqual(limit.get_usage(interval_ns + interval_ns // 2), 0)
+
+    def test_headroom(self):
+        limit = RateLimit("WEIGHT", 100, INTERVAL_MS)
+        limit.consume(80, 0)
+
+        self.assertEqual(limit.get_wait_ns(15, 0, headroom = 0), 0)
+        self.assertGreater(limit.get_wait_ns(15, 0, headroom = 10), 0)
+
+    def test_in_flight_weight_kept_on_sync(self):
+        limit = RateLimit("WEIGHT", 100, INTERVAL_MS)
+
+        limit.consume(10, 0)
+        reported_request = limit.consumed_total
+        limit.consume(20, 0)
+
+        # the report includes 30 weight of other processes and the reported request only
+        limit.sync(40, 0, reported_request)
+        self.assertEqual(limit.get_consumed_since_report(), 20)
+        self.assertEqual(limit.get_usage(0), 60)
+
+        # an older report arriving late is ignored
+        limit.sync(35, 0, reported_request - 10)
+        self.assertEqual(limit.get_usage(0), 60)
+
+        limit.sync(60, 0, limit.consumed_total)
+        self.assertEqual(limit.get_usage(0), 60)
+
+    def test_reported_usage_expires(self):
+        limit = RateLimit("WEIGHT", 100, INTERVAL_MS)
+        limit.sync(90, 0)
+
+        self.assertEqual(limit.get_usage(0), 90)
+        self.assertGreater(limit.get_wait_ns(20, 0), 0)
+        self.assertEqual(limit.get_usage(limit.reported_until_ns), 0)
+
+
+class RateLimiterTest(aiounittest.AsyncTestCase):
+    async def test_headroom_reserved_for_critical_requests(self):
+        rate_limiter = UsageRateLimiter()
+        await rate_limiter.acquire({"WEIGHT": 70}, RestCallPriority.BULK)
+
+        self.assertTrue(await is_blocked(rate_limiter.acquire({"WEIGHT": 1}, RestCallPriority.BULK)))
+        self.assertEqual(rate_limiter.get_budget(RestCallPriority.BULK), {"WEIGHT": 0})
+        self.assertEqual(rate_limiter.get_budget(RestCallPriority.NORMAL), {"WEIGHT": 20})
+
+        await rate_limiter.acquire({"WEIGHT": 20}, RestCallPriority.NORMAL)
+        self.assertTrue(await is_blocked(rate_limiter.acquire({"WEIGHT": 1}, RestCallPriority.NORMAL)))
+
+        await rate_limiter.acquire({"WEIGHT": 10}, RestCallPriority.CRITICAL)
+        self.assertEqual(rate_limiter.get_usage(), {"WEIGHT": 100})
+        self.assertTrue(await is_blocked(rate_limiter.acquire({"WEIGHT": 1}, RestCallPriority.CRITICAL)))
+
+    async def test_heavy_request_not_blocked_by_headroom(self):
+        rate_limiter = UsageRateLimiter()
+
+        # heavier than the capacity left to bulk requests, but fits into an empty limit
+        await rate_limiter.acquire({"WEIGHT": 95}, RestCallPriority.BULK)
+        self.assertEqual(rate_limiter.get_usage(), {"WEIGHT": 95})
+
+        with self.assertRaises(CryptoXLibException):
+            await rate_limiter.acquire({"WEIGHT": 101})
+
+    async def test_suspend(self):
+        rate_limiter = UsageRateLimiter()
+        rate_limiter.suspend(10 * 1000)
+
+        self.assertTrue(await is_blocked(rate_limiter.acquire({}, RestCallPriority.CRITICAL)))
+
+    async def test_client_synchronizes_usage_from_headers(self):
+        client = StubClient()
+        client.rate_limiter = UsageRateLimiter()
+
+        first_call = asyncio.ensure_future(client._create_get("first", params = {'weight': 10}))
+        await asyncio.sleep(0)
+        second_call = asyncio.ensure_future(client._create_get("second", params = {'weight': 20}))
+        await asyncio.sleep(0)
+        self.assertEqual(len(client.pending_responses), 2)
+
+        # first response arrives while the second request is in flight, the exchange counts 30 weight of others
+        client.pending_responses[0].set_result({"status_code": 200, "headers": {"X-USED-WEIGHT": "40"},
+                                                "response": {}})
+        await first_call
+        self.assertEqual(client.rate_limiter.get_usage(), {"WEIGHT": 60})
+
+        client.pending_responses[1].set_result({"status_code": 200, "headers": {"X-USED-WEIGHT": "65"},
+                                                "response": {}})
+        await second_call
+        self.assertEqual(client.rate_limiter.get_usage(), {"WEIGHT": 65})
+
+
+class BinanceRateLimiterTest(unittest.TestCase):
+    def test_request_cost(self):
+        rate_limiter = BinanceRateLimiter()
+
+        self.assertEqual(rate_limiter.get_request_cost(RestCallType.GET, "api/v3/depth", {'limit': 1000}),
+                         {REQUEST_WEIGHT: 50})
+        self.assertEqual(rate_limiter.get_request_cost(RestCallType.POST, "api/v3/order", {}),
+                         {REQUEST_WEIGHT: 1, ORDERS_10S: 1, ORDERS_1D: 1})
+        self.assertEqual(rate_limiter.get_request_priority(RestCallType.DELETE, "api/v3/order"),
+                         RestCallPriority.CRITICAL)
+
+    def test_usage_headers(self):
+        rate_limiter = BinanceRateLimiter()
+        rate_limiter.update_from_headers({"X-MBX-USED-WEIGHT-1M": "1200", "X-MBX-ORDER-COUNT-10S": "7"})
+
+        usage = rate_limiter.get_usage()
+        self.assertEqual(usage[REQUEST_WEIGHT], 1200)
+        self.assertEqual(usage[ORDERS_10S], 7)
+        self.assertEqual(usage[ORDERS_1D], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
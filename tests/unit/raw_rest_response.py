@@ -0,0 +1,38 @@
+import unittest
+
+from cryptoxlib.clients.bitforex.BitforexClient import BitforexClient
+from cryptoxlib.clients.bitforex.exceptions import BitforexRestException
+from cryptoxlib.clients.coinmate.CoinmateClient import CoinmateClient
+from cryptoxlib.clients.coinmate.exceptions import CoinmateRestException
+
+
+class RawRestResponseTest(unittest.TestCase):
+    # exchanges reporting errors within successful responses have to detect them in the undecoded body
+
+    def assert_errors_detected(self, client, exception_type, error_bodies: list, ok_bodies: list):
+        for body in error_bodies:
+            with self.assertRaises(exception_type, msg = body):
+                client._preprocess_raw_rest_response(200, {}, body)
+
+        for body in ok_bodies:
+            client._preprocess_raw_rest_response(200, {}, body)
+
+    def test_bitforex(self):
+        self.assert_errors_detected(BitforexClient(sec_key = "secret"), BitforexRestException,
+                                    [b'{"success":false,"code":"1003"}',
+                                     b'{"code": "1003", "success": false}',
+                                     b'{\n  "success" :\tfalse\n}'],
+                                    [b'{"success":true,"data":[]}',
+                                     b'{"success": true, "data": {"message": "success false"}}'])
+
+    def test_coinmate(self):
+        self.assert_errors_detected(CoinmateClient(api_key = "key", sec_key = "secret"), CoinmateRestException,
+                                    [b'{"error":true,"errorMessage":"Access denied."}',
+                                     b'{"error": true, "errorMessage": "Access denied.", "data": null}',
+                                     b'{\n  "error" :\ttrue\n}'],
+                                    [b'{"error":false,"errorMessage":null,"data":[]}',
+                                     b'{"error": false, "errorMessage": null, "data": {"text": "error true"}}'])
+
+
+if __name__ == '__main__':
+    unittest.main()
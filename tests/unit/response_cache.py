@@ -0,0 +1,130 @@
+import unittest
+import asyncio
+import os
+import tempfile
+import aiounittest
+
+from cryptoxlib.CryptoXLibClient import RestCallType
+from cryptoxlib.RestMiddleware import RestRequest
+from cryptoxlib.ResponseCache import ResponseCacheMiddleware
+
+from CryptoXLibStubs import StubClient, StubHandler, response
+
+EXCHANGE_INFO = "api/v3/exchangeInfo"
+
+
+def get_request(path: str = EXCHANGE_INFO, params: dict = None, signed: bool = False, raw: bool = False) -> RestRequest:
+    return RestRequest(RestCallType.GET, path, params = params if params is not None else {}, headers = {},
+                       signed = signed, raw = raw)
+
+
+class ResponseCacheTest(aiounittest.AsyncTestCase):
+    async def test_cached_within_ttl(self):
+        cache = ResponseCacheMiddleware({EXCHANGE_INFO: 0.05})
+        handler = StubHandler()
+
+        first = await cache.process(get_request(), handler)
+        second = await cache.process(get_request(), handler)
+        self.assertIs(first, second)
+        self.assertEqual(cache.get_stats(), {'entry_count': 1, 'hit_count': 1, 'miss_count': 1})
+
+        # different params are cached separately
+        await cache.process(get_request(params = {"symbol": "BTCUSDT"}), handler)
+        self.assertEqual(handler.call_count, 2)
+
+        await asyncio.sleep(0.1)
+        third = await cache.process(get_request(), handler)
+        self.assertEqual(third['response'], {"call": 3})
+
+    async def test_not_cached(self):
+        cache = ResponseCacheMiddleware({EXCHANGE_INFO: 60})
+
+        for request in [get_request(path = "api/v3/depth"), get_request(signed = True), get_request(raw = True),
+                        RestRequest(RestCallType.POST, EXCHANGE_INFO, params = {}, headers = {})]:
+            handler = StubHandler()
+            await cache.process(request, handler)
+            await cache.process(request, handler)
+            self.assertEqual(handler.call_count, 2, str(request))
+
+        handler = StubHandler(response(500))
+        await cache.process(get_request(), handler)
+        await cache.process(get_request(), handler)
+        self.assertEqual(handler.call_count, 2)
+        self.assertEqual(cache.get_stats()['entry_count'], 0)
+
+    async def test_least_recently_used_evicted(self):
+        cache = ResponseCacheMiddleware({EXCHANGE_INFO: 60}, max_entries = 2)
+        handler = StubHandler()
+
+        for symbol in ["BTCUSDT", "ETHUSDT", "BTCUSDT", "BNBUSDT"]:
+            await cache.process(get_request(params = {"symbol": symbol}), handler)
+        self.assertEqual(handler.call_count, 3)
+
+        # ETHUSDT was the least recently used
+        await cache.process(get_request(params = {"symbol": "BTCUSDT"}), handler)
+        self.assertEqual(handler.call_count, 3)
+        await cache.process(get_request(params = {"symbol": "ETHUSDT"}), handler)
+        self.assertEqual(handler.call_count, 4)
+
+    async def test_invalidate(self):
+        cache = ResponseCacheMiddleware({EXCHANGE_INFO: 60, "api/v3/ticker/price": 60})
+        handler = StubHandler()
+
+        await cache.process(get_request(), handler)
+        await cache.process(get_request(path = "api/v3/ticker/price"), handler)
+
+        cache.invalidate(EXCHANGE_INFO)
+        self.assertEqual(cache.get_stats()['entry_count'], 1)
+        await cache.process(get_request(), handler)
+        self.assertEqual(handler.call_count, 3)
+
+        cache.invalidate()
+        self.assertEqual(cache.get_stats()['entry_count'], 0)
+
+    async def test_save_and_load(self):
+        cache = ResponseCacheMiddleware({EXCHANGE_INFO: 60, "api/v3/ticker/price": 0.01})
+        handler = StubHandler()
+        await cache.process(get_request(), handler)
+        await cache.process(get_request(path = "api/v3/ticker/price"), handler)
+        await asyncio.sleep(0.05)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "cache.json")
+            cache.save(file_path)
+
+            loaded_cache = ResponseCacheMiddleware({EXCHANGE_INFO: 60, "api/v3/ticker/price": 0.01})
+            loaded_cache.load(file_path)
+            # a missing file is not an error
+            loaded_cache.load(os.path.join(directory, "missing.json"))
+
+        # the expired response is not persisted
+        self.assertEqual(loaded_cache.get_stats()['entry_count'], 1)
+
+        loaded = await loaded_cache.process(get_request(), StubHandler())
+        self.assertEqual(loaded['status_code'], 200)
+        self.assertEqual(loaded['response'], {"call": 1})
+        self.assertEqual(loaded['headers']['content-type'], "application/json")
+        self.assertEqual(loaded_cache.get_stats()['hit_count'], 1)
+
+
+class CacheClient(StubClient):
+    RESPONSE_CACHE_TTLS_SEC = {
+        EXCHANGE_INFO: 60
+    }
+
+
+class ClientResponseCacheTest(aiounittest.AsyncTestCase):
+    async def test_default_ttls(self):
+        client = CacheClient(handler = StubHandler())
+        cache = client.enable_response_cache()
+
+        await client._create_get("exchangeInfo", api_variable_path = "api/v3/")
+        await client._create_get("exchangeInfo", api_variable_path = "api/v3/")
+        await client._create_get("depth", api_variable_path = "api/v3/")
+
+        self.assertEqual(client.handler.call_count, 2)
+        self.assertEqual(cache.get_stats()['hit_count'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,265 @@
+import unittest
+import asyncio
+import aiohttp
+import aiounittest
+
+from cryptoxlib.CryptoXLibClient import RestCallType
+from cryptoxlib.LatencyTracker import LatencyTracker
+from cryptoxlib.RestMiddleware import RestMiddleware, RestRequest, RetryMiddleware, HedgingMiddleware, \
+    SingleFlightMiddleware
+
+from CryptoXLibStubs import StubClient, StubHandler, response
+
+
+def get_request(resource: str = "depth", symbol: str = "BTCUSDT", signed: bool = False) -> RestRequest:
+    return RestRequest(RestCallType.GET, resource, params = {"symbol": symbol}, headers = {}, signed = signed)
+
+
+def post_request(resource: str = "order") -> RestRequest:
+    return RestRequest(RestCallType.POST, resource, data = {"symbol": "BTCUSDT"}, params = {}, headers = {})
+
+
+class RetryMiddlewareTest(aiounittest.AsyncTestCase):
+    def create_middleware(self, **kwargs) -> RetryMiddleware:
+        return RetryMiddleware(initial_delay_ms = 1, max_delay_ms = 1, **kwargs)
+
+    async def test_retry_on_status_code(self):
+        middleware = self.create_middleware()
+        handler = StubHandler(response(503), response(502), response(200, {"ok": 1}))
+
+        result = await middleware.process(get_request(), handler)
+
+        self.assertEqual(result['response'], {"ok": 1})
+        self.assertEqual(handler.call_count, 3)
+        self.assertEqual(middleware.retry_count, 2)
+
+    async def test_retry_on_connection_error(self):
+        middleware = self.create_middleware()
+        handler = StubHandler(aiohttp.ClientConnectionError("reset"), response(200))
+
+        result = await middleware.process(get_request(), handler)
+
+        self.assertEqual(result['status_code'], 200)
+        self.assertEqual(handler.call_count, 2)
+
+    async def test_retries_exhausted(self):
+        middleware = self.create_middleware(max_retries = 2)
+
+        handler = StubHandler(response(503))
+        result = await middleware.process(get_request(), handler)
+        self.assertEqual(result['status_code'], 503)
+        self.assertEqual(handler.call_count, 3)
+
+        handler = StubHandler(aiohttp.ClientConnectionError("reset"))
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            await middleware.process(get_request(), handler)
+        self.assertEqual(handler.call_count, 3)
+
+    async def test_attempt_timeout(self):
+        middleware = self.create_middleware(max_retries = 1, timeout_ms = 10)
+        handler = StubHandler((1, response(200)), response(200, {"ok": 1}))
+
+        result = await middleware.process(get_request(), handler)
+
+        self.assertEqual(result['response'], {"ok": 1})
+        self.assertEqual(handler.cancelled_count, 1)
+
+    async def test_client_errors_and_non_idempotent_calls_not_retried(self):
+        middleware = self.create_middleware()
+
+        handler = StubHandler(response(400))
+        self.assertEqual((await middleware.process(get_request(), handler))['status_code'], 400)
+        self.assertEqual(handler.call_count, 1)
+
+        handler = StubHandler(response(503))
+        self.assertEqual((await middleware.process(post_request(), handler))['status_code'], 503)
+        self.assertEqual(handler.call_count, 1)
+
+        handler = StubHandler(aiohttp.ClientConnectionError("reset"))
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            await middleware.process(post_request(), handler)
+        self.assertEqual(handler.call_count, 1)
+
+    def test_delay(self):
+        middleware = RetryMiddleware(initial_delay_ms = 100, max_delay_ms = 500, multiplier = 2, jitter = 0)
+        self.assertEqual([middleware.get_delay_ms(attempt) for attempt in range(5)], [100, 200, 400, 500, 500])
+
+        middleware.jitter = 0.5
+        for attempt in range(5):
+            self.assertTrue(50 <= middleware.get_delay_ms(attempt) <= 500)
+
+
+class HedgingMiddlewareTest(aiounittest.AsyncTestCase):
+    def create_middleware(self, hedge_delay_ms: float = 10, **kwargs) -> HedgingMiddleware:
+        latency_tracker = LatencyTracker()
+        for _ in range(20):
+            latency_tracker.add(get_request().get_endpoint(), hedge_delay_ms)
+
+        return HedgingMiddleware(latency_tracker = latency_tracker, **kwargs)
+
+    async def test_not_hedged_without_samples(self):
+        middleware = HedgingMiddleware()
+        handler = StubHandler((0.05, response(200)))
+
+        await middleware.process(get_request(), handler)
+
+        self.assertEqual(handler.call_count, 1)
+        self.assertEqual(middleware.get_stats()['hedged_count'], 0)
+
+    async def test_fast_call_not_hedged(self):
+        middleware = self.create_middleware(hedge_delay_ms = 500)
+        handler = StubHandler(response(200))
+
+        await middleware.process(get_request(), handler)
+
+        self.assertEqual(handler.call_count, 1)
+
+    async def test_hedged_call_wins(self):
+        middleware = self.create_middleware()
+        handler = StubHandler((1, response(200, {"copy": "primary"})), response(200, {"copy": "hedge"}))
+
+        result = await middleware.process(get_request(), handler)
+
+        self.assertEqual(result['response'], {"copy": "hedge"})
+        self.assertEqual(middleware.get_stats(), {'call_count': 1, 'hedged_count': 1, 'hedge_win_count': 1})
+        # the slow primary call is cancelled
+        await asyncio.sleep(0)
+        self.assertEqual(handler.cancelled_count, 1)
+
+    async def test_primary_wins_after_hedge(self):
+        middleware = self.create_middleware()
+        handler = StubHandler((0.05, response(200, {"copy": "primary"})), (1, response(200, {"copy": "hedge"})))
+
+        result = await middleware.process(get_request(), handler)
+
+        self.assertEqual(result['response'], {"copy": "primary"})
+        self.assertEqual(middleware.get_stats()['hedge_win_count'], 0)
+
+    async def test_failed_call_replaced_by_other_copy(self):
+        middleware = self.create_middleware()
+        handler = StubHandler((0.05, aiohttp.ClientConnectionError("reset")), (0.1, response(200, {"copy": "hedge"})))
+
+        result = await middleware.process(get_request(), handler)
+        self.assertEqual(result['response'], {"copy": "hedge"})
+
+        handler = StubHandler((0.05, aiohttp.ClientConnectionError("reset")))
+        middleware = self.create_middleware()
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            await middleware.process(get_request(), handler)
+
+    async def test_only_primary_latency_sampled(self):
+        middleware = self.create_middleware(hedge_delay_ms = 20, max_hedge_ratio = 1)
+        endpoint = get_request().get_endpoint()
+        samples = middleware.latency_tracker.endpoints[endpoint].samples_ms
+
+        # the hedged copy answers first, the cancelled primary call is sampled with the time it had been waiting
+        await middleware.process(get_request(), StubHandler((1, response(200)), (0.01, response(200))))
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(samples), 21)
+        self.assertGreaterEqual(samples[-1], 30)
+
+        # the failed primary call is not sampled although the hedged copy succeeds
+        await middleware.process(get_request(), StubHandler((0.03, aiohttp.ClientConnectionError("reset")),
+                                                            (0.01, response(200))))
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(samples), 21)
+
+    async def test_hedge_ratio(self):
+        middleware = self.create_middleware(max_hedge_ratio = 0.5)
+        handler = StubHandler((0.05, response(200)))
+
+        for _ in range(4):
+            await middleware.process(get_request(), handler)
+
+        self.assertEqual(middleware.get_stats()['hedged_count'], 2)
+        self.assertEqual(handler.call_count, 6)
+
+    async def test_non_idempotent_call_not_hedged(self):
+        middleware = self.create_middleware()
+        handler = StubHandler((0.05, response(200)))
+
+        await middleware.process(post_request(), handler)
+
+        self.assertEqual(handler.call_count, 1)
+
+
+class SingleFlightMiddlewareTest(aiounittest.AsyncTestCase):
+    async def test_identical_calls_coalesced(self):
+        middleware = SingleFlightMiddleware()
+        handler = StubHandler((0.01, response(200, {"lastUpdateId": 1})))
+
+        results = await asyncio.gather(*[middleware.process(get_request(), handler) for _ in range(3)])
+
+        self.assertEqual(handler.call_count, 1)
+        self.assertIs(results[0], results[1])
+        self.assertIs(results[0], results[2])
+        self.assertEqual(middleware.get_stats(), {'call_count': 3, 'coalesced_count': 2})
+
+        # completed calls are not reused
+        await middleware.process(get_request(), handler)
+        self.assertEqual(handler.call_count, 2)
+        self.assertEqual(middleware.in_flight, {})
+
+    async def test_different_calls_not_coalesced(self):
+        middleware = SingleFlightMiddleware()
+        handler = StubHandler((0.01, response(200)))
+
+        await asyncio.gather(middleware.process(get_request(symbol = "BTCUSDT"), handler),
+                             middleware.process(get_request(symbol = "ETHUSDT"), handler),
+                             middleware.process(get_request(signed = True), handler),
+                             middleware.process(get_request(signed = True), handler),
+                             middleware.process(post_request(), handler),
+                             middleware.process(post_request(), handler))
+
+        self.assertEqual(handler.call_count, 6)
+        self.assertEqual(middleware.get_stats()['coalesced_count'], 0)
+
+    async def test_exception_shared(self):
+        middleware = SingleFlightMiddleware()
+        handler = StubHandler((0.01, aiohttp.ClientConnectionError("reset")), response(200))
+
+        results = await asyncio.gather(*[middleware.process(get_request(), handler) for _ in range(2)],
+                                       return_exceptions = True)
+
+        self.assertTrue(all(isinstance(result, aiohttp.ClientConnectionError) for result in results))
+        self.assertEqual(handler.call_count, 1)
+        self.assertEqual((await middleware.process(get_request(), handler))['status_code'], 200)
+
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        middleware = SingleFlightMiddleware()
+        handler = StubHandler((0.05, response(200, {"lastUpdateId": 1})))
+
+        first_call = asyncio.ensure_future(middleware.process(get_request(), handler))
+        second_call = asyncio.ensure_future(middleware.process(get_request(), handler))
+        await asyncio.sleep(0.01)
+        first_call.cancel()
+
+        self.assertEqual((await second_call)['response'], {"lastUpdateId": 1})
+        self.assertEqual(handler.cancelled_count, 0)
+        self.assertTrue(first_call.cancelled())
+
+
+class RecordingMiddleware(RestMiddleware):
+    def __init__(self, name: str, calls: list) -> None:
+        self.name = name
+        self.calls = calls
+
+    async def process(self, request: RestRequest, next_handler) -> dict:
+        self.calls.append(self.name)
+        return await next_handler(request)
+
+
+class MiddlewarePipelineTest(aiounittest.AsyncTestCase):
+    async def test_middleware_order(self):
+        client = StubClient(handler = StubHandler(response(200)))
+        client.add_rest_middleware(RecordingMiddleware("outer", client.calls))
+        client.add_rest_middleware(RecordingMiddleware("inner", client.calls))
+
+        await client._create_get("depth", api_variable_path = "api/v3/")
+
+        # exchange checks are applied once to the final response
+        self.assertEqual(client.calls, ["outer", "inner", "send GET api/v3/depth", "preprocess"])
+
+
+if __name__ == '__main__':
+    unittest.main()